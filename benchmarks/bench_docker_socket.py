@@ -0,0 +1,83 @@
+"""
+Benchmark: per-tick cost of one-shot container stats, SDK vs raw socket.
+
+Starts a fake Docker daemon on a temporary unix socket that serves a
+growing number of running containers, answering each stats request after
+`--latency` seconds (the time a real daemon spends reading cgroups), and
+times DockerCollector.collect() with the "api" backend (one blocking SDK
+request per container) against the "socket" backend (concurrent requests
+from one event loop over keep-alive connections). The conns column counts
+the connections each backend opened per tick after a first, untimed one.
+
+The fake daemon is the one the tests use (tests/fakedocker.py).
+
+Usage:
+    python benchmarks/bench_docker_socket.py [--sizes 10,100,300] [--ticks 5]
+        [--latency 0.01]
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(ROOT / "tests"))
+
+from fakedocker import FakeDockerDaemon  # noqa: E402
+from sysmon.collectors.docker import DockerCollector  # noqa: E402
+
+
+def time_collector(daemon: FakeDockerDaemon, backend: str, ticks: int) -> tuple:
+    """Return the median ms per tick, connections per tick and containers seen."""
+    collector = DockerCollector(backend=backend)
+    try:
+        if not collector.wait_connected(5.0):
+            raise RuntimeError(f"{backend} backend did not connect")
+        metrics = collector.collect()
+        connections = daemon.connections
+        samples = []
+        for _ in range(ticks):
+            start = time.perf_counter()
+            metrics = collector.collect()
+            samples.append((time.perf_counter() - start) * 1000)
+        samples.sort()
+        conns = (daemon.connections - connections) / ticks
+        return samples[len(samples) // 2], conns, len(metrics.containers)
+    finally:
+        collector.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", default="10,100,300")
+    parser.add_argument("--ticks", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.01)
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp(prefix="sysmon-bench-")
+    path = os.path.join(tmp, "docker.sock")
+    os.environ["DOCKER_HOST"] = f"unix://{path}"
+    print(f"{'containers':>10} {'backend':>8} {'ms/tick':>9} {'conns':>6} {'seen':>6}")
+
+    try:
+        for size in (int(s) for s in args.sizes.split(",")):
+            for backend in ("api", "socket"):
+                daemon = FakeDockerDaemon(path, size, args.latency)
+                daemon.start()
+                try:
+                    ms, conns, seen = time_collector(daemon, backend, args.ticks)
+                finally:
+                    daemon.stop()
+                    os.unlink(path)
+                print(f"{size:>10} {backend:>8} {ms:>9.1f} {conns:>6.1f} {seen:>6}")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
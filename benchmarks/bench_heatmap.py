@@ -0,0 +1,95 @@
+"""
+Benchmark: rendering cost of the per-core CPU display on many-core hosts.
+
+Renders the per-core CPU percentages of 64 to 512 logical CPUs to an
+off-screen console three ways: one styled Text per core laid out in a
+Table grid (the previous "Core N: X%" rows, extended to every core),
+CoreHeatmap with one cell per core, and CoreHeatmap with an 8-sample
+history strip per core.
+
+Usage:
+    python benchmarks/bench_heatmap.py [--sizes 64,128,256,512] [--frames 100] [--width 60]
+"""
+
+import argparse
+import io
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from rich.console import Console  # noqa: E402
+from rich.table import Table  # noqa: E402
+from rich.text import Text  # noqa: E402
+
+from sysmon.display.heatmap import CoreHeatmap  # noqa: E402
+from sysmon.utils.alerts import get_alert_color  # noqa: E402
+
+HISTORY_POINTS = 8
+
+
+def per_core_table(per_core: list) -> Table:
+    """Previous per-core rows: two "Core N: X%" Texts per row, for every core."""
+    table = Table.grid(padding=(0, 1))
+    table.add_column()
+    table.add_column()
+    for i in range(0, len(per_core), 2):
+        right = (
+            Text(f"Core {i + 1}: {per_core[i + 1]:.0f}%", style=get_alert_color(per_core[i + 1]))
+            if i + 1 < len(per_core)
+            else Text("")
+        )
+        table.add_row(
+            Text(f"Core {i}: {per_core[i]:.0f}%", style=get_alert_color(per_core[i])), right
+        )
+    return table
+
+
+def frame_values(cores: int, frame: int) -> list:
+    """Deterministic per-core percentages for a frame."""
+    return [float((i * 37 + frame * 11) % 101) for i in range(cores)]
+
+
+def time_frames(console: Console, frames: int, build) -> float:
+    """Return the median milliseconds to build and render one frame."""
+    samples = []
+    for frame in range(frames):
+        start = time.perf_counter()
+        console.print(build(frame))
+        samples.append((time.perf_counter() - start) * 1000)
+        console.file.seek(0)
+        console.file.truncate()
+    samples.sort()
+    return samples[len(samples) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", default="64,128,256,512")
+    parser.add_argument("--frames", type=int, default=100)
+    parser.add_argument("--width", type=int, default=60)
+    args = parser.parse_args()
+
+    console = Console(file=io.StringIO(), width=args.width, force_terminal=True)
+    print(f"{'cores':>6} {'table ms':>10} {'heatmap ms':>11} {'history ms':>11}")
+
+    for cores in (int(s) for s in args.sizes.split(",")):
+        history = [
+            tuple(frame_values(cores, -t)[i] for t in range(HISTORY_POINTS))
+            for i in range(cores)
+        ]
+        table_ms = time_frames(
+            console, args.frames, lambda f: per_core_table(frame_values(cores, f))
+        )
+        heatmap_ms = time_frames(
+            console, args.frames, lambda f: CoreHeatmap(frame_values(cores, f))
+        )
+        history_ms = time_frames(
+            console, args.frames, lambda f: CoreHeatmap(frame_values(cores, f), history)
+        )
+        print(f"{cores:>6} {table_ms:>10.2f} {heatmap_ms:>11.2f} {history_ms:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
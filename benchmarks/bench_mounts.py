@@ -0,0 +1,121 @@
+"""
+Benchmark: per-tick cost of reading the mount table.
+
+Builds synthetic procfs mount tables the size of busy container hosts
+(mostly overlay and bind mounts) and times three ways of getting the
+partition list for a tick: psutil.disk_partitions() as DiskCollector used
+to call it, reparsing mountinfo with MountTable.read(), and the cached
+DiskCollector.mounts(), which only polls for a change notification. The
+synthetic file never signals a change, so the last column is the cost of
+an unchanged tick.
+
+Usage:
+    python benchmarks/bench_mounts.py [--sizes 100,1000,5000] [--ticks 50]
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import psutil
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from sysmon.collectors.disk import DiskCollector  # noqa: E402
+from sysmon.collectors.mounts import MountTable  # noqa: E402
+
+FILESYSTEMS = "nodev\tsysfs\nnodev\tproc\nnodev\ttmpfs\nnodev\toverlay\n\text4\n\txfs\n"
+
+
+def build_proc_root(root: str, count: int) -> None:
+    """Create a fake procfs holding a mount table with `count` entries."""
+    os.mkdir(os.path.join(root, "self"))
+    with open(os.path.join(root, "filesystems"), "w") as f:
+        f.write(FILESYSTEMS)
+
+    mountinfo = [
+        "21 1 253:1 / / rw,relatime shared:1 - ext4 /dev/vda1 rw",
+        "22 21 0:20 / /proc rw,nosuid shared:2 - proc proc rw",
+        "23 21 0:21 / /sys rw,nosuid shared:3 - sysfs sysfs rw",
+        "24 21 253:2 / /var/lib/docker rw,relatime shared:4 - xfs /dev/vdb1 rw",
+    ]
+    mounts = [
+        "/dev/vda1 / ext4 rw 0 0",
+        "proc /proc proc rw 0 0",
+        "sysfs /sys sysfs rw 0 0",
+        "/dev/vdb1 /var/lib/docker xfs rw 0 0",
+    ]
+
+    for i in range(count):
+        mount_id = 100 + i
+        container = f"/var/lib/docker/overlay2/{i:064x}/merged"
+        if i % 3 == 0:
+            mountinfo.append(
+                f"{mount_id} 24 0:{50 + i} / {container} rw,relatime shared:{mount_id} "
+                f"- overlay overlay rw,lowerdir=/l{i},upperdir=/u{i},workdir=/w{i}"
+            )
+            mounts.append(f"overlay {container} overlay rw 0 0")
+        elif i % 3 == 1:
+            mountinfo.append(
+                f"{mount_id} 24 253:2 /volumes/v{i} /var/lib/kubelet/pods/p{i}/vol "
+                f"rw,relatime shared:{mount_id} - xfs /dev/vdb1 rw"
+            )
+            mounts.append(f"/dev/vdb1 /var/lib/kubelet/pods/p{i}/vol xfs rw 0 0")
+        else:
+            mountinfo.append(
+                f"{mount_id} 24 0:{50 + i} / /run/containers/c{i}/shm rw,nosuid "
+                f"shared:{mount_id} - tmpfs shm rw,size=65536k"
+            )
+            mounts.append(f"shm /run/containers/c{i}/shm tmpfs rw 0 0")
+
+    with open(os.path.join(root, "self", "mountinfo"), "w") as f:
+        f.write("\n".join(mountinfo) + "\n")
+    with open(os.path.join(root, "self", "mounts"), "w") as f:
+        f.write("\n".join(mounts) + "\n")
+
+
+def time_ticks(func, ticks: int) -> float:
+    """Return the median wall time of `ticks` calls in microseconds."""
+    samples = []
+    for _ in range(ticks):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    samples.sort()
+    return samples[len(samples) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", default="100,1000,5000")
+    parser.add_argument("--ticks", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{'mounts':>8} {'psutil us':>12} {'reparse us':>12} {'cached us':>12}")
+
+    for size in (int(s) for s in args.sizes.split(",")):
+        root = tempfile.mkdtemp(prefix="sysmon-bench-mounts-")
+        try:
+            build_proc_root(root, size)
+            psutil.PROCFS_PATH = root
+
+            table = MountTable(proc_root=root)
+            collector = DiskCollector(mount_table=table)
+            collector.mounts()
+
+            psutil_us = time_ticks(lambda: psutil.disk_partitions(all=False), args.ticks)
+            reparse_us = time_ticks(table.read, args.ticks)
+            cached_us = time_ticks(collector.mounts, args.ticks)
+            print(f"{size:>8} {psutil_us:>12.1f} {reparse_us:>12.1f} {cached_us:>12.1f}")
+
+            collector.close()
+        finally:
+            shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    main()
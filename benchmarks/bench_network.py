@@ -0,0 +1,110 @@
+"""
+Benchmark: per-tick cost of collecting network interface rates.
+
+Builds synthetic procfs/sysfs trees with one physical interface and a
+growing number of veth pairs, as on a busy container host, and times
+psutil.net_io_counters(pernic=True) against NetworkCollector.collect()
+when every interface has new traffic (busy) and when none has (idle).
+The busy column rewrites /proc/net/dev before each timed call.
+
+Usage:
+    python benchmarks/bench_network.py [--sizes 10,100,500,2000] [--ticks 50]
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import psutil
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from sysmon.collectors.network import NetworkCollector  # noqa: E402
+
+HEADER = (
+    "Inter-|   Receive                                                |  Transmit\n"
+    " face |bytes    packets errs drop fifo frame compressed multicast|"
+    "bytes    packets errs drop fifo colls carrier compressed\n"
+)
+
+
+def build_roots(root: str, count: int) -> list:
+    """Create fake procfs and sysfs trees; return the interface names."""
+    names = ["lo", "eth0", "docker0"] + [f"veth{i:07x}" for i in range(count)]
+    os.makedirs(os.path.join(root, "proc", "net"))
+    for name in names:
+        if name != "eth0":
+            os.makedirs(os.path.join(root, "sys", "devices", "virtual", "net", name))
+    return names
+
+
+def write_net_dev(root: str, names: list, tick: int) -> None:
+    """Write /proc/net/dev with every counter advanced by `tick`."""
+    lines = [HEADER]
+    for i, name in enumerate(names):
+        rx = 1_000_000 * i + tick * 1500
+        tx = 500_000 * i + tick * 900
+        lines.append(
+            f"{name:>6}: {rx:>8} {rx // 1000:>7} 0 0 0 0 0 0 "
+            f"{tx:>8} {tx // 1000:>7} 0 0 0 0 0 0\n"
+        )
+    with open(os.path.join(root, "proc", "net", "dev"), "w") as f:
+        f.write("".join(lines))
+
+
+def median(samples: list) -> float:
+    """Median of a list of samples."""
+    samples.sort()
+    return samples[len(samples) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", default="10,100,500,2000")
+    parser.add_argument("--ticks", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{'veths':>8} {'psutil us':>12} {'busy us':>12} {'idle us':>12}")
+
+    for size in (int(s) for s in args.sizes.split(",")):
+        root = tempfile.mkdtemp(prefix="sysmon-bench-network-")
+        try:
+            names = build_roots(root, size)
+            psutil.PROCFS_PATH = os.path.join(root, "proc")
+            collector = NetworkCollector(
+                proc_root=os.path.join(root, "proc"), sys_root=os.path.join(root, "sys")
+            )
+
+            write_net_dev(root, names, 0)
+            collector.collect()
+
+            psutil_samples, busy_samples, idle_samples = [], [], []
+            for tick in range(1, args.ticks + 1):
+                write_net_dev(root, names, tick)
+
+                start = time.perf_counter()
+                psutil.net_io_counters(pernic=True)
+                psutil_samples.append((time.perf_counter() - start) * 1_000_000)
+
+                start = time.perf_counter()
+                collector.collect()
+                busy_samples.append((time.perf_counter() - start) * 1_000_000)
+
+                start = time.perf_counter()
+                collector.collect()
+                idle_samples.append((time.perf_counter() - start) * 1_000_000)
+
+            print(
+                f"{size:>8} {median(psutil_samples):>12.1f} "
+                f"{median(busy_samples):>12.1f} {median(idle_samples):>12.1f}"
+            )
+        finally:
+            shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    main()
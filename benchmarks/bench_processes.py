@@ -0,0 +1,135 @@
+"""
+Benchmark: per-tick cost of the top-process scan.
+
+Builds synthetic /proc trees with 1k, 10k and 50k processes and times
+ProcessScanner.scan() against the previous implementation, which builds a
+ProcessInfo for every PID through psutil.process_iter and sorts the full
+list. psutil is pointed at the same tree through psutil.PROCFS_PATH.
+
+Usage:
+    python benchmarks/bench_processes.py [--sizes 1000,10000,50000] [--ticks 5]
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import psutil
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from sysmon.collectors.processes import ProcessInfo, ProcessScanner  # noqa: E402
+
+
+STAT_TEMPLATE = (
+    "{pid} ({name}) {state} 1 {pid} {pid} 0 -1 4194560 100 0 0 0 "
+    "{utime} {stime} 0 0 20 0 1 0 {start} 10000000 {rss} "
+    "18446744073709551615 1 1 0 0 0 0 0 0 0 0 0 0 17 0 0 0 0 0 0\n"
+)
+
+
+def build_proc_tree(root: str, count: int, rng: random.Random) -> None:
+    """Create a fake procfs with `count` process stat files."""
+    with open(os.path.join(root, "stat"), "w") as f:
+        f.write("cpu  0 0 0 0 0 0 0 0 0 0\nbtime 1700000000\n")
+    with open(os.path.join(root, "meminfo"), "w") as f:
+        f.write(
+            "MemTotal:       65536000 kB\nMemFree:        32768000 kB\n"
+            "MemAvailable:   40000000 kB\nBuffers:        100000 kB\n"
+            "Cached:         4000000 kB\nShmem:          10000 kB\n"
+            "Active:         9000000 kB\nInactive:       6000000 kB\n"
+            "SReclaimable:   200000 kB\n"
+        )
+
+    for pid in range(1, count + 1):
+        os.mkdir(os.path.join(root, str(pid)))
+        with open(os.path.join(root, str(pid), "statm"), "w") as f:
+            f.write("25000 5000 1000 100 0 10000 0\n")
+    advance_proc_tree(root, count, rng)
+
+
+def advance_proc_tree(root: str, count: int, rng: random.Random) -> None:
+    """Rewrite every stat file with new CPU tick counters."""
+    for pid in range(1, count + 1):
+        with open(os.path.join(root, str(pid), "stat"), "w") as f:
+            f.write(
+                STAT_TEMPLATE.format(
+                    pid=pid,
+                    name=f"worker-{pid % 97}",
+                    state=rng.choice("RSSSSI"),
+                    utime=rng.randint(0, 10_000_000),
+                    stime=rng.randint(0, 1_000_000),
+                    start=pid * 10,
+                    rss=rng.randint(100, 100_000),
+                )
+            )
+
+
+def psutil_reference(count: int):
+    """Previous ProcessTable implementation: full list through psutil, then sort."""
+    processes = []
+    for proc in psutil.process_iter(["pid", "name", "cpu_percent", "memory_percent", "status"]):
+        try:
+            info = proc.info
+            processes.append(
+                ProcessInfo(
+                    pid=info["pid"],
+                    name=info["name"] or "Unknown",
+                    cpu_percent=info["cpu_percent"] or 0.0,
+                    memory_percent=info["memory_percent"] or 0.0,
+                    status=info["status"] or "unknown",
+                )
+            )
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            continue
+
+    processes.sort(key=lambda p: p.cpu_percent, reverse=True)
+    return processes[:count]
+
+
+def time_ticks(func, ticks: int) -> float:
+    """Return the median wall time of `ticks` calls in milliseconds."""
+    samples = []
+    for _ in range(ticks):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return samples[len(samples) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", default="1000,10000,50000")
+    parser.add_argument("--ticks", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    print(f"{'processes':>10} {'scanner ms':>12} {'psutil ms':>12}")
+
+    for size in (int(s) for s in args.sizes.split(",")):
+        root = tempfile.mkdtemp(prefix="sysmon-bench-proc-")
+        try:
+            build_proc_tree(root, size, rng)
+            psutil.PROCFS_PATH = root
+
+            # Establish the CPU tick baselines
+            scanner = ProcessScanner(proc_root=root)
+            scanner.scan(5)
+            psutil_reference(5)
+            advance_proc_tree(root, size, rng)
+
+            scanner_ms = time_ticks(lambda: scanner.scan(5), args.ticks)
+            reference_ms = time_ticks(lambda: psutil_reference(5), args.ticks)
+            print(f"{size:>10} {scanner_ms:>12.2f} {reference_ms:>12.2f}")
+        finally:
+            shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""
+Benchmark: per-frame CPU time and allocation of the dashboard render path.
+
+Renders a sequence of synthetic snapshots to an off-screen console, once
+rebuilding the whole Layout tree every frame (the previous behaviour) and
+once reusing the persistent layout, where unchanged panels are neither
+rebuilt nor re-rendered. CPU, memory and load change every frame; disk,
+Docker and processes change every `--slow-every` frames, as they do with
+real collectors.
+
+Usage:
+    python benchmarks/bench_render.py [--frames 200] [--slow-every 5]
+"""
+
+import argparse
+import io
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from rich.console import Console  # noqa: E402
+
+from sysmon.collectors.cpu import CPUMetrics  # noqa: E402
+from sysmon.collectors.disk import DiskMetrics, DiskPartitionMetrics  # noqa: E402
+from sysmon.collectors.docker import ContainerMetrics, DockerMetrics  # noqa: E402
+from sysmon.collectors.load import LoadMetrics  # noqa: E402
+from sysmon.collectors.memory import MemoryMetrics  # noqa: E402
+from sysmon.collectors.processes import ProcessInfo  # noqa: E402
+from sysmon.display.dashboard import Dashboard  # noqa: E402
+from sysmon.snapshot import Snapshot  # noqa: E402
+
+
+def make_slow_metrics(generation: int):
+    """Build the disk, Docker and process metrics for a generation."""
+    disk = DiskMetrics(
+        partitions=[
+            DiskPartitionMetrics(
+                mountpoint=f"/mnt/data{i}",
+                device=f"/dev/sd{chr(97 + i)}1",
+                fstype="ext4",
+                total_bytes=500 << 30,
+                used_bytes=(100 + generation + i) << 30,
+                free_bytes=(400 - generation - i) << 30,
+                percent=(100 + generation + i) / 5,
+            )
+            for i in range(5)
+        ],
+        io=None,
+    )
+    docker = DockerMetrics(
+        available=True,
+        error=None,
+        containers=[
+            ContainerMetrics(
+                container_id=f"{i:012x}",
+                name=f"service-{i}",
+                status="running",
+                image="example/service:latest",
+                cpu_percent=(generation * 7 + i) % 100,
+                memory_used_bytes=(200 + i) << 20,
+                memory_limit_bytes=8 << 30,
+                memory_percent=(200 + i) / 81.92,
+                network_rx_bytes=generation * 1000,
+                network_tx_bytes=generation * 500,
+                block_read_bytes=0,
+                block_write_bytes=0,
+            )
+            for i in range(6)
+        ],
+        total_containers=8,
+        running_containers=6,
+    )
+    processes = tuple(
+        ProcessInfo(
+            pid=1000 + i,
+            name=f"worker-{i}",
+            cpu_percent=(generation * 3 + i) % 100,
+            memory_percent=i * 1.5,
+            status="running",
+        )
+        for i in range(5)
+    )
+    return disk, docker, processes
+
+
+def make_snapshots(frames: int, slow_every: int):
+    """Build a deterministic sequence of snapshots."""
+    snapshots = []
+    history = []
+    slow = make_slow_metrics(0)
+
+    for frame in range(frames):
+        if frame % slow_every == 0:
+            slow = make_slow_metrics(frame // slow_every)
+
+        cpu_percent = (frame * 13) % 100
+        history = (history + [float(cpu_percent)])[-60:]
+        snapshots.append(
+            Snapshot(
+                timestamp=1_700_000_000 + frame * 2,
+                cpu=CPUMetrics(
+                    overall_percent=cpu_percent,
+                    per_core_percent=[(cpu_percent + i) % 100 for i in range(8)],
+                    frequency_current=2400.0,
+                    frequency_max=3600.0,
+                    core_count=4,
+                    thread_count=8,
+                ),
+                memory=MemoryMetrics(
+                    total_bytes=16 << 30,
+                    available_bytes=(8 << 30) - frame,
+                    used_bytes=(8 << 30) + frame,
+                    percent=50 + frame % 10,
+                    swap_total_bytes=2 << 30,
+                    swap_used_bytes=0,
+                    swap_free_bytes=2 << 30,
+                    swap_percent=0.0,
+                ),
+                disk=slow[0],
+                load=LoadMetrics(
+                    load_1min=frame % 8, load_5min=2.0, load_15min=1.0, cpu_count=8
+                ),
+                docker=slow[1],
+                processes=slow[2],
+                cpu_history=tuple(history),
+                memory_history=tuple(history),
+                load_history=tuple(history),
+            )
+        )
+
+    return snapshots
+
+
+def run(dashboard: Dashboard, snapshots, rebuild: bool, trace: bool):
+    """Render all snapshots; return per-frame CPU ms or peak KiB samples."""
+    console = Console(file=io.StringIO(), width=120, height=45, force_terminal=True)
+    samples = []
+
+    dashboard.invalidate_layout()
+    for snapshot in snapshots:
+        if rebuild:
+            dashboard.invalidate_layout()
+
+        if trace:
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+        start = time.process_time()
+
+        console.print(dashboard.create_layout(snapshot))
+
+        if trace:
+            samples.append((tracemalloc.get_traced_memory()[1] - baseline) / 1024)
+        else:
+            samples.append((time.process_time() - start) * 1000)
+
+        console.file.seek(0)
+        console.file.truncate()
+
+    samples.sort()
+    return samples[len(samples) // 2], samples[int(len(samples) * 0.95)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--slow-every", type=int, default=5)
+    args = parser.parse_args()
+
+    snapshots = make_snapshots(args.frames, args.slow_every)
+    dashboard = Dashboard(show_processes=True, show_docker=True)
+
+    try:
+        print(f"{'mode':<12} {'cpu p50 ms':>11} {'cpu p95 ms':>11} {'alloc p50 KiB':>14} {'alloc p95 KiB':>14}")
+        for label, rebuild in (("rebuild", True), ("persistent", False)):
+            cpu_p50, cpu_p95 = run(dashboard, snapshots, rebuild, trace=False)
+            tracemalloc.start()
+            alloc_p50, alloc_p95 = run(dashboard, snapshots, rebuild, trace=True)
+            tracemalloc.stop()
+            print(f"{label:<12} {cpu_p50:>11.2f} {cpu_p95:>11.2f} {alloc_p50:>14.1f} {alloc_p95:>14.1f}")
+    finally:
+        dashboard.close()
+
+
+if __name__ == "__main__":
+    main()
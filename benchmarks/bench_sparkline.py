@@ -0,0 +1,114 @@
+"""
+Benchmark: cost of building and rendering colored sparklines.
+
+Renders a grid of colored history graphs, one per row, to an off-screen
+console three ways: the previous renderer building a Rich markup string
+per graph (one tag per sample, parsed again by Rich when printed),
+SparklineGraph.render_text building Text spans from lookup tables, and the
+same in braille mode with twice the samples in the same width.
+
+Usage:
+    python benchmarks/bench_sparkline.py [--graphs 1,8,32] [--width 20] [--frames 200]
+"""
+
+import argparse
+import io
+import math
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from rich.console import Console  # noqa: E402
+from rich.table import Table  # noqa: E402
+
+from sysmon.display.graphs import SparklineGraph  # noqa: E402
+
+
+def markup_reference(values: list, width: int, min_val: float = 0, max_val: float = 100) -> str:
+    """Previous render_with_color: one markup tag per sample."""
+    blocks = SparklineGraph.BLOCKS
+    values = values[-width:]
+    value_range = max_val - min_val
+    chars = []
+
+    for value in values:
+        if value_range == 0:
+            index = 4
+        else:
+            normalized = max(0.0, min(1.0, (value - min_val) / value_range))
+            index = int(normalized * (len(blocks) - 1))
+
+        if value >= 80:
+            color = "red"
+        elif value >= 60:
+            color = "yellow"
+        else:
+            color = "green"
+        chars.append(f"[{color}]{blocks[index]}[/{color}]")
+
+    return " " * (width - len(values)) + "".join(chars)
+
+
+def series(graph: int, frame: int, points: int) -> list:
+    """Deterministic percentages drifting between idle and busy."""
+    return [
+        50 + 50 * math.sin((frame + i) / 5 + graph) for i in range(points)
+    ]
+
+
+def time_frames(console: Console, frames: int, graphs: int, build) -> float:
+    """Return the median milliseconds to build and render a grid of graphs."""
+    samples = []
+    for frame in range(frames):
+        start = time.perf_counter()
+        table = Table.grid()
+        table.add_column()
+        for graph in range(graphs):
+            table.add_row(build(graph, frame))
+        console.print(table)
+        samples.append((time.perf_counter() - start) * 1000)
+        console.file.seek(0)
+        console.file.truncate()
+    samples.sort()
+    return samples[len(samples) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--graphs", default="1,8,32")
+    parser.add_argument("--width", type=int, default=20)
+    parser.add_argument("--frames", type=int, default=200)
+    args = parser.parse_args()
+
+    width = args.width
+    blocks = SparklineGraph(width=width)
+    braille = SparklineGraph(width=width, braille=True)
+    console = Console(file=io.StringIO(), width=width + 10, force_terminal=True)
+    print(f"{'graphs':>6} {'markup ms':>10} {'lut ms':>8} {'braille ms':>11}")
+
+    for graphs in (int(s) for s in args.graphs.split(",")):
+        markup_ms = time_frames(
+            console,
+            args.frames,
+            graphs,
+            lambda g, f: markup_reference(series(g, f, width), width),
+        )
+        lut_ms = time_frames(
+            console,
+            args.frames,
+            graphs,
+            lambda g, f: blocks.render_text(series(g, f, width)),
+        )
+        braille_ms = time_frames(
+            console,
+            args.frames,
+            graphs,
+            lambda g, f: braille.render_text(series(g, f, braille.samples)),
+        )
+        print(f"{graphs:>6} {markup_ms:>10.3f} {lut_ms:>8.3f} {braille_ms:>11.3f}")
+
+
+if __name__ == "__main__":
+    main()
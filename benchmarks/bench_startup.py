@@ -0,0 +1,146 @@
+"""
+Benchmark: startup time of the sysmon CLI.
+
+Times, in fresh interpreters, importing the dashboard modules, a complete
+`sysmon --once` run, and the time until the live dashboard draws its first
+frame on a pseudo-terminal. Each is measured without Docker, with Docker
+as found through the environment, and with DOCKER_HOST pointing at a
+daemon that accepts connections but never answers (which used to block
+startup until the SDK timed out).
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 5] [--timeout 30]
+"""
+
+import argparse
+import os
+import pty
+import select
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SRC = str(Path(__file__).resolve().parent.parent / "src")
+
+
+def environment(docker_host=None) -> dict:
+    """Environment for a sysmon child process."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = SRC + os.pathsep + env.get("PYTHONPATH", "")
+    if docker_host is not None:
+        env["DOCKER_HOST"] = docker_host
+    return env
+
+
+def time_import(env: dict, timeout: float) -> float:
+    """Seconds to start an interpreter and import the dashboard modules."""
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-c", "import sysmon.monitor"], env=env, check=True, timeout=timeout
+    )
+    return time.perf_counter() - start
+
+
+def time_once(args: list, env: dict, timeout: float) -> float:
+    """Seconds for a complete `sysmon --once` run."""
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-m", "sysmon", "--once", *args],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=True,
+        timeout=timeout,
+    )
+    return time.perf_counter() - start
+
+
+def time_first_frame(args: list, env: dict, timeout: float) -> float:
+    """Seconds until the live dashboard has drawn its first frame."""
+    master, slave = pty.openpty()
+    env = dict(env, COLUMNS="120", LINES="40", TERM="xterm-256color")
+
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "sysmon", *args],
+        env=env,
+        stdin=slave,
+        stdout=slave,
+        stderr=slave,
+        close_fds=True,
+    )
+    os.close(slave)
+
+    output = b""
+    elapsed = float("nan")
+    try:
+        while time.perf_counter() - start < timeout:
+            ready, _, _ = select.select([master], [], [], 0.05)
+            if not ready:
+                continue
+            try:
+                output += os.read(master, 65536)
+            except OSError:
+                break
+            # The process table is the last panel drawn
+            if b"Top Processes" in output:
+                elapsed = time.perf_counter() - start
+                break
+    finally:
+        process.send_signal(signal.SIGINT)
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+        os.close(master)
+
+    return elapsed
+
+
+def median(samples: list) -> float:
+    """Median of a list of samples."""
+    samples = sorted(samples)
+    return samples[len(samples) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="sysmon-bench-startup-") as tmp:
+        # A daemon that accepts connections and never replies
+        path = os.path.join(tmp, "docker.sock")
+        silent = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        silent.bind(path)
+        silent.listen(64)
+
+        cases = [
+            ("--no-docker", ["--no-docker"], environment()),
+            ("docker (environment)", [], environment()),
+            ("docker (silent daemon)", [], environment(f"unix://{path}")),
+        ]
+
+        print(f"{'case':<24} {'import ms':>10} {'--once ms':>10} {'first frame ms':>15}")
+        for name, flags, env in cases:
+            imports, onces, frames = [], [], []
+            for _ in range(args.runs):
+                imports.append(time_import(env, args.timeout) * 1000)
+                onces.append(time_once(flags, env, args.timeout) * 1000)
+                frames.append(time_first_frame(flags, env, args.timeout) * 1000)
+            print(
+                f"{name:<24} {median(imports):>10.0f} {median(onces):>10.0f} "
+                f"{median(frames):>15.0f}"
+            )
+
+        silent.close()
+
+
+if __name__ == "__main__":
+    main()
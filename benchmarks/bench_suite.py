@@ -0,0 +1,293 @@
+"""
+Benchmark suite: per-tick cost of every collector and of dashboard rendering.
+
+Runs each collector and the dashboard against a deterministic fake host
+(see fakehost.py) scaled to a large machine: 256 logical CPUs, 500
+mounts, 200 containers and 50k processes by default. Each case is timed
+for `--ticks` ticks, advancing the fake counters between ticks (untimed),
+and reported as p50/p95 wall time and p50 process CPU time, which also
+counts the collectors' worker threads.
+
+"layout" times Dashboard.create_layout alone on pre-collected snapshots;
+"render" times Dashboard.render (one full collection cycle plus building
+the layout) and writing the frame to an off-screen terminal.
+
+Results can be saved as a baseline (--save) and later runs compared
+against it (--compare); the comparison flags every case whose p50 wall
+time grew by more than --threshold percent and exits with status 1 if
+any did. Baselines are only comparable on the same machine.
+
+Usage:
+    python benchmarks/bench_suite.py [--ticks 20] [--cases cpu,render]
+        [--save | --compare] [--baseline benchmarks/baseline.json]
+"""
+
+import argparse
+import io
+import json
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from rich.console import Console  # noqa: E402
+
+from fakehost import FakeHost, FakeHostSnapshotCollector  # noqa: E402
+from sysmon.display.dashboard import Dashboard  # noqa: E402
+from sysmon.utils.overhead import percentile  # noqa: E402
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+
+# Changes below this many milliseconds are noise, whatever their ratio
+NOISE_MS = 0.05
+
+# Seconds between collection cycles in the "render" case
+RENDER_INTERVAL = 0.1
+
+
+def time_ticks(host: FakeHost, ticks: int, func) -> list:
+    """Call `func` once per tick; return (wall ms, CPU ms) samples."""
+    samples = []
+    for _ in range(ticks):
+        host.advance()
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        func()
+        samples.append(
+            ((time.perf_counter() - wall) * 1000, (time.process_time() - cpu) * 1000)
+        )
+    return samples
+
+
+def bench_collector(host: FakeHost, ticks: int, collector, collect=None) -> list:
+    """Time a collector after one untimed call that sets its baselines."""
+    collect = collect or collector.collect
+    try:
+        collect()
+        return time_ticks(host, ticks, collect)
+    finally:
+        if hasattr(collector, "close"):
+            collector.close()
+
+
+def bench_docker(host: FakeHost, ticks: int, backend: str) -> list:
+    """Time the Docker collector once every running container is reported."""
+    collector = host.docker_collector(backend)
+    deadline = time.monotonic() + 10.0
+    while (
+        len(collector.collect().containers) < host.containers
+        and time.monotonic() < deadline
+    ):
+        time.sleep(0.05)
+    return bench_collector(host, ticks, collector)
+
+
+def new_dashboard(host: FakeHost, collect: bool) -> Dashboard:
+    """Dashboard showing every panel, optionally collecting from the fake host."""
+    dashboard = Dashboard(collect=False)
+    if collect:
+        dashboard.collector = FakeHostSnapshotCollector(
+            host,
+            max_processes=dashboard.process_table.max_processes,
+            interval=RENDER_INTERVAL,
+            history_points=dashboard.panel_renderer.sparkline.width,
+        )
+    return dashboard
+
+
+def off_screen_console() -> Console:
+    """Terminal-sized console writing to memory."""
+    return Console(file=io.StringIO(), width=160, height=60, force_terminal=True)
+
+
+def bench_layout(host: FakeHost, ticks: int) -> list:
+    """Time create_layout on snapshots collected beforehand."""
+    source = new_dashboard(host, collect=True)
+    try:
+        snapshots = []
+        for _ in range(ticks + 1):
+            host.advance()
+            snapshots.append(source.collect_metrics())
+            time.sleep(RENDER_INTERVAL)
+    finally:
+        source.close()
+
+    dashboard = new_dashboard(host, collect=False)
+    console = off_screen_console()
+    # The first frame builds the layout tree
+    console.print(dashboard.create_layout(snapshots[0]))
+
+    samples = []
+    for snapshot in snapshots[1:]:
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        layout = dashboard.create_layout(snapshot)
+        samples.append(
+            ((time.perf_counter() - wall) * 1000, (time.process_time() - cpu) * 1000)
+        )
+        # Rendering marks the panels as drawn, as the live display would
+        console.print(layout)
+        console.file.seek(0)
+        console.file.truncate()
+    return samples
+
+
+def bench_render(host: FakeHost, ticks: int) -> list:
+    """Time Dashboard.render plus writing the frame, one collection per frame."""
+    dashboard = new_dashboard(host, collect=True)
+    console = off_screen_console()
+
+    def render():
+        console.print(dashboard.render())
+        console.file.seek(0)
+        console.file.truncate()
+
+    try:
+        render()
+        samples = []
+        for _ in range(ticks):
+            # Wait out the collection interval so every collector runs
+            time.sleep(RENDER_INTERVAL)
+            samples.extend(time_ticks(host, 1, render))
+        return samples
+    finally:
+        dashboard.close()
+
+
+CASES = {
+    "cpu": lambda host, ticks: bench_collector(host, ticks, host.cpu_collector()),
+    "memory": lambda host, ticks: bench_collector(host, ticks, host.memory_collector()),
+    "load": lambda host, ticks: bench_collector(host, ticks, host.load_collector()),
+    "disk": lambda host, ticks: bench_collector(host, ticks, host.disk_collector()),
+    "disk_devices": lambda host, ticks: bench_collector(
+        host, ticks, host.diskstats_collector()
+    ),
+    "network": lambda host, ticks: bench_collector(host, ticks, host.network_collector()),
+    "processes": lambda host, ticks: bench_collector(host, ticks, host.process_collector()),
+    "docker_api": lambda host, ticks: bench_docker(host, ticks, "api"),
+    "docker_stream": lambda host, ticks: bench_docker(host, ticks, "stream"),
+    "docker_cgroup": lambda host, ticks: bench_docker(host, ticks, "cgroup"),
+    "layout": bench_layout,
+    "render": bench_render,
+}
+
+
+def summarize(samples: list) -> dict:
+    """p50/p95 wall and p50 CPU milliseconds of (wall, CPU) samples."""
+    walls = sorted(wall for wall, _ in samples)
+    cpus = sorted(cpu for _, cpu in samples)
+    return {
+        "wall_p50_ms": round(percentile(walls, 0.50), 4),
+        "wall_p95_ms": round(percentile(walls, 0.95), 4),
+        "cpu_p50_ms": round(percentile(cpus, 0.50), 4),
+    }
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> bool:
+    """Print the change against a baseline; return True if nothing regressed."""
+    if baseline.get("host") != results["host"]:
+        print(
+            f"warning: baseline host {baseline.get('host')} differs from "
+            f"{results['host']}; changes are not comparable",
+            file=sys.stderr,
+        )
+
+    print(
+        f"{'case':<14} {'base p50 ms':>12} {'p50 ms':>10} {'change':>8} "
+        f"{'base cpu ms':>12} {'cpu ms':>10}"
+    )
+    ok = True
+    for name, row in results["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if base is None:
+            print(f"{name:<14} {'-':>12} {row['wall_p50_ms']:>10.3f} {'new':>8}")
+            continue
+
+        before, after = base["wall_p50_ms"], row["wall_p50_ms"]
+        change = (after - before) / before * 100 if before > 0 else 0.0
+        regressed = change > threshold and after - before > NOISE_MS
+        ok = ok and not regressed
+        print(
+            f"{name:<14} {before:>12.3f} {after:>10.3f} {change:>+7.0f}% "
+            f"{base['cpu_p50_ms']:>12.3f} {row['cpu_p50_ms']:>10.3f}"
+            + ("  REGRESSION" if regressed else "")
+        )
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--ticks", type=int, default=20)
+    parser.add_argument("--cases", default=",".join(CASES))
+    parser.add_argument("--cores", type=int, default=256)
+    parser.add_argument("--mounts", type=int, default=500)
+    parser.add_argument("--containers", type=int, default=200)
+    parser.add_argument("--pids", type=int, default=50_000)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--save", action="store_true", help="Write the results as the baseline")
+    mode.add_argument("--compare", action="store_true", help="Compare with the baseline")
+    parser.add_argument(
+        "--threshold", type=float, default=25.0, help="Regression threshold in percent"
+    )
+    args = parser.parse_args()
+
+    names = args.cases.split(",")
+    unknown = [name for name in names if name not in CASES]
+    if unknown:
+        parser.error(f"unknown cases: {', '.join(unknown)} (choose from {', '.join(CASES)})")
+
+    results = {
+        "host": {
+            "cores": args.cores,
+            "mounts": args.mounts,
+            "containers": args.containers,
+            "pids": args.pids,
+            "ticks": args.ticks,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+        },
+        "results": {},
+    }
+
+    root = tempfile.mkdtemp(prefix="sysmon-bench-suite-")
+    host = FakeHost(
+        root,
+        cores=args.cores,
+        mounts=args.mounts,
+        containers=args.containers,
+        pids=args.pids,
+    )
+    try:
+        host.build()
+        host.install()
+
+        if not args.compare:
+            print(f"{'case':<14} {'p50 ms':>10} {'p95 ms':>10} {'cpu p50 ms':>11}")
+        for name in names:
+            row = summarize(CASES[name](host, args.ticks))
+            results["results"][name] = row
+            if not args.compare:
+                print(
+                    f"{name:<14} {row['wall_p50_ms']:>10.3f} {row['wall_p95_ms']:>10.3f} "
+                    f"{row['cpu_p50_ms']:>11.3f}"
+                )
+    finally:
+        host.uninstall()
+        shutil.rmtree(root)
+
+    if args.save:
+        args.baseline.write_text(json.dumps(results, indent=2) + "\n")
+        print(f"baseline written to {args.baseline}")
+    elif args.compare:
+        baseline = json.loads(args.baseline.read_text())
+        if not compare(results, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,503 @@
+"""
+Deterministic fake host for the benchmarks.
+
+Builds procfs, sysfs and cgroupfs trees on disk for the collectors that
+read files, replaces the psutil calls that bypass procfs (CPU counts and
+frequency, load average, system-wide disk I/O, filesystem usage) with
+fixed values, and installs a fake `docker` module whose client serves a
+fixed set of containers. Every counter advances by the same amount on
+each tick, so two runs see exactly the same data.
+"""
+
+import os
+import sys
+import threading
+import types
+from collections import namedtuple
+
+import psutil
+
+from sysmon.collectors.cpu import CPUCollector
+from sysmon.collectors.disk import DiskCollector
+from sysmon.collectors.diskstats import DiskStatsCollector
+from sysmon.collectors.docker import DockerCollector
+from sysmon.collectors.load import LoadCollector
+from sysmon.collectors.memory import MemoryCollector
+from sysmon.collectors.mounts import MountTable
+from sysmon.collectors.network import NetworkCollector
+from sysmon.collectors.probe import UsageProber
+from sysmon.collectors.processes import ProcessCollector, ProcessScanner
+from sysmon.snapshot import SnapshotCollector
+
+DiskUsage = namedtuple("DiskUsage", "total used free percent")
+DiskIO = namedtuple("DiskIO", "read_count write_count read_bytes write_bytes")
+CPUFreq = namedtuple("CPUFreq", "current min max")
+
+FILESYSTEMS = "nodev\tsysfs\nnodev\tproc\nnodev\ttmpfs\nnodev\toverlay\n\text4\n\txfs\n"
+
+NET_DEV_HEADER = (
+    "Inter-|   Receive                                                |  Transmit\n"
+    " face |bytes    packets errs drop fifo frame compressed multicast|"
+    "bytes    packets errs drop fifo colls carrier compressed\n"
+)
+
+PID_STAT = (
+    "{pid} (worker-{name}) {state} 1 {pid} {pid} 0 -1 4194560 100 0 0 0 "
+    "{utime} {stime} 0 0 20 0 1 0 {start} 10000000 {rss} "
+    "18446744073709551615 1 1 0 0 0 0 0 0 0 0 0 0 17 0 0 0 0 0 0\n"
+)
+
+# Seconds between samples of a container's fake stats stream
+STATS_STREAM_INTERVAL = 1.0
+
+
+class FakeHost:
+    """
+    A large host simulated on disk and through patched psutil calls.
+
+    Call build() once, install() before creating collectors, advance()
+    between ticks and uninstall() when done. The *_collector() methods
+    create collectors that read the fake host.
+    """
+
+    def __init__(
+        self,
+        root: str,
+        cores: int = 256,
+        mounts: int = 500,
+        containers: int = 200,
+        pids: int = 50_000,
+        disks: int = 16,
+    ):
+        """
+        Initialize the fake host.
+
+        Args:
+            root: Empty directory the trees are created in
+            cores: Number of logical CPUs
+            mounts: Number of physical filesystems mounted
+            containers: Number of running containers (plus 10% stopped ones)
+            pids: Number of processes
+            disks: Number of whole disks the mounts are spread over
+        """
+        self.cores = cores
+        self.mounts = mounts
+        self.containers = containers
+        self.pids = pids
+        self.disks = disks
+        self.tick = 0
+
+        self.proc_root = os.path.join(root, "proc")
+        self.sys_root = os.path.join(root, "sys")
+        self.cgroup_root = os.path.join(root, "cgroup")
+
+        self.container_ids = [f"{i + 1:064x}" for i in range(containers)]
+        self.stopped_ids = [f"{containers + i + 1:064x}" for i in range(containers // 10)]
+        self.interfaces = ["lo", "eth0", "eth1", "docker0"] + [
+            f"veth{i:07x}" for i in range(containers)
+        ]
+        self.devices = [f"nvme{d}n1" for d in range(disks)] + [
+            self.partition(i) for i in range(mounts)
+        ]
+
+        self._patched = {}
+        self._docker_module = None
+        self._stopped = threading.Event()
+
+    def partition(self, index: int) -> str:
+        """Name of the partition holding mount number `index`."""
+        return f"nvme{index % self.disks}n1p{index // self.disks + 1}"
+
+    def build(self) -> None:
+        """Create the procfs, sysfs and cgroupfs trees."""
+        os.makedirs(os.path.join(self.proc_root, "self"))
+        os.makedirs(os.path.join(self.proc_root, "net"))
+        os.makedirs(self.cgroup_root)
+
+        _write(os.path.join(self.proc_root, "filesystems"), FILESYSTEMS)
+        _write(os.path.join(self.proc_root, "meminfo"), self._meminfo())
+        _write(os.path.join(self.proc_root, "vmstat"), "pswpin 1200\npswpout 3400\n")
+        _write(os.path.join(self.proc_root, "self", "mountinfo"), self._mountinfo())
+
+        for d in range(self.disks):
+            os.makedirs(os.path.join(self.sys_root, "block", f"nvme{d}n1"))
+        for name in self.devices:
+            os.makedirs(os.path.join(self.sys_root, "class", "block", name))
+        for name in self.interfaces:
+            if not name.startswith("eth"):
+                os.makedirs(os.path.join(self.sys_root, "devices", "virtual", "net", name))
+
+        for pid in range(1, self.pids + 1):
+            os.mkdir(os.path.join(self.proc_root, str(pid)))
+            self._write_pid(pid)
+
+        _write(os.path.join(self.cgroup_root, "cgroup.controllers"), "cpu io memory pids\n")
+        for i, container_id in enumerate(self.container_ids):
+            path = self._cgroup_path(container_id)
+            os.makedirs(path)
+            _write(os.path.join(path, "memory.max"), "max\n" if i % 2 else f"{4 << 30}\n")
+            _write(os.path.join(path, "cgroup.procs"), "")
+
+        self._write_counters()
+
+    def advance(self) -> None:
+        """Advance every counter by one tick."""
+        self.tick += 1
+        self._write_counters()
+        # One process in a hundred is busy
+        for pid in range(100, self.pids + 1, 100):
+            self._write_pid(pid)
+
+    def install(self) -> None:
+        """Point psutil and the Docker SDK at the fake host."""
+        replacements = {
+            "PROCFS_PATH": self.proc_root,
+            "cpu_count": self.cpu_count,
+            "cpu_freq": self.cpu_freq,
+            "getloadavg": self.getloadavg,
+            "disk_io_counters": self.disk_io_counters,
+        }
+        for name, value in replacements.items():
+            self._patched[name] = getattr(psutil, name)
+            setattr(psutil, name, value)
+
+        # DockerCollector imports the SDK when it connects
+        self._docker_module = sys.modules.get("docker")
+        module = types.ModuleType("docker")
+        module.from_env = lambda: FakeDockerClient(self)
+        sys.modules["docker"] = module
+
+    def uninstall(self) -> None:
+        """Restore psutil and the Docker SDK and end the fake streams."""
+        self._stopped.set()
+        for name, value in self._patched.items():
+            setattr(psutil, name, value)
+        self._patched.clear()
+
+        if self._docker_module is not None:
+            sys.modules["docker"] = self._docker_module
+        else:
+            sys.modules.pop("docker", None)
+
+    # psutil replacements
+
+    def cpu_count(self, logical: bool = True) -> int:
+        """Logical CPUs, or half as many physical cores."""
+        return self.cores if logical else self.cores // 2
+
+    def cpu_freq(self, percpu: bool = False) -> CPUFreq:
+        """Fixed CPU frequency in MHz."""
+        return CPUFreq(current=2450.0, min=1500.0, max=3700.0)
+
+    def getloadavg(self):
+        """Load average of a host running at roughly 40% of its CPUs."""
+        base = self.cores * 0.4
+        return (base + self.tick % 7, base, base - 3.0)
+
+    def disk_io_counters(self, perdisk: bool = False, nowrap: bool = True) -> DiskIO:
+        """System-wide disk I/O counters."""
+        return DiskIO(
+            read_count=self.tick * 4000,
+            write_count=self.tick * 9000,
+            read_bytes=self.tick * (400 << 20),
+            write_bytes=self.tick * (900 << 20),
+        )
+
+    def disk_usage(self, path: str) -> DiskUsage:
+        """Usage of a fake mount, from 5% to 94% full."""
+        index = int(path.rsplit("vol", 1)[1]) if "/srv/vol" in path else 0
+        total = 4 << 40
+        percent = float(index * 37 % 90 + 5)
+        used = int(total * percent / 100)
+        return DiskUsage(total=total, used=used, free=total - used, percent=percent)
+
+    # Collectors reading the fake host
+
+    def cpu_collector(self) -> CPUCollector:
+        """CPU collector (psutil on the fake procfs)."""
+        return CPUCollector()
+
+    def memory_collector(self) -> MemoryCollector:
+        """Memory collector (psutil on the fake procfs)."""
+        return MemoryCollector()
+
+    def load_collector(self) -> LoadCollector:
+        """Load collector."""
+        return LoadCollector()
+
+    def disk_collector(self) -> DiskCollector:
+        """Disk collector reading the fake mount table."""
+        return DiskCollector(
+            mount_table=MountTable(proc_root=self.proc_root, sys_root=self.sys_root),
+            prober=UsageProber(probe=self.disk_usage),
+        )
+
+    def diskstats_collector(self) -> DiskStatsCollector:
+        """Per-device disk I/O collector."""
+        return DiskStatsCollector(proc_root=self.proc_root, sys_root=self.sys_root)
+
+    def network_collector(self) -> NetworkCollector:
+        """Network interface collector."""
+        return NetworkCollector(proc_root=self.proc_root, sys_root=self.sys_root)
+
+    def process_collector(self, max_processes: int = 5) -> ProcessCollector:
+        """Process collector scanning the fake procfs."""
+        collector = ProcessCollector(max_processes=max_processes)
+        collector.scanner = ProcessScanner(proc_root=self.proc_root)
+        return collector
+
+    def docker_collector(self, backend: str = "stream") -> DockerCollector:
+        """Docker collector connected to the fake daemon."""
+        collector = DockerCollector(
+            backend=backend, cgroup_root=self.cgroup_root, proc_root=self.proc_root
+        )
+        collector.wait_connected(timeout=5.0)
+        return collector
+
+    # Fake Docker daemon
+
+    def container_listing(self) -> list:
+        """Response of GET /containers/json?all=1."""
+        listing = []
+        for i, container_id in enumerate(self.container_ids + self.stopped_ids):
+            listing.append(
+                {
+                    "Id": container_id,
+                    "Names": [f"/service-{i:03d}"],
+                    "Image": f"registry.example.com/team/service-{i % 20}:1.{i % 7}",
+                    "State": "running" if i < self.containers else "exited",
+                }
+            )
+        return listing
+
+    def container_stats(self, container_id: str) -> dict:
+        """Response of GET /containers/{id}/stats at the current tick."""
+        i = int(container_id, 16) - 1
+        tick = self.tick + 1
+        usage = 200_000_000 * (1 + i % 8)
+        system = self.cores * 1_000_000_000
+        return {
+            "cpu_stats": {
+                "cpu_usage": {"total_usage": tick * usage},
+                "system_cpu_usage": tick * system,
+                "online_cpus": self.cores,
+                "throttling_data": {"throttled_periods": i, "throttled_time": i * 1000},
+            },
+            "precpu_stats": {
+                "cpu_usage": {"total_usage": (tick - 1) * usage},
+                "system_cpu_usage": (tick - 1) * system,
+            },
+            "memory_stats": {
+                "usage": (256 + i * 8) << 20,
+                "limit": 4 << 30,
+                "stats": {"cache": 32 << 20},
+            },
+            "networks": {
+                "eth0": {"rx_bytes": tick * (i + 1) * 40_000, "tx_bytes": tick * (i + 1) * 9_000}
+            },
+            "blkio_stats": {
+                "io_service_bytes_recursive": [
+                    {"major": 259, "minor": 0, "op": "read", "value": tick * i * 4096},
+                    {"major": 259, "minor": 0, "op": "write", "value": tick * i * 16384},
+                ]
+            },
+        }
+
+    # File contents
+
+    def _meminfo(self) -> str:
+        """A 1 TiB host with half of its memory available."""
+        total = 1 << 30  # kB
+        return (
+            f"MemTotal:       {total} kB\n"
+            f"MemFree:        {total // 4} kB\n"
+            f"MemAvailable:   {total // 2} kB\n"
+            f"Buffers:        {total // 64} kB\n"
+            f"Cached:         {total // 8} kB\n"
+            f"SwapCached:     0 kB\n"
+            f"Active:         {total // 3} kB\n"
+            f"Inactive:       {total // 6} kB\n"
+            f"Shmem:          {total // 128} kB\n"
+            f"Slab:           {total // 64} kB\n"
+            f"SReclaimable:   {total // 128} kB\n"
+            f"SwapTotal:      {64 << 20} kB\n"
+            f"SwapFree:       {48 << 20} kB\n"
+        )
+
+    def _mountinfo(self) -> str:
+        """Root filesystem plus the data volumes."""
+        lines = [
+            "21 1 259:1 / / rw,relatime shared:1 - ext4 /dev/nvme0n1p0 rw",
+            "22 21 0:20 / /proc rw,nosuid shared:2 - proc proc rw",
+            "23 21 0:21 / /sys rw,nosuid shared:3 - sysfs sysfs rw",
+        ]
+        for i in range(self.mounts):
+            lines.append(
+                f"{100 + i} 21 259:{i + 2} / /srv/vol{i:03d} rw,relatime shared:{100 + i} "
+                f"- xfs /dev/{self.partition(i)} rw,attr2,inode64"
+            )
+        return "\n".join(lines) + "\n"
+
+    def _write_counters(self) -> None:
+        """Rewrite the tick-dependent procfs and cgroupfs files."""
+        tick = self.tick
+        proc = self.proc_root
+
+        # /proc/stat: core i is (i * 7 + tick * 13) % 100 percent busy
+        lines = []
+        total_busy = 0
+        for i in range(self.cores):
+            busy = sum((i * 7 + t * 13) % 100 for t in range(tick + 1))
+            total_busy += busy
+            lines.append(f"cpu{i} {busy} 0 0 {100 * (tick + 1) - busy} 0 0 0 0 0 0\n")
+        idle = 100 * (tick + 1) * self.cores - total_busy
+        _write(
+            os.path.join(proc, "stat"),
+            f"cpu  {total_busy} 0 0 {idle} 0 0 0 0 0 0\n"
+            + "".join(lines)
+            + "ctxt 123456\nbtime 1700000000\nprocesses 60000\n"
+            "procs_running 3\nprocs_blocked 0\n",
+        )
+
+        lines = []
+        for index, name in enumerate(self.devices):
+            rate = index % 17 + 1
+            lines.append(
+                f" 259 {index:>6} {name} {tick * rate * 30} 0 {tick * rate * 2400} "
+                f"{tick * rate * 9} {tick * rate * 80} 0 {tick * rate * 9000} "
+                f"{tick * rate * 40} 0 {tick * rate * 3} {tick * rate * 45} "
+                f"0 0 0 0 0 0\n"
+            )
+        _write(os.path.join(proc, "diskstats"), "".join(lines))
+
+        lines = [NET_DEV_HEADER]
+        for index, name in enumerate(self.interfaces):
+            rx = tick * (index + 1) * 150_000
+            tx = tick * (index + 1) * 90_000
+            lines.append(
+                f"{name:>6}: {rx} {rx // 1000} 0 0 0 0 0 0 {tx} {tx // 1000} 0 0 0 0 0 0\n"
+            )
+        _write(os.path.join(proc, "net", "dev"), "".join(lines))
+
+        for i, container_id in enumerate(self.container_ids):
+            path = self._cgroup_path(container_id)
+            _write(
+                os.path.join(path, "cpu.stat"),
+                f"usage_usec {tick * 200_000 * (1 + i % 8)}\nuser_usec 0\nsystem_usec 0\n"
+                f"nr_periods {tick * 10}\nnr_throttled {i}\nthrottled_usec {i * 1000}\n",
+            )
+            _write(
+                os.path.join(path, "memory.stat"),
+                f"anon {(224 + i * 8) << 20}\nfile {32 << 20}\ninactive_file {16 << 20}\n",
+            )
+            _write(os.path.join(path, "memory.current"), f"{(256 + i * 8) << 20}\n")
+            _write(
+                os.path.join(path, "io.stat"),
+                f"259:0 rbytes={tick * i * 4096} wbytes={tick * i * 16384} "
+                f"rios={tick * i} wios={tick * i * 4} dbytes=0 dios=0\n",
+            )
+
+    def _write_pid(self, pid: int) -> None:
+        """Write the stat file of a process at the current tick."""
+        busy = pid % 100 == 0
+        _write(
+            os.path.join(self.proc_root, str(pid), "stat"),
+            PID_STAT.format(
+                pid=pid,
+                name=pid % 97,
+                state="R" if busy else "S",
+                utime=1000 + (self.tick * (pid // 100 % 50) if busy else 0),
+                stime=pid % 1000,
+                start=pid * 10,
+                rss=pid % 5000 + 100,
+            ),
+        )
+
+    def _cgroup_path(self, container_id: str) -> str:
+        """cgroup directory of a container (systemd driver layout)."""
+        return os.path.join(self.cgroup_root, "system.slice", f"docker-{container_id}.scope")
+
+
+class FakeEventStream:
+    """Docker events stream that stays open without events until closed."""
+
+    def __init__(self, stopped: threading.Event):
+        self._closed = threading.Event()
+        self._stopped = stopped
+
+    def __iter__(self):
+        while not self._closed.wait(0.1) and not self._stopped.is_set():
+            pass
+        yield from ()
+
+    def close(self) -> None:
+        self._closed.set()
+
+
+class FakeDockerAPI:
+    """The parts of docker.APIClient used by DockerCollector."""
+
+    def __init__(self, host: FakeHost):
+        self.host = host
+
+    def containers(self, all: bool = False) -> list:
+        listing = self.host.container_listing()
+        return listing if all else [c for c in listing if c["State"] == "running"]
+
+    def events(self, since=None, decode: bool = False, filters=None) -> FakeEventStream:
+        return FakeEventStream(self.host._stopped)
+
+    def stats(self, container_id: str, stream: bool = True, decode: bool = False):
+        if not stream:
+            return self.host.container_stats(container_id)
+        return self._stream(container_id)
+
+    def _stream(self, container_id: str):
+        stopped = self.host._stopped
+        while not stopped.is_set():
+            yield self.host.container_stats(container_id)
+            stopped.wait(STATS_STREAM_INTERVAL)
+
+
+class FakeDockerClient:
+    """The parts of docker.DockerClient used by DockerCollector."""
+
+    def __init__(self, host: FakeHost):
+        self.api = FakeDockerAPI(host)
+
+    def ping(self) -> bool:
+        return True
+
+    def close(self) -> None:
+        pass
+
+
+class FakeHostSnapshotCollector(SnapshotCollector):
+    """SnapshotCollector whose collectors all read a fake host."""
+
+    def __init__(self, host: FakeHost, **kwargs):
+        self.host = host
+        super().__init__(**kwargs)
+
+    def _register_collectors(self) -> None:
+        # Swap out the collectors created for the real host before they
+        # are registered with the engine
+        self.disk_collector.close()
+        self.disk_collector = self.host.disk_collector()
+        self.diskstats_collector = self.host.diskstats_collector()
+        self.network_collector = self.host.network_collector()
+        self.process_collector = self.host.process_collector(
+            self.process_collector.max_processes
+        )
+        self.docker_collector = DockerCollector(
+            backend=self.docker_collector.backend,
+            cgroup_root=self.host.cgroup_root,
+            proc_root=self.host.proc_root,
+        )
+        super()._register_collectors()
+
+
+def _write(path: str, text: str) -> None:
+    """Replace a file's contents."""
+    with open(path, "w") as f:
+        f.write(text)
@@ -4,49 +4,125 @@ CLI entry point for the system monitor.
 
 import argparse
 import sys
+from typing import Dict, List
 
 from . import __version__
-from .monitor import Monitor
 
 
-def parse_args():
-    """Parse command line arguments."""
-    parser = argparse.ArgumentParser(
-        prog="sysmon",
-        description="A modern CLI tool for real-time Linux system performance monitoring",
-        epilog="Press Ctrl+C to exit the monitor.",
+def add_collection_arguments(parser, defaults: bool = True):
+    """
+    Add the options controlling what is collected and how often.
+
+    Args:
+        parser: Parser to add the options to
+        defaults: Whether the options set defaults; subcommand parsers
+            repeat the options without defaults so that values given
+            before the subcommand are kept
+    """
+    parser.add_argument(
+        "-r", "--refresh",
+        type=float,
+        default=2.0 if defaults else argparse.SUPPRESS,
+        metavar="SECONDS",
+        help="Refresh interval in seconds (default: 2.0)",
     )
 
     parser.add_argument(
-        "-v", "--version",
-        action="version",
-        version=f"%(prog)s {__version__}",
+        "--interval",
+        action="append",
+        default=[] if defaults else argparse.SUPPRESS,
+        metavar="NAME=SECONDS",
+        help="Sampling interval of one collector (cpu, memory, load, disk, "
+        "disk_io, disk_devices, network, docker, processes); may be repeated "
+        "(default: the refresh interval)",
     )
 
     parser.add_argument(
-        "-r", "--refresh",
+        "--history",
         type=float,
-        default=2.0,
+        default=None if defaults else argparse.SUPPRESS,
         metavar="SECONDS",
-        help="Refresh interval in seconds (default: 2.0)",
+        help="Time span shown in the history graphs, up to one day "
+        "(default: 20 refreshes, 40 with --braille)",
+    )
+
+    parser.add_argument(
+        "--core-history",
+        type=int,
+        default=0 if defaults else argparse.SUPPRESS,
+        metavar="SAMPLES",
+        help="Show the last SAMPLES values of each CPU core in the CPU heatmap, "
+        "up to 60 (default: 0, the current usage only)",
     )
 
     parser.add_argument(
         "--no-processes",
         action="store_true",
+        default=False if defaults else argparse.SUPPRESS,
         help="Hide the process list",
     )
 
     parser.add_argument(
         "--no-docker",
         action="store_true",
+        default=False if defaults else argparse.SUPPRESS,
         help="Hide Docker container metrics",
     )
 
+    parser.add_argument(
+        "--no-disk-io",
+        action="store_true",
+        default=False if defaults else argparse.SUPPRESS,
+        help="Hide per-device disk I/O",
+    )
+
+    parser.add_argument(
+        "--no-network",
+        action="store_true",
+        default=False if defaults else argparse.SUPPRESS,
+        help="Hide network interface rates",
+    )
+
     parser.add_argument(
         "--docker-only",
         action="store_true",
-        help="Show only Docker metrics (hide processes)",
+        default=False if defaults else argparse.SUPPRESS,
+        help="Show only Docker metrics (hide processes, disk I/O and network)",
+    )
+
+    parser.add_argument(
+        "--docker-backend",
+        choices=["api", "stream", "cgroup", "socket"],
+        default="api" if defaults else argparse.SUPPRESS,
+        help="How to read container stats: one request per container per "
+        "refresh, persistent streams (a thread per running container), "
+        "cgroup v2 files, or concurrent requests over the daemon's unix "
+        "socket without the Docker SDK (default: api)",
+    )
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="sysmon",
+        description="A modern CLI tool for real-time Linux system performance monitoring",
+        epilog="Press Ctrl+C to exit the monitor.",
+    )
+
+    parser.add_argument(
+        "-v", "--version",
+        action="version",
+        version=f"%(prog)s {__version__}",
+    )
+
+    add_collection_arguments(parser)
+
+    parser.add_argument(
+        "--docker-sort",
+        choices=["cpu", "memory", "net", "io"],
+        default=None,
+        help="Order of the container list: CPU, memory, network or block I/O "
+        "rate, busiest first (default: cpu)",
     )
 
     parser.add_argument(
@@ -55,7 +131,327 @@ def parse_args():
         help="Display metrics once and exit (no live updates)",
     )
 
-    return parser.parse_args()
+    parser.add_argument(
+        "--braille",
+        action="store_true",
+        help="Draw history graphs with braille dots, showing twice as many "
+        "samples in the same width",
+    )
+
+    parser.add_argument(
+        "--runtime",
+        choices=["threads", "asyncio"],
+        default=None,
+        help="How the dashboard runs: collection on a background thread "
+        "with a redraw per collection, or each collector as a task on one "
+        "event loop with the display redrawn on its own timer (default: threads)",
+    )
+
+    parser.add_argument(
+        "--overhead",
+        action="store_true",
+        help="Show sysmon's own collection, layout and drawing times and "
+        "memory use in a footer",
+    )
+
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print p50/p95/max of sysmon's own per-collector, layout and "
+        "drawing times and memory use on exit",
+    )
+
+    # Output modes other than the dashboard
+    modes = parser.add_mutually_exclusive_group()
+
+    modes.add_argument(
+        "--json",
+        action="store_true",
+        help="Write one JSON snapshot per line to stdout instead of "
+        "showing the dashboard",
+    )
+
+    parser.add_argument(
+        "--json-flush",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Flush JSON output after every N snapshots, 0 to flush only "
+        "when the buffer fills (default: 1)",
+    )
+
+    modes.add_argument(
+        "--exporter",
+        action="store_true",
+        help="Serve metrics in Prometheus format over HTTP instead of "
+        "showing the dashboard",
+    )
+
+    parser.add_argument(
+        "--listen",
+        default=None,
+        metavar="HOST:PORT",
+        help="Address the exporter listens on (default: 127.0.0.1:9877)",
+    )
+
+    subparsers = parser.add_subparsers(dest="command", metavar="COMMAND")
+
+    record = subparsers.add_parser(
+        "record",
+        help="Record snapshots to a file without a display",
+        description="Collect metrics without a display and append every "
+        "snapshot to a recording file.",
+    )
+    record.add_argument("file", metavar="FILE", help="Recording file")
+    record.add_argument(
+        "--duration",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Stop after this many seconds (default: until Ctrl+C)",
+    )
+    add_collection_arguments(record, defaults=False)
+
+    replay = subparsers.add_parser(
+        "replay",
+        help="Replay a recording in the dashboard",
+        description="Play a recording back through the dashboard.",
+    )
+    replay.add_argument("file", metavar="FILE", help="Recording file")
+    replay.add_argument(
+        "--start",
+        type=float,
+        default=0.0,
+        metavar="SECONDS",
+        help="Seek this far into the recording before playing (default: 0)",
+    )
+    replay.add_argument(
+        "--speed",
+        type=float,
+        default=1.0,
+        metavar="FACTOR",
+        help="Playback speed, 0 for as fast as possible (default: 1.0)",
+    )
+
+    args = parser.parse_args()
+
+    # The exporter serves until stopped, and the commands pick their own
+    # output, so these would otherwise be silently ignored
+    if args.exporter and args.once:
+        parser.error("argument --once: not allowed with argument --exporter")
+    if args.command is not None:
+        for flag in ("once", "json", "exporter"):
+            if getattr(args, flag):
+                parser.error(f"argument --{flag}: not allowed with command {args.command}")
+
+    # Options of the live dashboard only
+    if args.command is not None:
+        mode = f"command {args.command}"
+    elif args.json:
+        mode = "argument --json"
+    elif args.exporter:
+        mode = "argument --exporter"
+    else:
+        mode = None
+    if mode is not None:
+        for flag in ("braille", "overhead", "profile", "runtime", "docker_sort"):
+            if getattr(args, flag):
+                option = flag.replace("_", "-")
+                parser.error(f"argument --{option}: not allowed with {mode}")
+
+    # Options of one output mode only
+    for flag, owner, default in (
+        ("json_flush", "json", 1),
+        ("listen", "exporter", "127.0.0.1:9877"),
+    ):
+        if getattr(args, flag) is None:
+            setattr(args, flag, default)
+        elif not getattr(args, owner):
+            option = flag.replace("_", "-")
+            parser.error(
+                f"argument --{option}: not allowed with {mode}"
+                if mode is not None
+                else f"argument --{option}: not allowed without argument --{owner}"
+            )
+
+    return args
+
+
+COLLECTOR_NAMES = (
+    "cpu", "memory", "load", "disk", "disk_io", "disk_devices", "network", "docker",
+    "processes",
+)
+
+
+def parse_intervals(values: List[str]) -> Dict[str, float]:
+    """
+    Parse --interval NAME=SECONDS options.
+
+    Args:
+        values: Option values as given on the command line
+
+    Returns:
+        Dictionary mapping collector names to intervals in seconds
+    """
+    intervals = {}
+    for value in values:
+        name, _, seconds = value.partition("=")
+        if name not in COLLECTOR_NAMES:
+            print(
+                f"Error: Unknown collector '{name}' (choose from {', '.join(COLLECTOR_NAMES)})",
+                file=sys.stderr,
+            )
+            sys.exit(1)
+        try:
+            intervals[name] = float(seconds)
+        except ValueError:
+            print(f"Error: Invalid interval: {value}", file=sys.stderr)
+            sys.exit(1)
+        if not 0.5 <= intervals[name] <= 3600:
+            print("Error: Collector intervals must be between 0.5 and 3600 seconds", file=sys.stderr)
+            sys.exit(1)
+    return intervals
+
+
+def run_record(
+    args,
+    show_processes: bool,
+    show_docker: bool,
+    show_disk_io: bool,
+    show_network: bool,
+    docker_backend: str,
+    intervals: Dict[str, float],
+):
+    """Record snapshots to a file until interrupted."""
+    from .recording import Recorder
+    from .snapshot import SnapshotCollector
+
+    if args.duration is not None and args.duration <= 0:
+        print("Error: Duration must be positive", file=sys.stderr)
+        sys.exit(1)
+
+    collector = SnapshotCollector(
+        show_processes=show_processes,
+        show_docker=show_docker,
+        show_disk_io=show_disk_io,
+        show_network=show_network,
+        docker_backend=docker_backend,
+        interval=args.refresh,
+        intervals=intervals,
+        history_span=args.history,
+        core_history_points=args.core_history,
+    )
+    recorder = Recorder(args.file, collector, interval=collector.tick_interval)
+
+    print(
+        f"Recording to {args.file} every {collector.tick_interval}s (Ctrl+C to stop)",
+        file=sys.stderr,
+    )
+    try:
+        recorder.run(duration=args.duration)
+    except OSError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    print(f"Recorded {recorder.records} snapshots", file=sys.stderr)
+
+
+def run_json(
+    args,
+    show_processes: bool,
+    show_docker: bool,
+    show_disk_io: bool,
+    show_network: bool,
+    docker_backend: str,
+    intervals: Dict[str, float],
+):
+    """Write snapshots as JSON lines to stdout until interrupted."""
+    from .jsonlines import JsonLinesStreamer, JsonLinesWriter
+    from .snapshot import SnapshotCollector
+
+    if args.json_flush < 0:
+        print("Error: --json-flush must not be negative", file=sys.stderr)
+        sys.exit(1)
+
+    collector = SnapshotCollector(
+        show_processes=show_processes,
+        show_docker=show_docker,
+        show_disk_io=show_disk_io,
+        show_network=show_network,
+        docker_backend=docker_backend,
+        interval=args.refresh,
+        intervals=intervals,
+        core_history_points=args.core_history,
+    )
+    if args.once:
+        # A single snapshot cannot wait for Docker to show up later
+        collector.wait_for_docker(2.0)
+
+    streamer = JsonLinesStreamer(
+        collector,
+        JsonLinesWriter(flush_every=args.json_flush),
+        interval=collector.tick_interval,
+    )
+    streamer.run(count=1 if args.once else None)
+
+
+def run_exporter(
+    args,
+    show_docker: bool,
+    show_disk_io: bool,
+    show_network: bool,
+    docker_backend: str,
+    intervals: Dict[str, float],
+):
+    """Serve metrics in Prometheus format until interrupted."""
+    from .exporter import MetricsExporter
+    from .snapshot import SnapshotCollector
+
+    host, _, port = args.listen.rpartition(":")
+    if not port.isdigit() or not 0 < int(port) < 65536:
+        print(f"Error: Invalid listen address: {args.listen}", file=sys.stderr)
+        sys.exit(1)
+
+    # Processes are not exported, so the /proc scan is skipped
+    collector = SnapshotCollector(
+        show_processes=False,
+        show_docker=show_docker,
+        show_disk_io=show_disk_io,
+        show_network=show_network,
+        docker_backend=docker_backend,
+        interval=args.refresh,
+        intervals=intervals,
+    )
+    exporter = MetricsExporter(
+        collector,
+        interval=collector.tick_interval,
+        host=host.strip("[]") or "0.0.0.0",
+        port=int(port),
+    )
+
+    try:
+        exporter.run()
+    except OSError as e:
+        collector.close()
+        print(f"Error: Cannot listen on {args.listen}: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+def run_replay(args):
+    """Replay a recording in the dashboard."""
+    from .recording import RecordingError
+    from .replay import Replayer
+
+    if args.start < 0 or args.speed < 0:
+        print("Error: Start and speed must not be negative", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        replayer = Replayer(args.file, start=args.start, speed=args.speed)
+    except RecordingError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    replayer.run()
 
 
 def main():
@@ -71,19 +467,65 @@ def main():
         print("Error: Refresh rate must not exceed 60 seconds", file=sys.stderr)
         sys.exit(1)
 
+    if args.history is not None and not 0 < args.history <= 86400:
+        print("Error: History span must be between 0 and 86400 seconds", file=sys.stderr)
+        sys.exit(1)
+
+    if not 0 <= args.core_history <= 60:
+        print("Error: Core history must be between 0 and 60 samples", file=sys.stderr)
+        sys.exit(1)
+
     # Handle docker-only mode
     show_processes = not args.no_processes
     show_docker = not args.no_docker
+    show_disk_io = not args.no_disk_io
+    show_network = not args.no_network
 
     if args.docker_only:
         show_processes = False
         show_docker = True
+        show_disk_io = False
+        show_network = False
+
+    if args.command == "replay":
+        run_replay(args)
+        return
+
+    intervals = parse_intervals(args.interval)
+    docker_backend = args.docker_backend
+
+    if args.command == "record":
+        run_record(args, show_processes, show_docker, show_disk_io, show_network, docker_backend, intervals)
+        return
+
+    if args.exporter:
+        run_exporter(args, show_docker, show_disk_io, show_network, docker_backend, intervals)
+        return
+
+    if args.json:
+        run_json(args, show_processes, show_docker, show_disk_io, show_network, docker_backend, intervals)
+        return
+
+    # Imported here so that the headless modes never load Rich
+    from .monitor import Monitor
 
     # Create and run the monitor
     monitor = Monitor(
         refresh_rate=args.refresh,
         show_processes=show_processes,
         show_docker=show_docker,
+        show_disk_io=show_disk_io,
+        show_network=show_network,
+        docker_backend=docker_backend,
+        history_span=args.history,
+        intervals=intervals,
+        docker_sort=args.docker_sort or "cpu",
+        show_overhead=args.overhead,
+        profile=args.profile,
+        core_history=args.core_history,
+        braille=args.braille,
+        interactive=not args.once,
+        runtime=args.runtime or "threads",
     )
 
     if args.once:
@@ -5,7 +5,21 @@ Collectors module - System metrics data collection.
 from .cpu import CPUCollector
 from .memory import MemoryCollector
 from .disk import DiskCollector
+from .diskstats import DiskStatsCollector
 from .load import LoadCollector
+from .network import NetworkCollector
 from .docker import DockerCollector
+from .engine import CollectionEngine
+from .processes import ProcessCollector
 
-__all__ = ["CPUCollector", "MemoryCollector", "DiskCollector", "LoadCollector", "DockerCollector"]
+__all__ = [
+    "CPUCollector",
+    "MemoryCollector",
+    "DiskCollector",
+    "DiskStatsCollector",
+    "LoadCollector",
+    "NetworkCollector",
+    "DockerCollector",
+    "ProcessCollector",
+    "CollectionEngine",
+]
@@ -0,0 +1,220 @@
+"""
+Direct cgroup v2 reader for container resource usage.
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+
+@dataclass
+class CgroupStats:
+    """Container for raw counters read from a container's cgroup."""
+
+    # cpu.stat (microseconds)
+    usage_usec: int
+    nr_throttled: int
+    throttled_usec: int
+
+    # memory.current / memory.max / memory.stat (bytes)
+    memory_current: int
+    memory_max: Optional[int]
+    inactive_file: int
+
+    # io.stat (bytes, summed over devices)
+    io_read_bytes: int
+    io_write_bytes: int
+
+    # /proc/<pid>/net/dev of a process in the cgroup (bytes); zero for a
+    # container sharing the host's network namespace (--network=host)
+    network_rx_bytes: int
+    network_tx_bytes: int
+
+
+class CgroupReader:
+    """Reads container CPU, memory and block I/O counters from cgroupfs."""
+
+    DEFAULT_ROOT = "/sys/fs/cgroup"
+
+    # Container cgroup locations relative to the root, for the systemd and
+    # cgroupfs cgroup drivers
+    PATH_TEMPLATES = (
+        "system.slice/docker-{id}.scope",
+        "docker/{id}",
+    )
+
+    def __init__(self, root: str = DEFAULT_ROOT, proc_root: str = "/proc"):
+        """
+        Initialize the cgroup reader.
+
+        Args:
+            root: Mount point of the cgroup v2 hierarchy
+            proc_root: Mount point of procfs (for network counters)
+        """
+        self.root = root
+        self.proc_root = proc_root
+        self._paths: Dict[str, str] = {}
+        self._host_netns: Optional[str] = None
+
+    @property
+    def is_available(self) -> bool:
+        """Check if the root is a cgroup v2 (unified) hierarchy."""
+        return os.path.exists(os.path.join(self.root, "cgroup.controllers"))
+
+    def find(self, container_id: str) -> Optional[str]:
+        """
+        Locate the cgroup directory of a container.
+
+        Args:
+            container_id: Full container ID
+
+        Returns:
+            Absolute path of the cgroup directory, or None if not found
+        """
+        path = self._paths.get(container_id)
+        if path is not None and os.path.isdir(path):
+            return path
+
+        for template in self.PATH_TEMPLATES:
+            path = os.path.join(self.root, template.format(id=container_id))
+            if os.path.isdir(path):
+                self._paths[container_id] = path
+                return path
+
+        self._paths.pop(container_id, None)
+        return None
+
+    def forget(self, container_id: str) -> None:
+        """Drop the cached cgroup path of a container."""
+        self._paths.pop(container_id, None)
+
+    def read(self, container_id: str) -> Optional[CgroupStats]:
+        """
+        Read the current counters of a container.
+
+        Args:
+            container_id: Full container ID
+
+        Returns:
+            CgroupStats, or None if the container's cgroup is gone
+        """
+        path = self.find(container_id)
+        if path is None:
+            return None
+
+        try:
+            cpu = self._read_keyed(os.path.join(path, "cpu.stat"))
+            memory = self._read_keyed(os.path.join(path, "memory.stat"))
+            memory_current = self._read_int(os.path.join(path, "memory.current"))
+            memory_max = self._read_int(os.path.join(path, "memory.max"))
+            io_read, io_write = self._read_io(os.path.join(path, "io.stat"))
+        except (FileNotFoundError, ProcessLookupError):
+            self.forget(container_id)
+            return None
+
+        net_rx, net_tx = self._read_network(path)
+
+        return CgroupStats(
+            usage_usec=cpu.get("usage_usec", 0),
+            nr_throttled=cpu.get("nr_throttled", 0),
+            throttled_usec=cpu.get("throttled_usec", 0),
+            memory_current=memory_current or 0,
+            memory_max=memory_max,
+            inactive_file=memory.get("inactive_file", 0),
+            io_read_bytes=io_read,
+            io_write_bytes=io_write,
+            network_rx_bytes=net_rx,
+            network_tx_bytes=net_tx,
+        )
+
+    @property
+    def host_netns(self) -> Optional[str]:
+        """Network namespace of init, e.g. "net:[4026531840]" (None if unreadable)."""
+        if self._host_netns is None:
+            # Reading init's namespace needs privileges; sysmon itself
+            # normally runs in the host's namespace
+            self._host_netns = self._netns("1") or self._netns("self")
+        return self._host_netns
+
+    def _netns(self, pid: str) -> Optional[str]:
+        """Get the network namespace a process is in, or None if unreadable."""
+        try:
+            return os.readlink(os.path.join(self.proc_root, pid, "ns", "net"))
+        except OSError:
+            return None
+
+    @staticmethod
+    def _read_keyed(path: str) -> Dict[str, int]:
+        """Parse a flat "key value" file such as cpu.stat or memory.stat."""
+        values = {}
+        with open(path) as f:
+            for line in f:
+                key, _, value = line.partition(" ")
+                try:
+                    values[key] = int(value)
+                except ValueError:
+                    continue
+        return values
+
+    @staticmethod
+    def _read_int(path: str) -> Optional[int]:
+        """Read a single-value file, mapping "max" to None."""
+        with open(path) as f:
+            value = f.read().strip()
+        return None if value == "max" else int(value)
+
+    @staticmethod
+    def _read_io(path: str) -> Tuple[int, int]:
+        """Sum rbytes and wbytes over all devices in io.stat."""
+        read_bytes = 0
+        write_bytes = 0
+
+        try:
+            with open(path) as f:
+                for line in f:
+                    # Format: "8:0 rbytes=1 wbytes=2 rios=3 wios=4 ..."
+                    for field in line.split()[1:]:
+                        key, _, value = field.partition("=")
+                        if key == "rbytes":
+                            read_bytes += int(value)
+                        elif key == "wbytes":
+                            write_bytes += int(value)
+        except FileNotFoundError:
+            # io controller not enabled for this cgroup
+            pass
+
+        return read_bytes, write_bytes
+
+    def _read_network(self, path: str) -> Tuple[int, int]:
+        """
+        Sum rx/tx bytes of the container's network namespace.
+
+        A container in the host's namespace would report the traffic of the
+        whole host, so it reports none.
+        """
+        try:
+            with open(os.path.join(path, "cgroup.procs")) as f:
+                pid = f.readline().strip()
+            if not pid:
+                return 0, 0
+
+            netns = self._netns(pid)
+            if netns is not None and netns == self.host_netns:
+                return 0, 0
+
+            rx_bytes = 0
+            tx_bytes = 0
+            with open(os.path.join(self.proc_root, pid, "net", "dev")) as f:
+                # Skip the two header lines
+                for line in f.readlines()[2:]:
+                    interface, _, data = line.partition(":")
+                    if interface.strip() == "lo":
+                        continue
+                    fields = data.split()
+                    rx_bytes += int(fields[0])
+                    tx_bytes += int(fields[8])
+
+            return rx_bytes, tx_bytes
+
+        except (OSError, ValueError, IndexError):
+            return 0, 0
@@ -2,11 +2,14 @@
 Disk/storage metrics collector.
 """
 
-from dataclasses import dataclass
-from typing import List, Optional
+from dataclasses import dataclass, replace
+from typing import Dict, List, Optional
 
 import psutil
 
+from .mounts import MountInfo, MountTable
+from .probe import UsageProber
+
 
 @dataclass
 class DiskPartitionMetrics:
@@ -20,6 +23,10 @@ class DiskPartitionMetrics:
     free_bytes: int
     percent: float
 
+    # False while the mount is quarantined after a usage probe timed out;
+    # the usage fields then hold the last known values
+    responsive: bool = True
+
 
 @dataclass
 class DiskIOMetrics:
@@ -56,9 +63,49 @@ class DiskCollector:
     # Mount points to exclude
     EXCLUDED_MOUNTPOINTS = {"/boot", "/boot/efi", "/snap"}
 
-    def __init__(self):
-        """Initialize the disk collector."""
+    def __init__(
+        self,
+        mount_table: Optional[MountTable] = None,
+        prober: Optional[UsageProber] = None,
+    ):
+        """
+        Initialize the disk collector.
+
+        Args:
+            mount_table: Mount table to read partitions from
+                (default: the mount table of the running system)
+            prober: Usage prober (default: psutil.disk_usage with a timeout)
+        """
         self._last_io: Optional[DiskIOMetrics] = None
+        self.mount_table = mount_table or MountTable()
+        self.prober = prober or UsageProber()
+        self._mounts: Optional[List[MountInfo]] = None
+        self._last_usage: Dict[str, DiskPartitionMetrics] = {}
+
+    def mounts(self) -> List[MountInfo]:
+        """
+        Get the included mounts, rereading them only after a mount table change.
+
+        Returns:
+            List of MountInfo objects for the partitions to report
+        """
+        if self._mounts is None or self.mount_table.changed():
+            previous = {mount.mountpoint for mount in self._mounts or ()}
+            self._mounts = [
+                mount
+                for mount in self.mount_table.read()
+                if mount.fstype.lower() not in self.EXCLUDED_FSTYPES
+                and not any(
+                    mount.mountpoint.startswith(excl)
+                    for excl in self.EXCLUDED_MOUNTPOINTS
+                )
+            ]
+
+            gone = previous - {mount.mountpoint for mount in self._mounts}
+            self.prober.forget(gone)
+            for mountpoint in gone:
+                self._last_usage.pop(mountpoint, None)
+        return self._mounts
 
     def collect(self) -> DiskMetrics:
         """
@@ -67,44 +114,72 @@ class DiskCollector:
         Returns:
             DiskMetrics object with current disk data
         """
-        partitions = []
+        return DiskMetrics(partitions=self.collect_usage(), io=self.collect_io())
 
-        # Get disk partitions
-        for partition in psutil.disk_partitions(all=False):
-            # Skip excluded filesystem types
-            if partition.fstype.lower() in self.EXCLUDED_FSTYPES:
-                continue
+    def collect_usage(self) -> List[DiskPartitionMetrics]:
+        """
+        Collect space usage of the mounted partitions.
 
-            # Skip excluded mount points
-            if any(
-                partition.mountpoint.startswith(excl)
-                for excl in self.EXCLUDED_MOUNTPOINTS
-            ):
-                continue
+        Usage is probed through the prober, so a hung mount costs at most its
+        timeout. Quarantined mounts are reported with their last known usage
+        and responsive=False.
+
+        Returns:
+            List of DiskPartitionMetrics, one per included partition
+        """
+        mounts = self.mounts()
+        usages = self.prober.probe_all(mount.mountpoint for mount in mounts)
+        quarantined = self.prober.quarantined
+        partitions = []
 
-            try:
-                usage = psutil.disk_usage(partition.mountpoint)
-                partitions.append(
-                    DiskPartitionMetrics(
-                        mountpoint=partition.mountpoint,
+        for partition in mounts:
+            mountpoint = partition.mountpoint
+
+            if mountpoint in quarantined:
+                last = self._last_usage.get(mountpoint)
+                if last is None:
+                    last = DiskPartitionMetrics(
+                        mountpoint=mountpoint,
                         device=partition.device,
                         fstype=partition.fstype,
-                        total_bytes=usage.total,
-                        used_bytes=usage.used,
-                        free_bytes=usage.free,
-                        percent=usage.percent,
+                        total_bytes=0,
+                        used_bytes=0,
+                        free_bytes=0,
+                        percent=0.0,
                     )
-                )
-            except (PermissionError, OSError):
+                partitions.append(replace(last, responsive=False))
+                continue
+
+            usage = usages.get(mountpoint)
+            if usage is None:
                 # Skip partitions we can't access
                 continue
 
-        # Get disk I/O counters
-        io_metrics = None
+            metrics = DiskPartitionMetrics(
+                mountpoint=mountpoint,
+                device=partition.device,
+                fstype=partition.fstype,
+                total_bytes=usage.total,
+                used_bytes=usage.used,
+                free_bytes=usage.free,
+                percent=usage.percent,
+            )
+            self._last_usage[mountpoint] = metrics
+            partitions.append(metrics)
+
+        return partitions
+
+    def collect_io(self) -> Optional[DiskIOMetrics]:
+        """
+        Collect system-wide disk I/O counters.
+
+        Returns:
+            DiskIOMetrics object, or None if unavailable
+        """
         try:
             io_counters = psutil.disk_io_counters()
             if io_counters:
-                io_metrics = DiskIOMetrics(
+                return DiskIOMetrics(
                     read_bytes=io_counters.read_bytes,
                     write_bytes=io_counters.write_bytes,
                     read_count=io_counters.read_count,
@@ -113,7 +188,12 @@ class DiskCollector:
         except (AttributeError, NotImplementedError):
             pass
 
-        return DiskMetrics(partitions=partitions, io=io_metrics)
+        return None
+
+    def close(self) -> None:
+        """Stop watching the mount table and stop the probe workers."""
+        self.mount_table.close()
+        self.prober.close()
 
     @staticmethod
     def format_bytes(bytes_value: int) -> str:
@@ -0,0 +1,181 @@
+"""
+Per-device disk I/O metrics collector reading /proc/diskstats.
+"""
+
+import os
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+
+from ..utils.counters import counter_delta
+
+
+@dataclass
+class DeviceIOMetrics:
+    """Container for the I/O rates of one block device (as in iostat -x)."""
+
+    name: str
+    read_bytes_per_sec: float
+    write_bytes_per_sec: float
+    read_iops: float
+    write_iops: float
+
+    # Average time per completed request, queueing included
+    await_ms: float
+
+    # Average number of requests in flight
+    queue_depth: float
+
+    # Share of time the device had requests in flight
+    util_percent: float
+
+
+# Field positions in a /proc/diskstats line (after splitting on whitespace)
+_READS, _READ_SECTORS, _READ_MS = 3, 5, 6
+_WRITES, _WRITE_SECTORS, _WRITE_MS = 7, 9, 10
+_IO_MS, _WEIGHTED_MS = 12, 13
+
+# Raw counters kept per device, in this order
+_FIELDS = (
+    _READS, _READ_SECTORS, _READ_MS,
+    _WRITES, _WRITE_SECTORS, _WRITE_MS,
+    _IO_MS, _WEIGHTED_MS,
+)
+
+SECTOR_SIZE = 512
+
+
+class DiskStatsCollector:
+    """
+    Computes per-device I/O rates from successive /proc/diskstats samples.
+
+    Only whole devices are reported (partitions, loop and ram devices are
+    skipped). A device appearing for the first time is reported from its
+    second sample on; a device that disappears is forgotten, so a name
+    reused after hotplug is classified again.
+    """
+
+    # Device name prefixes never reported
+    EXCLUDED_PREFIXES = ("loop", "ram")
+
+    def __init__(self, proc_root: str = "/proc", sys_root: str = "/sys"):
+        """
+        Initialize the collector.
+
+        Args:
+            proc_root: Mount point of procfs
+            sys_root: Mount point of sysfs (used to tell disks from partitions)
+        """
+        self.path = os.path.join(proc_root, "diskstats")
+        self.block_path = os.path.join(sys_root, "block")
+        self.class_path = os.path.join(sys_root, "class", "block")
+        self._previous: Dict[str, Tuple[int, ...]] = {}
+        self._previous_time: Optional[float] = None
+
+        # Whether each device name in the last read is reported
+        self._included: Dict[str, bool] = {}
+
+    def is_available(self) -> bool:
+        """Check whether /proc/diskstats can be read."""
+        return os.path.exists(self.path)
+
+    def collect(self) -> List[DeviceIOMetrics]:
+        """
+        Collect per-device I/O rates since the previous call.
+
+        Returns:
+            List of DeviceIOMetrics in /proc/diskstats order (empty on the
+            first call)
+        """
+        try:
+            with open(self.path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return []
+
+        now = time.monotonic()
+        elapsed = now - self._previous_time if self._previous_time is not None else 0.0
+        previous = self._previous
+        included = self._included
+        whole: Optional[Set[str]] = None
+        current: Dict[str, Tuple[int, ...]] = {}
+        classified: Dict[str, bool] = {}
+        devices = []
+
+        for line in data.splitlines():
+            fields = line.split()
+            if len(fields) < 14:
+                continue
+
+            name = fields[2].decode()
+            include = included.get(name)
+            if include is None:
+                # Whole devices are listed in /sys/block, partitions are
+                # not; list it once per call when unknown devices show up
+                if whole is None:
+                    whole = self._whole_devices()
+                include = self._include(name, whole)
+            if include is not None:
+                classified[name] = include
+            if not include:
+                continue
+
+            counters = tuple([int(fields[i]) for i in _FIELDS])
+            current[name] = counters
+
+            last = previous.get(name)
+            if last is not None and elapsed > 0:
+                devices.append(self._rates(name, last, counters, elapsed))
+
+        self._included = classified
+        self._previous = current
+        self._previous_time = now
+        return devices
+
+    def _whole_devices(self) -> Set[str]:
+        """List the whole block devices; empty if sysfs is unavailable."""
+        try:
+            return set(os.listdir(self.block_path))
+        except OSError:
+            return set()
+
+    def _include(self, name: str, whole: Set[str]) -> Optional[bool]:
+        """
+        Decide whether to report a device seen for the first time.
+
+        Returns:
+            Whether to report the device, or None if it is not reported yet
+            because sysfs does not know it (it may still be registering)
+        """
+        if name.startswith(self.EXCLUDED_PREFIXES):
+            return False
+        # Without sysfs, report every device
+        if not whole or name in whole:
+            return True
+        # Partitions are block devices too, just not in /sys/block
+        if os.path.exists(os.path.join(self.class_path, name)):
+            return False
+        return None
+
+    def _rates(
+        self, name: str, last: Tuple[int, ...], counters: Tuple[int, ...], elapsed: float
+    ) -> DeviceIOMetrics:
+        """Compute iostat-style rates from two samples of a device."""
+        delta = counter_delta
+        reads, read_sectors, read_ms, writes, write_sectors, write_ms, io_ms, weighted_ms = (
+            delta(c, p) for c, p in zip(counters, last)
+        )
+
+        ios = reads + writes
+        elapsed_ms = elapsed * 1000
+
+        return DeviceIOMetrics(
+            name=name,
+            read_bytes_per_sec=read_sectors * SECTOR_SIZE / elapsed,
+            write_bytes_per_sec=write_sectors * SECTOR_SIZE / elapsed,
+            read_iops=reads / elapsed,
+            write_iops=writes / elapsed,
+            await_ms=(read_ms + write_ms) / ios if ios else 0.0,
+            queue_depth=weighted_ms / elapsed_ms,
+            util_percent=min(100.0, io_ms / elapsed_ms * 100),
+        )
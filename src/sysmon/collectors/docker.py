@@ -2,16 +2,17 @@
 Docker container metrics collector.
 """
 
+import asyncio
+import threading
+import time
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
-try:
-    import docker
-    from docker.errors import DockerException
+import psutil
 
-    DOCKER_AVAILABLE = True
-except ImportError:
-    DOCKER_AVAILABLE = False
+from ..utils.counters import RateTracker
+from .cgroup import CgroupReader, CgroupStats
+from .dockersock import DockerSocketAPI, DockerSocketClient, EventLoopThread
 
 
 @dataclass
@@ -39,6 +40,16 @@ class ContainerMetrics:
     block_read_bytes: int
     block_write_bytes: int
 
+    # CPU throttling (CFS quota enforcement)
+    cpu_throttled_periods: int = 0
+    cpu_throttled_usec: int = 0
+
+    # Network and block I/O rates since the previous sample (bytes/s)
+    network_rx_bytes_per_sec: float = 0.0
+    network_tx_bytes_per_sec: float = 0.0
+    block_read_bytes_per_sec: float = 0.0
+    block_write_bytes_per_sec: float = 0.0
+
 
 @dataclass
 class DockerMetrics:
@@ -51,28 +62,369 @@ class DockerMetrics:
     running_containers: int
 
 
+@dataclass
+class ContainerInfo:
+    """Cached metadata for a single Docker container."""
+
+    container_id: str
+    name: str
+    image: str
+    status: str
+
+    @property
+    def short_id(self) -> str:
+        """Get the abbreviated container ID."""
+        return self.container_id[:12]
+
+
+class ContainerInventory:
+    """
+    Container list loaded once and kept current from the Docker events stream.
+
+    Names, images and statuses are cached by container ID, so reading the
+    inventory makes no API calls in steady state. If the events stream breaks,
+    the next read reloads the full list and resubscribes.
+    """
+
+    # Container status after each lifecycle event (None removes the container).
+    # "kill" is sent for every signal, including the SIGTERM before a stop,
+    # so exits are only taken from "die" and "stop".
+    EVENT_STATUS = {
+        "create": "created",
+        "start": "running",
+        "restart": "running",
+        "unpause": "running",
+        "pause": "paused",
+        "stop": "exited",
+        "die": "exited",
+        "destroy": None,
+    }
+
+    def __init__(self, api):
+        """
+        Initialize the container inventory.
+
+        Args:
+            api: Low-level Docker API client (docker.APIClient, or
+                DockerSocketAPI without the SDK)
+        """
+        self._api = api
+        self._containers: Dict[str, ContainerInfo] = {}
+        self._events = None
+        self._watcher: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the inventory is loaded and following events."""
+        return self._watcher is not None and self._watcher.is_alive()
+
+    def containers(self) -> List[ContainerInfo]:
+        """
+        Get all known containers, loading the inventory if needed.
+
+        Returns:
+            List of ContainerInfo objects
+        """
+        if not self.loaded:
+            self._load()
+
+        with self._lock:
+            return list(self._containers.values())
+
+    def stop(self) -> None:
+        """Stop following the events stream."""
+        events = self._events
+        self._events = None
+        if events is not None:
+            try:
+                events.close()
+            except Exception:
+                pass
+
+    def _load(self) -> None:
+        """Load the full container list and start following events."""
+        self.stop()
+
+        # Subscribe from just before the listing so no event is missed;
+        # replayed events are idempotent against the loaded state
+        since = int(time.time()) - 1
+        listing = self._api.containers(all=True)
+
+        containers = {entry["Id"]: self.from_listing(entry) for entry in listing}
+
+        with self._lock:
+            self._containers = containers
+
+        self._events = self._api.events(
+            since=since, decode=True, filters={"type": "container"}
+        )
+        self._watcher = threading.Thread(
+            target=self._watch, args=(self._events,), name="sysmon-docker-events", daemon=True
+        )
+        self._watcher.start()
+
+    @classmethod
+    def from_listing(cls, entry: dict) -> ContainerInfo:
+        """Build the metadata of a container from its container list entry."""
+        names = entry.get("Names") or [""]
+        return ContainerInfo(
+            container_id=entry["Id"],
+            name=names[0].lstrip("/"),
+            image=cls._image_name(entry.get("Image", "")),
+            status=entry.get("State", ""),
+        )
+
+    @staticmethod
+    def _image_name(image: str) -> str:
+        """Shorten image references given by digest to a short ID."""
+        if image.startswith("sha256:"):
+            return image[:17]
+        return image
+
+    def _watch(self, events) -> None:
+        """Apply container events to the cache until the stream ends."""
+        try:
+            for event in events:
+                self._apply(event)
+        except Exception:
+            pass
+
+    def _apply(self, event: dict) -> None:
+        """Update the cache from a single container event."""
+        # Actions such as "health_status: healthy" carry a detail suffix
+        action = (event.get("Action") or event.get("status") or "").split(":")[0]
+        actor = event.get("Actor", {})
+        container_id = actor.get("ID") or event.get("id")
+        attributes = actor.get("Attributes", {})
+
+        if not container_id:
+            return
+
+        with self._lock:
+            info = self._containers.get(container_id)
+
+            if action == "rename":
+                if info is not None:
+                    info.name = attributes.get("name", info.name).lstrip("/")
+                return
+
+            if action not in self.EVENT_STATUS:
+                return
+
+            status = self.EVENT_STATUS[action]
+            if status is None:
+                self._containers.pop(container_id, None)
+            elif info is None:
+                self._containers[container_id] = ContainerInfo(
+                    container_id=container_id,
+                    name=attributes.get("name", container_id[:12]).lstrip("/"),
+                    image=self._image_name(attributes.get("image", event.get("from", ""))),
+                    status=status,
+                )
+            else:
+                info.status = status
+
+
+class ContainerStatsStreamer:
+    """
+    Keeps one long-lived stats stream per running container.
+
+    Each stream runs on its own background thread and stores the most recent
+    sample in a shared table, so reading the latest stats for any number of
+    containers never waits on the Docker daemon.
+    """
+
+    def __init__(self, api):
+        """
+        Initialize the stats streamer.
+
+        Args:
+            api: Low-level Docker API client (docker.APIClient)
+        """
+        self._api = api
+        self._samples: Dict[str, Tuple[float, dict]] = {}
+        self._streams: Dict[str, threading.Thread] = {}
+        self._lock = threading.Lock()
+
+    def sync(self, container_ids: Iterable[str]) -> None:
+        """
+        Start streams for new containers and retire streams for gone ones.
+
+        Args:
+            container_ids: IDs of the currently running containers
+        """
+        wanted = set(container_ids)
+
+        with self._lock:
+            # Retired streams notice on their next sample and exit
+            for container_id in list(self._streams):
+                if container_id not in wanted:
+                    del self._streams[container_id]
+                    self._samples.pop(container_id, None)
+
+            for container_id in wanted:
+                stream = self._streams.get(container_id)
+                if stream is not None and stream.is_alive():
+                    continue
+
+                stream = threading.Thread(
+                    target=self._run_stream,
+                    args=(container_id,),
+                    name=f"sysmon-docker-stats-{container_id[:12]}",
+                    daemon=True,
+                )
+                self._streams[container_id] = stream
+                stream.start()
+
+    def latest(self, container_id: str) -> Optional[Tuple[float, dict]]:
+        """
+        Get the most recent stats sample for a container.
+
+        Args:
+            container_id: Full container ID
+
+        Returns:
+            Monotonic arrival time and stats dictionary, or None if no
+            sample has arrived yet
+        """
+        with self._lock:
+            return self._samples.get(container_id)
+
+    def stop(self) -> None:
+        """Ask all streams to finish after their next sample."""
+        with self._lock:
+            self._streams.clear()
+            self._samples.clear()
+
+    def _run_stream(self, container_id: str) -> None:
+        """Consume a container's stats stream until it ends or is retired."""
+        current = threading.current_thread()
+
+        try:
+            for stats in self._api.stats(container_id, stream=True, decode=True):
+                with self._lock:
+                    if self._streams.get(container_id) is not current:
+                        break
+                    self._samples[container_id] = (time.monotonic(), stats)
+        except Exception:
+            pass
+        finally:
+            with self._lock:
+                if self._streams.get(container_id) is current:
+                    del self._streams[container_id]
+                    self._samples.pop(container_id, None)
+
+
 class DockerCollector:
-    """Collects Docker container metrics using the Docker SDK."""
+    """
+    Collects Docker container metrics using the Docker SDK.
+
+    The SDK is imported and the daemon contacted on a background thread, so
+    neither delays startup; until the connection is up, collect() reports
+    Docker as unavailable with a "Connecting" message. When the daemon stops
+    answering, the collector drops the connection and reconnects in the
+    background, waiting RETRY_INITIAL seconds after the first failed attempt
+    and doubling the wait up to RETRY_MAX.
+
+    The "socket" backend needs no SDK: it follows the same event-driven
+    inventory over the daemon's unix socket, and requests the stats of all
+    running containers concurrently each tick, over keep-alive connections,
+    from a single event loop.
+    """
+
+    # Available ways of gathering per-container stats:
+    #   "api"    - one blocking stats request per container per tick
+    #   "stream" - persistent per-container stats streams read from memory
+    #   "cgroup" - counters read directly from the cgroup v2 filesystem
+    #   "socket" - concurrent one-shot stats requests from an event loop,
+    #              without the SDK
+    BACKENDS = ("api", "stream", "cgroup", "socket")
+
+    # Seconds between reconnection attempts (doubling up to the maximum)
+    RETRY_INITIAL = 1.0
+    RETRY_MAX = 30.0
+
+    def __init__(
+        self,
+        backend: str = "api",
+        cgroup_root: str = CgroupReader.DEFAULT_ROOT,
+        proc_root: str = "/proc",
+    ):
+        """
+        Initialize the Docker collector.
+
+        No connection is made until connect() or collect() is called.
+
+        Args:
+            backend: Stats backend to use (one of BACKENDS)
+            cgroup_root: cgroup v2 mount point used by the "cgroup" backend
+            proc_root: procfs mount point the "cgroup" backend reads the
+                containers' network counters from
+        """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown Docker backend: {backend}")
 
-    def __init__(self):
-        """Initialize the Docker collector."""
+        self.backend = backend
+        self.cgroup_root = cgroup_root
+        self.proc_root = proc_root
         self._client = None
-        self._available = DOCKER_AVAILABLE
+        self._inventory: Optional[ContainerInventory] = None
+        self._streamer: Optional[ContainerStatsStreamer] = None
+        self._cgroup: Optional[CgroupReader] = None
+        self._cgroup_samples: Dict[str, Tuple[float, int]] = {}
+        self._io_rates = RateTracker()
+        self._host_memory = psutil.virtual_memory().total
         self._error: Optional[str] = None
 
-        if self._available:
-            try:
-                self._client = docker.from_env()
-                # Test connection
-                self._client.ping()
-            except Exception as e:
-                self._available = False
-                self._error = str(e)
+        # Event loop of the "socket" backend for synchronous callers, and the
+        # CPU counters of the last one-shot sample of each container
+        self._loop_thread: Optional[EventLoopThread] = None
+        self._socket_cpu: Dict[str, dict] = {}
+
+        # Set once connected; a permanent error (SDK missing, no cgroup v2)
+        # stops further attempts
+        self._connected = threading.Event()
+        self._attempted = threading.Event()
+        self._closed = threading.Event()
+        self._permanent_error: Optional[str] = None
+        self._connector: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
 
     @property
     def is_available(self) -> bool:
-        """Check if Docker is available and accessible."""
-        return self._available and self._client is not None
+        """Check if Docker is connected and accessible."""
+        return self._connected.is_set()
+
+    def connect(self) -> None:
+        """Start connecting to the Docker daemon in the background, if not already."""
+        with self._lock:
+            if (
+                self._connected.is_set()
+                or self._permanent_error is not None
+                or self._closed.is_set()
+                or (self._connector is not None and self._connector.is_alive())
+            ):
+                return
+
+            self._connector = threading.Thread(
+                target=self._connect_loop, name="sysmon-docker-connect", daemon=True
+            )
+            self._connector.start()
+
+    def wait_connected(self, timeout: float) -> bool:
+        """
+        Connect and wait for the outcome of the first connection attempt.
+
+        Args:
+            timeout: Longest wait in seconds
+
+        Returns:
+            True if connected
+        """
+        self.connect()
+        self._attempted.wait(timeout)
+        return self._connected.is_set()
 
     def collect(self) -> DockerMetrics:
         """
@@ -82,55 +434,301 @@ class DockerCollector:
             DockerMetrics object with container data
         """
         if not self.is_available:
-            return DockerMetrics(
-                available=False,
-                error=self._error or "Docker not available",
-                containers=[],
-                total_containers=0,
-                running_containers=0,
+            self.connect()
+            return self._unavailable(
+                self._permanent_error or self._error or "Connecting to Docker..."
             )
 
+        if self.backend == "socket":
+            with self._lock:
+                if self._loop_thread is None:
+                    self._loop_thread = EventLoopThread("sysmon-docker-loop")
+            return self._loop_thread.run(self._collect_socket())
+
         try:
-            containers = self._client.containers.list(all=True)
+            containers = self._inventory.containers()
             running_containers = [c for c in containers if c.status == "running"]
 
+            if self._streamer is not None:
+                self._streamer.sync(c.container_id for c in running_containers)
+
             container_metrics = []
             for container in running_containers:
                 metrics = self._get_container_metrics(container)
                 if metrics:
                     container_metrics.append(metrics)
 
-            return DockerMetrics(
-                available=True,
-                error=None,
-                containers=container_metrics,
-                total_containers=len(containers),
-                running_containers=len(running_containers),
-            )
+            return self._report(containers, running_containers, container_metrics)
 
         except Exception as e:
-            return DockerMetrics(
-                available=False,
-                error=str(e),
-                containers=[],
-                total_containers=0,
-                running_containers=0,
+            # The daemon went away; reconnect in the background
+            self._disconnect(str(e))
+            self.connect()
+            return self._unavailable(str(e))
+
+    async def collect_async(self) -> DockerMetrics:
+        """
+        Collect metrics on the running event loop.
+
+        The "socket" backend awaits its requests on the loop itself; the
+        other backends block, so collect() runs in the loop's executor.
+
+        Returns:
+            DockerMetrics object with container data
+        """
+        if self.backend != "socket" or not self.is_available:
+            return await asyncio.get_running_loop().run_in_executor(None, self.collect)
+        return await self._collect_socket()
+
+    async def _collect_socket(self) -> DockerMetrics:
+        """Collect all containers' stats with concurrent requests over the socket."""
+        client = self._client
+        inventory = self._inventory
+
+        try:
+            if inventory.loaded:
+                containers = inventory.containers()
+            else:
+                # Loading lists the containers with a blocking request
+                containers = await asyncio.get_running_loop().run_in_executor(
+                    None, inventory.containers
+                )
+            running_containers = [c for c in containers if c.status == "running"]
+
+            samples = await asyncio.gather(
+                *(self._socket_stats(client, c.container_id) for c in running_containers),
+                return_exceptions=True,
             )
+        except Exception as e:
+            # The daemon went away; reconnect in the background
+            self._disconnect(str(e))
+            self.connect()
+            return self._unavailable(str(e))
+
+        container_metrics = []
+        for container, sample in zip(running_containers, samples):
+            # A container that stopped during the tick has no stats
+            if isinstance(sample, BaseException):
+                continue
+            metrics = self._metrics_from_stats(container, sample[1], sample[0])
+            if metrics:
+                container_metrics.append(metrics)
+
+        return self._report(containers, running_containers, container_metrics)
+
+    async def _socket_stats(self, client: DockerSocketClient, container_id: str) -> Tuple[float, dict]:
+        """
+        Request one stats sample of a container without waiting for a second.
 
-    def _get_container_metrics(self, container) -> Optional[ContainerMetrics]:
+        Returns:
+            Monotonic arrival time and stats dictionary, whose precpu_stats
+            are the CPU counters of the previous request when the daemon
+            sent none
+        """
+        stats = await client.get(
+            f"/containers/{container_id}/stats", {"stream": "false", "one-shot": "true"}
+        )
+        sampled_at = time.monotonic()
+
+        if not stats.get("precpu_stats", {}).get("system_cpu_usage"):
+            stats["precpu_stats"] = self._socket_cpu.get(container_id, {})
+        self._socket_cpu[container_id] = stats.get("cpu_stats", {})
+
+        return sampled_at, stats
+
+    def _report(
+        self,
+        containers: List[ContainerInfo],
+        running_containers: List[ContainerInfo],
+        container_metrics: List[ContainerMetrics],
+    ) -> DockerMetrics:
+        """Forget containers that are no longer running and build the metrics."""
+        # Containers that stopped or went away start over if they return
+        running_ids = {c.container_id for c in running_containers}
+        self._io_rates.retain(running_ids)
+
+        if self._cgroup is not None:
+            for container_id in list(self._cgroup_samples):
+                if container_id not in running_ids:
+                    del self._cgroup_samples[container_id]
+                    self._cgroup.forget(container_id)
+
+        for container_id in list(self._socket_cpu):
+            if container_id not in running_ids:
+                del self._socket_cpu[container_id]
+
+        return DockerMetrics(
+            available=True,
+            error=None,
+            containers=container_metrics,
+            total_containers=len(containers),
+            running_containers=len(running_containers),
+        )
+
+    @staticmethod
+    def _unavailable(error: str) -> DockerMetrics:
+        """Build the metrics reported while Docker cannot be reached."""
+        return DockerMetrics(
+            available=False,
+            error=error,
+            containers=[],
+            total_containers=0,
+            running_containers=0,
+        )
+
+    def _connect_loop(self) -> None:
+        """Connect to the daemon, retrying with backoff until it answers."""
+        try:
+            self._connect_with_retries()
+        finally:
+            self._attempted.set()
+
+    def _connect_with_retries(self) -> None:
+        """Body of the connection thread."""
+        if self.backend == "socket":
+            try:
+                socket_client = DockerSocketClient.from_env()
+            except ValueError as e:
+                self._permanent_error = str(e)
+                return
+        else:
+            try:
+                # Imported here: the SDK pulls in requests and urllib3, which
+                # runs without Docker metrics should not pay for
+                import docker
+            except ImportError:
+                self._permanent_error = "Docker SDK not installed (pip install docker)"
+                return
+
+        if self.backend == "cgroup":
+            cgroup = CgroupReader(self.cgroup_root, self.proc_root)
+            if not cgroup.is_available:
+                self._permanent_error = f"No cgroup v2 hierarchy at {self.cgroup_root}"
+                return
+            self._cgroup = cgroup
+
+        retry = self.RETRY_INITIAL
+        while not self._closed.is_set():
+            try:
+                if self.backend == "socket":
+                    client = socket_client
+                    asyncio.run(self._ping_socket(client))
+                else:
+                    client = docker.from_env()
+                    client.ping()
+            except Exception as e:
+                self._error = f"{e} (retrying in {retry:.0f}s)"
+                self._attempted.set()
+                self._closed.wait(retry)
+                retry = min(retry * 2, self.RETRY_MAX)
+                continue
+
+            with self._lock:
+                if self._closed.is_set():
+                    client.close()
+                    return
+                self._client = client
+                if self.backend == "socket":
+                    self._inventory = ContainerInventory(
+                        DockerSocketAPI(client.path, client.timeout)
+                    )
+                else:
+                    self._inventory = ContainerInventory(client.api)
+                if self.backend == "stream":
+                    self._streamer = ContainerStatsStreamer(client.api)
+                self._error = None
+                self._connected.set()
+            return
+
+    @staticmethod
+    async def _ping_socket(client: DockerSocketClient) -> None:
+        """Ping the daemon on a short-lived loop, closing its connection after."""
+        try:
+            await client.ping()
+        finally:
+            client.close()
+
+    def _disconnect(self, error: str) -> None:
+        """Drop the connection and its streams after the daemon failed."""
+        with self._lock:
+            self._connected.clear()
+            self._error = error
+            self._stop_streams()
+            client, self._client = self._client, None
+
+        if client is not None:
+            try:
+                client.close()
+            except Exception:
+                pass
+
+    def _stop_streams(self) -> None:
+        """Stop the events and stats streams of the current connection."""
+        if self._inventory is not None:
+            self._inventory.stop()
+            self._inventory = None
+        if self._streamer is not None:
+            self._streamer.stop()
+            self._streamer = None
+
+    def close(self) -> None:
+        """Stop connecting and the background event and stats streams."""
+        self._closed.set()
+        with self._lock:
+            self._connected.clear()
+            self._stop_streams()
+            if self.backend == "socket" and self._client is not None:
+                self._client.close()
+                self._client = None
+            if self._loop_thread is not None:
+                self._loop_thread.stop()
+                self._loop_thread = None
+
+    def _get_container_metrics(self, container: ContainerInfo) -> Optional[ContainerMetrics]:
         """
         Get metrics for a single container.
 
         Args:
-            container: Docker container object
+            container: Cached container metadata
 
         Returns:
             ContainerMetrics or None if unable to get stats
         """
+        if self._cgroup is not None:
+            return self._get_cgroup_metrics(container)
+
         try:
-            # Get container stats (non-streaming for single snapshot)
-            stats = container.stats(stream=False)
+            if self._streamer is not None:
+                # Latest sample from the container's persistent stream
+                latest = self._streamer.latest(container.container_id)
+                if latest is None:
+                    return None
+                sampled_at, stats = latest
+            else:
+                # Get container stats (non-streaming for single snapshot)
+                stats = self._client.api.stats(container.container_id, stream=False)
+                sampled_at = time.monotonic()
+
+            return self._metrics_from_stats(container, stats, sampled_at)
 
+        except Exception:
+            return None
+
+    def _metrics_from_stats(
+        self, container: ContainerInfo, stats: dict, sampled_at: float
+    ) -> Optional[ContainerMetrics]:
+        """
+        Build a container's metrics from a Docker stats sample.
+
+        Args:
+            container: Cached container metadata
+            stats: Stats dictionary as returned by the Docker API
+            sampled_at: Monotonic time the sample arrived
+
+        Returns:
+            ContainerMetrics or None if the sample is malformed
+        """
+        try:
             # Calculate CPU percentage
             cpu_percent = self._calculate_cpu_percent(stats)
 
@@ -164,19 +762,18 @@ class DockerCollector:
                 if entry.get("op") == "write"
             )
 
-            # Get container name (remove leading slash)
-            name = container.name
-            if name.startswith("/"):
-                name = name[1:]
+            # CPU throttling (reported in nanoseconds)
+            throttling = stats.get("cpu_stats", {}).get("throttling_data", {})
 
-            # Get image name
-            image = container.image.tags[0] if container.image.tags else container.image.short_id
+            rx_rate, tx_rate, read_rate, write_rate = self._io_rates.update(
+                container.container_id, (net_rx, net_tx, block_read, block_write), sampled_at
+            )
 
             return ContainerMetrics(
                 container_id=container.short_id,
-                name=name,
+                name=container.name,
                 status=container.status,
-                image=image,
+                image=container.image,
                 cpu_percent=cpu_percent,
                 memory_used_bytes=memory_used,
                 memory_limit_bytes=memory_limit,
@@ -185,11 +782,102 @@ class DockerCollector:
                 network_tx_bytes=net_tx,
                 block_read_bytes=block_read,
                 block_write_bytes=block_write,
+                cpu_throttled_periods=throttling.get("throttled_periods", 0),
+                cpu_throttled_usec=throttling.get("throttled_time", 0) // 1000,
+                network_rx_bytes_per_sec=rx_rate,
+                network_tx_bytes_per_sec=tx_rate,
+                block_read_bytes_per_sec=read_rate,
+                block_write_bytes_per_sec=write_rate,
             )
 
         except Exception:
             return None
 
+    def _get_cgroup_metrics(self, container: ContainerInfo) -> Optional[ContainerMetrics]:
+        """
+        Get metrics for a single container from its cgroup files.
+
+        Args:
+            container: Cached container metadata
+
+        Returns:
+            ContainerMetrics or None if the container's cgroup is not found
+        """
+        try:
+            stats = self._cgroup.read(container.container_id)
+        except (OSError, ValueError):
+            return None
+
+        if stats is None:
+            return None
+
+        now = time.monotonic()
+        cpu_percent = self._calculate_cgroup_cpu_percent(container.container_id, stats, now)
+        self._cgroup_samples[container.container_id] = (now, stats.usage_usec)
+
+        # Same accounting as `docker stats`: exclude reclaimable page cache
+        memory_used = max(0, stats.memory_current - stats.inactive_file)
+        memory_limit = stats.memory_max or self._host_memory
+        memory_percent = (memory_used / memory_limit * 100) if memory_limit > 0 else 0
+
+        rx_rate, tx_rate, read_rate, write_rate = self._io_rates.update(
+            container.container_id,
+            (
+                stats.network_rx_bytes,
+                stats.network_tx_bytes,
+                stats.io_read_bytes,
+                stats.io_write_bytes,
+            ),
+            now,
+        )
+
+        return ContainerMetrics(
+            container_id=container.short_id,
+            name=container.name,
+            status=container.status,
+            image=container.image,
+            cpu_percent=cpu_percent,
+            memory_used_bytes=memory_used,
+            memory_limit_bytes=memory_limit,
+            memory_percent=memory_percent,
+            network_rx_bytes=stats.network_rx_bytes,
+            network_tx_bytes=stats.network_tx_bytes,
+            block_read_bytes=stats.io_read_bytes,
+            block_write_bytes=stats.io_write_bytes,
+            cpu_throttled_periods=stats.nr_throttled,
+            cpu_throttled_usec=stats.throttled_usec,
+            network_rx_bytes_per_sec=rx_rate,
+            network_tx_bytes_per_sec=tx_rate,
+            block_read_bytes_per_sec=read_rate,
+            block_write_bytes_per_sec=write_rate,
+        )
+
+    def _calculate_cgroup_cpu_percent(
+        self, container_id: str, stats: CgroupStats, now: float
+    ) -> float:
+        """
+        Calculate CPU percentage from the change in cgroup CPU usage.
+
+        Args:
+            container_id: Full container ID
+            stats: Current cgroup counters
+            now: Monotonic time of the current sample
+
+        Returns:
+            CPU usage percentage (100% per fully used core, like `docker stats`)
+        """
+        previous = self._cgroup_samples.get(container_id)
+        if previous is None:
+            return 0.0
+
+        elapsed_usec = (now - previous[0]) * 1_000_000
+        usage_delta = stats.usage_usec - previous[1]
+
+        if elapsed_usec > 0 and usage_delta > 0:
+            return usage_delta / elapsed_usec * 100
+
+        return 0.0
+
     def _calculate_cpu_percent(self, stats: dict) -> float:
         """
         Calculate CPU percentage from container stats.
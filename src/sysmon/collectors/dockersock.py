@@ -0,0 +1,444 @@
+"""
+Minimal asyncio HTTP client for the Docker Engine API on its unix socket.
+"""
+
+import asyncio
+import http.client
+import json
+import os
+import socket
+import threading
+from typing import Any, Coroutine, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlencode
+
+_Connection = Tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+
+class DockerAPIError(Exception):
+    """Error response from the Docker daemon."""
+
+    def __init__(self, status: int, message: str):
+        """
+        Initialize the error.
+
+        Args:
+            status: HTTP status code
+            message: Error message from the daemon
+        """
+        super().__init__(f"Docker API error {status}: {message}")
+        self.status = status
+        self.message = message
+
+
+class _ConnectionPool:
+    """Idle keep-alive connections to the daemon, for one event loop."""
+
+    def __init__(self, path: str, size: int):
+        """
+        Initialize the pool.
+
+        Args:
+            path: Path of the daemon's unix socket
+            size: Maximum number of connections in use at once
+        """
+        self.path = path
+        self.slots = asyncio.Semaphore(size)
+        self._idle: List[_Connection] = []
+
+    async def acquire(self) -> Tuple[_Connection, bool]:
+        """
+        Take an idle connection, or open a new one.
+
+        Returns:
+            The connection, and whether it was reused
+        """
+        while self._idle:
+            reader, writer = self._idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                return (reader, writer), True
+            writer.close()
+
+        return await asyncio.open_unix_connection(self.path), False
+
+    def release(self, connection: _Connection) -> None:
+        """Return a connection for reuse by the next request."""
+        self._idle.append(connection)
+
+    def close(self) -> None:
+        """Close every idle connection."""
+        for _, writer in self._idle:
+            writer.close()
+        self._idle.clear()
+
+
+class DockerSocketClient:
+    """
+    Speaks HTTP/1.1 to the Docker daemon over its unix socket.
+
+    Requests reuse keep-alive connections, of which up to `max_connections`
+    are open at once, so hundreds of concurrent requests from one event loop
+    share a handful of sockets. Only what sysmon needs is implemented: GET
+    requests with JSON responses, sent with either a Content-Length or a
+    chunked body. Each event loop that uses the client gets its own pool.
+    """
+
+    DEFAULT_SOCKET = "/var/run/docker.sock"
+
+    def __init__(
+        self, path: str = DEFAULT_SOCKET, max_connections: int = 16, timeout: float = 5.0
+    ):
+        """
+        Initialize the client. No connection is made until the first request.
+
+        Args:
+            path: Path of the daemon's unix socket
+            max_connections: Maximum number of connections open at once
+            timeout: Seconds allowed for each request
+        """
+        self.path = path
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self._pools: Dict[asyncio.AbstractEventLoop, _ConnectionPool] = {}
+
+    @classmethod
+    def from_env(cls, **kwargs) -> "DockerSocketClient":
+        """
+        Create a client for the daemon named by DOCKER_HOST, like docker.from_env().
+
+        Raises:
+            ValueError: If DOCKER_HOST names a daemon not on a unix socket
+        """
+        host = os.environ.get("DOCKER_HOST", "")
+        if not host:
+            return cls(**kwargs)
+        if not host.startswith("unix://"):
+            raise ValueError(f"DOCKER_HOST {host} is not a unix socket")
+        return cls(host[len("unix://") :], **kwargs)
+
+    async def ping(self) -> None:
+        """
+        Check that the daemon answers.
+
+        Raises:
+            DockerAPIError: If the daemon reports an error
+            OSError: If the socket cannot be reached
+        """
+        status, body = await self.request("GET", "/_ping")
+        if status != 200:
+            raise DockerAPIError(status, body.decode("utf-8", "replace"))
+
+    async def get(self, path: str, params: Optional[Dict[str, str]] = None) -> Any:
+        """
+        Send a GET request and decode its JSON response.
+
+        Args:
+            path: API path (e.g. "/containers/json")
+            params: Optional query parameters
+
+        Returns:
+            Decoded JSON body (None for an empty body)
+
+        Raises:
+            DockerAPIError: If the daemon answers with an error status
+        """
+        status, body = await self.request("GET", path, params)
+        data = json.loads(body) if body else None
+
+        if status >= 400:
+            message = data.get("message", "") if isinstance(data, dict) else ""
+            raise DockerAPIError(status, message)
+
+        return data
+
+    async def request(
+        self, method: str, path: str, params: Optional[Dict[str, str]] = None
+    ) -> Tuple[int, bytes]:
+        """
+        Send a request without a body on a pooled connection.
+
+        A reused connection that the daemon closed while idle is replaced
+        once before the error is raised.
+
+        Returns:
+            Status code and raw response body
+        """
+        target = f"{path}?{urlencode(params)}" if params else path
+        head = (
+            f"{method} {target} HTTP/1.1\r\n"
+            "Host: docker\r\n"
+            "User-Agent: sysmon\r\n"
+            "Accept: application/json\r\n"
+            "\r\n"
+        ).encode("ascii")
+
+        pool = self._pool()
+        async with pool.slots:
+            while True:
+                (reader, writer), reused = await pool.acquire()
+                try:
+                    writer.write(head)
+                    status, headers, body = await asyncio.wait_for(
+                        self._exchange(reader, writer), self.timeout
+                    )
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    writer.close()
+                    if reused:
+                        continue
+                    raise
+                except BaseException:
+                    writer.close()
+                    raise
+
+                if headers.get("connection", "").lower() == "close":
+                    writer.close()
+                else:
+                    pool.release((reader, writer))
+                return status, body
+
+    def close(self) -> None:
+        """Close the idle connections of every event loop that used the client."""
+        try:
+            current = asyncio.get_running_loop()
+        except RuntimeError:
+            current = None
+
+        for loop, pool in self._pools.items():
+            if loop is current:
+                pool.close()
+            elif not loop.is_closed():
+                loop.call_soon_threadsafe(pool.close)
+        self._pools.clear()
+
+    def _pool(self) -> _ConnectionPool:
+        """Get the connection pool of the running event loop."""
+        loop = asyncio.get_running_loop()
+        pool = self._pools.get(loop)
+        if pool is None:
+            pool = self._pools[loop] = _ConnectionPool(self.path, self.max_connections)
+        return pool
+
+    @staticmethod
+    async def _exchange(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> Tuple[int, Dict[str, str], bytes]:
+        """Flush the request and read the response."""
+        await writer.drain()
+
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionResetError("Connection closed by the Docker daemon")
+        status = int(status_line.split()[1])
+
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    # Skip any trailers up to the blank line
+                    while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                        pass
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            body = b"".join(chunks)
+        elif "content-length" in headers:
+            body = await reader.readexactly(int(headers["content-length"]))
+        elif status in (204, 304) or 100 <= status < 200:
+            body = b""
+        else:
+            # Body delimited by the end of the connection
+            body = await reader.read()
+            headers["connection"] = "close"
+
+        return status, headers, body
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """Blocking HTTP connection over a unix socket."""
+
+    def __init__(self, socket_path: str, timeout: Optional[float]):
+        super().__init__("docker", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            raise
+        self.sock = sock
+
+
+class DockerEventStream:
+    """Decoded events from a streamed /events response, closable from any thread."""
+
+    def __init__(self, connection: _UnixHTTPConnection, response: http.client.HTTPResponse):
+        self._connection = connection
+        self._response = response
+        self._reading = False
+        self._closed = False
+
+    def __iter__(self) -> Iterator[dict]:
+        self._reading = True
+        try:
+            for line in self._response:
+                if line.strip():
+                    yield json.loads(line)
+        except (OSError, http.client.HTTPException, ValueError):
+            # Reading fails once close() has shut the socket down
+            if not self._closed:
+                raise
+        finally:
+            self._connection.close()
+
+    def close(self) -> None:
+        """End the stream, waking a thread blocked reading it."""
+        self._closed = True
+        sock = self._connection.sock
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        # A reading thread closes the connection itself when it wakes up
+        if not self._reading:
+            self._connection.close()
+
+
+class DockerSocketAPI:
+    """
+    Blocking subset of docker.APIClient over the daemon's unix socket.
+
+    Implements what ContainerInventory needs, the container list and the
+    events stream, so the "socket" backend shares its event-driven
+    inventory without the Docker SDK.
+    """
+
+    def __init__(self, path: str = DockerSocketClient.DEFAULT_SOCKET, timeout: float = 5.0):
+        """
+        Initialize the API. No connection is made until the first request.
+
+        Args:
+            path: Path of the daemon's unix socket
+            timeout: Seconds allowed for each request (the events stream
+                waits for events without a limit)
+        """
+        self.path = path
+        self.timeout = timeout
+
+    def containers(self, all: bool = False) -> List[dict]:
+        """
+        List the containers, like docker.APIClient.containers().
+
+        Raises:
+            DockerAPIError: If the daemon answers with an error status
+            OSError: If the socket cannot be reached
+        """
+        connection = _UnixHTTPConnection(self.path, self.timeout)
+        try:
+            response = self._get(connection, "/containers/json", {"all": "1" if all else "0"})
+            return json.loads(response.read())
+        finally:
+            connection.close()
+
+    def events(
+        self,
+        since: Optional[int] = None,
+        decode: bool = True,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> DockerEventStream:
+        """
+        Follow the events stream, like docker.APIClient.events(decode=True).
+
+        Raises:
+            DockerAPIError: If the daemon answers with an error status
+            OSError: If the socket cannot be reached
+        """
+        params = {}
+        if since is not None:
+            params["since"] = str(since)
+        if filters:
+            # The API takes a list of values per filter
+            params["filters"] = json.dumps(
+                {
+                    key: [value] if isinstance(value, str) else value
+                    for key, value in filters.items()
+                }
+            )
+
+        connection = _UnixHTTPConnection(self.path, self.timeout)
+        try:
+            response = self._get(connection, "/events", params)
+        except BaseException:
+            connection.close()
+            raise
+        # Events arrive whenever containers change
+        connection.sock.settimeout(None)
+        return DockerEventStream(connection, response)
+
+    @staticmethod
+    def _get(
+        connection: _UnixHTTPConnection, path: str, params: Dict[str, str]
+    ) -> http.client.HTTPResponse:
+        """Send a GET request and check the response status."""
+        target = f"{path}?{urlencode(params)}" if params else path
+        connection.request("GET", target, headers={"User-Agent": "sysmon"})
+        response = connection.getresponse()
+
+        if response.status >= 400:
+            body = response.read()
+            try:
+                message = json.loads(body).get("message", "")
+            except (ValueError, AttributeError):
+                message = body.decode("utf-8", "replace")
+            raise DockerAPIError(response.status, message)
+
+        return response
+
+
+class EventLoopThread:
+    """An event loop running on a daemon thread, for synchronous callers."""
+
+    def __init__(self, name: str = "sysmon-event-loop"):
+        """
+        Start the event loop thread.
+
+        Args:
+            name: Name of the thread
+        """
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def run(self, coroutine: Coroutine, timeout: Optional[float] = None) -> Any:
+        """
+        Run a coroutine on the loop and wait for its result.
+
+        Args:
+            coroutine: Coroutine to run
+            timeout: Longest wait in seconds (default: no limit)
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result(timeout)
+
+    def stop(self) -> None:
+        """Stop the loop once the callbacks already scheduled have run."""
+        if not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+
+    def _run(self) -> None:
+        """Thread body."""
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.loop.run_forever()
+        finally:
+            self.loop.close()
@@ -0,0 +1,448 @@
+"""
+Concurrent collection engine with per-collector deadlines and intervals.
+"""
+
+import asyncio
+import queue
+import threading
+import time
+from concurrent.futures import Future, wait
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from ..utils.overhead import OverheadRecorder
+
+# Sentinel distinguishing "collector failed" from a legitimate None result
+_NO_VALUE = object()
+
+
+@dataclass
+class CollectorResult:
+    """Container for the outcome of a single collector run."""
+
+    name: str
+    value: Any
+    stale: bool
+    collected_at: float
+    error: Optional[str] = None
+
+    @property
+    def age(self) -> float:
+        """Seconds since the value was collected."""
+        return time.monotonic() - self.collected_at
+
+
+@dataclass
+class CollectorSpec:
+    """Registration details for a collector."""
+
+    name: str
+    collect: Callable[[], Any]
+    deadline: float
+    placeholder: Any = None
+    interval: Optional[float] = None
+
+
+class CollectionEngine:
+    """
+    Runs collectors in parallel on a bounded pool of worker threads.
+
+    Each collector gets its own deadline per tick. A collector that misses
+    its deadline keeps running in the background and the engine reports its
+    last good value marked as stale. A collector is never queued twice, so a
+    hung call cannot pile up work behind it.
+
+    Collectors registered with an interval only run on ticks at which they
+    are due; on other ticks the engine reports their latest value, whose
+    age shows how old it is. This lets one tick cadence serve both cheap,
+    frequently sampled collectors and expensive, rarely sampled ones.
+    """
+
+    def __init__(self, max_workers: int = 4, recorder: Optional["OverheadRecorder"] = None):
+        """
+        Initialize the collection engine.
+
+        Args:
+            max_workers: Number of worker threads in the pool
+            recorder: Optional recorder of each collector call's wall and
+                CPU time
+        """
+        self.recorder = recorder
+        self._specs: Dict[str, CollectorSpec] = {}
+        self._pending: Dict[str, Future] = {}
+        self._last: Dict[str, CollectorResult] = {}
+        self._reported: Dict[str, CollectorResult] = {}
+        self._due: Dict[str, float] = {}
+        self._last_start: Optional[float] = None
+        self._lock = threading.Lock()
+        self._queue: "queue.Queue" = queue.Queue()
+
+        # Daemon workers so that a collector stuck in a system call never
+        # prevents the interpreter from exiting.
+        self._workers = [
+            threading.Thread(
+                target=self._worker, name=f"sysmon-collector-{i}", daemon=True
+            )
+            for i in range(max_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def register(
+        self,
+        name: str,
+        collect: Callable[[], Any],
+        deadline: float = 1.0,
+        placeholder: Any = None,
+        interval: Optional[float] = None,
+    ) -> None:
+        """
+        Register a collector with the engine.
+
+        Args:
+            name: Unique collector name (used as the result key)
+            collect: Callable returning the collector's metrics
+            deadline: Seconds to wait for the collector each tick
+            placeholder: Value reported before the first successful run
+            interval: Minimum seconds between runs (default: every tick)
+        """
+        self._specs[name] = CollectorSpec(
+            name=name,
+            collect=collect,
+            deadline=deadline,
+            placeholder=placeholder,
+            interval=interval,
+        )
+
+    @property
+    def names(self) -> List[str]:
+        """Names of the registered collectors, in registration order."""
+        return list(self._specs)
+
+    def set_interval(self, name: str, interval: Optional[float]) -> None:
+        """
+        Change the interval of a registered collector.
+
+        The collector runs on the next tick and at the new interval after it.
+
+        Args:
+            name: Name the collector was registered under
+            interval: Minimum seconds between runs (None: every tick)
+        """
+        self._specs[name].interval = interval
+        self._due.pop(name, None)
+
+    def collect_all(self) -> Dict[str, CollectorResult]:
+        """
+        Run the collectors that are due and wait for them up to their deadlines.
+
+        Collectors that are not due report their latest value. A collector
+        counts as due when it falls due within half a tick of now, so that a
+        tick waking slightly early does not skip a collector sampled at the
+        tick rate.
+
+        Returns:
+            Dictionary mapping collector names to CollectorResult objects
+        """
+        start = time.monotonic()
+        tolerance = 0.0
+        if self._last_start is not None:
+            tolerance = 0.5 * (start - self._last_start)
+        self._last_start = start
+
+        futures = {}
+        for name, spec in self._specs.items():
+            due = self._due.get(name)
+            if due is None or start + tolerance >= due:
+                futures[name] = self._submit(spec)
+                if spec.interval:
+                    # Keep to the schedule unless we have fallen a full
+                    # interval behind it
+                    next_due = start + spec.interval
+                    if due is not None and due + spec.interval > start:
+                        next_due = due + spec.interval
+                    self._due[name] = next_due
+
+        # Wait for the collectors in deadline order so the shortest waits
+        # are spent first and every collector gets its full budget.
+        for name in sorted(futures, key=lambda n: self._specs[n].deadline):
+            remaining = start + self._specs[name].deadline - time.monotonic()
+            if remaining > 0:
+                wait([futures[name]], timeout=remaining)
+
+        results = {}
+        for name in self._specs:
+            if name in futures:
+                results[name] = self._reported[name] = self._result(name, futures[name])
+            else:
+                results[name] = self._latest(name)
+        return results
+
+    def shutdown(self) -> None:
+        """Stop the worker threads once their current work has finished."""
+        for _ in self._workers:
+            self._queue.put(None)
+
+    def _submit(self, spec: CollectorSpec) -> Future:
+        """Queue a collector run unless one is already in flight."""
+        with self._lock:
+            future = self._pending.get(spec.name)
+            if future is None:
+                future = Future()
+                self._pending[spec.name] = future
+                self._queue.put((spec, future))
+            return future
+
+    def _worker(self) -> None:
+        """Worker thread loop executing queued collector runs."""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+
+            spec, future = item
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            recorder = self.recorder
+            if recorder is not None:
+                wall = time.perf_counter()
+                cpu = time.thread_time()
+
+            try:
+                value = spec.collect()
+            except Exception as e:
+                self._finish(spec.name)
+                future.set_exception(e)
+            else:
+                self._finish(spec.name, value)
+                future.set_result(value)
+            finally:
+                if recorder is not None:
+                    recorder.record(
+                        spec.name, time.perf_counter() - wall, time.thread_time() - cpu
+                    )
+
+    def _finish(self, name: str, value: Any = _NO_VALUE) -> None:
+        """Record a completed run and allow the collector to be queued again."""
+        with self._lock:
+            if value is not _NO_VALUE:
+                self._last[name] = CollectorResult(
+                    name=name,
+                    value=value,
+                    stale=False,
+                    collected_at=time.monotonic(),
+                )
+            self._pending.pop(name, None)
+
+    def _latest(self, name: str) -> CollectorResult:
+        """Get the result for a collector that was not due this tick."""
+        with self._lock:
+            last = self._last.get(name)
+        reported = self._reported.get(name)
+
+        # A run that missed its deadline may have finished since
+        if last is not None and (reported is None or last.collected_at > reported.collected_at):
+            return last
+        if reported is not None:
+            return reported
+        return CollectorResult(
+            name=name,
+            value=self._specs[name].placeholder,
+            stale=True,
+            collected_at=time.monotonic(),
+            error="not collected yet",
+        )
+
+    def _result(self, name: str, future: Future) -> CollectorResult:
+        """Build the result for a collector after its deadline has passed."""
+        with self._lock:
+            last = self._last.get(name)
+
+        if future.done() and future.exception() is None and last is not None:
+            return last
+
+        if future.done():
+            error = str(future.exception())
+        else:
+            error = "deadline exceeded"
+
+        if last is None:
+            return CollectorResult(
+                name=name,
+                value=self._specs[name].placeholder,
+                stale=True,
+                collected_at=time.monotonic(),
+                error=error,
+            )
+
+        return CollectorResult(
+            name=name,
+            value=last.value,
+            stale=True,
+            collected_at=last.collected_at,
+            error=error,
+        )
+
+
+class AsyncCollectionEngine(CollectionEngine):
+    """
+    Runs every collector as its own task on an asyncio event loop.
+
+    Each task repeats its collector at the collector's interval, independent
+    of the other collectors and of whoever reads the results; collect_all()
+    only reads the latest results and never waits. Coroutine collectors
+    (such as the Docker "socket" backend) run on the loop itself. Plain
+    collectors block on file reads, so they run on the same daemon worker
+    threads as in CollectionEngine, and are never queued twice.
+
+    A run that has taken longer than its deadline, or that failed, is
+    reported as stale with the last good value. For coroutine collectors,
+    the CPU time recorded is that of the loop thread over the run, so it
+    includes other tasks that ran while the collector was waiting.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        recorder: Optional["OverheadRecorder"] = None,
+        interval: float = 2.0,
+    ):
+        """
+        Initialize the engine.
+
+        Args:
+            max_workers: Number of worker threads for blocking collectors
+            recorder: Optional recorder of each collector call's wall and
+                CPU time
+            interval: Seconds between runs of collectors registered without
+                an interval
+        """
+        super().__init__(max_workers=max_workers, recorder=recorder)
+        self.interval = interval
+        self._errors: Dict[str, str] = {}
+        self._running_since: Dict[str, float] = {}
+        self._wakeups: Dict[str, asyncio.Event] = {}
+        self._ran: set = set()
+        self._ready: Optional[asyncio.Event] = None
+
+    async def run(self) -> None:
+        """Run every registered collector as a task until cancelled."""
+        await asyncio.gather(*(self._repeat(spec) for spec in self._specs.values()))
+
+    async def wait_ready(self, timeout: float) -> bool:
+        """
+        Wait until every collector has run once.
+
+        Args:
+            timeout: Longest wait in seconds
+
+        Returns:
+            True if every collector has run
+        """
+        try:
+            await asyncio.wait_for(self._ready_event().wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    def set_interval(self, name: str, interval: Optional[float]) -> None:
+        """
+        Change the interval of a registered collector.
+
+        The collector runs again now and at the new interval after it. Must
+        be called from the event loop's thread.
+
+        Args:
+            name: Name the collector was registered under
+            interval: Minimum seconds between runs (None: the engine interval)
+        """
+        super().set_interval(name, interval)
+        wakeup = self._wakeups.get(name)
+        if wakeup is not None:
+            wakeup.set()
+
+    def collect_all(self) -> Dict[str, CollectorResult]:
+        """
+        Get the latest result of every collector without waiting.
+
+        Returns:
+            Dictionary mapping collector names to CollectorResult objects
+        """
+        now = time.monotonic()
+        with self._lock:
+            last_results = dict(self._last)
+
+        results = {}
+        for name, spec in self._specs.items():
+            last = last_results.get(name)
+            error = self._errors.get(name)
+            running_since = self._running_since.get(name)
+            if running_since is not None and now - running_since > spec.deadline:
+                error = "deadline exceeded"
+            elif last is None and error is None:
+                error = "not collected yet"
+
+            if error is None:
+                results[name] = last
+            else:
+                results[name] = CollectorResult(
+                    name=name,
+                    value=spec.placeholder if last is None else last.value,
+                    stale=True,
+                    collected_at=now if last is None else last.collected_at,
+                    error=error,
+                )
+        return results
+
+    def _ready_event(self) -> asyncio.Event:
+        """Get the event set once every collector has run, creating it on the loop."""
+        if self._ready is None:
+            self._ready = asyncio.Event()
+        return self._ready
+
+    async def _repeat(self, spec: CollectorSpec) -> None:
+        """Run a collector at its interval until cancelled."""
+        wakeup = self._wakeups[spec.name] = asyncio.Event()
+
+        while True:
+            started = time.monotonic()
+            await self._run_once(spec)
+            wakeup.clear()
+
+            self._ran.add(spec.name)
+            if len(self._ran) == len(self._specs):
+                self._ready_event().set()
+
+            delay = (spec.interval or self.interval) - (time.monotonic() - started)
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def _run_once(self, spec: CollectorSpec) -> None:
+        """Run a collector once, on the loop or on a worker thread."""
+        name = spec.name
+        self._running_since[name] = time.monotonic()
+
+        try:
+            if asyncio.iscoroutinefunction(spec.collect):
+                wall = time.perf_counter()
+                cpu = time.thread_time()
+                try:
+                    self._finish(name, await spec.collect())
+                finally:
+                    if self.recorder is not None:
+                        self.recorder.record(
+                            name, time.perf_counter() - wall, time.thread_time() - cpu
+                        )
+            else:
+                await asyncio.wrap_future(self._submit(spec))
+        except Exception as e:
+            self._errors[name] = str(e)
+        else:
+            self._errors.pop(name, None)
+        finally:
+            del self._running_since[name]
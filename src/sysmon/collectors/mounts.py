@@ -0,0 +1,180 @@
+"""
+Mount table reader with kernel change notifications.
+"""
+
+import os
+import re
+import select
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Set
+
+import psutil
+
+
+@dataclass
+class MountInfo:
+    """A mounted filesystem."""
+
+    device: str
+    mountpoint: str
+    fstype: str
+
+
+class MountTable:
+    """
+    Reads the physical mounts from /proc/self/mountinfo.
+
+    The kernel signals every change to the mount table with POLLPRI/POLLERR
+    on an open mountinfo file, so callers can ask whether the table changed
+    with a zero-timeout poll instead of reparsing it. Where mountinfo cannot
+    be polled, changed() falls back to reporting a change every `ttl`
+    seconds; where it does not exist, psutil is used to read the table.
+    """
+
+    # Octal escapes used by the kernel for spaces, tabs, newlines and
+    # backslashes in paths
+    _ESCAPE = re.compile(r"\\([0-7]{3})")
+
+    def __init__(self, proc_root: str = "/proc", sys_root: str = "/sys", ttl: float = 30.0):
+        """
+        Initialize the mount table.
+
+        Args:
+            proc_root: Mount point of procfs
+            sys_root: Mount point of sysfs (used to resolve /dev/root)
+            ttl: Seconds after which an unwatchable table counts as changed
+        """
+        self.proc_root = proc_root
+        self.sys_root = sys_root
+        self.ttl = ttl
+        self._read_at: Optional[float] = None
+        self._fd: Optional[int] = None
+        self._poll = None
+
+        try:
+            self._fd = os.open(os.path.join(proc_root, "self", "mountinfo"), os.O_RDONLY)
+        except OSError:
+            return
+
+        if hasattr(select, "poll"):
+            self._poll = select.poll()
+            self._poll.register(self._fd, select.POLLPRI | select.POLLERR)
+
+    @property
+    def watching(self) -> bool:
+        """Whether changes are detected through kernel notifications."""
+        return self._poll is not None
+
+    def changed(self) -> bool:
+        """
+        Check whether the mount table changed since it was last read.
+
+        Always True before the first read.
+        """
+        if self._read_at is None:
+            return True
+
+        if self._poll is None:
+            return time.monotonic() - self._read_at >= self.ttl
+
+        # The kernel reports each change once per open file
+        return any(
+            events & (select.POLLPRI | select.POLLERR) for _, events in self._poll.poll(0)
+        )
+
+    def read(self) -> List[MountInfo]:
+        """
+        Read the physical mounts, skipping virtual filesystems.
+
+        Matches psutil.disk_partitions(all=False): mounts without a device
+        or with a filesystem type that needs no device are left out.
+
+        Returns:
+            List of MountInfo objects in mount order
+        """
+        if self._poll is not None:
+            # Drain a pending notification so that it is not reported again
+            self._poll.poll(0)
+        self._read_at = time.monotonic()
+
+        if self._fd is None:
+            return [
+                MountInfo(p.device, p.mountpoint, p.fstype)
+                for p in psutil.disk_partitions(all=False)
+            ]
+
+        fstypes = self._physical_fstypes()
+        mounts = []
+
+        for line in self._read_mountinfo().splitlines():
+            # id parent major:minor root mountpoint options [optional...] - fstype source super
+            head, _, tail = line.partition(" - ")
+            tail_fields = tail.split(" ", 2)
+            if len(tail_fields) < 2 or tail_fields[0] not in fstypes:
+                continue
+
+            fstype, device = tail_fields[0], self._unescape(tail_fields[1])
+            if device == "none" or not device:
+                continue
+
+            fields = head.split(" ", 5)
+            if len(fields) < 5:
+                continue
+            if device in ("/dev/root", "rootfs"):
+                device = self._block_device(fields[2]) or device
+
+            mounts.append(MountInfo(device, self._unescape(fields[4]), fstype))
+
+        return mounts
+
+    def close(self) -> None:
+        """Close the watched mountinfo file."""
+        if self._fd is not None:
+            if self._poll is not None:
+                self._poll.unregister(self._fd)
+                self._poll = None
+            os.close(self._fd)
+            self._fd = None
+
+    def _read_mountinfo(self) -> str:
+        """Read the whole mountinfo file through the watched descriptor."""
+        chunks = []
+        offset = 0
+        while True:
+            chunk = os.pread(self._fd, 65536, offset)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            offset += len(chunk)
+        return b"".join(chunks).decode("utf-8", "surrogateescape")
+
+    def _physical_fstypes(self) -> Set[str]:
+        """Filesystem types that need a block device, plus zfs."""
+        fstypes = {"zfs"}
+        try:
+            with open(os.path.join(self.proc_root, "filesystems")) as f:
+                for line in f:
+                    if not line.startswith("nodev"):
+                        fstypes.add(line.strip())
+        except OSError:
+            pass
+        return fstypes
+
+    def _block_device(self, major_minor: str) -> Optional[str]:
+        """Resolve a device number to its /dev path through sysfs."""
+        try:
+            with open(os.path.join(self.sys_root, "dev", "block", major_minor, "uevent")) as f:
+                for line in f:
+                    if line.startswith("DEVNAME="):
+                        return "/dev/" + line[8:].strip()
+        except OSError:
+            pass
+        return None
+
+    @classmethod
+    def _unescape(cls, path: str) -> str:
+        """Decode the kernel's octal escapes in a path."""
+        if "\\" not in path:
+            return path
+        return cls._ESCAPE.sub(lambda m: chr(int(m.group(1), 8)), path)
@@ -0,0 +1,184 @@
+"""
+Per-interface network throughput collector reading /proc/net/dev.
+"""
+
+import os
+import re
+import time
+from dataclasses import dataclass
+from operator import add, sub
+from typing import Dict, List, Optional, Tuple
+
+from ..utils.counters import counter_delta
+
+
+@dataclass
+class InterfaceMetrics:
+    """Container for the traffic rates of one interface or group of interfaces."""
+
+    name: str
+    rx_bytes_per_sec: float
+    tx_bytes_per_sec: float
+    rx_packets_per_sec: float
+    tx_packets_per_sec: float
+    rx_errors_per_sec: float
+    tx_errors_per_sec: float
+    rx_drops_per_sec: float
+    tx_drops_per_sec: float
+
+    # Number of interfaces summed into this entry (more than one for a
+    # group of virtual interfaces such as "veth*")
+    interfaces: int = 1
+
+
+# Field positions after the interface name in a /proc/net/dev line, in
+# InterfaceMetrics order: bytes, packets, errs and drop, each rx then tx
+_FIELDS = (0, 8, 1, 9, 2, 10, 3, 11)
+
+# Leading part of a virtual interface name shared by its group
+_GROUP_PREFIX = re.compile(r"[A-Za-z]+-?")
+
+
+class NetworkCollector:
+    """
+    Computes per-interface traffic rates from successive /proc/net/dev samples.
+
+    Virtual interfaces (those under /sys/devices/virtual/net: veth pairs,
+    bridges, tunnels) are summed into one entry per name prefix, so that a
+    host with hundreds of veth pairs reports a single "veth*" row. The
+    loopback interface is left out. An interface appearing for the first
+    time is counted from its second sample on; one that disappears is
+    forgotten.
+    """
+
+    LOOPBACK = "lo"
+
+    def __init__(
+        self,
+        proc_root: str = "/proc",
+        sys_root: str = "/sys",
+        group_virtual: bool = True,
+    ):
+        """
+        Initialize the collector.
+
+        Args:
+            proc_root: Mount point of procfs
+            sys_root: Mount point of sysfs (used to tell virtual interfaces)
+            group_virtual: Whether to sum virtual interfaces by name prefix
+        """
+        self.path = os.path.join(proc_root, "net", "dev")
+        self.virtual_path = os.path.join(sys_root, "devices", "virtual", "net")
+        self.group_virtual = group_virtual
+
+        # Raw text and parsed counters of each interface at the last sample
+        self._previous: Dict[bytes, Tuple[bytes, Tuple[int, ...]]] = {}
+        self._previous_time: Optional[float] = None
+
+        # Entry each interface name is reported under (None: not reported)
+        self._groups: Dict[bytes, Optional[str]] = {}
+
+    def is_available(self) -> bool:
+        """Check whether /proc/net/dev can be read."""
+        return os.path.exists(self.path)
+
+    def collect(self) -> List[InterfaceMetrics]:
+        """
+        Collect per-interface traffic rates since the previous call.
+
+        Returns:
+            List of InterfaceMetrics, physical interfaces first in
+            /proc/net/dev order, then groups of virtual interfaces (empty on
+            the first call)
+        """
+        try:
+            with open(self.path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return []
+
+        now = time.monotonic()
+        elapsed = now - self._previous_time if self._previous_time is not None else 0.0
+        previous = self._previous
+        groups = self._groups
+        current: Dict[bytes, Tuple[bytes, Tuple[int, ...]]] = {}
+
+        # Summed counter deltas and interface count per reported entry
+        totals: Dict[str, List[int]] = {}
+        counts: Dict[str, int] = {}
+        idle = [0] * len(_FIELDS)
+
+        # The first two lines are headers
+        lines = data.splitlines()[2:]
+        for line in lines:
+            name, _, raw = line.partition(b":")
+            name = name.strip()
+
+            group = groups.get(name, "")
+            if group == "":
+                group = groups[name] = self._group(name.decode())
+            if group is None:
+                continue
+
+            last = previous.get(name)
+            if last is not None and last[0] == raw:
+                # Idle interface: nothing changed since the last sample
+                current[name] = last
+                deltas = idle
+            else:
+                fields = raw.split()
+                if len(fields) < 16:
+                    continue
+                counters = tuple([int(fields[i]) for i in _FIELDS])
+                current[name] = (raw, counters)
+                if last is None:
+                    continue
+
+                deltas = list(map(sub, counters, last[1]))
+                if min(deltas) < 0:
+                    deltas = list(map(counter_delta, counters, last[1]))
+
+            total = totals.get(group)
+            if total is None:
+                totals[group] = deltas
+                counts[group] = 1
+            else:
+                totals[group] = list(map(add, total, deltas))
+                counts[group] += 1
+
+        self._previous = current
+        self._previous_time = now
+
+        # Forget interfaces that went away so that their names can be reused
+        if len(groups) > len(lines):
+            present = {line.partition(b":")[0].strip() for line in lines}
+            for name in [name for name in groups if name not in present]:
+                del groups[name]
+
+        if elapsed <= 0:
+            return []
+
+        # Physical interfaces first; virtual groups are named "prefix*" even
+        # with a single member, so that their key survives container churn
+        interfaces = []
+        for group in sorted(totals, key=lambda group: group.endswith("*")):
+            interfaces.append(
+                InterfaceMetrics(
+                    group,
+                    *[delta / elapsed for delta in totals[group]],
+                    interfaces=counts[group],
+                )
+            )
+        return interfaces
+
+    def _group(self, name: str) -> Optional[str]:
+        """Decide which entry an interface seen for the first time is reported under."""
+        if name == self.LOOPBACK:
+            return None
+        if not self.group_virtual or not os.path.exists(
+            os.path.join(self.virtual_path, name)
+        ):
+            return name
+
+        match = _GROUP_PREFIX.match(name)
+        return (match.group() if match else name) + "*"
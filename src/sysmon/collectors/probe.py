@@ -0,0 +1,169 @@
+"""
+Hang-proof filesystem usage probing.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Set
+
+import psutil
+
+
+@dataclass
+class Quarantine:
+    """A mount whose usage probe timed out."""
+
+    future: Future
+    retry_at: float
+    backoff: float
+
+
+class UsageProber:
+    """
+    Runs filesystem usage probes on worker threads with a timeout.
+
+    statvfs on a stale NFS or FUSE mount can block indefinitely. Probes run
+    on daemon worker threads and the caller waits at most `timeout` seconds
+    per batch. A mount whose probe times out is quarantined: it is not
+    probed again until its backoff expires, and never while its previous
+    probe is still blocked. Each timeout doubles the backoff up to
+    `max_backoff`. Workers stuck in a probe are replaced so that one hung
+    mount cannot starve the others.
+    """
+
+    def __init__(
+        self,
+        probe: Callable[[str], Any] = psutil.disk_usage,
+        timeout: float = 0.5,
+        workers: int = 4,
+        backoff: float = 5.0,
+        max_backoff: float = 300.0,
+        max_threads: int = 32,
+    ):
+        """
+        Initialize the prober.
+
+        Args:
+            probe: Callable returning the usage of a mount point
+            timeout: Seconds to wait for a batch of probes
+            workers: Number of worker threads available for probing
+            backoff: Seconds before a quarantined mount is first re-probed
+            max_backoff: Upper bound for the re-probe backoff
+            max_threads: Upper bound for worker threads, including hung ones
+        """
+        self.probe = probe
+        self.timeout = timeout
+        self.workers = workers
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_threads = max_threads
+
+        self._quarantine: Dict[str, Quarantine] = {}
+        self._queue: "queue.Queue" = queue.Queue()
+        self._threads: List[threading.Thread] = []
+
+    @property
+    def quarantined(self) -> Set[str]:
+        """Mount points currently quarantined."""
+        return set(self._quarantine)
+
+    def probe_all(self, mountpoints: Iterable[str]) -> Dict[str, Any]:
+        """
+        Probe the usage of several mount points.
+
+        Args:
+            mountpoints: Mount points to probe
+
+        Returns:
+            Dictionary mapping mount points to probe results; mount points
+            that are quarantined or whose probe failed are left out
+        """
+        now = time.monotonic()
+        futures: Dict[str, Future] = {}
+        self._replace_stuck_workers()
+
+        for mountpoint in mountpoints:
+            held = self._quarantine.get(mountpoint)
+            if held is not None:
+                if now < held.retry_at:
+                    continue
+                if not held.future.done():
+                    # Still blocked in the previous probe; wait longer
+                    self._extend(held, now)
+                    continue
+            futures[mountpoint] = self._submit(mountpoint)
+
+        if futures:
+            wait(list(futures.values()), timeout=self.timeout)
+
+        results = {}
+        for mountpoint, future in futures.items():
+            if not future.done():
+                held = self._quarantine.get(mountpoint)
+                if held is None:
+                    self._quarantine[mountpoint] = Quarantine(
+                        future=future, retry_at=now + self.backoff, backoff=self.backoff
+                    )
+                else:
+                    held.future = future
+                    self._extend(held, now)
+                continue
+
+            self._quarantine.pop(mountpoint, None)
+            if future.exception() is None:
+                results[mountpoint] = future.result()
+
+        return results
+
+    def forget(self, mountpoints: Iterable[str]) -> None:
+        """Drop the quarantine of mount points that no longer exist."""
+        for mountpoint in mountpoints:
+            self._quarantine.pop(mountpoint, None)
+
+    def close(self) -> None:
+        """Stop the idle worker threads."""
+        for _ in self._threads:
+            self._queue.put(None)
+
+    def _extend(self, held: Quarantine, now: float) -> None:
+        """Double a quarantined mount's backoff."""
+        held.backoff = min(held.backoff * 2, self.max_backoff)
+        held.retry_at = now + held.backoff
+
+    def _replace_stuck_workers(self) -> None:
+        """Start workers until `workers` of them are not stuck in a probe."""
+        stuck = sum(1 for held in self._quarantine.values() if held.future.running())
+        while (
+            len(self._threads) - stuck < self.workers
+            and len(self._threads) < self.max_threads
+        ):
+            thread = threading.Thread(
+                target=self._worker, name="sysmon-disk-probe", daemon=True
+            )
+            self._threads.append(thread)
+            thread.start()
+
+    def _submit(self, mountpoint: str) -> Future:
+        """Queue a probe."""
+        future: Future = Future()
+        self._queue.put((mountpoint, future))
+        return future
+
+    def _worker(self) -> None:
+        """Worker thread loop executing queued probes."""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+
+            mountpoint, future = item
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            try:
+                future.set_result(self.probe(mountpoint))
+            except Exception as e:
+                future.set_exception(e)
@@ -0,0 +1,296 @@
+"""
+Process metrics collector reading /proc directly.
+"""
+
+import heapq
+import os
+import time
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import psutil
+
+
+@dataclass
+class ProcessInfo:
+    """Container for process information."""
+
+    pid: int
+    name: str
+    cpu_percent: float
+    memory_percent: float
+    status: str
+
+
+class ProcessScanner:
+    """
+    Finds the top processes by CPU or memory from /proc/<pid>/stat.
+
+    Only the stat file of each process is read. Between scans the scanner
+    keeps just the start time and CPU tick count of every PID, and the top
+    entries of each order are picked with a bounded heap instead of sorting
+    every process.
+    """
+
+    # Single-letter states from /proc/<pid>/stat (same names as psutil)
+    STATES = {
+        "R": "running",
+        "S": "sleeping",
+        "D": "disk-sleep",
+        "T": "stopped",
+        "t": "tracing-stop",
+        "Z": "zombie",
+        "X": "dead",
+        "x": "dead",
+        "K": "wake-kill",
+        "W": "waking",
+        "I": "idle",
+        "P": "parked",
+    }
+
+    # Key of each sort order in the candidate tuples built by scan_top
+    SORT_FIELDS = {"cpu": itemgetter(0), "memory": itemgetter(1)}
+
+    def __init__(self, proc_root: str = "/proc"):
+        """
+        Initialize the process scanner.
+
+        Args:
+            proc_root: Mount point of procfs
+        """
+        self.proc_root = proc_root
+        self._clock_ticks = os.sysconf("SC_CLK_TCK")
+        self._page_size = os.sysconf("SC_PAGE_SIZE")
+        self._total_memory = self._read_total_memory()
+
+        # PID -> (start time, utime + stime) from the previous scan
+        self._cpu_ticks: Dict[int, Tuple[int, int]] = {}
+        self._last_scan: Optional[float] = None
+
+    @property
+    def is_available(self) -> bool:
+        """Check if procfs is mounted at the configured root."""
+        return os.path.isfile(os.path.join(self.proc_root, "stat"))
+
+    def scan(self, count: int, sort_by: str = "cpu") -> List[ProcessInfo]:
+        """
+        Scan all processes and return the top entries.
+
+        CPU percentages are measured since the previous scan; the first scan
+        reports 0.0 for every process.
+
+        Args:
+            count: Number of processes to return
+            sort_by: Sort criteria ("cpu" or "memory")
+
+        Returns:
+            List of ProcessInfo objects, highest usage first
+        """
+        return self.scan_top(count, (sort_by,))
+
+    def scan_top(self, count: int, sort_keys: Sequence[str]) -> List[ProcessInfo]:
+        """
+        Scan all processes once and return the top entries of several orders.
+
+        Args:
+            count: Number of processes to return per sort order
+            sort_keys: Sort criteria ("cpu" and/or "memory")
+
+        Returns:
+            List of ProcessInfo objects: the top entries of the first order,
+            highest usage first, followed by those of the other orders that
+            are not already listed
+        """
+        now = time.monotonic()
+        elapsed_ticks = 0.0
+        if self._last_scan is not None:
+            elapsed_ticks = (now - self._last_scan) * self._clock_ticks
+
+        previous = self._cpu_ticks
+        current: Dict[int, Tuple[int, int]] = {}
+
+        def candidates():
+            for pid, name, state, start, ticks, rss in self._read_all():
+                current[pid] = (start, ticks)
+
+                cpu_delta = 0
+                last = previous.get(pid)
+                if last is not None and last[0] == start:
+                    cpu_delta = ticks - last[1]
+
+                yield (cpu_delta, rss, pid, name, state)
+
+        keys = [self.SORT_FIELDS.get(sort_by, itemgetter(0)) for sort_by in sort_keys]
+
+        # One pass over /proc feeding one bounded min-heap per order; entries
+        # are (key, pid, candidate), the PID breaking ties
+        heaps: List[list] = [[] for _ in keys]
+        for candidate in candidates():
+            pid = candidate[2]
+            for key, heap in zip(keys, heaps):
+                entry = (key(candidate), pid, candidate)
+                if len(heap) < count:
+                    heapq.heappush(heap, entry)
+                else:
+                    heapq.heappushpop(heap, entry)
+
+        top = []
+        listed = set()
+        for heap in heaps:
+            for _, pid, candidate in sorted(heap, reverse=True):
+                if pid not in listed:
+                    listed.add(pid)
+                    top.append(candidate)
+
+        self._cpu_ticks = current
+        self._last_scan = now
+
+        return [
+            ProcessInfo(
+                pid=pid,
+                name=name.decode("utf-8", "replace") or "Unknown",
+                cpu_percent=(cpu_delta / elapsed_ticks * 100) if elapsed_ticks > 0 else 0.0,
+                memory_percent=(rss * self._page_size / self._total_memory * 100)
+                if self._total_memory
+                else 0.0,
+                status=self.STATES.get(state.decode(), "unknown"),
+            )
+            for cpu_delta, rss, pid, name, state in top
+        ]
+
+    def _read_all(self):
+        """
+        Yield the stat fields of every process.
+
+        Yields:
+            Tuples of (pid, name, state, start time, cpu ticks, rss pages),
+            with name and state left as undecoded bytes
+        """
+        root = self.proc_root
+
+        try:
+            entries = os.listdir(root)
+        except OSError:
+            return
+
+        for entry in entries:
+            if not entry.isdigit():
+                continue
+
+            try:
+                fd = os.open(f"{root}/{entry}/stat", os.O_RDONLY)
+                try:
+                    data = os.read(fd, 1024)
+                finally:
+                    os.close(fd)
+            except OSError:
+                # Process exited between listdir() and open()
+                continue
+
+            # The command name may itself contain spaces and parentheses,
+            # so split on the first "(" and the last ")"
+            open_paren = data.find(b"(")
+            close_paren = data.rfind(b")")
+            if open_paren < 0 or close_paren < 0:
+                continue
+
+            fields = data[close_paren + 2 :].split()
+            if len(fields) < 22:
+                continue
+
+            # Field numbers from proc(5), offset by the three leading fields:
+            # 14 utime, 15 stime, 22 starttime, 24 rss
+            yield (
+                int(entry),
+                data[open_paren + 1 : close_paren],
+                fields[0],
+                int(fields[19]),
+                int(fields[11]) + int(fields[12]),
+                int(fields[21]),
+            )
+
+    def _read_total_memory(self) -> int:
+        """Read total physical memory in bytes from meminfo."""
+        try:
+            with open(os.path.join(self.proc_root, "meminfo")) as f:
+                for line in f:
+                    if line.startswith("MemTotal:"):
+                        return int(line.split()[1]) * 1024
+        except (OSError, ValueError, IndexError):
+            pass
+        return 0
+
+
+class ProcessCollector:
+    """Collects the top processes by CPU or memory usage."""
+
+    def __init__(self, max_processes: int = 5):
+        """
+        Initialize the process collector.
+
+        Args:
+            max_processes: Number of processes to report
+        """
+        self.max_processes = max_processes
+        self.scanner = ProcessScanner()
+
+    def collect(self, sort_by: str = "cpu") -> List[ProcessInfo]:
+        """
+        Collect the top processes sorted by CPU or memory usage.
+
+        Args:
+            sort_by: Sort criteria ("cpu" or "memory")
+
+        Returns:
+            List of ProcessInfo objects
+        """
+        return self.collect_top((sort_by,))
+
+    def collect_top(self, sort_keys: Sequence[str] = ("cpu",)) -> List[ProcessInfo]:
+        """
+        Collect the top processes of several sort orders from a single scan.
+
+        Args:
+            sort_keys: Sort criteria ("cpu" and/or "memory")
+
+        Returns:
+            List of ProcessInfo objects: the top entries of the first order,
+            followed by those of the other orders not already listed
+        """
+        if self.scanner.is_available:
+            return self.scanner.scan_top(self.max_processes, sort_keys)
+
+        # No procfs (non-Linux): fall back to psutil
+        processes = []
+
+        for proc in psutil.process_iter(["pid", "name", "cpu_percent", "memory_percent", "status"]):
+            try:
+                info = proc.info
+                processes.append(
+                    ProcessInfo(
+                        pid=info["pid"],
+                        name=info["name"] or "Unknown",
+                        cpu_percent=info["cpu_percent"] or 0.0,
+                        memory_percent=info["memory_percent"] or 0.0,
+                        status=info["status"] or "unknown",
+                    )
+                )
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                continue
+
+        top = []
+        listed = set()
+        for sort_by in sort_keys:
+            # Sort by CPU or memory
+            if sort_by == "memory":
+                processes.sort(key=lambda p: p.memory_percent, reverse=True)
+            else:
+                processes.sort(key=lambda p: p.cpu_percent, reverse=True)
+
+            for process in processes[: self.max_processes]:
+                if process.pid not in listed:
+                    listed.add(process.pid)
+                    top.append(process)
+
+        return top
@@ -7,5 +7,15 @@ from .panels import MetricPanel
 from .graphs import SparklineGraph
 from .processes import ProcessTable
 from .docker import DockerPanel
+from .diskio import DiskIOPanel
+from .network import NetworkPanel
 
-__all__ = ["Dashboard", "MetricPanel", "SparklineGraph", "ProcessTable", "DockerPanel"]
+__all__ = [
+    "Dashboard",
+    "MetricPanel",
+    "SparklineGraph",
+    "ProcessTable",
+    "DockerPanel",
+    "DiskIOPanel",
+    "NetworkPanel",
+]
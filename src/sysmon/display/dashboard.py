@@ -3,128 +3,480 @@ Main dashboard layout component.
 """
 
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Callable, Dict, List, Optional, Sequence
 
-from rich.console import Console, Group
-from rich.layout import Layout
+from rich.console import Console, ConsoleOptions, RenderableType, RenderResult
+from rich.layout import Layout, RenderMap
 from rich.panel import Panel
+from rich.segment import Segment
 from rich.table import Table
 from rich.text import Text
 
-from ..collectors.cpu import CPUCollector, CPUMetrics
-from ..collectors.disk import DiskCollector, DiskMetrics
-from ..collectors.docker import DockerCollector, DockerMetrics
-from ..collectors.load import LoadCollector, LoadMetrics
-from ..collectors.memory import MemoryCollector, MemoryMetrics
-from ..utils.history import HistoryBuffer
+from ..snapshot import Snapshot, SnapshotCollector
+from ..utils.overhead import OverheadRecorder
+from .diskio import DiskIOPanel
 from .docker import DockerPanel
+from .network import NetworkPanel
 from .panels import MetricPanel
 from .processes import ProcessTable
 
 
+class _CachedRenderable:
+    """Renders a renderable once per size and replays the lines afterwards."""
+
+    def __init__(self, renderable: RenderableType):
+        self.renderable = renderable
+        self._size: Optional[tuple] = None
+        self._lines: List[List[Segment]] = []
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        size = (options.max_width, options.height)
+        if size != self._size:
+            self._lines = console.render_lines(self.renderable, options, pad=False)
+            self._size = size
+
+        new_line = Segment.line()
+        for line in self._lines:
+            yield from line
+            yield new_line
+
+
+class _FittingLayout(Layout):
+    """
+    Root layout that hides optional sections the terminal has no room for.
+
+    Before each render, the optional sections are shown in priority order
+    as long as the section that fills the remaining height keeps at least
+    `min_height` rows; the others are hidden until the terminal grows.
+    """
+
+    def __init__(self, fill: str, min_height: int, optional: Sequence[str]):
+        """
+        Initialize the layout.
+
+        Args:
+            fill: Name of the section taking the remaining height
+            min_height: Rows `fill` keeps before optional sections are shown
+            optional: Names of the fixed-size sections that may be hidden,
+                most important first
+        """
+        super().__init__()
+        self.fill = fill
+        self.min_height = min_height
+        self.optional = optional
+
+    def render(self, console: Console, options: ConsoleOptions) -> RenderMap:
+        self.fit(options.height or console.height)
+        return super().render(console, options)
+
+    def fit(self, height: int) -> None:
+        """Show the optional sections that fit in `height` rows."""
+        # Hidden sections are left out of children, but still found by get()
+        used = self.min_height + sum(
+            section.size or 0
+            for section in self.children
+            if section.name != self.fill and section.name not in self.optional
+        )
+        for name in self.optional:
+            section = self.get(name)
+            if section is None:
+                continue
+            section.visible = used + section.size <= height
+            if section.visible:
+                used += section.size
+
+
 class Dashboard:
     """Main dashboard that combines all metric panels."""
 
-    def __init__(self, show_processes: bool = True, show_docker: bool = True):
+    # Timings shown in the overhead footer
+    OVERHEAD_FOOTER = ["snapshot", "layout", "write"]
+
+    # Processes collected per sort order when the view can be changed, so
+    # the list can be re-sorted and scrolled without a new collection
+    INTERACTIVE_PROCESSES = 50
+
+    # Samples per CPU core kept for the expanded core view
+    EXPANDED_CORE_HISTORY = 8
+
+    # Lists that can be scrolled, in the order Tab moves through them
+    SCROLL_TARGETS = ("processes", "docker")
+
+    # Rows the CPU/memory/load/disk grid keeps on short terminals; the
+    # sections below are hidden, last first, rather than shrink it further
+    MIN_MAIN_HEIGHT = 15
+    OPTIONAL_SECTIONS = ("disk_io", "network")
+
+    def __init__(
+        self,
+        show_processes: bool = True,
+        show_docker: bool = True,
+        deadlines: Optional[Dict[str, float]] = None,
+        docker_backend: str = "api",
+        refresh_rate: float = 2.0,
+        history_span: Optional[float] = None,
+        collect: bool = True,
+        title: str = "System Monitor",
+        intervals: Optional[Dict[str, float]] = None,
+        show_disk_io: bool = True,
+        show_network: bool = True,
+        docker_sort: str = "cpu",
+        recorder: Optional[OverheadRecorder] = None,
+        show_overhead: bool = False,
+        core_history: int = 0,
+        braille: bool = False,
+        interactive: bool = False,
+        use_asyncio: bool = False,
+    ):
         """
         Initialize the dashboard.
 
         Args:
             show_processes: Whether to show the process list
             show_docker: Whether to show Docker container metrics
+            deadlines: Optional per-collector deadline overrides in seconds
+            docker_backend: Docker stats backend ("api", "stream", "cgroup"
+                or "socket")
+            refresh_rate: Seconds between collections
+            history_span: Seconds of history shown in sparklines
+                (default: one value per refresh)
+            collect: Whether to create collectors; without them the dashboard
+                only renders snapshots passed to create_layout
+            title: Title shown in the header
+            intervals: Optional per-collector interval overrides in seconds
+            show_disk_io: Whether to show per-device disk I/O
+            show_network: Whether to show per-interface network rates
+            docker_sort: Order of the containers ("cpu", "memory", "net" or "io")
+            recorder: Optional recorder of sysmon's own overhead, passed to
+                the collectors
+            show_overhead: Whether to show the latest overhead measurements
+                from `recorder` in a footer
+            core_history: Number of recent samples shown for each CPU core
+                in the CPU heatmap (0: the current usage only)
+            braille: Whether to draw the history graphs with braille dots,
+                fitting two samples in each character
+            interactive: Whether the view can be changed between frames;
+                collects the top processes of every sort order, enough of
+                them to scroll through, and the per-core history of the
+                expanded core view
+            use_asyncio: Whether the collectors run as tasks on an event
+                loop (see SnapshotCollector.run_collectors)
         """
         self.show_processes = show_processes
         self.show_docker = show_docker
-
-        # Collectors
-        self.cpu_collector = CPUCollector()
-        self.memory_collector = MemoryCollector()
-        self.disk_collector = DiskCollector()
-        self.load_collector = LoadCollector()
-        self.docker_collector = DockerCollector()
+        self.show_disk_io = show_disk_io
+        self.show_network = show_network
+        self.show_overhead = show_overhead and recorder is not None
+        self.recorder = recorder
+        self.title = title
 
         # Display components
-        self.panel_renderer = MetricPanel()
+        self.panel_renderer = MetricPanel(braille=braille)
         self.process_table = ProcessTable(max_processes=5)
-        self.docker_panel = DockerPanel(max_containers=6)
+        self.docker_panel = DockerPanel(max_containers=6, sort_by=docker_sort)
+        self.disk_io_panel = DiskIOPanel(max_devices=4, braille=braille)
+        self.network_panel = NetworkPanel(max_interfaces=4, braille=braille)
+
+        # View state, changed between frames in interactive mode
+        self.process_sort = "cpu"
+        self.expand_cores = core_history > 0
+        self.scroll_target = "processes" if show_processes else "docker"
+        self.offsets = {target: 0 for target in self.SCROLL_TARGETS}
+        self.status = ""
+
+        max_processes = self.process_table.max_processes
+        process_sort_keys: tuple = ("cpu",)
+        if interactive:
+            max_processes = self.INTERACTIVE_PROCESSES
+            process_sort_keys = tuple(ProcessTable.SORT_KEYS)
+            core_history = core_history or self.EXPANDED_CORE_HISTORY
+        self._process_depth = max_processes
+
+        # Persistent layout tree and the inputs each leaf panel was built from
+        self._layout: Optional[Layout] = None
+        self._layout_structure: Optional[tuple] = None
+        self._panel_inputs: Dict[str, tuple] = {}
 
-        # History buffers for sparklines
-        self.cpu_history = HistoryBuffer(max_size=60)
-        self.memory_history = HistoryBuffer(max_size=60)
-        self.load_history = HistoryBuffer(max_size=60)
-
-        # Prime CPU collector
-        CPUCollector.prime()
+        # Collectors
+        self.collector: Optional[SnapshotCollector] = None
+        if collect:
+            self.collector = SnapshotCollector(
+                show_processes=show_processes,
+                show_docker=show_docker,
+                deadlines=deadlines,
+                docker_backend=docker_backend,
+                max_processes=max_processes,
+                interval=refresh_rate,
+                history_points=self.panel_renderer.sparkline.samples,
+                history_span=history_span,
+                intervals=intervals,
+                show_disk_io=show_disk_io,
+                show_network=show_network,
+                recorder=recorder,
+                core_history_points=core_history,
+                process_sort_keys=process_sort_keys,
+                use_asyncio=use_asyncio,
+            )
 
-    def collect_metrics(self) -> Dict:
+    def collect_metrics(self) -> Snapshot:
         """
         Collect all system metrics.
 
         Returns:
-            Dictionary containing all metrics
-        """
-        cpu = self.cpu_collector.collect()
-        memory = self.memory_collector.collect()
-        disk = self.disk_collector.collect()
-        load = self.load_collector.collect()
-
-        # Update history
-        self.cpu_history.add(cpu.overall_percent)
-        self.memory_history.add(memory.percent)
-        self.load_history.add(load.load_1min_normalized)
-
-        metrics = {
-            "cpu": cpu,
-            "memory": memory,
-            "disk": disk,
-            "load": load,
-        }
-
-        # Collect Docker metrics if enabled
-        if self.show_docker:
-            metrics["docker"] = self.docker_collector.collect()
+            Snapshot containing all metrics
+        """
+        return self.collector.collect()
 
-        return metrics
+    def close(self) -> None:
+        """Release background resources held by the dashboard."""
+        if self.collector is not None:
+            self.collector.close()
 
-    def create_header(self) -> Panel:
-        """Create the dashboard header."""
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    def create_header(self, timestamp: Optional[float] = None) -> Panel:
+        """
+        Create the dashboard header.
+
+        Args:
+            timestamp: Time the displayed metrics were collected (default: now)
+        """
+        when = datetime.fromtimestamp(timestamp) if timestamp else datetime.now()
+        now = when.strftime("%Y-%m-%d %H:%M:%S")
 
         header_table = Table.grid(expand=True)
         header_table.add_column(justify="center", ratio=1)
 
         header_table.add_row(
-            Text("System Monitor", style="bold magenta", justify="center")
+            Text(self.title, style="bold magenta", justify="center")
         )
         header_table.add_row(Text(now, style="dim", justify="center"))
 
-        return Panel(header_table, style="magenta", padding=(0, 1))
+        return Panel(
+            header_table,
+            style="magenta",
+            padding=(0, 1),
+            subtitle=self.status or None,
+        )
 
-    def create_layout(self, metrics: Dict) -> Layout:
+    def create_layout(self, snapshot: Snapshot) -> Layout:
         """
-        Create the full dashboard layout.
+        Update the dashboard layout with a snapshot.
+
+        The layout tree is built once and reused across frames; only leaf
+        panels whose inputs changed since the previous frame are rebuilt.
+        Only reads the snapshot; rendering never triggers a collection.
 
         Args:
-            metrics: Dictionary of collected metrics
+            snapshot: Snapshot of collected metrics
 
         Returns:
             Rich Layout object
         """
-        layout = Layout()
+        structure = (
+            self.show_disk_io,
+            self.show_network,
+            self.show_docker,
+            self.show_processes,
+            self.show_overhead,
+        )
+        if self._layout is None or self._layout_structure != structure:
+            self._layout = self._build_layout()
+            self._layout_structure = structure
+            self._panel_inputs = {}
+
+        layout = self._layout
+        stale = snapshot.stale
+        ages = snapshot.ages
+
+        # Header
+        layout["header"].update(self.create_header(snapshot.timestamp))
+
+        # Metric panels
+        core_history = snapshot.core_history if self.expand_cores else ()
+        self._update_panel(
+            "cpu",
+            (snapshot.cpu, snapshot.cpu_history, "cpu" in stale, core_history),
+            lambda: self.panel_renderer.create_cpu_panel(
+                snapshot.cpu,
+                snapshot.cpu_history,
+                stale="cpu" in stale,
+                core_history=core_history,
+            ),
+            age=ages.get("cpu", 0.0),
+        )
+        self._update_panel(
+            "memory",
+            (snapshot.memory, snapshot.memory_history, "memory" in stale),
+            lambda: self.panel_renderer.create_memory_panel(
+                snapshot.memory, snapshot.memory_history, stale="memory" in stale
+            ),
+            age=ages.get("memory", 0.0),
+        )
+        self._update_panel(
+            "load",
+            (snapshot.load, snapshot.load_history, "load" in stale),
+            lambda: self.panel_renderer.create_load_panel(
+                snapshot.load, snapshot.load_history, stale="load" in stale
+            ),
+            age=ages.get("load", 0.0),
+        )
+        self._update_panel(
+            "disk",
+            (snapshot.disk, "disk" in stale),
+            lambda: self.panel_renderer.create_disk_panel(
+                snapshot.disk, stale="disk" in stale
+            ),
+            age=ages.get("disk", 0.0),
+        )
+
+        # Per-device disk I/O
+        if self.show_disk_io and snapshot.disk_devices is not None:
+            self._update_panel(
+                "disk_io",
+                (snapshot.disk_devices, snapshot.disk_device_history, "disk_devices" in stale),
+                lambda: self.disk_io_panel.create_panel(
+                    snapshot.disk_devices,
+                    snapshot.disk_device_history,
+                    stale="disk_devices" in stale,
+                ),
+                age=ages.get("disk_devices", 0.0),
+            )
+
+        # Network interfaces
+        if self.show_network and snapshot.network is not None:
+            self._update_panel(
+                "network",
+                (snapshot.network, snapshot.network_history, "network" in stale),
+                lambda: self.network_panel.create_panel(
+                    snapshot.network,
+                    snapshot.network_history,
+                    stale="network" in stale,
+                ),
+                age=ages.get("network", 0.0),
+            )
+
+        # Docker containers
+        if self.show_docker and snapshot.docker is not None:
+            self._clamp_offset("docker", len(snapshot.docker.containers))
+            self._update_panel(
+                "docker",
+                (
+                    snapshot.docker,
+                    "docker" in stale,
+                    self.docker_panel.sort_by,
+                    self.offsets["docker"],
+                ),
+                lambda: self.docker_panel.create_panel(
+                    snapshot.docker, stale="docker" in stale, offset=self.offsets["docker"]
+                ),
+                age=ages.get("docker", 0.0),
+            )
+
+        # Process table
+        if self.show_processes and snapshot.processes is not None:
+            # Past the top of the shown order come other orders' top processes
+            self._clamp_offset("processes", min(len(snapshot.processes), self._process_depth))
+            self._update_panel(
+                "processes",
+                (
+                    snapshot.processes,
+                    "processes" in stale,
+                    self.process_sort,
+                    self.offsets["processes"],
+                ),
+                lambda: self.process_table.create_panel(
+                    sort_by=self.process_sort,
+                    processes=snapshot.processes,
+                    offset=self.offsets["processes"],
+                    stale="processes" in stale,
+                ),
+                age=ages.get("processes", 0.0),
+            )
+
+        # Own overhead, as of the previous frame
+        if self.show_overhead:
+            layout["footer"].update(
+                Text(
+                    self.recorder.footer(self.OVERHEAD_FOOTER),
+                    style="dim",
+                    no_wrap=True,
+                    overflow="ellipsis",
+                )
+            )
+
+        return layout
+
+    def cycle_process_sort(self) -> None:
+        """Sort processes by the next order, scrolled back to the top."""
+        self.process_sort = self._next(list(ProcessTable.SORT_KEYS), self.process_sort)
+        self.offsets["processes"] = 0
+
+    def cycle_docker_sort(self) -> None:
+        """Sort containers by the next order, scrolled back to the top."""
+        panel = self.docker_panel
+        panel.sort_by = self._next(list(DockerPanel.SORT_KEYS), panel.sort_by)
+        self.offsets["docker"] = 0
+
+    def cycle_scroll_target(self) -> None:
+        """Make the next shown list the one scroll() moves."""
+        shown = [
+            target
+            for target, visible in zip(self.SCROLL_TARGETS, (self.show_processes, self.show_docker))
+            if visible
+        ]
+        if shown:
+            self.scroll_target = self._next(shown, self.scroll_target)
+
+    def scroll(self, rows: int) -> None:
+        """
+        Scroll the current scroll target.
+
+        Args:
+            rows: Rows to move down (negative: up); clamped to the list on
+                the next frame
+        """
+        self.offsets[self.scroll_target] = max(0, self.offsets[self.scroll_target] + rows)
+
+    def page_size(self, target: Optional[str] = None) -> int:
+        """
+        Get the number of rows a scrollable list shows at once.
+
+        Args:
+            target: One of SCROLL_TARGETS (default: the current scroll target)
+        """
+        if (target or self.scroll_target) == "docker":
+            return self.docker_panel.max_containers
+        return self.process_table.max_processes
+
+    def invalidate_layout(self) -> None:
+        """Force the layout tree and all panels to be rebuilt on the next frame."""
+        self._layout = None
+
+    def _build_layout(self) -> Layout:
+        """Build the layout tree for the current display flags."""
+        layout = _FittingLayout("main", self.MIN_MAIN_HEIGHT, self.OPTIONAL_SECTIONS)
 
         # Build layout sections list
         sections = [Layout(name="header", size=3), Layout(name="main", ratio=2)]
 
+        if self.show_disk_io:
+            # Borders, table header and one row per device
+            sections.append(Layout(name="disk_io", size=self.disk_io_panel.max_devices + 3))
+
+        if self.show_network:
+            sections.append(
+                Layout(name="network", size=self.network_panel.max_interfaces + 3)
+            )
+
         if self.show_docker:
             sections.append(Layout(name="docker", size=12))
 
         if self.show_processes:
             sections.append(Layout(name="processes", size=10))
 
-        layout.split_column(*sections)
+        if self.show_overhead:
+            sections.append(Layout(name="footer", size=1))
 
-        # Header
-        layout["header"].update(self.create_header())
+        layout.split_column(*sections)
 
         # Main area split into 2x2 grid
         layout["main"].split_row(
@@ -142,35 +494,51 @@ class Dashboard:
             Layout(name="disk"),
         )
 
-        # Update panels with metrics
-        layout["cpu"].update(
-            self.panel_renderer.create_cpu_panel(
-                metrics["cpu"], self.cpu_history.get_values()
-            )
-        )
-        layout["memory"].update(
-            self.panel_renderer.create_memory_panel(
-                metrics["memory"], self.memory_history.get_values()
-            )
-        )
-        layout["load"].update(
-            self.panel_renderer.create_load_panel(
-                metrics["load"], self.load_history.get_values()
-            )
-        )
-        layout["disk"].update(self.panel_renderer.create_disk_panel(metrics["disk"]))
-
-        # Docker containers
-        if self.show_docker:
-            layout["docker"].update(
-                self.docker_panel.create_panel(metrics["docker"])
-            )
+        return layout
 
-        # Process table
-        if self.show_processes:
-            layout["processes"].update(self.process_table.create_panel())
+    def _update_panel(
+        self, name: str, inputs: tuple, build: Callable[[], Panel], age: float = 0.0
+    ) -> None:
+        """
+        Rebuild a leaf panel unless its inputs equal those of the last frame.
 
-        return layout
+        Args:
+            name: Name of the leaf layout
+            inputs: Everything the panel is built from
+            build: Callable building the panel
+            age: Age of the panel's metrics in seconds, shown in its title
+                once it reaches one second
+        """
+        label = self._format_age(age) if age >= 1.0 else None
+        inputs = inputs + (label,)
+        if self._panel_inputs.get(name) == inputs:
+            return
+
+        panel = build()
+        if label:
+            panel.title = f"{panel.title} [dim]({label} ago)[/dim]"
+
+        self._layout[name].update(_CachedRenderable(panel))
+        self._panel_inputs[name] = inputs
+
+    def _clamp_offset(self, target: str, rows: int) -> None:
+        """Keep a list's offset from scrolling past its last full page."""
+        self.offsets[target] = max(0, min(self.offsets[target], rows - self.page_size(target)))
+
+    @staticmethod
+    def _next(options: List[str], current: str) -> str:
+        """Get the option after `current`, wrapping around."""
+        index = options.index(current) if current in options else -1
+        return options[(index + 1) % len(options)]
+
+    @staticmethod
+    def _format_age(seconds: float) -> str:
+        """Format an age compactly (e.g. "12s", "5m", "2h")."""
+        if seconds < 60:
+            return f"{seconds:.0f}s"
+        if seconds < 3600:
+            return f"{seconds // 60:.0f}m"
+        return f"{seconds // 3600:.0f}h"
 
     def render(self) -> Layout:
         """
@@ -179,5 +547,4 @@ class Dashboard:
         Returns:
             Rich Layout object ready for display
         """
-        metrics = self.collect_metrics()
-        return self.create_layout(metrics)
+        return self.create_layout(self.collect_metrics())
@@ -0,0 +1,99 @@
+"""
+Per-device disk I/O display panel.
+"""
+
+from typing import Dict, Optional, Sequence
+
+from rich.panel import Panel
+from rich.table import Table
+from rich.text import Text
+
+from ..collectors.disk import DiskCollector
+from ..collectors.diskstats import DeviceIOMetrics
+from ..utils.alerts import get_alert_color
+from .graphs import SparklineGraph
+from .panels import stale_marker
+
+
+class DiskIOPanel:
+    """Displays per-device disk I/O rates in a Rich panel."""
+
+    def __init__(self, max_devices: int = 4, braille: bool = False):
+        """
+        Initialize the disk I/O panel.
+
+        Args:
+            max_devices: Maximum number of devices to display
+            braille: Whether to draw the history graphs with braille dots,
+                two samples per character
+        """
+        self.max_devices = max_devices
+        self.sparkline = SparklineGraph(width=20, braille=braille)
+
+    def create_panel(
+        self,
+        devices: Sequence[DeviceIOMetrics],
+        history: Optional[Dict[str, Sequence[float]]] = None,
+        stale: bool = False,
+    ) -> Panel:
+        """
+        Create a panel displaying per-device disk I/O.
+
+        The busiest devices (by %util) are shown first.
+
+        Args:
+            devices: DeviceIOMetrics for each device
+            history: Optional %util history by device name
+            stale: Whether the metrics are a stale last-known value
+
+        Returns:
+            Rich Panel object
+        """
+        title = "[bold]Disk I/O[/bold]" + stale_marker(stale)
+
+        if not devices:
+            content = Table.grid(padding=(0, 1))
+            content.add_column(justify="center")
+            content.add_row(Text("Waiting for a second sample...", style="dim"))
+            return Panel(content, title=title, border_style="blue")
+
+        table = Table(
+            show_header=True,
+            header_style="bold cyan",
+            box=None,
+            padding=(0, 1),
+            expand=True,
+        )
+
+        table.add_column("Device", justify="left", width=8, no_wrap=True)
+        table.add_column("Read/s", justify="right", width=9)
+        table.add_column("Write/s", justify="right", width=9)
+        table.add_column("r/s", justify="right", width=5)
+        table.add_column("w/s", justify="right", width=5)
+        table.add_column("await", justify="right", width=7)
+        table.add_column("aqu", justify="right", width=4)
+        table.add_column("%util", justify="right", width=5)
+        # Takes whatever width is left, cropping the sparkline if narrow
+        table.add_column("History", justify="left", ratio=1, no_wrap=True, overflow="crop")
+
+        busiest = sorted(devices, key=lambda d: d.util_percent, reverse=True)
+        for device in busiest[: self.max_devices]:
+            color = get_alert_color(device.util_percent)
+            values = (history or {}).get(device.name, ())
+
+            table.add_row(
+                Text(device.name, style="bold"),
+                DiskCollector.format_bytes(device.read_bytes_per_sec),
+                DiskCollector.format_bytes(device.write_bytes_per_sec),
+                f"{device.read_iops:.0f}",
+                f"{device.write_iops:.0f}",
+                f"{device.await_ms:.1f}ms",
+                f"{device.queue_depth:.1f}",
+                Text(f"{device.util_percent:.0f}", style=color),
+                self.sparkline.render_text(values) if values else "",
+            )
+
+        if len(devices) > self.max_devices:
+            title += f" [dim]({self.max_devices} of {len(devices)} devices)[/dim]"
+
+        return Panel(table, title=title, border_style="blue")
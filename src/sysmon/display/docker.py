@@ -8,37 +8,58 @@ from rich.text import Text
 
 from ..collectors.docker import DockerCollector, DockerMetrics
 from ..utils.alerts import get_alert_color
+from .panels import stale_marker
 
 
 class DockerPanel:
     """Displays Docker container metrics in a Rich panel."""
 
-    def __init__(self, max_containers: int = 8):
+    # Orders containers can be listed in, busiest first
+    SORT_KEYS = {
+        "cpu": lambda c: c.cpu_percent,
+        "memory": lambda c: c.memory_used_bytes,
+        "net": lambda c: c.network_rx_bytes_per_sec + c.network_tx_bytes_per_sec,
+        "io": lambda c: c.block_read_bytes_per_sec + c.block_write_bytes_per_sec,
+    }
+
+    def __init__(self, max_containers: int = 8, sort_by: str = "cpu"):
         """
         Initialize the Docker panel.
 
         Args:
             max_containers: Maximum number of containers to display
+            sort_by: Order of the containers (one of SORT_KEYS)
         """
+        if sort_by not in self.SORT_KEYS:
+            raise ValueError(f"Unknown sort order: {sort_by}")
+
         self.max_containers = max_containers
+        self.sort_by = sort_by
 
-    def create_panel(self, metrics: DockerMetrics) -> Panel:
+    def create_panel(
+        self, metrics: DockerMetrics, stale: bool = False, offset: int = 0
+    ) -> Panel:
         """
         Create a panel displaying Docker container metrics.
 
         Args:
             metrics: DockerMetrics data
+            stale: Whether the metrics are a stale last-known value
+            offset: Number of top containers to scroll past
 
         Returns:
             Rich Panel object
         """
         if not metrics.available:
-            return self._create_unavailable_panel(metrics.error)
+            panel = self._create_unavailable_panel(metrics.error)
+        elif not metrics.containers:
+            panel = self._create_no_containers_panel(metrics)
+        else:
+            panel = self._create_containers_panel(metrics, offset)
 
-        if not metrics.containers:
-            return self._create_no_containers_panel(metrics)
+        panel.title = f"{panel.title}{stale_marker(stale)}"
 
-        return self._create_containers_panel(metrics)
+        return panel
 
     def _create_unavailable_panel(self, error: str) -> Panel:
         """Create a panel when Docker is not available."""
@@ -73,7 +94,7 @@ class DockerPanel:
             border_style="blue",
         )
 
-    def _create_containers_panel(self, metrics: DockerMetrics) -> Panel:
+    def _create_containers_panel(self, metrics: DockerMetrics, offset: int = 0) -> Panel:
         """Create a panel with container metrics table."""
         table = Table(
             show_header=True,
@@ -88,9 +109,13 @@ class DockerPanel:
         table.add_column("CPU%", justify="right", width=7)
         table.add_column("Memory", justify="right", width=12)
         table.add_column("MEM%", justify="right", width=7)
-        table.add_column("Net I/O", justify="right", width=14)
+        table.add_column("Net ↓/↑ /s", justify="right", width=16)
+        table.add_column("Disk R/W /s", justify="right", width=16)
 
-        for container in metrics.containers[: self.max_containers]:
+        containers = sorted(metrics.containers, key=self.SORT_KEYS[self.sort_by], reverse=True)
+        offset = max(0, min(offset, len(containers) - self.max_containers))
+        shown = containers[offset : offset + self.max_containers]
+        for container in shown:
             # Truncate long names
             name = container.name
             if len(name) > 13:
@@ -109,10 +134,14 @@ class DockerPanel:
             mem_limit = DockerCollector.format_bytes(container.memory_limit_bytes)
             memory_str = f"{mem_used}"
 
-            # Format network I/O
-            net_rx = DockerCollector.format_bytes(container.network_rx_bytes)
-            net_tx = DockerCollector.format_bytes(container.network_tx_bytes)
-            net_io = f"↓{net_rx}/↑{net_tx}"
+            # Format network and block I/O rates
+            net_rx = DockerCollector.format_bytes(container.network_rx_bytes_per_sec)
+            net_tx = DockerCollector.format_bytes(container.network_tx_bytes_per_sec)
+            net_io = f"{net_rx}/{net_tx}"
+
+            block_read = DockerCollector.format_bytes(container.block_read_bytes_per_sec)
+            block_write = DockerCollector.format_bytes(container.block_write_bytes_per_sec)
+            block_io = f"{block_read}/{block_write}"
 
             table.add_row(
                 name,
@@ -121,10 +150,18 @@ class DockerPanel:
                 memory_str,
                 Text(f"{container.memory_percent:.1f}", style=mem_color),
                 Text(net_io, style="dim"),
+                Text(block_io, style="dim"),
             )
 
-        # Title with container count
-        title = f"[bold]Docker Containers[/bold] [dim]({metrics.running_containers}/{metrics.total_containers})[/dim]"
+        # Title with container count, and the rows shown if not all fit
+        position = ""
+        if len(containers) > self.max_containers:
+            position = f", {offset + 1}-{offset + len(shown)}"
+        title = (
+            f"[bold]Docker Containers[/bold] "
+            f"[dim]({metrics.running_containers}/{metrics.total_containers}, "
+            f"by {self.sort_by}{position})[/dim]"
+        )
 
         return Panel(
             table,
@@ -2,25 +2,77 @@
 Sparkline graph renderer for historical metrics.
 """
 
-from typing import List
+from typing import Iterable, List, Optional, Sequence, Union
+
+from rich.style import Style
+from rich.text import Span, Text
+
+from ..utils.alerts import get_alert_color
+
+# Steps a value is quantized to between the bottom and top of the scale.
+# A multiple of both 8 (block levels) and 5 (braille levels), so that the
+# glyph looked up from a step equals the glyph computed from the value.
+RESOLUTION = 800
+
+# Unicode block characters for vertical bars (8 levels)
+BLOCKS = " ▁▂▃▄▅▆▇█"
+
+# Braille dots lighting a bar of 0-4 dots from the bottom of the left and
+# of the right column of a cell
+_BRAILLE_LEFT = (0x00, 0x40, 0x44, 0x46, 0x47)
+_BRAILLE_RIGHT = (0x00, 0x80, 0xA0, 0xB0, 0xB8)
+
+# Lookup tables indexed by step
+_BLOCK_GLYPHS = [BLOCKS[step * 8 // RESOLUTION] for step in range(RESOLUTION + 1)]
+_BRAILLE_LEVELS = [min(4, step * 5 // RESOLUTION) for step in range(RESOLUTION + 1)]
+_ALERT_STYLES = {color: Style(color=color) for color in ("green", "yellow", "red")}
+
+# Alert style of each step of the 0-100 scale that values are colored on,
+# whatever scale they are drawn on
+_PERCENT_STEPS = RESOLUTION / 100
+_STEP_STYLES = [
+    _ALERT_STYLES[get_alert_color(step * 100 / RESOLUTION)] for step in range(RESOLUTION + 1)
+]
+
+# Braille cell for each (left, right) pair of bar heights
+_BRAILLE_GLYPHS = [
+    [chr(0x2800 | left | right) for right in _BRAILLE_RIGHT] for left in _BRAILLE_LEFT
+]
 
 
 class SparklineGraph:
-    """Renders sparkline graphs using Unicode block characters."""
+    """
+    Renders sparkline graphs using Unicode block or braille characters.
 
-    # Unicode block characters for vertical bars (8 levels)
-    BLOCKS = " ▁▂▃▄▅▆▇█"
+    Values are quantized once into steps of the scale, which pick glyphs
+    from lookup tables; colors follow the values themselves, as alert
+    levels. Colored graphs are returned as Text with one span per run of
+    equally colored characters, so no markup is built or parsed. In braille
+    mode each character holds two samples as bars of up to four dots,
+    fitting twice the history in the same width.
+    """
 
-    def __init__(self, width: int = 20):
+    # Kept for callers that used the class attribute
+    BLOCKS = BLOCKS
+
+    def __init__(self, width: int = 20, braille: bool = False):
         """
         Initialize the sparkline graph.
 
         Args:
             width: Maximum width of the sparkline in characters
+            braille: Whether to draw two samples per character with braille
+                dots instead of one block per sample
         """
         self.width = width
+        self.braille = braille
+
+    @property
+    def samples(self) -> int:
+        """Number of values the sparkline shows at full width."""
+        return self.width * 2 if self.braille else self.width
 
-    def render(self, values: List[float], min_val: float = 0, max_val: float = 100) -> str:
+    def render(self, values: Sequence[float], min_val: float = 0, max_val: float = 100) -> str:
         """
         Render a sparkline graph from a list of values.
 
@@ -32,35 +84,42 @@ class SparklineGraph:
         Returns:
             String containing the sparkline graph
         """
-        if not values:
-            return " " * self.width
-
-        # Take the last `width` values if we have more
-        display_values = values[-self.width :]
-
-        # Build the sparkline
-        sparkline = ""
-        value_range = max_val - min_val
+        glyphs = self._glyphs(self._steps(values, min_val, max_val))
+        return " " * (self.width - len(glyphs)) + "".join(glyphs)
+
+    def render_text(
+        self,
+        values: Sequence[float],
+        min_val: float = 0,
+        max_val: float = 100,
+        style: Optional[Union[str, Style]] = None,
+    ) -> Text:
+        """
+        Render a sparkline graph as Rich Text.
 
-        for value in display_values:
-            if value_range == 0:
-                index = 4  # Middle block if no range
-            else:
-                # Normalize to 0-1 range and map to block index (0-8)
-                normalized = (value - min_val) / value_range
-                normalized = max(0, min(1, normalized))  # Clamp to 0-1
-                index = int(normalized * 8)
+        Args:
+            values: List of numeric values to graph
+            min_val: Minimum value for scaling (default 0)
+            max_val: Maximum value for scaling (default 100)
+            style: Style of the whole graph; by default each character is
+                colored by its value as a percentage, green below 60,
+                yellow below 80 and red above
 
-            sparkline += self.BLOCKS[index]
+        Returns:
+            Text of exactly `width` characters, padded on the left
+        """
+        values = values[-self.samples :]
+        glyphs = self._glyphs(self._steps(values, min_val, max_val))
+        padding = self.width - len(glyphs)
+        text = " " * padding + "".join(glyphs)
 
-        # Pad with spaces if needed
-        if len(sparkline) < self.width:
-            sparkline = " " * (self.width - len(sparkline)) + sparkline
+        if style is not None:
+            return Text(text, style=style)
 
-        return sparkline
+        return Text(text, spans=self._spans(self._color_steps(values), padding))
 
     def render_with_color(
-        self, values: List[float], min_val: float = 0, max_val: float = 100
+        self, values: Sequence[float], min_val: float = 0, max_val: float = 100
     ) -> str:
         """
         Render a sparkline graph with color gradient based on values.
@@ -73,38 +132,70 @@ class SparklineGraph:
         Returns:
             Rich markup string with colored sparkline
         """
-        if not values:
-            return " " * self.width
+        return self.render_text(values, min_val, max_val).markup
 
-        display_values = values[-self.width :]
-        sparkline_parts = []
+    def _steps(self, values: Sequence[float], min_val: float, max_val: float) -> List[int]:
+        """Quantize the most recent values into steps of the scale."""
+        values = values[-self.samples :]
         value_range = max_val - min_val
 
-        for value in display_values:
-            if value_range == 0:
-                index = 4
-                color = "green"
-            else:
-                normalized = (value - min_val) / value_range
-                normalized = max(0, min(1, normalized))
-                index = int(normalized * 8)
-
-                # Color based on value
-                if value >= 80:
-                    color = "red"
-                elif value >= 60:
-                    color = "yellow"
-                else:
-                    color = "green"
-
-            block = self.BLOCKS[index]
-            sparkline_parts.append(f"[{color}]{block}[/{color}]")
-
-        result = "".join(sparkline_parts)
-
-        # Pad with spaces if needed
-        if len(display_values) < self.width:
-            padding = " " * (self.width - len(display_values))
-            result = padding + result
-
-        return result
+        if value_range == 0:
+            # Middle of the scale if there is no range
+            return [RESOLUTION // 2] * len(values)
+
+        scale = RESOLUTION / value_range
+        return self._clamp((value - min_val) * scale for value in values)
+
+    def _color_steps(self, values: Sequence[float]) -> List[int]:
+        """Quantize values on the 0-100 scale, one step per character."""
+        steps = self._clamp(value * _PERCENT_STEPS for value in values)
+        if not self.braille:
+            return steps
+
+        if len(steps) % 2:
+            steps = [0] + steps
+        # Each character takes the color of its higher sample
+        return [max(pair) for pair in zip(steps[::2], steps[1::2])]
+
+    @staticmethod
+    def _clamp(positions: Iterable[float]) -> List[int]:
+        """Truncate positions on the scale to steps, NaN counting as the bottom."""
+        # Comparisons with NaN are false, so it falls through to 0
+        return [
+            int(p) if 0 < p < RESOLUTION else RESOLUTION if p >= RESOLUTION else 0
+            for p in positions
+        ]
+
+    def _glyphs(self, steps: List[int]) -> List[str]:
+        """Look up the characters for quantized values."""
+        if not self.braille:
+            return [_BLOCK_GLYPHS[s] for s in steps]
+
+        if len(steps) % 2:
+            # The oldest character only holds a right-hand sample
+            steps = [0] + steps
+
+        levels = [_BRAILLE_LEVELS[s] for s in steps]
+        return [
+            _BRAILLE_GLYPHS[left][right] for left, right in zip(levels[::2], levels[1::2])
+        ]
+
+    @staticmethod
+    def _spans(steps: List[int], offset: int) -> List[Span]:
+        """Merge runs of equally colored characters into spans."""
+        spans = []
+        start = offset
+        current = None
+
+        for end, step in enumerate(steps, offset):
+            style = _STEP_STYLES[step]
+            if style is not current:
+                if current is not None:
+                    spans.append(Span(start, end, current))
+                start = end
+                current = style
+
+        if current is not None:
+            spans.append(Span(start, offset + len(steps), current))
+
+        return spans
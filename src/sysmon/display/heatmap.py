@@ -0,0 +1,140 @@
+"""
+Per-core CPU heatmap renderer.
+"""
+
+from typing import Iterable, List, Optional, Sequence
+
+from rich.console import Console, ConsoleOptions, RenderResult
+from rich.measure import Measurement
+from rich.segment import Segment
+from rich.style import Style
+
+from ..utils.alerts import THRESHOLD_CRITICAL, THRESHOLD_WARNING
+
+# Upper bound (exclusive) of each color band; the bands below the warning
+# threshold tell idle cores from busy ones
+HEAT_BANDS = (
+    (5, "grey35"),
+    (20, "dark_green"),
+    (40, "green4"),
+    (THRESHOLD_WARNING, "green3"),
+    (70, "yellow3"),
+    (THRESHOLD_CRITICAL, "dark_orange3"),
+    (90, "red3"),
+    (101, "bright_red"),
+)
+
+# Style of each whole percentage, so a cell costs one list lookup
+_STYLES: List[Style] = []
+for _upper, _color in HEAT_BANDS:
+    _STYLES.extend([Style(color=_color)] * (_upper - len(_STYLES)))
+
+# Cell of the current value, and history levels from idle to fully busy
+CELL = "█"
+LEVELS = "▁▂▃▄▅▆▇█"
+
+_LABEL_STYLE = Style(dim=True)
+
+
+def _quantize(values: Iterable[float]) -> List[int]:
+    """Clamp percentages to whole numbers from 0 to 100."""
+    return [0 if v < 0 else 100 if v >= 100 else int(v) for v in values]
+
+
+class CoreHeatmap:
+    """
+    Rich renderable showing every logical CPU as one colored cell.
+
+    Cells wrap to the available width, with the number of the first CPU of
+    each row on the left. With a history, each CPU becomes a strip of one
+    block character per sample. Rendering emits Segments directly, merging
+    runs of equally styled cells, so its cost grows with the number of
+    terminal cells rather than with the number of Rich objects.
+    """
+
+    def __init__(
+        self,
+        per_core: Sequence[float],
+        history: Optional[Sequence[Sequence[float]]] = None,
+    ):
+        """
+        Initialize the heatmap.
+
+        Args:
+            per_core: Current usage percentage of each logical CPU
+            history: Optional recent percentages of each CPU, oldest first;
+                ignored unless it has one non-empty entry per CPU
+        """
+        self.per_core = per_core
+        self.history = None
+        if history and len(history) == len(per_core) and all(history):
+            self.history = history
+
+    @property
+    def cell_width(self) -> int:
+        """Columns taken by one CPU, including the gap after a history strip."""
+        if self.history is None:
+            return 1
+        return max(len(samples) for samples in self.history) + 1
+
+    @property
+    def label_width(self) -> int:
+        """Columns taken by the row labels, including their trailing space."""
+        return len(str(max(len(self.per_core) - 1, 0))) + 1
+
+    def __rich_measure__(self, console: Console, options: ConsoleOptions) -> Measurement:
+        """Report the width of one cell up to all cells on a single row."""
+        return Measurement(
+            self.label_width + self.cell_width,
+            self.label_width + self.cell_width * len(self.per_core),
+        )
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        """Yield the heatmap rows as Segments."""
+        count = len(self.per_core)
+        if not count:
+            return
+
+        label_width = self.label_width
+        cell_width = self.cell_width
+        # The gap after the last history strip of a row is not drawn
+        gap = 0 if self.history is None else 1
+        per_row = max(1, (options.max_width - label_width + gap) // cell_width)
+
+        if self.history is None:
+            styles = [_STYLES[q] for q in _quantize(self.per_core)]
+
+        new_line = Segment.line()
+        for start in range(0, count, per_row):
+            end = min(start + per_row, count)
+            yield Segment(f"{start:>{label_width - 1}} ", _LABEL_STYLE)
+            if self.history is None:
+                yield from self._merge((CELL, style) for style in styles[start:end])
+            else:
+                yield from self._merge(self._strips(start, end, cell_width - 1))
+            yield new_line
+
+    def _strips(self, start: int, end: int, points: int):
+        """Yield (text, style) per history sample of CPUs start to end - 1."""
+        for cpu in range(start, end):
+            if cpu > start:
+                yield " ", None
+            samples = _quantize(self.history[cpu])
+            if len(samples) < points:
+                yield " " * (points - len(samples)), None
+            for q in samples:
+                yield LEVELS[q * len(LEVELS) // 101], _STYLES[q]
+
+    @staticmethod
+    def _merge(cells) -> Iterable[Segment]:
+        """Merge runs of equally styled (text, style) cells into single Segments."""
+        texts: List[str] = []
+        current = None
+        for text, style in cells:
+            if style is not current and texts:
+                yield Segment("".join(texts), current)
+                texts = []
+            current = style
+            texts.append(text)
+        if texts:
+            yield Segment("".join(texts), current)
@@ -0,0 +1,107 @@
+"""
+Network interface throughput display panel.
+"""
+
+from typing import Dict, Optional, Sequence
+
+from rich.panel import Panel
+from rich.table import Table
+from rich.text import Text
+
+from ..collectors.disk import DiskCollector
+from ..collectors.network import InterfaceMetrics
+from .graphs import SparklineGraph
+from .panels import stale_marker
+
+
+class NetworkPanel:
+    """Displays per-interface network rates in a Rich panel."""
+
+    def __init__(self, max_interfaces: int = 4, braille: bool = False):
+        """
+        Initialize the network panel.
+
+        Args:
+            max_interfaces: Maximum number of interfaces to display
+            braille: Whether to draw the history graphs with braille dots,
+                two samples per character
+        """
+        self.max_interfaces = max_interfaces
+        self.sparkline = SparklineGraph(width=20, braille=braille)
+
+    def create_panel(
+        self,
+        interfaces: Sequence[InterfaceMetrics],
+        history: Optional[Dict[str, Sequence[float]]] = None,
+        stale: bool = False,
+    ) -> Panel:
+        """
+        Create a panel displaying per-interface network rates.
+
+        The busiest interfaces (by rx + tx bytes/s) are shown first. Each
+        sparkline is scaled to its own peak.
+
+        Args:
+            interfaces: InterfaceMetrics for each interface or group
+            history: Optional throughput history by interface name
+            stale: Whether the metrics are a stale last-known value
+
+        Returns:
+            Rich Panel object
+        """
+        title = "[bold]Network[/bold]" + stale_marker(stale)
+
+        if not interfaces:
+            content = Table.grid(padding=(0, 1))
+            content.add_column(justify="center")
+            content.add_row(Text("Waiting for a second sample...", style="dim"))
+            return Panel(content, title=title, border_style="blue")
+
+        table = Table(
+            show_header=True,
+            header_style="bold cyan",
+            box=None,
+            padding=(0, 1),
+            expand=True,
+        )
+
+        table.add_column("Interface", justify="left", width=10, no_wrap=True)
+        table.add_column("RX/s", justify="right", width=9)
+        table.add_column("TX/s", justify="right", width=9)
+        table.add_column("rx pk/s", justify="right", width=7)
+        table.add_column("tx pk/s", justify="right", width=7)
+        table.add_column("err/s", justify="right", width=5)
+        table.add_column("drop/s", justify="right", width=6)
+        # Takes whatever width is left, cropping the sparkline if narrow
+        table.add_column("History", justify="left", ratio=1, no_wrap=True, overflow="crop")
+
+        busiest = sorted(
+            interfaces, key=lambda i: i.rx_bytes_per_sec + i.tx_bytes_per_sec, reverse=True
+        )
+        for interface in busiest[: self.max_interfaces]:
+            name = interface.name
+            if name.endswith("*"):
+                # Group of virtual interfaces
+                name += f" ({interface.interfaces})"
+
+            errors = interface.rx_errors_per_sec + interface.tx_errors_per_sec
+            drops = interface.rx_drops_per_sec + interface.tx_drops_per_sec
+            values = (history or {}).get(interface.name, ())
+
+            table.add_row(
+                Text(name, style="bold"),
+                DiskCollector.format_bytes(interface.rx_bytes_per_sec),
+                DiskCollector.format_bytes(interface.tx_bytes_per_sec),
+                f"{interface.rx_packets_per_sec:.0f}",
+                f"{interface.tx_packets_per_sec:.0f}",
+                Text(f"{errors:.0f}", style="red" if errors else ""),
+                Text(f"{drops:.0f}", style="yellow" if drops else ""),
+                self.sparkline.render_text(values, 0, max(values) or 1, style="cyan")
+                if values
+                else "",
+            )
+
+        if len(interfaces) > self.max_interfaces:
+            title += f" [dim]({self.max_interfaces} of {len(interfaces)} interfaces)[/dim]"
+
+        return Panel(table, title=title, border_style="blue")
@@ -2,8 +2,9 @@
 Individual metric panel components.
 """
 
-from typing import List, Optional
+from typing import Optional, Sequence
 
+from rich.console import Group
 from rich.panel import Panel
 from rich.progress import BarColumn, Progress, TextColumn
 from rich.table import Table
@@ -15,17 +16,35 @@ from ..collectors.load import LoadMetrics
 from ..collectors.memory import MemoryCollector, MemoryMetrics
 from ..utils.alerts import get_alert_color
 from .graphs import SparklineGraph
+from .heatmap import CoreHeatmap
+
+# Title suffix of a panel showing a collector's last-known value
+STALE_MARKER = " [dim italic](stale)[/dim italic]"
+
+
+def stale_marker(stale: bool) -> str:
+    """Get the title suffix marking a panel as showing stale data."""
+    return STALE_MARKER if stale else ""
 
 
 class MetricPanel:
     """Creates Rich panels for displaying metrics."""
 
-    def __init__(self):
-        """Initialize the metric panel renderer."""
-        self.sparkline = SparklineGraph(width=20)
+    def __init__(self, braille: bool = False):
+        """
+        Initialize the metric panel renderer.
+
+        Args:
+            braille: Whether to draw the history graphs with braille dots,
+                two samples per character
+        """
+        self.sparkline = SparklineGraph(width=20, braille=braille)
 
     def create_cpu_panel(
-        self, metrics: CPUMetrics, history: Optional[List[float]] = None
+        self,
+        metrics: CPUMetrics, history: Optional[Sequence[float]] = None,
+        stale: bool = False,
+        core_history: Optional[Sequence[Sequence[float]]] = None,
     ) -> Panel:
         """
         Create a panel displaying CPU metrics.
@@ -33,6 +52,9 @@ class MetricPanel:
         Args:
             metrics: CPUMetrics data
             history: Optional list of historical CPU percentages
+            stale: Whether the metrics are a stale last-known value
+            core_history: Optional recent percentages of each core, shown
+                as a strip per core in the heatmap
 
         Returns:
             Rich Panel object
@@ -46,23 +68,13 @@ class MetricPanel:
 
         # Sparkline graph
         if history:
-            graph = self.sparkline.render_with_color(history)
+            graph = self.sparkline.render_text(history)
             content.add_row("History:", graph)
 
         # Progress bar for overall CPU
         bar = self._create_progress_bar(metrics.overall_percent, color)
         content.add_row("Overall:", bar)
 
-        # Per-core display (show up to 8 cores in 2 columns)
-        cores = metrics.per_core_percent[:8]
-        for i in range(0, len(cores), 2):
-            left = f"Core {i}: {cores[i]:.0f}%"
-            right = f"Core {i+1}: {cores[i+1]:.0f}%" if i + 1 < len(cores) else ""
-            content.add_row(
-                Text(left, style=get_alert_color(cores[i])),
-                Text(right, style=get_alert_color(cores[i + 1]) if right else ""),
-            )
-
         # Frequency if available
         if metrics.frequency_current:
             freq_text = f"{metrics.frequency_current:.0f} MHz"
@@ -70,14 +82,22 @@ class MetricPanel:
                 freq_text += f" / {metrics.frequency_max:.0f} MHz"
             content.add_row("Frequency:", freq_text)
 
+        # Every logical CPU as one heatmap cell
+        renderable = content
+        if metrics.per_core_percent:
+            renderable = Group(content, CoreHeatmap(metrics.per_core_percent, core_history))
+
         return Panel(
-            content,
-            title=f"[bold]CPU Usage[/bold] [{color}]{metrics.overall_percent:.1f}%[/{color}]",
+            renderable,
+            title=f"[bold]CPU Usage[/bold] [{color}]{metrics.overall_percent:.1f}%[/{color}]"
+            + stale_marker(stale),
             border_style=color,
         )
 
     def create_memory_panel(
-        self, metrics: MemoryMetrics, history: Optional[List[float]] = None
+        self,
+        metrics: MemoryMetrics, history: Optional[Sequence[float]] = None,
+        stale: bool = False,
     ) -> Panel:
         """
         Create a panel displaying memory metrics.
@@ -85,6 +105,7 @@ class MetricPanel:
         Args:
             metrics: MemoryMetrics data
             history: Optional list of historical memory percentages
+            stale: Whether the metrics are a stale last-known value
 
         Returns:
             Rich Panel object
@@ -97,7 +118,7 @@ class MetricPanel:
 
         # Sparkline graph
         if history:
-            graph = self.sparkline.render_with_color(history)
+            graph = self.sparkline.render_text(history)
             content.add_row("History:", graph)
 
         # Progress bar for RAM
@@ -128,12 +149,15 @@ class MetricPanel:
 
         return Panel(
             content,
-            title=f"[bold]Memory Usage[/bold] [{color}]{metrics.percent:.1f}%[/{color}]",
+            title=f"[bold]Memory Usage[/bold] [{color}]{metrics.percent:.1f}%[/{color}]"
+            + stale_marker(stale),
             border_style=color,
         )
 
     def create_load_panel(
-        self, metrics: LoadMetrics, history: Optional[List[float]] = None
+        self,
+        metrics: LoadMetrics, history: Optional[Sequence[float]] = None,
+        stale: bool = False,
     ) -> Panel:
         """
         Create a panel displaying system load metrics.
@@ -141,6 +165,7 @@ class MetricPanel:
         Args:
             metrics: LoadMetrics data
             history: Optional list of historical load values (normalized)
+            stale: Whether the metrics are a stale last-known value
 
         Returns:
             Rich Panel object
@@ -155,7 +180,7 @@ class MetricPanel:
 
         # Sparkline graph
         if history:
-            graph = self.sparkline.render_with_color(history, min_val=0, max_val=100)
+            graph = self.sparkline.render_text(history, min_val=0, max_val=100)
             content.add_row("History:", graph)
 
         # Load averages
@@ -177,16 +202,17 @@ class MetricPanel:
 
         return Panel(
             content,
-            title=f"[bold]System Load[/bold]",
+            title=f"[bold]System Load[/bold]" + stale_marker(stale),
             border_style=color,
         )
 
-    def create_disk_panel(self, metrics: DiskMetrics) -> Panel:
+    def create_disk_panel(self, metrics: DiskMetrics, stale: bool = False) -> Panel:
         """
         Create a panel displaying disk metrics.
 
         Args:
             metrics: DiskMetrics data
+            stale: Whether the metrics are a stale last-known value
 
         Returns:
             Rich Panel object
@@ -205,24 +231,34 @@ class MetricPanel:
             if len(mount) > 10:
                 mount = mount[:9] + "…"
 
-            # Create mini progress bar
-            bar = self._create_mini_bar(partition.percent, color)
+            # Create mini progress bar, or flag a mount whose probe hung
+            if partition.responsive:
+                bar = self._create_mini_bar(partition.percent, color)
+            else:
+                bar = Text("not responding", style="bold red")
+                color = "dim"
 
             # Size info
             from ..collectors.disk import DiskCollector
 
             used = DiskCollector.format_bytes(partition.used_bytes)
             total = DiskCollector.format_bytes(partition.total_bytes)
+            size = f"{used}/{total}" if partition.total_bytes else "unknown"
 
             content.add_row(
                 Text(mount, style="bold"),
                 bar,
-                Text(f"{used}/{total}", style=color),
+                Text(size, style=color),
             )
 
+        title = "[bold]Disk Usage[/bold]"
+        unresponsive = sum(1 for p in metrics.partitions if not p.responsive)
+        if unresponsive:
+            title += f" [red]({unresponsive} not responding)[/red]"
+
         return Panel(
             content,
-            title="[bold]Disk Usage[/bold]",
+            title=title + stale_marker(stale),
             border_style="blue",
         )
 
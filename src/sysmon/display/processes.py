@@ -2,30 +2,26 @@
 Process list table component.
 """
 
-from dataclasses import dataclass
-from typing import List
+from operator import attrgetter
+from typing import Sequence
 
-import psutil
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 
+from ..collectors.processes import ProcessInfo
 from ..utils.alerts import get_alert_color
-
-
-@dataclass
-class ProcessInfo:
-    """Container for process information."""
-
-    pid: int
-    name: str
-    cpu_percent: float
-    memory_percent: float
-    status: str
+from .panels import stale_marker
 
 
 class ProcessTable:
-    """Collects and displays top processes by resource usage."""
+    """Displays top processes by resource usage."""
+
+    # Orders processes can be listed in, busiest first
+    SORT_KEYS = {
+        "cpu": attrgetter("cpu_percent"),
+        "memory": attrgetter("memory_percent"),
+    }
 
     def __init__(self, max_processes: int = 5):
         """
@@ -36,52 +32,28 @@ class ProcessTable:
         """
         self.max_processes = max_processes
 
-    def get_top_processes(self, sort_by: str = "cpu") -> List[ProcessInfo]:
-        """
-        Get top processes sorted by CPU or memory usage.
-
-        Args:
-            sort_by: Sort criteria ("cpu" or "memory")
-
-        Returns:
-            List of ProcessInfo objects
-        """
-        processes = []
-
-        for proc in psutil.process_iter(["pid", "name", "cpu_percent", "memory_percent", "status"]):
-            try:
-                info = proc.info
-                processes.append(
-                    ProcessInfo(
-                        pid=info["pid"],
-                        name=info["name"] or "Unknown",
-                        cpu_percent=info["cpu_percent"] or 0.0,
-                        memory_percent=info["memory_percent"] or 0.0,
-                        status=info["status"] or "unknown",
-                    )
-                )
-            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                continue
-
-        # Sort by CPU or memory
-        if sort_by == "memory":
-            processes.sort(key=lambda p: p.memory_percent, reverse=True)
-        else:
-            processes.sort(key=lambda p: p.cpu_percent, reverse=True)
-
-        return processes[: self.max_processes]
-
-    def create_panel(self, sort_by: str = "cpu") -> Panel:
+    def create_panel(
+        self,
+        sort_by: str = "cpu",
+        processes: Sequence[ProcessInfo] = (),
+        offset: int = 0,
+        stale: bool = False,
+    ) -> Panel:
         """
         Create a panel displaying top processes.
 
         Args:
             sort_by: Sort criteria ("cpu" or "memory")
+            processes: Collected processes, in any order
+            offset: Number of top processes to scroll past
+            stale: Whether the processes are a stale last-known value
 
         Returns:
             Rich Panel object
         """
-        processes = self.get_top_processes(sort_by)
+        ordered = sorted(processes, key=self.SORT_KEYS[sort_by], reverse=True)
+        offset = max(0, min(offset, len(ordered) - self.max_processes))
+        shown = ordered[offset : offset + self.max_processes]
 
         table = Table(
             show_header=True,
@@ -97,7 +69,7 @@ class ProcessTable:
         table.add_column("MEM%", justify="right", width=8)
         table.add_column("Status", justify="left", width=10)
 
-        for proc in processes:
+        for proc in shown:
             # Truncate long names
             name = proc.name
             if len(name) > 18:
@@ -119,9 +91,11 @@ class ProcessTable:
             )
 
         title = "Top Processes by CPU" if sort_by == "cpu" else "Top Processes by Memory"
+        if len(ordered) > self.max_processes:
+            title += f" [dim]({offset + 1}-{offset + len(shown)})[/dim]"
 
         return Panel(
             table,
-            title=f"[bold]{title}[/bold]",
+            title=f"[bold]{title}[/bold]" + stale_marker(stale),
             border_style="cyan",
         )
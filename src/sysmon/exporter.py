@@ -0,0 +1,387 @@
+"""
+Prometheus exporter serving the latest snapshot over HTTP.
+"""
+
+import gzip
+import math
+import signal
+import socket
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .snapshot import Snapshot, SnapshotCollector, SnapshotStream
+
+# (labels, value) pairs of one metric family
+Samples = Iterable[Tuple[Dict[str, str], Optional[float]]]
+
+
+def encode_snapshot(snapshot: Snapshot) -> bytes:
+    """
+    Encode a snapshot in the Prometheus text exposition format.
+
+    Args:
+        snapshot: Snapshot to encode
+
+    Returns:
+        UTF-8 encoded exposition text
+    """
+    lines: List[str] = []
+    cpu = snapshot.cpu
+    memory = snapshot.memory
+    load = snapshot.load
+    disk = snapshot.disk
+
+    _family(lines, "sysmon_snapshot_timestamp_seconds", "gauge",
+            "Time the exported snapshot was collected",
+            [({}, snapshot.timestamp)])
+    # One sample per collector, so that the family exists while all are fresh
+    collectors = sorted(set(snapshot.ages) | snapshot.stale)
+    _family(lines, "sysmon_collector_stale", "gauge",
+            "Whether a collector missed its deadline and reports its last value",
+            [({"collector": name}, name in snapshot.stale) for name in collectors])
+    _family(lines, "sysmon_collector_age_seconds", "gauge",
+            "Age of each collector's value when the snapshot was taken",
+            [({"collector": name}, age) for name, age in sorted(snapshot.ages.items())])
+
+    # CPU
+    _family(lines, "sysmon_cpu_usage_percent", "gauge",
+            "Overall CPU usage", [({}, cpu.overall_percent)])
+    _family(lines, "sysmon_cpu_core_usage_percent", "gauge",
+            "CPU usage per logical core",
+            [({"core": str(i)}, p) for i, p in enumerate(cpu.per_core_percent)])
+    _family(lines, "sysmon_cpu_frequency_mhz", "gauge",
+            "Current CPU frequency", [({}, cpu.frequency_current)])
+    _family(lines, "sysmon_cpu_cores", "gauge",
+            "Number of physical CPU cores", [({}, cpu.core_count)])
+    _family(lines, "sysmon_cpu_threads", "gauge",
+            "Number of logical CPUs", [({}, cpu.thread_count)])
+
+    # Memory
+    _family(lines, "sysmon_memory_total_bytes", "gauge",
+            "Total physical memory", [({}, memory.total_bytes)])
+    _family(lines, "sysmon_memory_available_bytes", "gauge",
+            "Memory available without swapping", [({}, memory.available_bytes)])
+    _family(lines, "sysmon_memory_used_bytes", "gauge",
+            "Memory in use", [({}, memory.used_bytes)])
+    _family(lines, "sysmon_swap_total_bytes", "gauge",
+            "Total swap space", [({}, memory.swap_total_bytes)])
+    _family(lines, "sysmon_swap_used_bytes", "gauge",
+            "Swap space in use", [({}, memory.swap_used_bytes)])
+
+    # Load
+    _family(lines, "sysmon_load_average", "gauge",
+            "System load average",
+            [({"period": "1m"}, load.load_1min),
+             ({"period": "5m"}, load.load_5min),
+             ({"period": "15m"}, load.load_15min)])
+
+    # Disk
+    partitions = [
+        ({"mountpoint": p.mountpoint, "device": p.device, "fstype": p.fstype}, p)
+        for p in disk.partitions
+    ]
+    _family(lines, "sysmon_filesystem_size_bytes", "gauge",
+            "Filesystem size", [(labels, p.total_bytes) for labels, p in partitions])
+    _family(lines, "sysmon_filesystem_used_bytes", "gauge",
+            "Filesystem space in use", [(labels, p.used_bytes) for labels, p in partitions])
+    _family(lines, "sysmon_filesystem_free_bytes", "gauge",
+            "Filesystem space free", [(labels, p.free_bytes) for labels, p in partitions])
+    _family(lines, "sysmon_filesystem_responsive", "gauge",
+            "Whether the filesystem answered its last usage probe in time",
+            [(labels, p.responsive) for labels, p in partitions])
+
+    if disk.io is not None:
+        _family(lines, "sysmon_disk_read_bytes_total", "counter",
+                "Bytes read from all disks", [({}, disk.io.read_bytes)])
+        _family(lines, "sysmon_disk_written_bytes_total", "counter",
+                "Bytes written to all disks", [({}, disk.io.write_bytes)])
+        _family(lines, "sysmon_disk_reads_total", "counter",
+                "Read operations on all disks", [({}, disk.io.read_count)])
+        _family(lines, "sysmon_disk_writes_total", "counter",
+                "Write operations on all disks", [({}, disk.io.write_count)])
+
+    if snapshot.disk_devices:
+        devices = [({"device": d.name}, d) for d in snapshot.disk_devices]
+        _family(lines, "sysmon_disk_device_read_bytes_per_second", "gauge",
+                "Bytes read from the device per second",
+                [(labels, d.read_bytes_per_sec) for labels, d in devices])
+        _family(lines, "sysmon_disk_device_written_bytes_per_second", "gauge",
+                "Bytes written to the device per second",
+                [(labels, d.write_bytes_per_sec) for labels, d in devices])
+        _family(lines, "sysmon_disk_device_reads_per_second", "gauge",
+                "Read requests completed by the device per second",
+                [(labels, d.read_iops) for labels, d in devices])
+        _family(lines, "sysmon_disk_device_writes_per_second", "gauge",
+                "Write requests completed by the device per second",
+                [(labels, d.write_iops) for labels, d in devices])
+        _family(lines, "sysmon_disk_device_await_milliseconds", "gauge",
+                "Average time per completed request, queueing included",
+                [(labels, d.await_ms) for labels, d in devices])
+        _family(lines, "sysmon_disk_device_queue_depth", "gauge",
+                "Average number of requests in flight",
+                [(labels, d.queue_depth) for labels, d in devices])
+        _family(lines, "sysmon_disk_device_utilization_percent", "gauge",
+                "Share of time the device had requests in flight",
+                [(labels, d.util_percent) for labels, d in devices])
+
+    # Network
+    if snapshot.network:
+        interfaces = [({"interface": i.name}, i) for i in snapshot.network]
+        _family(lines, "sysmon_network_receive_bytes_per_second", "gauge",
+                "Bytes received per second",
+                [(labels, i.rx_bytes_per_sec) for labels, i in interfaces])
+        _family(lines, "sysmon_network_transmit_bytes_per_second", "gauge",
+                "Bytes sent per second",
+                [(labels, i.tx_bytes_per_sec) for labels, i in interfaces])
+        _family(lines, "sysmon_network_receive_packets_per_second", "gauge",
+                "Packets received per second",
+                [(labels, i.rx_packets_per_sec) for labels, i in interfaces])
+        _family(lines, "sysmon_network_transmit_packets_per_second", "gauge",
+                "Packets sent per second",
+                [(labels, i.tx_packets_per_sec) for labels, i in interfaces])
+        _family(lines, "sysmon_network_receive_errors_per_second", "gauge",
+                "Receive errors per second",
+                [(labels, i.rx_errors_per_sec) for labels, i in interfaces])
+        _family(lines, "sysmon_network_transmit_errors_per_second", "gauge",
+                "Transmit errors per second",
+                [(labels, i.tx_errors_per_sec) for labels, i in interfaces])
+        _family(lines, "sysmon_network_receive_drops_per_second", "gauge",
+                "Received packets dropped per second",
+                [(labels, i.rx_drops_per_sec) for labels, i in interfaces])
+        _family(lines, "sysmon_network_transmit_drops_per_second", "gauge",
+                "Outgoing packets dropped per second",
+                [(labels, i.tx_drops_per_sec) for labels, i in interfaces])
+        _family(lines, "sysmon_network_interfaces", "gauge",
+                "Number of interfaces summed into each entry",
+                [(labels, i.interfaces) for labels, i in interfaces])
+
+    # Docker
+    docker = snapshot.docker
+    if docker is not None:
+        _family(lines, "sysmon_docker_up", "gauge",
+                "Whether the Docker daemon is reachable", [({}, docker.available)])
+
+        if docker.available:
+            _family(lines, "sysmon_docker_containers", "gauge",
+                    "Number of containers by state",
+                    [({"state": "all"}, docker.total_containers),
+                     ({"state": "running"}, docker.running_containers)])
+
+            containers = [
+                ({"id": c.container_id, "name": c.name, "image": c.image}, c)
+                for c in docker.containers
+            ]
+            _family(lines, "sysmon_container_cpu_usage_percent", "gauge",
+                    "Container CPU usage (100 per fully used core)",
+                    [(labels, c.cpu_percent) for labels, c in containers])
+            _family(lines, "sysmon_container_memory_usage_bytes", "gauge",
+                    "Container memory usage",
+                    [(labels, c.memory_used_bytes) for labels, c in containers])
+            _family(lines, "sysmon_container_memory_limit_bytes", "gauge",
+                    "Container memory limit",
+                    [(labels, c.memory_limit_bytes) for labels, c in containers])
+            _family(lines, "sysmon_container_network_receive_bytes_total", "counter",
+                    "Bytes received by the container",
+                    [(labels, c.network_rx_bytes) for labels, c in containers])
+            _family(lines, "sysmon_container_network_transmit_bytes_total", "counter",
+                    "Bytes sent by the container",
+                    [(labels, c.network_tx_bytes) for labels, c in containers])
+            _family(lines, "sysmon_container_block_read_bytes_total", "counter",
+                    "Bytes read from block devices by the container",
+                    [(labels, c.block_read_bytes) for labels, c in containers])
+            _family(lines, "sysmon_container_block_written_bytes_total", "counter",
+                    "Bytes written to block devices by the container",
+                    [(labels, c.block_write_bytes) for labels, c in containers])
+            _family(lines, "sysmon_container_cpu_throttled_periods_total", "counter",
+                    "CFS periods in which the container was throttled",
+                    [(labels, c.cpu_throttled_periods) for labels, c in containers])
+            _family(lines, "sysmon_container_cpu_throttled_seconds_total", "counter",
+                    "Time the container was throttled by its CPU quota",
+                    [(labels, c.cpu_throttled_usec / 1e6) for labels, c in containers])
+
+    lines.append("")
+    return "\n".join(lines).encode()
+
+
+def _family(lines: List[str], name: str, kind: str, help_text: str, samples: Samples) -> None:
+    """Append one metric family; samples with a value of None are skipped."""
+    samples = [(labels, value) for labels, value in samples if value is not None]
+    if not samples:
+        return
+
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} {kind}")
+    for labels, value in samples:
+        lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    """Format a label set, escaping values as the exposition format requires."""
+    if not labels:
+        return ""
+    pairs = ",".join(
+        '{}="{}"'.format(
+            key,
+            str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"'),
+        )
+        for key, value in labels.items()
+    )
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value."""
+    if isinstance(value, (bool, int)):
+        return str(int(value))
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+class _IPv6HTTPServer(ThreadingHTTPServer):
+    """HTTP server listening on an IPv6 address."""
+
+    address_family = socket.AF_INET6
+
+
+class MetricsExporter:
+    """
+    Serves the latest snapshot in Prometheus format.
+
+    Collection runs on its own schedule through a SnapshotStream. A scrape
+    only reads the latest snapshot; its encoded (and gzipped) payload is
+    built by the first scrape after the snapshot changes and reused by every
+    scrape until the next one.
+    """
+
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(
+        self,
+        collector: SnapshotCollector,
+        interval: float = 2.0,
+        host: str = "127.0.0.1",
+        port: int = 9877,
+    ):
+        """
+        Initialize the exporter.
+
+        Args:
+            collector: Collector producing the snapshots
+            interval: Seconds between collections
+            host: Address to listen on (IPv4, or IPv6 without brackets)
+            port: Port to listen on
+        """
+        self.collector = collector
+        self.stream = SnapshotStream(collector, interval, on_error=self._report_error)
+        self.host = host
+        self.port = port
+        self._server: Optional[ThreadingHTTPServer] = None
+
+        self._lock = threading.Lock()
+        self._encoded: Optional[Snapshot] = None
+        self._payloads: Dict[str, bytes] = {}
+
+    def payload(self, encoding: str = "identity") -> Optional[bytes]:
+        """
+        Get the encoded latest snapshot.
+
+        Args:
+            encoding: "identity" or "gzip"
+
+        Returns:
+            Encoded payload, or None before the first snapshot
+        """
+        snapshot = self.stream.latest
+        if snapshot is None:
+            return None
+
+        with self._lock:
+            if snapshot is not self._encoded:
+                self._encoded = snapshot
+                self._payloads = {"identity": encode_snapshot(snapshot)}
+
+            if encoding not in self._payloads:
+                self._payloads[encoding] = gzip.compress(self._payloads["identity"])
+            return self._payloads[encoding]
+
+    @staticmethod
+    def _report_error(error: Exception) -> None:
+        """Report a failed collection; scrapes keep the previous snapshot."""
+        print(f"sysmon: collection failed: {type(error).__name__}: {error}", file=sys.stderr)
+
+    def _signal_handler(self, signum, frame):
+        """Handle interrupt signals gracefully."""
+        threading.Thread(target=self._server.shutdown, daemon=True).start()
+
+    def run(self) -> None:
+        """
+        Collect and serve metrics until interrupted.
+
+        Raises:
+            OSError: If the address cannot be bound
+        """
+        self._server = self._create_server()
+
+        signal.signal(signal.SIGINT, self._signal_handler)
+        signal.signal(signal.SIGTERM, self._signal_handler)
+
+        self.stream.start()
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+            self.stream.stop()
+            self.collector.close()
+
+    def _create_server(self) -> ThreadingHTTPServer:
+        """
+        Bind the HTTP server to the listen address.
+
+        Raises:
+            OSError: If the address cannot be bound
+        """
+        server_class = _IPv6HTTPServer if ":" in self.host else ThreadingHTTPServer
+        server = server_class((self.host, self.port), self._handler())
+        server.daemon_threads = True
+        return server
+
+    def _handler(self):
+        """Build the request handler class bound to this exporter."""
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self._reply(404, b"Not found; metrics are at /metrics\n")
+                    return
+
+                encoding = (
+                    "gzip"
+                    if "gzip" in self.headers.get("Accept-Encoding", "")
+                    else "identity"
+                )
+                body = exporter.payload(encoding)
+                if body is None:
+                    self._reply(503, b"No snapshot collected yet\n")
+                    return
+
+                self._reply(200, body, exporter.CONTENT_TYPE, encoding)
+
+            def _reply(self, status, body, content_type="text/plain", encoding="identity"):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                if encoding != "identity":
+                    self.send_header("Content-Encoding", encoding)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
@@ -0,0 +1,171 @@
+"""
+JSON-lines output of snapshots for pipelines.
+
+This module is used without the dashboard and must not import Rich.
+"""
+
+import json
+import os
+import signal
+import sys
+import threading
+import time
+from dataclasses import asdict
+from typing import Any, BinaryIO, Dict, Optional
+
+from .snapshot import Snapshot, SnapshotCollector
+
+
+def snapshot_to_record(snapshot: Snapshot) -> Dict[str, Any]:
+    """
+    Convert a snapshot to the object written as one JSON line.
+
+    Sparkline histories are left out; every line describes one point in time.
+
+    Args:
+        snapshot: Snapshot to convert
+
+    Returns:
+        Dictionary of JSON-compatible values
+    """
+    return {
+        "timestamp": snapshot.timestamp,
+        "cpu": asdict(snapshot.cpu),
+        "memory": asdict(snapshot.memory),
+        "disk": asdict(snapshot.disk),
+        "load": asdict(snapshot.load),
+        "disk_devices": [asdict(d) for d in snapshot.disk_devices]
+        if snapshot.disk_devices is not None
+        else None,
+        "network": [asdict(i) for i in snapshot.network]
+        if snapshot.network is not None
+        else None,
+        "docker": asdict(snapshot.docker) if snapshot.docker is not None else None,
+        "processes": [asdict(p) for p in snapshot.processes]
+        if snapshot.processes is not None
+        else None,
+        "stale": sorted(snapshot.stale),
+        "ages": snapshot.ages,
+    }
+
+
+class JsonLinesWriter:
+    """Buffered writer of one JSON object per line."""
+
+    BUFFER_SIZE = 64 * 1024
+
+    def __init__(self, stream: Optional[BinaryIO] = None, flush_every: int = 1):
+        """
+        Initialize the writer.
+
+        Args:
+            stream: Binary stream to write to (default: standard output)
+            flush_every: Flush after this many lines; 0 flushes only when the
+                buffer fills and on close
+        """
+        if stream is None:
+            stream = open(sys.stdout.fileno(), "wb", buffering=self.BUFFER_SIZE, closefd=False)
+
+        self.stream = stream
+        self.flush_every = flush_every
+        self.closed = False
+        self._pending = 0
+        self._encoder = json.JSONEncoder(separators=(",", ":"))
+
+    def write(self, record: Dict[str, Any]) -> bool:
+        """
+        Write one record as a line.
+
+        Args:
+            record: JSON-compatible object
+
+        Returns:
+            False once the reader has gone away (closed pipe)
+        """
+        if self.closed:
+            return False
+
+        try:
+            self.stream.write(self._encoder.encode(record).encode() + b"\n")
+            self._pending += 1
+            if self.flush_every and self._pending >= self.flush_every:
+                self.stream.flush()
+                self._pending = 0
+        except BrokenPipeError:
+            self._broken_pipe()
+            return False
+        return True
+
+    def close(self) -> None:
+        """Flush buffered lines and stop writing."""
+        if self.closed:
+            return
+        try:
+            self.stream.flush()
+        except BrokenPipeError:
+            self._broken_pipe()
+        self.closed = True
+
+    def _broken_pipe(self) -> None:
+        """Stop writing after the reader closed the pipe."""
+        self.closed = True
+
+        # Point stdout at /dev/null so that the interpreter's own flush at
+        # exit does not raise again
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        os.close(devnull)
+
+
+class JsonLinesStreamer:
+    """Collects snapshots at a fixed interval and writes them as JSON lines."""
+
+    def __init__(
+        self,
+        collector: SnapshotCollector,
+        writer: JsonLinesWriter,
+        interval: float = 2.0,
+    ):
+        """
+        Initialize the streamer.
+
+        Args:
+            collector: Collector producing the snapshots
+            writer: Writer receiving the records
+            interval: Seconds between snapshots
+        """
+        self.collector = collector
+        self.writer = writer
+        self.interval = interval
+        self._stop = threading.Event()
+
+    def _signal_handler(self, signum, frame):
+        """Handle interrupt signals gracefully."""
+        self._stop.set()
+
+    def run(self, count: Optional[int] = None) -> None:
+        """
+        Write snapshots until interrupted or the output pipe is closed.
+
+        Args:
+            count: Optional number of snapshots to write
+        """
+        signal.signal(signal.SIGINT, self._signal_handler)
+        signal.signal(signal.SIGTERM, self._signal_handler)
+
+        written = 0
+        try:
+            while not self._stop.is_set():
+                started = time.monotonic()
+                if not self.writer.write(snapshot_to_record(self.collector.collect())):
+                    break
+
+                written += 1
+                if count is not None and written >= count:
+                    break
+
+                elapsed = time.monotonic() - started
+                self._stop.wait(max(0.0, self.interval - elapsed))
+        finally:
+            self.writer.close()
+            self.collector.close()
@@ -2,25 +2,59 @@
 Main monitor class with live display.
 """
 
+import asyncio
 import signal
 import sys
-import time
-from typing import Optional
+import threading
+from contextlib import nullcontext
+from typing import Callable, ContextManager, Dict, List, Optional
 
-from rich.console import Console
+from rich.console import Console, ConsoleDimensions
 from rich.live import Live
+from rich.markup import escape
 
 from .display.dashboard import Dashboard
+from .snapshot import Snapshot, SnapshotStream
+from .utils.keys import KeyReader
+from .utils.overhead import OverheadRecorder
 
 
 class Monitor:
     """Main system monitor with real-time updating display."""
 
+    # How often the render loop checks for a resized terminal while waiting
+    # for the next snapshot
+    RESIZE_POLL_INTERVAL = 0.25
+
+    # Longest wait for the Docker connection before a single frame
+    DOCKER_CONNECT_TIMEOUT = 2.0
+
+    # Refresh rates the + and - keys step through, in seconds
+    REFRESH_RATES = (0.5, 1.0, 2.0, 5.0, 10.0)
+
+    # Ways of running the collectors and the display
+    RUNTIMES = ("threads", "asyncio")
+
+    # Key hints shown in the header while keys are read
+    KEY_HINTS = "p pause · s/o sort · +/- rate · ↑↓ scroll · tab list · c cores · q quit"
+
     def __init__(
         self,
         refresh_rate: float = 2.0,
         show_processes: bool = True,
         show_docker: bool = True,
+        docker_backend: str = "api",
+        history_span: Optional[float] = None,
+        intervals: Optional[Dict[str, float]] = None,
+        show_disk_io: bool = True,
+        show_network: bool = True,
+        docker_sort: str = "cpu",
+        show_overhead: bool = False,
+        profile: bool = False,
+        core_history: int = 0,
+        braille: bool = False,
+        interactive: bool = True,
+        runtime: str = "threads",
     ):
         """
         Initialize the system monitor.
@@ -29,48 +63,254 @@ class Monitor:
             refresh_rate: Refresh interval in seconds (default 2.0)
             show_processes: Whether to show the process list
             show_docker: Whether to show Docker container metrics
+            docker_backend: Docker stats backend ("api", "stream", "cgroup"
+                or "socket")
+            history_span: Seconds of history shown in sparklines
+            intervals: Optional per-collector interval overrides in seconds
+            show_disk_io: Whether to show per-device disk I/O
+            show_network: Whether to show per-interface network rates
+            docker_sort: Order of the containers ("cpu", "memory", "net" or "io")
+            show_overhead: Whether to show sysmon's own overhead in a footer
+            profile: Whether to print a summary of sysmon's own overhead on exit
+            core_history: Number of recent samples shown for each CPU core
+            braille: Whether to draw the history graphs with braille dots
+            interactive: Whether the live display can be changed with keys;
+                collects enough to re-sort and scroll without collecting again
+            runtime: "threads" to collect on a background thread and redraw
+                for each snapshot, or "asyncio" to run each collector as a
+                task on an event loop and redraw on a timer of its own
         """
+        if runtime not in self.RUNTIMES:
+            raise ValueError(f"Unknown runtime: {runtime}")
+        self.runtime = runtime
         self.refresh_rate = refresh_rate
+        self.profile = profile
+        self.recorder = OverheadRecorder() if show_overhead or profile else None
         self.show_processes = show_processes
         self.show_docker = show_docker
         self.console = Console()
-        self.dashboard = Dashboard(show_processes=show_processes, show_docker=show_docker)
+        self.dashboard = Dashboard(
+            show_processes=show_processes,
+            show_docker=show_docker,
+            docker_backend=docker_backend,
+            refresh_rate=refresh_rate,
+            history_span=history_span,
+            intervals=intervals,
+            show_disk_io=show_disk_io,
+            show_network=show_network,
+            docker_sort=docker_sort,
+            recorder=self.recorder,
+            show_overhead=show_overhead,
+            core_history=core_history,
+            braille=braille,
+            interactive=interactive,
+            use_asyncio=runtime == "asyncio",
+        )
+        self.paused = False
         self._running = False
+        self._stream: Optional[SnapshotStream] = None
+        # Error of the last failed collection, shown in the header
+        self._error: Optional[str] = None
+
+        # Set by new snapshots, key presses and signals to wake the display
+        self._wake = threading.Event()
+        # Wakes the display from any thread; replaced while the event loop runs
+        self._notify: Callable[[], None] = self._wake.set
+
+        self._bindings: Dict[str, Callable[[], None]] = {
+            "q": self.stop,
+            "p": self._toggle_pause,
+            "space": self._toggle_pause,
+            "s": self.dashboard.cycle_process_sort,
+            "o": self.dashboard.cycle_docker_sort,
+            "+": lambda: self._step_refresh_rate(-1),
+            "=": lambda: self._step_refresh_rate(-1),
+            "-": lambda: self._step_refresh_rate(1),
+            "up": lambda: self.dashboard.scroll(-1),
+            "k": lambda: self.dashboard.scroll(-1),
+            "down": lambda: self.dashboard.scroll(1),
+            "j": lambda: self.dashboard.scroll(1),
+            "pageup": lambda: self.dashboard.scroll(-self.dashboard.page_size()),
+            "pagedown": lambda: self.dashboard.scroll(self.dashboard.page_size()),
+            "home": lambda: self.dashboard.scroll(-sys.maxsize),
+            "end": lambda: self.dashboard.scroll(sys.maxsize),
+            "tab": self.dashboard.cycle_scroll_target,
+            "c": self._toggle_cores,
+        }
 
     def _signal_handler(self, signum, frame):
         """Handle interrupt signals gracefully."""
+        self.stop()
+
+    def stop(self) -> None:
+        """Make the live display exit after the current frame."""
         self._running = False
+        self._notify()
 
     def run(self) -> None:
         """
         Start the monitor with live updating display.
 
-        Runs until Ctrl+C is pressed.
+        With the threads runtime, collection runs on its own thread at the
+        refresh rate and publishes immutable snapshots, and the display is
+        redrawn when a new snapshot arrives. With the asyncio runtime, each
+        collector is a task on one event loop and the display is redrawn on
+        its own timer from the latest results. Either way a key that changes
+        the view or a resized terminal redraws the last snapshot right away,
+        without triggering a collection.
+
+        Runs until q or Ctrl+C is pressed.
         """
         # Set up signal handlers for graceful exit
         signal.signal(signal.SIGINT, self._signal_handler)
         signal.signal(signal.SIGTERM, self._signal_handler)
 
         self._running = True
+        try:
+            if self.runtime == "asyncio":
+                asyncio.run(self._run_async())
+            else:
+                self._run_threads()
+        except Exception as e:
+            self.console.print(f"[red]Error: {e}[/red]")
+            sys.exit(1)
+        finally:
+            self.dashboard.close()
+            self.console.print("\n[dim]Monitor stopped.[/dim]")
+            self._print_profile()
+
+    def _run_threads(self) -> None:
+        """Display loop of the threads runtime, woken by each new snapshot."""
+        collector = self.dashboard.collector
+        stream = self._stream = SnapshotStream(
+            collector, collector.tick_interval, on_snapshot=self._wake.set
+        )
+        stream.start()
+        keys = KeyReader(on_key=self._wake.set)
 
         try:
-            with Live(
-                self.dashboard.render(),
-                console=self.console,
-                refresh_per_second=1,
-                screen=True,
+            # Show the first frame as soon as the first snapshot exists
+            snapshot = None
+            while self._running and snapshot is None:
+                snapshot = stream.wait(None, timeout=self.RESIZE_POLL_INTERVAL)
+            if snapshot is None:
+                return
+
+            with keys, Live(
+                console=self.console, auto_refresh=False, screen=True
             ) as live:
+                self._update_status(keys.active)
+                self._draw(live, snapshot)
+                size = self.console.size
+
                 while self._running:
                     try:
-                        live.update(self.dashboard.render())
-                        time.sleep(self.refresh_rate)
+                        self._wake.wait(self.RESIZE_POLL_INTERVAL)
+                        self._wake.clear()
+
+                        changed = self._handle_keys(keys.read())
+                        if changed:
+                            self._update_status(keys.active)
+
+                        if stream.error != self._error:
+                            self._error = stream.error
+                            self._update_status(keys.active)
+                            changed = True
+
+                        newer = stream.latest
+                        if newer is not snapshot and not self.paused:
+                            snapshot = newer
+                            self._sample_memory()
+                            changed = True
+
+                        size = self._redraw(live, snapshot, changed, size)
                     except KeyboardInterrupt:
                         break
-        except Exception as e:
-            self.console.print(f"[red]Error: {e}[/red]")
-            sys.exit(1)
         finally:
-            self.console.print("\n[dim]Monitor stopped.[/dim]")
+            stream.stop()
+            self._stream = None
+            self._error = None
+
+    async def _run_async(self) -> None:
+        """Display loop of the asyncio runtime, woken by its frame timer."""
+        loop = asyncio.get_running_loop()
+        wake = asyncio.Event()
+        self._notify = lambda: loop.call_soon_threadsafe(wake.set)
+
+        collector = self.dashboard.collector
+        collectors = loop.create_task(collector.run_collectors())
+        keys = KeyReader(on_key=self._notify)
+
+        try:
+            # Show the first frame once every collector has had its chance
+            await collector.wait_ready(max(collector.deadlines.values()))
+            if not self._running:
+                return
+
+            with keys, Live(
+                console=self.console, auto_refresh=False, screen=True
+            ) as live:
+                self._update_status(keys.active)
+                snapshot = collector.collect()
+                self._draw(live, snapshot)
+                size = self.console.size
+                next_frame = loop.time() + self.refresh_rate
+
+                while self._running:
+                    timeout = min(next_frame - loop.time(), self.RESIZE_POLL_INTERVAL)
+                    if timeout > 0:
+                        try:
+                            await asyncio.wait_for(wake.wait(), timeout)
+                        except asyncio.TimeoutError:
+                            pass
+                    wake.clear()
+
+                    changed = self._handle_keys(keys.read())
+                    if changed:
+                        self._update_status(keys.active)
+
+                    now = loop.time()
+                    if now >= next_frame:
+                        next_frame = max(next_frame + self.refresh_rate, now)
+                        # Keep the histories going while the display is paused
+                        latest = collector.collect()
+                        if not self.paused:
+                            snapshot = latest
+                            self._sample_memory()
+                            changed = True
+
+                    size = self._redraw(live, snapshot, changed, size)
+        finally:
+            collectors.cancel()
+            try:
+                await collectors
+            except asyncio.CancelledError:
+                pass
+            self._notify = self._wake.set
+
+    def _draw(self, live: Live, snapshot: Snapshot) -> None:
+        """Lay out a snapshot and write it to the terminal."""
+        with self._measure("layout"):
+            layout = self.dashboard.create_layout(snapshot)
+        with self._measure("write"):
+            live.update(layout, refresh=True)
+
+    def _redraw(
+        self, live: Live, snapshot: Snapshot, changed: bool, size: ConsoleDimensions
+    ) -> ConsoleDimensions:
+        """
+        Redraw after a wake-up if the view changed or the terminal was resized.
+
+        Returns:
+            The terminal size now, to compare with at the next wake-up
+        """
+        if changed:
+            self._draw(live, snapshot)
+        elif self.console.size != size:
+            # Re-render the last snapshot at the new size
+            with self._measure("write"):
+                live.refresh()
+        return self.console.size
 
     def run_once(self) -> None:
         """
@@ -78,4 +318,108 @@ class Monitor:
 
         Useful for testing or one-shot display.
         """
-        self.console.print(self.dashboard.render())
+        try:
+            # A single frame cannot wait for Docker to show up later
+            self.dashboard.collector.wait_for_docker(self.DOCKER_CONNECT_TIMEOUT)
+            if self.runtime == "asyncio":
+                snapshot = asyncio.run(self._collect_once_async())
+            else:
+                snapshot = self.dashboard.collect_metrics()
+            self._sample_memory()
+            with self._measure("layout"):
+                layout = self.dashboard.create_layout(snapshot)
+            with self._measure("write"):
+                self.console.print(layout)
+        finally:
+            self.dashboard.close()
+            self._print_profile()
+
+    async def _collect_once_async(self) -> Snapshot:
+        """Run every collector once as a task and assemble their results."""
+        collector = self.dashboard.collector
+        collectors = asyncio.ensure_future(collector.run_collectors())
+        try:
+            await collector.wait_ready(max(collector.deadlines.values()))
+            return collector.collect()
+        finally:
+            collectors.cancel()
+            try:
+                await collectors
+            except asyncio.CancelledError:
+                pass
+
+    def _handle_keys(self, keys: List[str]) -> bool:
+        """
+        Apply the actions bound to pressed keys.
+
+        Returns:
+            True if any key changed the view
+        """
+        changed = False
+        for key in keys:
+            action = self._bindings.get(key)
+            if action is not None:
+                action()
+                changed = True
+        return changed
+
+    def _toggle_pause(self) -> None:
+        """Freeze or resume the display; collection goes on while paused."""
+        self.paused = not self.paused
+
+    def _toggle_cores(self) -> None:
+        """Show or hide the recent history of each CPU core."""
+        self.dashboard.expand_cores = not self.dashboard.expand_cores
+
+    def _step_refresh_rate(self, step: int) -> None:
+        """
+        Move to the next shorter (-1) or longer (1) refresh rate.
+
+        Collectors given their own interval keep it.
+        """
+        rates = self.REFRESH_RATES
+        if step < 0:
+            shorter = [rate for rate in rates if rate < self.refresh_rate]
+            rate = shorter[-1] if shorter else rates[0]
+        else:
+            longer = [rate for rate in rates if rate > self.refresh_rate]
+            rate = longer[0] if longer else rates[-1]
+        if rate == self.refresh_rate:
+            return
+
+        self.refresh_rate = rate
+        if self._stream is not None:
+            # Applied by the collection thread between two collections
+            self._stream.set_interval(rate)
+        else:
+            # The asyncio runtime collects on this thread
+            self.dashboard.collector.set_interval(rate)
+
+    def _update_status(self, keys_active: bool) -> None:
+        """Show the refresh rate, pause state, errors and key hints in the header."""
+        parts = []
+        if self._error is not None:
+            parts.append(f"[bold red]collection failed: {escape(self._error)}[/bold red]")
+        if self.paused:
+            parts.append("[bold yellow]PAUSED[/bold yellow]")
+        parts.append(f"every {self.refresh_rate:g}s")
+        if keys_active:
+            parts.append(f"scroll {self.dashboard.scroll_target}")
+            parts.append(self.KEY_HINTS)
+        self.dashboard.status = f"[dim]{' · '.join(parts)}[/dim]"
+
+    def _measure(self, name: str) -> ContextManager:
+        """Time a block under `name` when overhead is being recorded."""
+        if self.recorder is None:
+            return nullcontext()
+        return self.recorder.measure(name)
+
+    def _sample_memory(self) -> None:
+        """Record the memory use when overhead is being recorded."""
+        if self.recorder is not None:
+            self.recorder.sample_memory()
+
+    def _print_profile(self) -> None:
+        """Print the overhead summary to stderr if --profile was given."""
+        if self.profile and self.recorder is not None:
+            print(self.recorder.format_summary(), file=sys.stderr)
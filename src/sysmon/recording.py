@@ -0,0 +1,424 @@
+"""
+Append-only binary recordings of snapshots with a time index.
+
+A recording is two files:
+
+    <path>       data file: a magic header followed by records, each a
+                 (timestamp: float64, length: uint32) header and a
+                 zlib-compressed JSON snapshot
+    <path>.idx   index file: one fixed-size (timestamp: float64,
+                 offset: uint64) entry per record
+
+Both files are only ever appended to. Because index entries have a fixed
+size, finding the record for a point in time is a binary search over the
+index that reads a handful of 16-byte entries, however large the recording.
+
+Records leave out the sparkline histories: each history is made of the
+per-tick values of the records before it, and HistoryRebuilder rebuilds
+them on replay.
+"""
+
+import json
+import math
+import os
+import signal
+import struct
+import threading
+import time
+import zlib
+from dataclasses import replace
+from typing import Dict, Iterator, Optional
+
+from .snapshot import Snapshot, SnapshotCollector, snapshot_from_dict, snapshot_to_dict
+from .utils.history import HistoryBuffer, HistoryMatrix
+
+MAGIC = b"SYSMONREC\x01"
+
+RECORD_HEADER = struct.Struct("<dI")
+INDEX_ENTRY = struct.Struct("<dQ")
+
+# Snapshot fields left out of records
+HISTORY_FIELDS = (
+    "cpu_history",
+    "memory_history",
+    "load_history",
+    "disk_device_history",
+    "network_history",
+    "core_history",
+)
+
+
+class RecordingError(Exception):
+    """Raised when a recording file is missing or malformed."""
+
+
+class RecordingWriter:
+    """Appends snapshots to a recording."""
+
+    def __init__(self, path: str):
+        """
+        Open a recording for appending, creating it if needed.
+
+        Args:
+            path: Path of the data file (the index is stored next to it)
+        """
+        self.path = path
+        self._data = open(path, "ab")
+        self._index = open(path + ".idx", "ab")
+
+        if self._data.tell() == 0:
+            self._data.write(MAGIC)
+            self._data.flush()
+
+    def append(self, snapshot: Snapshot) -> None:
+        """
+        Append a snapshot to the recording, without its histories.
+
+        The data record is flushed before its index entry so that an
+        interrupted write never leaves an index entry without a record.
+
+        Args:
+            snapshot: Snapshot to store
+        """
+        data = snapshot_to_dict(snapshot)
+        for name in HISTORY_FIELDS:
+            del data[name]
+        payload = zlib.compress(json.dumps(data, separators=(",", ":")).encode())
+
+        offset = self._data.tell()
+        self._data.write(RECORD_HEADER.pack(snapshot.timestamp, len(payload)))
+        self._data.write(payload)
+        self._data.flush()
+
+        self._index.write(INDEX_ENTRY.pack(snapshot.timestamp, offset))
+        self._index.flush()
+
+    def close(self) -> None:
+        """Close the recording files."""
+        self._data.close()
+        self._index.close()
+
+
+class RecordingReader:
+    """Random access to the snapshots of a recording."""
+
+    def __init__(self, path: str):
+        """
+        Open a recording for reading.
+
+        Rebuilds the index from the data file if it is missing. If the index
+        file cannot be written (e.g. in a read-only location), the rebuilt
+        index is kept in memory instead.
+
+        Args:
+            path: Path of the data file
+
+        Raises:
+            RecordingError: If the file is not a sysmon recording
+        """
+        self.path = path
+        try:
+            self._data = os.open(path, os.O_RDONLY)
+        except OSError as e:
+            raise RecordingError(str(e)) from e
+
+        if os.pread(self._data, len(MAGIC), 0) != MAGIC:
+            os.close(self._data)
+            raise RecordingError(f"{path} is not a sysmon recording")
+
+        # Index file descriptor, or None when the index is held in _entries
+        self._index: Optional[int] = None
+        self._entries = b""
+
+        index_path = path + ".idx"
+        if not os.path.exists(index_path):
+            try:
+                self.rebuild_index()
+            except OSError:
+                self._entries = self._scan_index()
+                return
+        self._index = os.open(index_path, os.O_RDONLY)
+
+    def __len__(self) -> int:
+        """Return the number of indexed records."""
+        if self._index is None:
+            return len(self._entries) // INDEX_ENTRY.size
+        return os.fstat(self._index).st_size // INDEX_ENTRY.size
+
+    @property
+    def start_time(self) -> Optional[float]:
+        """Timestamp of the first record, or None if empty."""
+        return self._entry(0)[0] if len(self) else None
+
+    @property
+    def end_time(self) -> Optional[float]:
+        """Timestamp of the last record, or None if empty."""
+        return self._entry(len(self) - 1)[0] if len(self) else None
+
+    def find(self, timestamp: float) -> int:
+        """
+        Find the first record at or after a point in time.
+
+        Args:
+            timestamp: Wall-clock time to seek to
+
+        Returns:
+            Record number (len(self) if every record is earlier)
+        """
+        low, high = 0, len(self)
+        while low < high:
+            middle = (low + high) // 2
+            if self._entry(middle)[0] < timestamp:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def timestamp(self, number: int) -> float:
+        """Get the timestamp of a record without reading it."""
+        return self._entry(number)[0]
+
+    def read(self, number: int) -> Snapshot:
+        """
+        Read a single record.
+
+        Args:
+            number: Record number
+
+        Returns:
+            The stored Snapshot, with empty histories
+        """
+        _, offset = self._entry(number)
+        header = os.pread(self._data, RECORD_HEADER.size, offset)
+        if len(header) < RECORD_HEADER.size:
+            raise RecordingError(f"Truncated record {number}")
+
+        _, length = RECORD_HEADER.unpack(header)
+        payload = os.pread(self._data, length, offset + RECORD_HEADER.size)
+        if len(payload) < length:
+            raise RecordingError(f"Truncated record {number}")
+
+        return snapshot_from_dict(json.loads(zlib.decompress(payload)))
+
+    def iter_from(self, number: int = 0) -> Iterator[Snapshot]:
+        """
+        Iterate over records starting at a record number.
+
+        Records appended while iterating are included.
+
+        Args:
+            number: First record number
+        """
+        while number < len(self):
+            yield self.read(number)
+            number += 1
+
+    def rebuild_index(self) -> None:
+        """
+        Recreate the index file by scanning the data file.
+
+        Raises:
+            OSError: If the index file cannot be written
+        """
+        entries = self._scan_index()
+        with open(self.path + ".idx", "wb") as index:
+            index.write(entries)
+
+    def close(self) -> None:
+        """Close the recording files."""
+        os.close(self._data)
+        if self._index is not None:
+            os.close(self._index)
+
+    def _scan_index(self) -> bytes:
+        """Build the index entries of every complete record in the data file."""
+        size = os.fstat(self._data).st_size
+        offset = len(MAGIC)
+        entries = bytearray()
+
+        while offset + RECORD_HEADER.size <= size:
+            timestamp, length = RECORD_HEADER.unpack(
+                os.pread(self._data, RECORD_HEADER.size, offset)
+            )
+            if offset + RECORD_HEADER.size + length > size:
+                # Partially written trailing record
+                break
+            entries += INDEX_ENTRY.pack(timestamp, offset)
+            offset += RECORD_HEADER.size + length
+
+        return bytes(entries)
+
+    def _entry(self, number: int):
+        """Read one index entry as (timestamp, offset)."""
+        if not 0 <= number < len(self):
+            raise IndexError(f"Record {number} out of range")
+        if self._index is None:
+            return INDEX_ENTRY.unpack_from(self._entries, number * INDEX_ENTRY.size)
+        return INDEX_ENTRY.unpack(
+            os.pread(self._index, INDEX_ENTRY.size, number * INDEX_ENTRY.size)
+        )
+
+
+class HistoryRebuilder:
+    """
+    Reads records with their sparkline histories rebuilt.
+
+    The histories are rebuilt from the per-tick values of the records read
+    before, the way SnapshotCollector builds them: a value joins a history
+    only if it was freshly collected for its record, i.e. it is not stale
+    and is younger than the time since the previous record. Each history
+    holds the last `points` values.
+    """
+
+    def __init__(self, reader: RecordingReader, points: int = 20):
+        """
+        Initialize the rebuilder.
+
+        Args:
+            reader: Recording to read
+            points: Number of values kept in each history
+        """
+        self.reader = reader
+        self.points = points
+        self._number = -1
+        self._clear()
+
+    def read(self, number: int) -> Snapshot:
+        """
+        Read a record with its histories.
+
+        Reading the record after the last one read extends the histories by
+        that record; any other record is preceded by reading the `points`
+        records before it.
+
+        Args:
+            number: Record number
+
+        Returns:
+            The stored Snapshot with its histories
+        """
+        if number != self._number + 1:
+            self._clear()
+            for earlier in range(max(0, number - self.points), number):
+                self._add(self.reader.read(earlier))
+
+        snapshot = self.reader.read(number)
+        self._add(snapshot)
+        self._number = number
+
+        return replace(
+            snapshot,
+            cpu_history=tuple(self._cpu.view()),
+            memory_history=tuple(self._memory.view()),
+            load_history=tuple(self._load.view()),
+            disk_device_history={
+                name: tuple(history.view()) for name, history in self._devices.items()
+            }
+            if snapshot.disk_devices is not None
+            else {},
+            network_history={
+                name: tuple(history.view()) for name, history in self._network.items()
+            }
+            if snapshot.network is not None
+            else {},
+            core_history=tuple(self._cores.rows()),
+        )
+
+    def _clear(self) -> None:
+        """Forget every history."""
+        self._previous: Optional[Snapshot] = None
+        self._cpu = HistoryBuffer(self.points)
+        self._memory = HistoryBuffer(self.points)
+        self._load = HistoryBuffer(self.points)
+        self._cores = HistoryMatrix(self.points)
+        self._devices: Dict[str, HistoryBuffer] = {}
+        self._network: Dict[str, HistoryBuffer] = {}
+
+    def _add(self, snapshot: Snapshot) -> None:
+        """Add the fresh values of a record to the histories."""
+        previous, self._previous = self._previous, snapshot
+        gap = snapshot.timestamp - previous.timestamp if previous is not None else math.inf
+
+        def fresh(name: str) -> bool:
+            return name not in snapshot.stale and snapshot.ages.get(name, 0.0) < gap
+
+        if fresh("cpu"):
+            self._cpu.add(snapshot.cpu.overall_percent)
+            if snapshot.cpu.per_core_percent:
+                self._cores.add(snapshot.cpu.per_core_percent)
+        if fresh("memory"):
+            self._memory.add(snapshot.memory.percent)
+        if fresh("load"):
+            self._load.add(snapshot.load.load_1min_normalized)
+
+        if snapshot.disk_devices is not None and fresh("disk_devices"):
+            self._update(
+                self._devices, {d.name: d.util_percent for d in snapshot.disk_devices}
+            )
+        if snapshot.network is not None and fresh("network"):
+            self._update(
+                self._network,
+                {i.name: i.rx_bytes_per_sec + i.tx_bytes_per_sec for i in snapshot.network},
+            )
+
+    def _update(self, histories: Dict[str, HistoryBuffer], values: Dict[str, float]) -> None:
+        """Add a value to the history of each name, forgetting absent names."""
+        for name, value in values.items():
+            history = histories.get(name)
+            if history is None:
+                history = histories[name] = HistoryBuffer(self.points)
+            history.add(value)
+
+        for name in set(histories) - set(values):
+            del histories[name]
+
+
+class Recorder:
+    """Runs the collectors without a UI and appends every snapshot to a recording."""
+
+    def __init__(self, path: str, collector: SnapshotCollector, interval: float = 2.0):
+        """
+        Initialize the recorder.
+
+        Args:
+            path: Path of the recording data file
+            collector: Collector producing the snapshots
+            interval: Seconds between snapshots
+        """
+        self.path = path
+        self.collector = collector
+        self.interval = interval
+        self.records = 0
+        self._stop = threading.Event()
+
+    def _signal_handler(self, signum, frame):
+        """Handle interrupt signals gracefully."""
+        self._stop.set()
+
+    def run(self, duration: Optional[float] = None) -> None:
+        """
+        Record until interrupted or until `duration` seconds have passed.
+
+        Args:
+            duration: Optional recording length in seconds
+        """
+        signal.signal(signal.SIGINT, self._signal_handler)
+        signal.signal(signal.SIGTERM, self._signal_handler)
+
+        writer = RecordingWriter(self.path)
+        deadline = time.monotonic() + duration if duration else None
+
+        try:
+            while not self._stop.is_set():
+                started = time.monotonic()
+                writer.append(self.collector.collect())
+                self.records += 1
+
+                if deadline is not None and started + self.interval >= deadline:
+                    break
+
+                elapsed = time.monotonic() - started
+                self._stop.wait(max(0.0, self.interval - elapsed))
+        finally:
+            writer.close()
+            self.collector.close()
@@ -0,0 +1,270 @@
+"""
+Replay of recorded snapshots through the live dashboard.
+"""
+
+import signal
+import sys
+import threading
+import time
+from typing import Optional
+
+from rich.console import Console
+from rich.live import Live
+
+from .display.dashboard import Dashboard
+from .recording import HistoryRebuilder, RecordingError, RecordingReader
+from .snapshot import Snapshot
+from .utils.keys import KeyReader
+
+
+class Replayer:
+    """Plays a recording back through the normal dashboard rendering path."""
+
+    # How often the replay loop checks for a resized terminal or newly
+    # appended records while idle
+    POLL_INTERVAL = 0.25
+
+    # Recorded seconds the left and right keys seek by
+    SEEK_STEP = 10.0
+
+    # Playback speeds the + and - keys step through (0 plays as fast as
+    # possible and counts as the fastest)
+    SPEEDS = (0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 16.0, 32.0, 64.0)
+
+    # Key hints shown in the header while keys are read
+    KEY_HINTS = "space pause · ←/→ seek · +/- speed · q quit"
+
+    def __init__(
+        self,
+        path: str,
+        start: float = 0.0,
+        speed: float = 1.0,
+        max_gap: float = 10.0,
+    ):
+        """
+        Initialize the replayer.
+
+        Args:
+            path: Path of the recording
+            start: Seconds from the beginning of the recording to seek to
+            speed: Playback speed multiplier (0 plays as fast as possible)
+            max_gap: Longest wait between two frames in recorded seconds,
+                so that pauses in a recording are skipped
+
+        Raises:
+            RecordingError: If the file is not a sysmon recording
+        """
+        self.reader = RecordingReader(path)
+        self.start = start
+        self.speed = speed
+        self.max_gap = max_gap
+        self.paused = False
+        self.console = Console()
+        self._stop = threading.Event()
+        # Set by key presses and signals to wake the replay loop
+        self._wake = threading.Event()
+
+        # Record number to show next, set by a seek
+        self._seek: Optional[int] = None
+        self._number = 0
+
+        self._bindings = {
+            "q": self._stop.set,
+            "p": self._toggle_pause,
+            "space": self._toggle_pause,
+            "left": lambda: self.seek(-self.SEEK_STEP),
+            "right": lambda: self.seek(self.SEEK_STEP),
+            "pageup": lambda: self.seek(-6 * self.SEEK_STEP),
+            "pagedown": lambda: self.seek(6 * self.SEEK_STEP),
+            "home": lambda: self._seek_to(0),
+            "end": lambda: self._seek_to(len(self.reader) - 1),
+            "+": lambda: self.step_speed(1),
+            "=": lambda: self.step_speed(1),
+            "-": lambda: self.step_speed(-1),
+        }
+
+    def _signal_handler(self, signum, frame):
+        """Handle interrupt signals gracefully."""
+        self._stop.set()
+        self._wake.set()
+
+    def seek(self, seconds: float) -> None:
+        """
+        Move the replay position by recorded seconds.
+
+        Seeking always moves by at least one record, so a gap in the
+        recording cannot swallow the key press.
+
+        Args:
+            seconds: Seconds to move forward (negative: backward)
+        """
+        reader = self.reader
+        current = self._number if self._seek is None else self._seek
+        number = reader.find(reader.timestamp(current) + seconds)
+        if seconds > 0:
+            number = max(number, current + 1)
+        elif number >= current:
+            number = current - 1
+        self._seek_to(number)
+
+    def step_speed(self, step: int) -> None:
+        """Move to the next faster (1) or slower (-1) playback speed."""
+        current = self.speed or float("inf")
+        if step > 0:
+            faster = [speed for speed in self.SPEEDS if speed > current]
+            if faster:
+                self.speed = faster[0]
+        else:
+            slower = [speed for speed in self.SPEEDS if speed < current]
+            self.speed = slower[-1] if slower else self.SPEEDS[0]
+
+    def run(self) -> None:
+        """
+        Replay the recording from the start position.
+
+        Frames are shown with their recorded spacing divided by the speed.
+        Keys pause, seek and change the speed while playing. After the last
+        frame the display stays up, picking up records that are still being
+        appended, until q or Ctrl+C is pressed.
+        """
+        signal.signal(signal.SIGINT, self._signal_handler)
+        signal.signal(signal.SIGTERM, self._signal_handler)
+
+        reader = self.reader
+        if not len(reader):
+            self.console.print("[red]Error: Recording is empty[/red]")
+            sys.exit(1)
+
+        number = reader.find(reader.start_time + self.start)
+        self._number = min(number, len(reader) - 1)
+
+        snapshot = reader.read(self._number)
+        dashboard = Dashboard(
+            show_processes=snapshot.processes is not None,
+            show_docker=snapshot.docker is not None,
+            show_disk_io=snapshot.disk_devices is not None,
+            show_network=snapshot.network is not None,
+            collect=False,
+            title="System Monitor (replay)",
+        )
+        histories = HistoryRebuilder(reader, dashboard.panel_renderer.sparkline.samples)
+        snapshot = histories.read(self._number)
+        keys = KeyReader(on_key=self._wake.set)
+
+        try:
+            with keys, Live(
+                console=self.console, auto_refresh=False, screen=True
+            ) as live:
+                self._draw(live, dashboard, snapshot, keys.active)
+                size = self.console.size
+                next_frame = self._next_frame_time()
+
+                while not self._stop.is_set():
+                    timeout = self.POLL_INTERVAL
+                    if next_frame is not None and not self.paused:
+                        timeout = min(timeout, next_frame - time.monotonic())
+                    if timeout > 0:
+                        self._wake.wait(timeout)
+                        self._wake.clear()
+                    if self._stop.is_set():
+                        break
+
+                    changed = self._handle_keys(keys.read())
+
+                    if self._seek is not None:
+                        self._number, self._seek = self._seek, None
+                        snapshot = histories.read(self._number)
+                        next_frame = self._next_frame_time()
+                        changed = True
+                    elif changed or next_frame is None:
+                        # A new speed or resumed playback restarts the wait
+                        # for the next record; at the end of the recording,
+                        # this picks up records being appended
+                        next_frame = self._next_frame_time()
+                    elif not self.paused and time.monotonic() >= next_frame:
+                        self._number += 1
+                        snapshot = histories.read(self._number)
+                        next_frame = self._next_frame_time()
+                        changed = True
+
+                    if changed:
+                        self._draw(live, dashboard, snapshot, keys.active)
+                        size = self.console.size
+                    elif self.console.size != size:
+                        # Re-render the current frame at the new size
+                        size = self.console.size
+                        live.refresh()
+        except RecordingError as e:
+            self.console.print(f"[red]Error: {e}[/red]")
+            sys.exit(1)
+        finally:
+            reader.close()
+            dashboard.close()
+            self.console.print("\n[dim]Replay stopped.[/dim]")
+
+    def _next_frame_time(self) -> Optional[float]:
+        """
+        Get when the record after the current one is due on the monotonic clock.
+
+        Returns:
+            The due time, or None if there is no later record yet
+        """
+        reader = self.reader
+        if self._number + 1 >= len(reader):
+            return None
+        if not self.speed:
+            return time.monotonic()
+
+        gap = reader.timestamp(self._number + 1) - reader.timestamp(self._number)
+        return time.monotonic() + min(gap, self.max_gap) / self.speed
+
+    def _handle_keys(self, keys) -> bool:
+        """
+        Apply the actions bound to pressed keys.
+
+        Returns:
+            True if any key changed the view
+        """
+        changed = False
+        for key in keys:
+            action = self._bindings.get(key)
+            if action is not None:
+                action()
+                changed = True
+        return changed
+
+    def _seek_to(self, number: int) -> None:
+        """Show a record next, clamped to the recording."""
+        self._seek = max(0, min(number, len(self.reader) - 1))
+
+    def _toggle_pause(self) -> None:
+        """Freeze or resume playback."""
+        self.paused = not self.paused
+
+    def _draw(
+        self, live: Live, dashboard: Dashboard, snapshot: Snapshot, keys_active: bool
+    ) -> None:
+        """Show a frame with the replay position, speed and key hints in the header."""
+        reader = self.reader
+        parts = []
+        if self.paused:
+            parts.append("[bold yellow]PAUSED[/bold yellow]")
+        parts.append(
+            f"{self._format_offset(snapshot.timestamp - reader.start_time)}"
+            f" / {self._format_offset(reader.end_time - reader.start_time)}"
+        )
+        parts.append(f"{self.speed:g}x" if self.speed else "max speed")
+        if keys_active:
+            parts.append(self.KEY_HINTS)
+        dashboard.status = f"[dim]{' · '.join(parts)}[/dim]"
+
+        live.update(dashboard.create_layout(snapshot), refresh=True)
+
+    @staticmethod
+    def _format_offset(seconds: float) -> str:
+        """Format seconds into the recording as H:MM:SS or M:SS."""
+        minutes, seconds = divmod(int(seconds), 60)
+        hours, minutes = divmod(minutes, 60)
+        if hours:
+            return f"{hours}:{minutes:02d}:{seconds:02d}"
+        return f"{minutes}:{seconds:02d}"
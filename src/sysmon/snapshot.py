@@ -0,0 +1,681 @@
+"""
+Immutable metric snapshots and the collector that produces them.
+"""
+
+import threading
+import time
+from dataclasses import asdict, dataclass, field, fields
+from typing import Any, Callable, Dict, FrozenSet, Optional, Sequence, Tuple
+
+from .collectors.cpu import CPUCollector, CPUMetrics
+from .collectors.disk import DiskCollector, DiskIOMetrics, DiskMetrics, DiskPartitionMetrics
+from .collectors.diskstats import DeviceIOMetrics, DiskStatsCollector
+from .collectors.docker import ContainerMetrics, DockerCollector, DockerMetrics
+from .collectors.engine import AsyncCollectionEngine, CollectionEngine, CollectorResult
+from .collectors.load import LoadCollector, LoadMetrics
+from .collectors.memory import MemoryCollector, MemoryMetrics
+from .collectors.network import InterfaceMetrics, NetworkCollector
+from .collectors.processes import ProcessCollector, ProcessInfo
+from .utils.history import HistoryBuffer, HistoryMatrix, TieredHistory
+from .utils.overhead import OverheadRecorder
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """All metrics from one collection cycle, never modified after creation."""
+
+    timestamp: float
+    cpu: CPUMetrics
+    memory: MemoryMetrics
+    disk: DiskMetrics
+    load: LoadMetrics
+    docker: Optional[DockerMetrics]
+    processes: Optional[Tuple[ProcessInfo, ...]]
+
+    # Sparkline history covering the configured span, oldest first
+    cpu_history: Tuple[float, ...]
+    memory_history: Tuple[float, ...]
+    load_history: Tuple[float, ...]
+
+    # Names of collectors that contributed a stale last-known value
+    stale: FrozenSet[str] = frozenset()
+
+    # Age of each collector's value when the cycle started; values collected
+    # during the cycle have age 0
+    ages: Dict[str, float] = field(default_factory=dict)
+
+    # Per-device I/O rates and %util history by device name (None when
+    # per-device I/O is not collected)
+    disk_devices: Optional[Tuple[DeviceIOMetrics, ...]] = None
+    disk_device_history: Dict[str, Tuple[float, ...]] = field(default_factory=dict)
+
+    # Per-interface traffic rates and throughput (rx + tx bytes/s) history
+    # by interface name (None when the network is not collected)
+    network: Optional[Tuple[InterfaceMetrics, ...]] = None
+    network_history: Dict[str, Tuple[float, ...]] = field(default_factory=dict)
+
+    # Recent percentages of each logical CPU, oldest first (empty unless
+    # per-core history is collected)
+    core_history: Tuple[Tuple[float, ...], ...] = ()
+
+
+def snapshot_to_dict(snapshot: Snapshot) -> Dict[str, Any]:
+    """
+    Convert a snapshot to plain JSON-compatible data.
+
+    Args:
+        snapshot: Snapshot to convert
+
+    Returns:
+        Dictionary of lists, numbers, strings and None
+    """
+    data = asdict(snapshot)
+    data["stale"] = sorted(snapshot.stale)
+    return data
+
+
+def snapshot_from_dict(data: Dict[str, Any]) -> Snapshot:
+    """
+    Rebuild a snapshot from data produced by snapshot_to_dict.
+
+    Fields missing from the data (e.g. from an older sysmon) take their
+    defaults; unknown fields are ignored.
+
+    Args:
+        data: Dictionary produced by snapshot_to_dict
+
+    Returns:
+        Snapshot object
+    """
+    disk = data["disk"]
+    docker = data.get("docker")
+    processes = data.get("processes")
+    disk_devices = data.get("disk_devices")
+    network = data.get("network")
+
+    return _build(
+        Snapshot,
+        data,
+        cpu=_build(CPUMetrics, data["cpu"]),
+        memory=_build(MemoryMetrics, data["memory"]),
+        disk=_build(
+            DiskMetrics,
+            disk,
+            partitions=[_build(DiskPartitionMetrics, p) for p in disk["partitions"]],
+            io=_build(DiskIOMetrics, disk["io"]) if disk.get("io") else None,
+        ),
+        load=_build(LoadMetrics, data["load"]),
+        docker=_build(
+            DockerMetrics,
+            docker,
+            containers=[_build(ContainerMetrics, c) for c in docker["containers"]],
+        )
+        if docker is not None
+        else None,
+        processes=tuple(_build(ProcessInfo, p) for p in processes)
+        if processes is not None
+        else None,
+        cpu_history=tuple(data.get("cpu_history", ())),
+        memory_history=tuple(data.get("memory_history", ())),
+        load_history=tuple(data.get("load_history", ())),
+        stale=frozenset(data.get("stale", ())),
+        ages=dict(data.get("ages", {})),
+        disk_devices=tuple(_build(DeviceIOMetrics, d) for d in disk_devices)
+        if disk_devices is not None
+        else None,
+        disk_device_history={
+            name: tuple(values)
+            for name, values in data.get("disk_device_history", {}).items()
+        },
+        network=tuple(_build(InterfaceMetrics, i) for i in network)
+        if network is not None
+        else None,
+        network_history={
+            name: tuple(values) for name, values in data.get("network_history", {}).items()
+        },
+        core_history=tuple(tuple(values) for values in data.get("core_history", ())),
+    )
+
+
+def _build(cls, data: Dict[str, Any], **overrides):
+    """Instantiate a dataclass from the known fields of a dictionary."""
+    kwargs = {f.name: data[f.name] for f in fields(cls) if f.name in data}
+    kwargs.update(overrides)
+    return cls(**kwargs)
+
+
+class SnapshotCollector:
+    """Runs all enabled collectors and assembles their results into snapshots."""
+
+    # Seconds each collector may take per tick before its last value is
+    # reported as stale
+    DEFAULT_DEADLINES = {
+        "cpu": 0.5,
+        "memory": 0.5,
+        "load": 0.5,
+        "disk": 1.0,
+        "disk_io": 0.5,
+        "disk_devices": 0.5,
+        "network": 0.5,
+        "docker": 1.5,
+        "processes": 1.0,
+    }
+
+    def __init__(
+        self,
+        show_processes: bool = True,
+        show_docker: bool = True,
+        deadlines: Optional[Dict[str, float]] = None,
+        docker_backend: str = "api",
+        max_processes: int = 5,
+        interval: float = 2.0,
+        history_points: int = 20,
+        history_span: Optional[float] = None,
+        intervals: Optional[Dict[str, float]] = None,
+        show_disk_io: bool = True,
+        show_network: bool = True,
+        recorder: Optional[OverheadRecorder] = None,
+        core_history_points: int = 0,
+        process_sort_keys: Sequence[str] = ("cpu",),
+        use_asyncio: bool = False,
+    ):
+        """
+        Initialize the snapshot collector.
+
+        Args:
+            show_processes: Whether to collect the top processes
+            show_docker: Whether to collect Docker container metrics
+            deadlines: Optional per-collector deadline overrides in seconds
+            docker_backend: Docker stats backend ("api", "stream", "cgroup"
+                or "socket")
+            max_processes: Number of top processes to collect
+            interval: Seconds between collections
+            history_points: Number of history values captured per snapshot
+            history_span: Seconds of history captured per snapshot
+                (default: history_points samples of each metric)
+            intervals: Optional per-collector interval overrides in seconds;
+                collectors without one run every `interval`
+            show_disk_io: Whether to collect per-device disk I/O rates
+            show_network: Whether to collect per-interface network rates
+            recorder: Optional recorder of the time spent in each collector
+                and in each collection cycle ("snapshot")
+            core_history_points: Number of recent samples of each CPU core
+                captured per snapshot (0: no per-core history)
+            process_sort_keys: Orders ("cpu" and/or "memory") whose top
+                `max_processes` processes are all collected, from one scan
+            use_asyncio: Whether collectors run as tasks on an event loop,
+                started with run_collectors(); collect() then assembles the
+                latest results without waiting for any collector
+        """
+        self.show_processes = show_processes
+        self.show_docker = show_docker
+        self.show_disk_io = show_disk_io
+        self.show_network = show_network
+
+        # Collectors
+        self.cpu_collector = CPUCollector()
+        self.memory_collector = MemoryCollector()
+        self.disk_collector = DiskCollector()
+        self.diskstats_collector = DiskStatsCollector()
+        self.load_collector = LoadCollector()
+        self.network_collector = NetworkCollector()
+        self.docker_collector = DockerCollector(backend=docker_backend)
+        self.process_collector = ProcessCollector(max_processes=max_processes)
+        self.process_sort_keys = tuple(process_sort_keys)
+
+        # Sampling interval of each collector
+        self.intervals = {name: interval for name in self.DEFAULT_DEADLINES}
+        if intervals:
+            self.intervals.update(intervals)
+        self._interval_overrides = frozenset(intervals or ())
+
+        # Tiered histories for sparklines
+        self.history_points = history_points
+        self.history_span = history_span
+        self.cpu_history = TieredHistory(interval=self.intervals["cpu"])
+        self.memory_history = TieredHistory(interval=self.intervals["memory"])
+        self.load_history = TieredHistory(interval=self.intervals["load"])
+        self.device_histories: Dict[str, HistoryBuffer] = {}
+        self.network_histories: Dict[str, HistoryBuffer] = {}
+        self.core_history: Optional[HistoryMatrix] = None
+        if core_history_points > 0:
+            self.core_history = HistoryMatrix(core_history_points)
+        self._sampled: Dict[str, float] = {}
+
+        # Prime CPU collector
+        CPUCollector.prime()
+
+        # Collection engine running all collectors in parallel
+        self.deadlines = dict(self.DEFAULT_DEADLINES)
+        if deadlines:
+            self.deadlines.update(deadlines)
+
+        self.recorder = recorder
+        self.use_asyncio = use_asyncio
+        if use_asyncio:
+            self.engine: CollectionEngine = AsyncCollectionEngine(
+                max_workers=len(self.deadlines), recorder=recorder, interval=interval
+            )
+        else:
+            self.engine = CollectionEngine(max_workers=len(self.deadlines), recorder=recorder)
+        self._register_collectors()
+
+    def _register_collectors(self) -> None:
+        """Register the enabled collectors with the collection engine."""
+        cpu_count = self.load_collector.collect().cpu_count
+
+        self.engine.register(
+            "cpu",
+            self.cpu_collector.collect,
+            deadline=self.deadlines["cpu"],
+            interval=self.intervals["cpu"],
+            placeholder=CPUMetrics(
+                overall_percent=0.0,
+                per_core_percent=[],
+                frequency_current=None,
+                frequency_max=None,
+                core_count=cpu_count,
+                thread_count=cpu_count,
+            ),
+        )
+        self.engine.register(
+            "memory",
+            self.memory_collector.collect,
+            deadline=self.deadlines["memory"],
+            interval=self.intervals["memory"],
+            placeholder=MemoryMetrics(
+                total_bytes=0,
+                available_bytes=0,
+                used_bytes=0,
+                percent=0.0,
+                swap_total_bytes=0,
+                swap_used_bytes=0,
+                swap_free_bytes=0,
+                swap_percent=0.0,
+            ),
+        )
+        self.engine.register(
+            "disk",
+            self.disk_collector.collect_usage,
+            deadline=self.deadlines["disk"],
+            interval=self.intervals["disk"],
+            placeholder=[],
+        )
+        self.engine.register(
+            "disk_io",
+            self.disk_collector.collect_io,
+            deadline=self.deadlines["disk_io"],
+            interval=self.intervals["disk_io"],
+            placeholder=None,
+        )
+        self.engine.register(
+            "load",
+            self.load_collector.collect,
+            deadline=self.deadlines["load"],
+            interval=self.intervals["load"],
+            placeholder=LoadMetrics(
+                load_1min=0.0, load_5min=0.0, load_15min=0.0, cpu_count=cpu_count
+            ),
+        )
+
+        if self.show_disk_io:
+            self.engine.register(
+                "disk_devices",
+                lambda: tuple(self.diskstats_collector.collect()),
+                deadline=self.deadlines["disk_devices"],
+                interval=self.intervals["disk_devices"],
+                placeholder=(),
+            )
+
+        if self.show_network:
+            self.engine.register(
+                "network",
+                lambda: tuple(self.network_collector.collect()),
+                deadline=self.deadlines["network"],
+                interval=self.intervals["network"],
+                placeholder=(),
+            )
+
+        if self.show_docker:
+            # Connect in the background while the first samples are taken
+            self.docker_collector.connect()
+            self.engine.register(
+                "docker",
+                self.docker_collector.collect_async
+                if self.use_asyncio
+                else self.docker_collector.collect,
+                deadline=self.deadlines["docker"],
+                interval=self.intervals["docker"],
+                placeholder=DockerMetrics(
+                    available=False,
+                    error="Waiting for Docker...",
+                    containers=[],
+                    total_containers=0,
+                    running_containers=0,
+                ),
+            )
+
+        if self.show_processes:
+            self.engine.register(
+                "processes",
+                lambda: tuple(self.process_collector.collect_top(self.process_sort_keys)),
+                deadline=self.deadlines["processes"],
+                interval=self.intervals["processes"],
+                placeholder=(),
+            )
+
+    async def run_collectors(self) -> None:
+        """
+        Run every collector as a task on the running event loop until cancelled.
+
+        Only for collectors created with use_asyncio.
+        """
+        await self.engine.run()
+
+    async def wait_ready(self, timeout: float) -> bool:
+        """
+        Wait until every collector has run once, with use_asyncio.
+
+        Args:
+            timeout: Longest wait in seconds
+
+        Returns:
+            True if every collector has run
+        """
+        return await self.engine.wait_ready(timeout)
+
+    def wait_for_docker(self, timeout: float) -> bool:
+        """
+        Wait for the Docker connection, for callers that collect only once.
+
+        Args:
+            timeout: Longest wait in seconds
+
+        Returns:
+            True if Docker is connected (False also when it is not collected)
+        """
+        if not self.show_docker:
+            return False
+        return self.docker_collector.wait_connected(timeout)
+
+    def set_interval(self, interval: float) -> None:
+        """
+        Change the sampling interval of the collectors without an override.
+
+        Collectors given their own interval keep it. The histories' raw
+        samples are resampled to the new interval; their rollups are kept.
+
+        Args:
+            interval: Seconds between collections
+        """
+        histories = {
+            "cpu": self.cpu_history,
+            "memory": self.memory_history,
+            "load": self.load_history,
+        }
+        registered = self.engine.names
+        for name in self.intervals:
+            if name in self._interval_overrides:
+                continue
+            self.intervals[name] = interval
+            if name in registered:
+                self.engine.set_interval(name, interval)
+            if name in histories:
+                histories[name].set_interval(interval)
+
+    @property
+    def tick_interval(self) -> float:
+        """Seconds between collection cycles: the shortest collector interval."""
+        return min(self.intervals.values())
+
+    def collect(self) -> Snapshot:
+        """
+        Run one collection cycle.
+
+        Collectors that are due run concurrently; the others contribute their
+        latest value, with its age recorded in Snapshot.ages. A collector that
+        misses its deadline contributes its last good value and is listed in
+        Snapshot.stale. With use_asyncio the collectors run on their own, and
+        the snapshot holds their latest values without waiting for any.
+
+        Returns:
+            Snapshot of all metrics
+        """
+        if self.recorder is None:
+            return self._collect()
+        with self.recorder.measure("snapshot"):
+            return self._collect()
+
+    def _collect(self) -> Snapshot:
+        """Run one collection cycle and assemble its snapshot."""
+        started = time.monotonic()
+        results = self.engine.collect_all()
+        stale = frozenset(name for name, result in results.items() if result.stale)
+
+        cpu = results["cpu"].value
+        memory = results["memory"].value
+        load = results["load"].value
+
+        # Update history only with fresh samples, each added once
+        if self._is_new_sample(results["cpu"]):
+            self.cpu_history.add(cpu.overall_percent)
+            if self.core_history is not None and cpu.per_core_percent:
+                self.core_history.add(cpu.per_core_percent)
+        if self._is_new_sample(results["memory"]):
+            self.memory_history.add(memory.percent)
+        if self._is_new_sample(results["load"]):
+            self.load_history.add(load.load_1min_normalized)
+
+        disk_devices = results["disk_devices"].value if "disk_devices" in results else None
+        if disk_devices is not None and self._is_new_sample(results["disk_devices"]):
+            self._update_histories(
+                self.device_histories, {d.name: d.util_percent for d in disk_devices}
+            )
+
+        network = results["network"].value if "network" in results else None
+        if network is not None and self._is_new_sample(results["network"]):
+            self._update_histories(
+                self.network_histories,
+                {i.name: i.rx_bytes_per_sec + i.tx_bytes_per_sec for i in network},
+            )
+
+        return Snapshot(
+            timestamp=time.time(),
+            cpu=cpu,
+            memory=memory,
+            disk=DiskMetrics(partitions=results["disk"].value, io=results["disk_io"].value),
+            load=load,
+            docker=results["docker"].value if "docker" in results else None,
+            processes=results["processes"].value if "processes" in results else None,
+            cpu_history=self._capture(self.cpu_history),
+            memory_history=self._capture(self.memory_history),
+            load_history=self._capture(self.load_history),
+            stale=stale,
+            ages={
+                name: max(0.0, started - result.collected_at)
+                for name, result in results.items()
+            },
+            disk_devices=disk_devices,
+            disk_device_history=self._capture_all(self.device_histories)
+            if disk_devices is not None
+            else {},
+            network=network,
+            network_history=self._capture_all(self.network_histories)
+            if network is not None
+            else {},
+            core_history=tuple(self.core_history.rows())
+            if self.core_history is not None
+            else (),
+        )
+
+    def _update_histories(
+        self, histories: Dict[str, HistoryBuffer], values: Dict[str, float]
+    ) -> None:
+        """Add a value to the history of each name, forgetting absent names."""
+        for name, value in values.items():
+            history = histories.get(name)
+            if history is None:
+                history = histories[name] = HistoryBuffer(self.history_points)
+            history.add(value)
+
+        for name in set(histories) - set(values):
+            del histories[name]
+
+    def _is_new_sample(self, result: CollectorResult) -> bool:
+        """Check whether a result holds a fresh value not seen before."""
+        if result.stale or self._sampled.get(result.name) == result.collected_at:
+            return False
+        self._sampled[result.name] = result.collected_at
+        return True
+
+    def _capture(self, history: TieredHistory) -> Tuple[float, ...]:
+        """Copy the configured span of a history into an immutable tuple."""
+        span = self.history_span or self.history_points * history.interval
+        return tuple(history.span(span, points=self.history_points))
+
+    @staticmethod
+    def _capture_all(histories: Dict[str, HistoryBuffer]) -> Dict[str, Tuple[float, ...]]:
+        """Copy a set of per-name histories into immutable tuples."""
+        return {name: tuple(history.view()) for name, history in histories.items()}
+
+    def close(self) -> None:
+        """Release background resources held by the collectors."""
+        self.engine.shutdown()
+        self.docker_collector.close()
+        self.disk_collector.close()
+
+
+class SnapshotStream:
+    """
+    Produces snapshots on a background thread at a fixed cadence.
+
+    Consumers read the latest snapshot or wait for a newer one; reading never
+    triggers a collection. A collection that raises does not stop the
+    stream: the latest snapshot is kept, the error is recorded, and the
+    next collection runs on schedule.
+    """
+
+    def __init__(
+        self,
+        collector: SnapshotCollector,
+        interval: float,
+        on_snapshot: Optional[Callable[[], None]] = None,
+        on_error: Optional[Callable[[Exception], None]] = None,
+    ):
+        """
+        Initialize the snapshot stream.
+
+        Args:
+            collector: Collector used to produce snapshots
+            interval: Seconds between the starts of two collections
+            on_snapshot: Optional callback run on the collection thread
+                after each snapshot is published, and after a failed
+                collection
+            on_error: Optional callback run on the collection thread with
+                the exception of each failed collection
+        """
+        self.collector = collector
+        self.interval = interval
+        self.on_snapshot = on_snapshot
+        self.on_error = on_error
+        self._latest: Optional[Snapshot] = None
+        self._error: Optional[str] = None
+        self._pending_interval: Optional[float] = None
+        self._condition = threading.Condition()
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def latest(self) -> Optional[Snapshot]:
+        """Get the most recent snapshot, or None before the first one."""
+        with self._condition:
+            return self._latest
+
+    @property
+    def error(self) -> Optional[str]:
+        """Get the error of the last collection, or None if it succeeded."""
+        with self._condition:
+            return self._error
+
+    def start(self) -> None:
+        """Start collecting on the background thread."""
+        self._stop.clear()
+        self._wake.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="sysmon-snapshots", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop collecting after the current cycle."""
+        self._stop.set()
+        self._wake.set()
+        with self._condition:
+            self._condition.notify_all()
+
+    def set_interval(self, interval: float) -> None:
+        """
+        Change the collector's sampling interval, then collect right away.
+
+        The change is applied on the collection thread between two
+        collections, so it never races with a collection in progress; the
+        cadence then follows the collector's new tick interval.
+
+        Args:
+            interval: Seconds between collections, passed to
+                SnapshotCollector.set_interval
+        """
+        with self._condition:
+            self._pending_interval = interval
+        self._wake.set()
+
+    def wait(self, previous: Optional[Snapshot], timeout: float) -> Optional[Snapshot]:
+        """
+        Wait for a snapshot newer than `previous`.
+
+        Args:
+            previous: Snapshot the caller already has (or None)
+            timeout: Maximum seconds to wait
+
+        Returns:
+            The newer snapshot, or None if none arrived within the timeout
+        """
+        with self._condition:
+            self._condition.wait_for(
+                lambda: self._latest is not previous or self._stop.is_set(),
+                timeout=timeout,
+            )
+            if self._latest is previous:
+                return None
+            return self._latest
+
+    def _run(self) -> None:
+        """Collection loop."""
+        while not self._stop.is_set():
+            with self._condition:
+                interval, self._pending_interval = self._pending_interval, None
+            if interval is not None:
+                self.collector.set_interval(interval)
+                self.interval = self.collector.tick_interval
+
+            started = time.monotonic()
+            try:
+                snapshot = self.collector.collect()
+            except Exception as e:
+                # Keep the last snapshot and try again on the next tick
+                with self._condition:
+                    self._error = f"{type(e).__name__}: {e}"
+                if self.on_error is not None:
+                    self.on_error(e)
+            else:
+                with self._condition:
+                    self._latest = snapshot
+                    self._error = None
+                    self._condition.notify_all()
+            if self.on_snapshot is not None:
+                self.on_snapshot()
+
+            elapsed = time.monotonic() - started
+            self._wake.wait(max(0.0, self.interval - elapsed))
+            self._wake.clear()
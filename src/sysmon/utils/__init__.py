@@ -2,7 +2,25 @@
 Utilities module - Helper classes and functions.
 """
 
-from .history import HistoryBuffer
-from .alerts import get_alert_color, get_alert_style
+from .counters import RateTracker, counter_delta
+from .history import HistoryBuffer, HistoryMatrix, TieredHistory
 
-__all__ = ["HistoryBuffer", "get_alert_color", "get_alert_style"]
+__all__ = [
+    "HistoryBuffer",
+    "HistoryMatrix",
+    "TieredHistory",
+    "RateTracker",
+    "counter_delta",
+    "get_alert_color",
+    "get_alert_style",
+]
+
+
+def __getattr__(name):
+    # The alert helpers depend on Rich; importing them lazily keeps Rich out
+    # of headless modes that only need the history buffers
+    if name in ("get_alert_color", "get_alert_style"):
+        from . import alerts
+
+        return getattr(alerts, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
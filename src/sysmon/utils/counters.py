@@ -0,0 +1,82 @@
+"""
+Helpers for cumulative counters.
+"""
+
+from typing import Dict, Iterable, Tuple
+
+
+def counter_delta(current: int, previous: int) -> int:
+    """
+    Difference between two samples of a cumulative counter.
+
+    Some kernel counters are 32-bit and wrap; a counter that was in the
+    upper half of the 32-bit range and is now lower has wrapped. Any other
+    decrease means the counter was reset (device replaced, interface
+    recreated), and the new value is the delta.
+
+    Args:
+        current: Latest sample
+        previous: Previous sample
+
+    Returns:
+        Non-negative increase between the samples
+    """
+    if current >= previous:
+        return current - previous
+    if 1 << 31 <= previous < 1 << 32:
+        return current + (1 << 32) - previous
+    return current
+
+
+class RateTracker:
+    """
+    Per-key rates of cumulative counters between successive samples.
+
+    Keeps the previous sample of each key (e.g. a container ID). A key's
+    first sample reports zero rates. A counter that decreased was reset
+    (the process or container restarted), so its new value is taken as the
+    increase. Samples taken at the same time as the previous one (a data
+    source that has not refreshed yet) repeat the previous rates.
+    """
+
+    def __init__(self):
+        """Initialize the tracker."""
+        self._samples: Dict[str, Tuple[float, Tuple[int, ...], Tuple[float, ...]]] = {}
+
+    def update(self, key: str, counters: Tuple[int, ...], sampled_at: float) -> Tuple[float, ...]:
+        """
+        Record a sample and compute the rates since the previous one.
+
+        Args:
+            key: Identity the counters belong to
+            counters: Current counter values
+            sampled_at: Monotonic time the counters were read
+
+        Returns:
+            Increase per second of each counter
+        """
+        previous = self._samples.get(key)
+        if previous is None or len(previous[1]) != len(counters):
+            rates = (0.0,) * len(counters)
+        elif sampled_at <= previous[0]:
+            return previous[2]
+        else:
+            elapsed = sampled_at - previous[0]
+            rates = tuple(
+                (current - last if current >= last else current) / elapsed
+                for current, last in zip(counters, previous[1])
+            )
+
+        self._samples[key] = (sampled_at, counters, rates)
+        return rates
+
+    def retain(self, keys: Iterable[str]) -> None:
+        """
+        Forget every key not in `keys`.
+
+        Args:
+            keys: Keys still present
+        """
+        keep = set(keys)
+        for key in [key for key in self._samples if key not in keep]:
+            del self._samples[key]
@@ -2,12 +2,23 @@
 Circular buffer for storing metric history data.
 """
 
+import math
+import time
+from array import array
 from collections import deque
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
 
 
 class HistoryBuffer:
-    """A circular buffer that stores historical metric values for sparkline graphs."""
+    """
+    A circular buffer that stores historical metric values for sparkline graphs.
+
+    Values live in a flat array of doubles. Every value is written twice, at
+    its slot and at the same slot in a mirror half, so the most recent values
+    are always contiguous and can be handed out as a zero-copy memoryview.
+    The running sum and monotonic min/max deques keep get_average, get_min
+    and get_max at amortized O(1) regardless of the buffer size.
+    """
 
     def __init__(self, max_size: int = 60):
         """
@@ -16,44 +27,436 @@ class HistoryBuffer:
         Args:
             max_size: Maximum number of values to store (default 60 = 2 min at 2s refresh)
         """
-        self._buffer: deque = deque(maxlen=max_size)
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
         self._max_size = max_size
+        self._data = array("d", bytes(16 * max_size))
+        self._next = 0
+        self._count = 0
+        self._added = 0
+        self._sum = 0.0
+
+        # (sequence number, value) pairs; values decrease (max) or increase
+        # (min) from front to back, so the front is always the extreme
+        self._max_deque: deque = deque()
+        self._min_deque: deque = deque()
 
     def add(self, value: float) -> None:
         """Add a new value to the buffer."""
-        self._buffer.append(value)
+        value = float(value)
+        size = self._max_size
+        index = self._next
+
+        if self._count == size:
+            self._sum -= self._data[index]
+        else:
+            self._count += 1
+
+        self._data[index] = value
+        self._data[index + size] = value
+        self._sum += value
+        self._next = (index + 1) % size
+
+        sequence = self._added
+        self._added += 1
+
+        max_deque = self._max_deque
+        while max_deque and max_deque[-1][1] <= value:
+            max_deque.pop()
+        max_deque.append((sequence, value))
+        if max_deque[0][0] <= sequence - size:
+            max_deque.popleft()
+
+        min_deque = self._min_deque
+        while min_deque and min_deque[-1][1] >= value:
+            min_deque.pop()
+        min_deque.append((sequence, value))
+        if min_deque[0][0] <= sequence - size:
+            min_deque.popleft()
+
+        # Re-sum once per lap so floating point error cannot accumulate
+        if self._next == 0:
+            self._sum = math.fsum(self.view())
+
+    def view(self, count: Optional[int] = None) -> memoryview:
+        """
+        Get the most recent values without copying them.
+
+        The view aliases the buffer's storage and is only valid until the
+        next call to add(); copy it if it must outlive that.
+
+        Args:
+            count: Number of most recent values (default: all stored values)
+
+        Returns:
+            Read-only memoryview of floats, oldest first
+        """
+        if count is None or count > self._count:
+            count = self._count
+        start = (self._next - count) % self._max_size
+        return memoryview(self._data)[start : start + count].toreadonly()
 
     def get_values(self) -> List[float]:
         """Get all values in the buffer as a list."""
-        return list(self._buffer)
+        return self.view().tolist()
 
     def get_latest(self) -> Optional[float]:
         """Get the most recent value, or None if empty."""
-        return self._buffer[-1] if self._buffer else None
+        if not self._count:
+            return None
+        return self._data[self._next - 1 + self._max_size]
 
     def get_average(self) -> float:
         """Get the average of all values in the buffer."""
-        if not self._buffer:
+        if not self._count:
             return 0.0
-        return sum(self._buffer) / len(self._buffer)
+        return self._sum / self._count
 
     def get_min(self) -> float:
         """Get the minimum value in the buffer."""
-        return min(self._buffer) if self._buffer else 0.0
+        return self._min_deque[0][1] if self._count else 0.0
 
     def get_max(self) -> float:
         """Get the maximum value in the buffer."""
-        return max(self._buffer) if self._buffer else 0.0
+        return self._max_deque[0][1] if self._count else 0.0
 
     def clear(self) -> None:
         """Clear all values from the buffer."""
-        self._buffer.clear()
+        self._next = 0
+        self._count = 0
+        self._sum = 0.0
+        self._max_deque.clear()
+        self._min_deque.clear()
 
     def __len__(self) -> int:
         """Return the current number of values in the buffer."""
-        return len(self._buffer)
+        return self._count
+
+    @property
+    def max_size(self) -> int:
+        """Maximum number of values the buffer holds."""
+        return self._max_size
 
     @property
     def is_full(self) -> bool:
         """Check if the buffer is at maximum capacity."""
-        return len(self._buffer) >= self._max_size
+        return self._count >= self._max_size
+
+
+class HistoryMatrix:
+    """
+    A fixed-size 2D ring buffer holding the same number of samples for each
+    of several series, such as the per-core CPU percentages.
+
+    Samples of all series are added together, one column at a time. Each
+    series is a row of a single flat array of doubles, mirrored like
+    HistoryBuffer so the most recent values of a row are contiguous and can
+    be handed out as a zero-copy memoryview. Memory never grows after the
+    first column; a column with a different number of series (e.g. after
+    CPUs were taken offline) starts the history over.
+    """
+
+    def __init__(self, max_size: int = 8):
+        """
+        Initialize the history matrix.
+
+        Args:
+            max_size: Maximum number of samples stored per series
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        self._max_size = max_size
+        self._rows = 0
+        self._data = array("d")
+        self._next = 0
+        self._count = 0
+
+    def add(self, values: Sequence[float]) -> None:
+        """
+        Add one sample of every series.
+
+        Args:
+            values: One value per series, in series order
+        """
+        size = self._max_size
+        if len(values) != self._rows:
+            self._rows = len(values)
+            self._data = array("d", bytes(16 * size * self._rows))
+            self._next = 0
+            self._count = 0
+
+        data = self._data
+        index = self._next
+        stride = 2 * size
+        # Write the column and its mirror with two strided slice assignments
+        column = array("d", values)
+        data[index : len(data) : stride] = column
+        data[index + size : len(data) : stride] = column
+
+        self._next = (index + 1) % size
+        if self._count < size:
+            self._count += 1
+
+    def row(self, series: int, count: Optional[int] = None) -> memoryview:
+        """
+        Get the most recent values of one series without copying them.
+
+        The view aliases the matrix's storage and is only valid until the
+        next call to add(); copy it if it must outlive that.
+
+        Args:
+            series: Index of the series
+            count: Number of most recent values (default: all stored values)
+
+        Returns:
+            Read-only memoryview of floats, oldest first
+        """
+        if not 0 <= series < self._rows:
+            raise IndexError("series index out of range")
+        if count is None or count > self._count:
+            count = self._count
+        start = series * 2 * self._max_size + (self._next - count) % self._max_size
+        return memoryview(self._data)[start : start + count].toreadonly()
+
+    def rows(self, count: Optional[int] = None) -> List[Tuple[float, ...]]:
+        """
+        Copy the most recent values of every series.
+
+        Args:
+            count: Number of most recent values (default: all stored values)
+
+        Returns:
+            One tuple of values per series, oldest first
+        """
+        return [tuple(self.row(series, count)) for series in range(self._rows)]
+
+    def clear(self) -> None:
+        """Clear all samples, keeping the number of series."""
+        self._next = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Return the number of samples stored per series."""
+        return self._count
+
+    @property
+    def series_count(self) -> int:
+        """Number of series in the matrix."""
+        return self._rows
+
+    @property
+    def max_size(self) -> int:
+        """Maximum number of samples stored per series."""
+        return self._max_size
+
+
+class RollupTier:
+    """Min/avg/max of fixed-length time buckets, in fixed memory."""
+
+    def __init__(self, resolution: float, size: int):
+        """
+        Initialize the rollup tier.
+
+        Args:
+            resolution: Seconds covered by each bucket
+            size: Number of completed buckets to keep
+        """
+        self.resolution = resolution
+        self.size = size
+        self.min = HistoryBuffer(size)
+        self.avg = HistoryBuffer(size)
+        self.max = HistoryBuffer(size)
+
+        # Accumulators for the bucket in progress
+        self._bucket: Optional[int] = None
+        self._count = 0
+        self._sum = 0.0
+        self._low = 0.0
+        self._high = 0.0
+
+    @property
+    def span(self) -> float:
+        """Seconds of history the tier can hold."""
+        return self.resolution * self.size
+
+    def add(self, value: float, timestamp: float) -> None:
+        """
+        Fold a sample into the bucket containing its timestamp.
+
+        Buckets are emitted when the first sample of a later bucket arrives.
+        Buckets without any samples are skipped rather than filled.
+        """
+        bucket = int(timestamp // self.resolution)
+
+        if bucket != self._bucket:
+            if self._count:
+                self.min.add(self._low)
+                self.avg.add(self._sum / self._count)
+                self.max.add(self._high)
+            self._bucket = bucket
+            self._count = 0
+            self._sum = 0.0
+            self._low = value
+            self._high = value
+
+        self._count += 1
+        self._sum += value
+        if value < self._low:
+            self._low = value
+        if value > self._high:
+            self._high = value
+
+    def series(self, stat: str) -> HistoryBuffer:
+        """Get the buffer for a statistic ("min", "avg" or "max")."""
+        if stat not in ("min", "avg", "max"):
+            raise ValueError(f"Unknown statistic: {stat}")
+        return getattr(self, stat)
+
+
+class TieredHistory:
+    """
+    Multi-resolution (RRD-style) metric history in fixed memory.
+
+    Raw samples are kept for the last few minutes. Every sample is also folded
+    into rollup tiers holding min/avg/max per bucket for the last hour and the
+    last day. Queries for a time span are answered from the finest tier that
+    covers it, so they never rescan raw samples.
+    """
+
+    # (seconds per bucket, number of buckets) for each rollup tier
+    DEFAULT_ROLLUPS: Tuple[Tuple[float, int], ...] = (
+        (30.0, 120),  # last hour
+        (600.0, 144),  # last day
+    )
+
+    def __init__(
+        self,
+        interval: float = 2.0,
+        raw_span: float = 300.0,
+        rollups: Sequence[Tuple[float, int]] = DEFAULT_ROLLUPS,
+    ):
+        """
+        Initialize the tiered history.
+
+        Args:
+            interval: Expected seconds between samples
+            raw_span: Seconds of full-resolution samples to keep
+            rollups: (seconds per bucket, bucket count) for each rollup tier,
+                finest first
+        """
+        self.interval = interval
+        self.raw_span = raw_span
+        self.raw = HistoryBuffer(max(1, math.ceil(raw_span / interval)))
+        self.tiers = [RollupTier(resolution, size) for resolution, size in rollups]
+
+    def set_interval(self, interval: float) -> None:
+        """
+        Change the expected seconds between samples.
+
+        The raw buffer is resized to keep covering `raw_span`, and the
+        samples it holds are resampled to the new spacing: averaged when it
+        grows, repeated when it shrinks. The rollup tiers bucket samples by
+        timestamp and keep their history as is.
+
+        Args:
+            interval: Expected seconds between samples
+        """
+        if interval == self.interval:
+            return
+
+        old = self.raw.view()
+        ratio = self.interval / interval
+        raw = HistoryBuffer(max(1, math.ceil(self.raw_span / interval)))
+        count = min(raw.max_size, int((len(old) - 1) * ratio) + 1) if len(old) else 0
+
+        # Sum the old samples falling in each new slot, newest slot first
+        sums = [0.0] * count
+        counts = [0] * count
+        for age, value in enumerate(reversed(old)):
+            slot = int(age * ratio)
+            if slot >= count:
+                break
+            sums[slot] += value
+            counts[slot] += 1
+
+        # Slots no old sample falls in repeat the older value
+        value = 0.0
+        for slot in reversed(range(count)):
+            if counts[slot]:
+                value = sums[slot] / counts[slot]
+            raw.add(value)
+
+        self.interval = interval
+        self.raw = raw
+
+    def add(self, value: float, timestamp: Optional[float] = None) -> None:
+        """
+        Add a sample to the raw buffer and every rollup tier.
+
+        Args:
+            value: Sample value
+            timestamp: Wall-clock time of the sample (default: now)
+        """
+        if timestamp is None:
+            timestamp = time.time()
+
+        self.raw.add(value)
+        for tier in self.tiers:
+            tier.add(value, timestamp)
+
+    def span(
+        self, seconds: float, points: Optional[int] = None, stat: str = "avg"
+    ) -> Sequence[float]:
+        """
+        Get the history covering the last `seconds`, oldest first.
+
+        Args:
+            seconds: Time span to cover
+            points: Maximum number of values to return; adjacent values are
+                merged with `stat` when the tier holds more
+            stat: Rollup statistic to use ("min", "avg" or "max")
+
+        Returns:
+            Sequence of values (a zero-copy view when no merging is needed)
+        """
+        values = self.raw.view(math.ceil(seconds / self.interval))
+
+        if seconds > self.raw.max_size * self.interval and self.tiers:
+            tier = next((t for t in self.tiers if t.span >= seconds), self.tiers[-1])
+            series = tier.series(stat)
+
+            # Shortly after startup the raw buffer may still cover more time
+            # than the tier's completed buckets
+            if len(series) * tier.resolution >= len(values) * self.interval:
+                values = series.view(math.ceil(seconds / tier.resolution))
+
+        if points is not None and len(values) > points:
+            return self._merge(values, points, stat)
+        return values
+
+    def get_latest(self) -> Optional[float]:
+        """Get the most recent sample, or None if empty."""
+        return self.raw.get_latest()
+
+    def __len__(self) -> int:
+        """Return the number of raw samples held."""
+        return len(self.raw)
+
+    @staticmethod
+    def _merge(values: Sequence[float], points: int, stat: str) -> List[float]:
+        """Merge adjacent values into `points` groups."""
+        count = len(values)
+        merged = []
+
+        for i in range(points):
+            group = values[i * count // points : (i + 1) * count // points]
+            if stat == "min":
+                merged.append(min(group))
+            elif stat == "max":
+                merged.append(max(group))
+            else:
+                merged.append(sum(group) / len(group))
+
+        return merged
@@ -0,0 +1,201 @@
+"""
+Non-blocking keyboard input from the terminal.
+"""
+
+import os
+import select
+import sys
+import threading
+from collections import deque
+from typing import Callable, List, Optional, TextIO
+
+
+class KeyReader:
+    """
+    Reads key presses on a background thread while the display runs.
+
+    The terminal is switched to cbreak mode, so keys arrive without Enter
+    and are not echoed, while Ctrl+C still raises SIGINT. Printable keys are
+    reported as themselves and special keys by name ("up", "pagedown",
+    "tab", ...). Where stdin is not a terminal, or there is no termios
+    (Windows), no keys are read and the display runs as before.
+    """
+
+    # Escape sequences of the special keys, as sent by common terminals
+    SEQUENCES = {
+        b"\x1b[A": "up",
+        b"\x1b[B": "down",
+        b"\x1b[C": "right",
+        b"\x1b[D": "left",
+        b"\x1bOA": "up",
+        b"\x1bOB": "down",
+        b"\x1bOC": "right",
+        b"\x1bOD": "left",
+        b"\x1b[5~": "pageup",
+        b"\x1b[6~": "pagedown",
+        b"\x1b[H": "home",
+        b"\x1b[F": "end",
+        b"\x1bOH": "home",
+        b"\x1bOF": "end",
+        b"\x1b[1~": "home",
+        b"\x1b[4~": "end",
+    }
+
+    NAMES = {
+        b"\t": "tab",
+        b"\r": "enter",
+        b"\n": "enter",
+        b" ": "space",
+        b"\x7f": "backspace",
+        b"\x1b": "escape",
+    }
+
+    # How often the reader thread checks whether it should stop
+    POLL_INTERVAL = 0.1
+
+    def __init__(
+        self, on_key: Optional[Callable[[], None]] = None, stream: Optional[TextIO] = None
+    ):
+        """
+        Initialize the key reader.
+
+        Args:
+            on_key: Optional callback run on the reader thread after keys
+                arrive, e.g. to wake the display loop
+            stream: Terminal to read from (default: stdin)
+        """
+        self.on_key = on_key
+        self.stream = stream or sys.stdin
+        self._keys: deque = deque()
+        self._saved_mode: Optional[list] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def active(self) -> bool:
+        """Whether keys are being read."""
+        return self._thread is not None
+
+    def start(self) -> bool:
+        """
+        Switch the terminal to cbreak mode and start reading keys.
+
+        Returns:
+            True if keys are read, False if the terminal does not allow it
+        """
+        try:
+            import termios
+            import tty
+        except ImportError:
+            return False
+
+        try:
+            fd = self.stream.fileno()
+            if not os.isatty(fd):
+                return False
+            self._saved_mode = termios.tcgetattr(fd)
+            tty.setcbreak(fd, termios.TCSANOW)
+        except (AttributeError, OSError, ValueError, termios.error):
+            return False
+
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(fd,), name="sysmon-keys", daemon=True
+        )
+        self._thread.start()
+        return True
+
+    def stop(self) -> None:
+        """Stop reading keys and restore the terminal mode."""
+        if self._thread is None:
+            return
+
+        self._stop.set()
+        self._thread.join(self.POLL_INTERVAL * 2)
+        self._thread = None
+
+        import termios
+
+        try:
+            termios.tcsetattr(self.stream.fileno(), termios.TCSADRAIN, self._saved_mode)
+        except (OSError, ValueError, termios.error):
+            pass
+
+    def read(self) -> List[str]:
+        """
+        Take the keys pressed since the last call.
+
+        Returns:
+            Keys in the order they were pressed
+        """
+        keys = []
+        while self._keys:
+            keys.append(self._keys.popleft())
+        return keys
+
+    def __enter__(self) -> "KeyReader":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _run(self, fd: int) -> None:
+        """Reader thread loop."""
+        while not self._stop.is_set():
+            try:
+                ready, _, _ = select.select([fd], [], [], self.POLL_INTERVAL)
+                if not ready:
+                    continue
+                data = os.read(fd, 64)
+            except (OSError, ValueError):
+                return
+
+            if not data:
+                # End of input
+                return
+
+            self._keys.extend(self.decode(data))
+            if self.on_key is not None:
+                self.on_key()
+
+    @classmethod
+    def decode(cls, data: bytes) -> List[str]:
+        """
+        Split raw terminal input into keys.
+
+        Args:
+            data: Bytes read from the terminal
+
+        Returns:
+            Names of special keys and printable characters; unknown escape
+            sequences are dropped
+        """
+        keys = []
+        index = 0
+
+        while index < len(data):
+            if data[index] == 0x1B and index + 1 < len(data):
+                for sequence, name in cls.SEQUENCES.items():
+                    if data.startswith(sequence, index):
+                        keys.append(name)
+                        index += len(sequence)
+                        break
+                else:
+                    # Skip an unknown CSI or SS3 sequence up to its final byte
+                    end = index + 2
+                    if data[index + 1] in b"[O":
+                        while end < len(data) and not 0x40 <= data[end] <= 0x7E:
+                            end += 1
+                        end += 1
+                    index = end
+                continue
+
+            byte = data[index : index + 1]
+            if byte in cls.NAMES:
+                keys.append(cls.NAMES[byte])
+            elif 0x20 < data[index] < 0x7F:
+                keys.append(byte.decode("ascii"))
+            index += 1
+
+        return keys
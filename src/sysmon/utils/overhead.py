@@ -0,0 +1,203 @@
+"""
+Measurement of sysmon's own overhead.
+"""
+
+import math
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Dict, Iterator, List, Optional, Tuple
+
+import psutil
+
+
+def percentile(ordered: List[float], fraction: float) -> float:
+    """
+    Nearest-rank percentile of sorted values.
+
+    Args:
+        ordered: Values in ascending order
+        fraction: Percentile as a fraction between 0 and 1
+
+    Returns:
+        The smallest value with at least `fraction` of the values at or below
+        it (0.0 if there are no values)
+    """
+    if not ordered:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[rank - 1]
+
+
+class OverheadRecorder:
+    """
+    Records the wall and CPU time of sysmon's own work, and its memory use.
+
+    Timings are kept per name (a collector, "layout", "write", ...) in
+    bounded windows of the most recent samples; CPU time is the time spent
+    by the measuring thread. Memory samples track the resident set size and
+    the number of memory blocks allocated by the interpreter. Recording is
+    thread-safe, so collectors can record from their worker threads.
+    """
+
+    # Samples kept per name for the summary
+    WINDOW = 4096
+
+    def __init__(self, window: int = WINDOW):
+        """
+        Initialize the recorder.
+
+        Args:
+            window: Number of most recent samples kept per name
+        """
+        self.window = window
+        self._timings: Dict[str, Deque[Tuple[float, float]]] = {}
+        self._rss: Deque[float] = deque(maxlen=window)
+        self._blocks: Deque[float] = deque(maxlen=window)
+        self._process = psutil.Process()
+        self._lock = threading.Lock()
+
+    def record(self, name: str, wall: float, cpu: float) -> None:
+        """
+        Record one timing.
+
+        Args:
+            name: What was measured
+            wall: Elapsed wall time in seconds
+            cpu: CPU time of the measuring thread in seconds
+        """
+        with self._lock:
+            samples = self._timings.get(name)
+            if samples is None:
+                samples = self._timings[name] = deque(maxlen=self.window)
+            samples.append((wall, cpu))
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        """Time the body of a with statement under `name`."""
+        wall = time.perf_counter()
+        cpu = time.thread_time()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - wall, time.thread_time() - cpu)
+
+    def sample_memory(self) -> None:
+        """Record the current resident set size and allocated block count."""
+        try:
+            rss = self._process.memory_info().rss
+        except psutil.Error:
+            return
+        with self._lock:
+            self._rss.append(rss)
+            self._blocks.append(sys.getallocatedblocks())
+
+    def latest(self, name: str) -> Optional[Tuple[float, float]]:
+        """
+        Get the most recent timing recorded under a name.
+
+        Returns:
+            Wall and CPU seconds, or None if nothing was recorded
+        """
+        with self._lock:
+            samples = self._timings.get(name)
+            return samples[-1] if samples else None
+
+    def footer(self, names: List[str]) -> str:
+        """
+        Format the latest timings and memory use as one line.
+
+        Args:
+            names: Timings to show, in order
+
+        Returns:
+            Line such as "layout 3.1/2.9 ms · RSS 41.0 MB"
+        """
+        parts = []
+        for name in names:
+            latest = self.latest(name)
+            if latest is not None:
+                parts.append(f"{name} {latest[0] * 1000:.1f}/{latest[1] * 1000:.1f} ms")
+
+        with self._lock:
+            if self._rss:
+                parts.append(f"RSS {self._rss[-1] / 1024 ** 2:.1f} MB")
+                parts.append(f"{self._blocks[-1] / 1000:.0f}k blocks")
+
+        return "sysmon overhead (wall/cpu): " + " · ".join(parts)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        Summarize the recorded samples.
+
+        Returns:
+            Dictionary mapping each timing name to p50/p95/max of its wall
+            and CPU milliseconds and its sample count, plus "rss_mb" and
+            "blocks" entries for the memory samples
+        """
+        with self._lock:
+            timings = {name: list(samples) for name, samples in self._timings.items()}
+            rss = list(self._rss)
+            blocks = list(self._blocks)
+
+        result = {}
+        for name, samples in timings.items():
+            if not samples:
+                continue
+            walls = sorted(wall * 1000 for wall, _ in samples)
+            cpus = sorted(cpu * 1000 for _, cpu in samples)
+            result[name] = {
+                "count": len(samples),
+                "wall_p50": percentile(walls, 0.50),
+                "wall_p95": percentile(walls, 0.95),
+                "wall_max": walls[-1],
+                "cpu_p50": percentile(cpus, 0.50),
+                "cpu_p95": percentile(cpus, 0.95),
+                "cpu_max": cpus[-1],
+            }
+
+        for name, values, scale in (("rss_mb", rss, 1024 ** 2), ("blocks", blocks, 1)):
+            if values:
+                ordered = sorted(value / scale for value in values)
+                result[name] = {
+                    "count": len(ordered),
+                    "p50": percentile(ordered, 0.50),
+                    "p95": percentile(ordered, 0.95),
+                    "max": ordered[-1],
+                }
+
+        return result
+
+    def format_summary(self) -> str:
+        """
+        Format the summary as a plain-text table.
+
+        Returns:
+            Multi-line table of timings in milliseconds and memory use
+        """
+        summary = self.summary()
+        lines = [
+            f"{'(ms)':<14} {'count':>6} {'wall p50':>9} {'p95':>8} {'max':>8} "
+            f"{'cpu p50':>9} {'p95':>8} {'max':>8}"
+        ]
+        for name in sorted(summary):
+            row = summary[name]
+            if "wall_p50" not in row:
+                continue
+            lines.append(
+                f"{name:<14} {row['count']:>6} {row['wall_p50']:>9.2f} "
+                f"{row['wall_p95']:>8.2f} {row['wall_max']:>8.2f} {row['cpu_p50']:>9.2f} "
+                f"{row['cpu_p95']:>8.2f} {row['cpu_max']:>8.2f}"
+            )
+
+        for name, label, fmt in (("rss_mb", "RSS MB", ".1f"), ("blocks", "blocks", ".0f")):
+            row = summary.get(name)
+            if row is not None:
+                lines.append(
+                    f"{label:<14} {row['count']:>6} {row['p50']:>9{fmt}} "
+                    f"{row['p95']:>8{fmt}} {row['max']:>8{fmt}}"
+                )
+
+        return "\n".join(lines)
@@ -0,0 +1,35 @@
+"""
+Shared fixtures.
+"""
+
+import shutil
+import tempfile
+
+import pytest
+
+from fakedocker import FakeDockerDaemon
+
+
+@pytest.fixture
+def docker_daemon(monkeypatch):
+    """
+    Factory starting fake Docker daemons, the latest named by DOCKER_HOST.
+
+    Sockets live in a short temporary directory: unix socket paths are
+    limited to about 100 bytes, which pytest's tmp_path can exceed.
+    """
+    root = tempfile.mkdtemp(prefix="sysmon-")
+    daemons = []
+
+    def start(**kwargs) -> FakeDockerDaemon:
+        daemon = FakeDockerDaemon(f"{root}/docker{len(daemons)}.sock", **kwargs)
+        daemon.start()
+        daemons.append(daemon)
+        monkeypatch.setenv("DOCKER_HOST", f"unix://{daemon.path}")
+        return daemon
+
+    yield start
+
+    for daemon in daemons:
+        daemon.stop()
+    shutil.rmtree(root, ignore_errors=True)
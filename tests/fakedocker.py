@@ -0,0 +1,221 @@
+"""
+Fake Docker daemon serving a minimal Engine API on a unix socket.
+
+Used by the tests and by benchmarks/bench_docker_socket.py. It answers
+the requests of both the Docker SDK and DockerSocketClient: list
+responses carry a Content-Length, stats responses are chunked by default,
+and connections are kept alive unless asked otherwise.
+"""
+
+import asyncio
+import json
+import re
+import threading
+from collections import Counter
+from typing import List, Optional
+
+API_VERSION = "1.43"
+
+
+class FakeDockerDaemon:
+    """Minimal Docker Engine API on a unix socket, run on its own thread."""
+
+    def __init__(
+        self,
+        path: str,
+        containers: int = 0,
+        latency: float = 0.0,
+        chunked: bool = True,
+        keep_alive: bool = True,
+        precpu: bool = False,
+    ):
+        """
+        Initialize the daemon; nothing listens until start().
+
+        Args:
+            path: Path of the unix socket to listen on
+            containers: Number of running containers
+            latency: Seconds each stats request takes
+            chunked: Whether stats bodies are chunked, or sent with a
+                Content-Length
+            keep_alive: Whether connections stay open between requests
+            precpu: Whether stats carry precpu_stats, like a streamed
+                sample; one-shot samples leave them empty
+        """
+        self.path = path
+        self.latency = latency
+        self.chunked = chunked
+        self.keep_alive = keep_alive
+        self.precpu = precpu
+        self.ids: List[str] = [f"{i:064x}" for i in range(containers)]
+        self.connections = 0
+        self.requests: List[str] = []
+        self.samples: Counter = Counter()
+        self._writers: set = set()
+        self._event_writers: set = set()
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._ready = threading.Event()
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    @property
+    def stats_requests(self) -> int:
+        """Number of stats requests answered."""
+        return sum(self.samples.values())
+
+    def start(self) -> None:
+        self._thread.start()
+        self._ready.wait()
+
+    def stop(self) -> None:
+        asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+    def stop_container(self, container_id: str) -> None:
+        """Stop a container and send its "die" event to every events stream."""
+        self.ids.remove(container_id)
+        event = {"Type": "container", "Action": "die", "Actor": {"ID": container_id}}
+        asyncio.run_coroutine_threadsafe(self._emit(event), self._loop).result()
+
+    def drop_connections(self) -> None:
+        """Close every open connection without telling the client, as on an idle timeout."""
+        asyncio.run_coroutine_threadsafe(self._close_writers(), self._loop).result()
+
+    def __enter__(self) -> "FakeDockerDaemon":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._server = self._loop.run_until_complete(
+            asyncio.start_unix_server(self._serve, path=self.path)
+        )
+        self._ready.set()
+        self._loop.run_forever()
+        self._loop.close()
+
+    async def _shutdown(self) -> None:
+        """Stop listening and drop the connections still open."""
+        self._server.close()
+        await self._close_writers()
+        handlers = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        await asyncio.gather(*handlers, return_exceptions=True)
+
+    async def _close_writers(self) -> None:
+        for writer in list(self._writers):
+            writer.close()
+
+    async def _serve(self, reader, writer) -> None:
+        self.connections += 1
+        self._writers.add(writer)
+        try:
+            while True:
+                request = await reader.readline()
+                if not request:
+                    return
+                while (await reader.readline()) not in (b"\r\n", b""):
+                    pass
+
+                target = request.split()[1].decode()
+                self.requests.append(target)
+                path = re.sub(r"^/v[0-9.]+", "", target.split("?")[0])
+                if path == "/events":
+                    # Held open until the client leaves; events are sent by
+                    # stop_container()
+                    writer.write(self._head(200, "Transfer-Encoding: chunked"))
+                    self._event_writers.add(writer)
+                    try:
+                        await reader.read()
+                    finally:
+                        self._event_writers.discard(writer)
+                    return
+                await self._respond(writer, path, target)
+                if not self.keep_alive:
+                    return
+        except ConnectionError:
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    async def _emit(self, event: dict) -> None:
+        line = json.dumps(event).encode() + b"\n"
+        for writer in list(self._event_writers):
+            writer.write(b"%x\r\n%s\r\n" % (len(line), line))
+            await writer.drain()
+
+    async def _respond(self, writer, path: str, target: str) -> None:
+        if path == "/_ping":
+            writer.write(self._head(200, "Content-Length: 2", "text/plain") + b"OK")
+        elif path == "/version":
+            self._send_json(writer, {"ApiVersion": API_VERSION, "Version": "24.0.0"})
+        elif path == "/containers/json":
+            self._send_json(writer, [self._listing(cid) for cid in self.ids])
+        elif path.startswith("/containers/") and path.endswith("/stats"):
+            container_id = path.split("/")[2]
+            if container_id not in self.ids:
+                self._send_json(writer, {"message": f"No such container: {container_id}"}, 404)
+            else:
+                await asyncio.sleep(self.latency)
+                self.samples[container_id] += 1
+                body = json.dumps(self._stats(container_id)).encode()
+                if self.chunked:
+                    # Split in two to exercise reassembly
+                    half = len(body) // 2
+                    chunks = b"".join(
+                        b"%x\r\n%s\r\n" % (len(part), part)
+                        for part in (body[:half], body[half:])
+                    )
+                    writer.write(
+                        self._head(200, "Transfer-Encoding: chunked") + chunks + b"0\r\n\r\n"
+                    )
+                else:
+                    writer.write(self._head(200, f"Content-Length: {len(body)}") + body)
+        else:
+            self._send_json(writer, {"message": f"page not found: {target}"}, 404)
+        await writer.drain()
+
+    def _send_json(self, writer, data, status: int = 200) -> None:
+        body = json.dumps(data).encode()
+        writer.write(self._head(status, f"Content-Length: {len(body)}") + body)
+
+    def _head(self, status: int, length: str, content_type: str = "application/json") -> bytes:
+        connection = "" if self.keep_alive else "Connection: close\r\n"
+        return (
+            f"HTTP/1.1 {status} {'OK' if status == 200 else 'Not Found'}\r\n"
+            f"Api-Version: {API_VERSION}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"{connection}{length}\r\n\r\n"
+        ).encode()
+
+    @staticmethod
+    def _listing(container_id: str) -> dict:
+        return {
+            "Id": container_id,
+            "Names": [f"/app-{int(container_id, 16)}"],
+            "Image": "nginx:latest",
+            "State": "running",
+        }
+
+    def _stats(self, container_id: str) -> dict:
+        # Every sample adds 10 ms of container CPU per second of system CPU
+        sample = self.samples[container_id]
+        return {
+            "cpu_stats": self._cpu(sample),
+            "precpu_stats": self._cpu(sample - 1) if self.precpu else {},
+            "memory_stats": {"usage": 50 << 20, "limit": 1 << 30, "stats": {}},
+            "networks": {"eth0": {"rx_bytes": sample * 1500, "tx_bytes": sample * 900}},
+            "blkio_stats": {"io_service_bytes_recursive": []},
+        }
+
+    @staticmethod
+    def _cpu(sample: int) -> dict:
+        return {
+            "cpu_usage": {"total_usage": sample * 10_000_000},
+            "system_cpu_usage": sample * 1_000_000_000,
+            "online_cpus": 8,
+        }
@@ -0,0 +1,63 @@
+"""
+Small hand-built snapshots for tests that do not collect from the host.
+"""
+
+from sysmon.collectors.cpu import CPUMetrics
+from sysmon.collectors.disk import DiskIOMetrics, DiskMetrics, DiskPartitionMetrics
+from sysmon.collectors.load import LoadMetrics
+from sysmon.collectors.memory import MemoryMetrics
+from sysmon.snapshot import Snapshot
+
+
+def make_snapshot(timestamp: float = 1_700_000_000.0, cpu_percent: float = 25.0, **fields) -> Snapshot:
+    """
+    Build a snapshot of a small two-core host.
+
+    Args:
+        timestamp: Wall-clock time of the snapshot
+        cpu_percent: Overall CPU percentage
+        **fields: Other Snapshot fields to set
+    """
+    values = dict(
+        timestamp=timestamp,
+        cpu=CPUMetrics(
+            overall_percent=cpu_percent,
+            per_core_percent=[cpu_percent, cpu_percent],
+            frequency_current=2400.0,
+            frequency_max=3600.0,
+            core_count=2,
+            thread_count=2,
+        ),
+        memory=MemoryMetrics(
+            total_bytes=8 << 30,
+            available_bytes=6 << 30,
+            used_bytes=2 << 30,
+            percent=25.0,
+            swap_total_bytes=0,
+            swap_used_bytes=0,
+            swap_free_bytes=0,
+            swap_percent=0.0,
+        ),
+        disk=DiskMetrics(
+            partitions=[
+                DiskPartitionMetrics(
+                    mountpoint="/",
+                    device="/dev/sda1",
+                    fstype="ext4",
+                    total_bytes=100 << 30,
+                    used_bytes=40 << 30,
+                    free_bytes=60 << 30,
+                    percent=40.0,
+                )
+            ],
+            io=DiskIOMetrics(read_bytes=1000, write_bytes=2000, read_count=10, write_count=20),
+        ),
+        load=LoadMetrics(load_1min=0.5, load_5min=0.25, load_15min=0.125, cpu_count=2),
+        docker=None,
+        processes=None,
+        cpu_history=(cpu_percent,),
+        memory_history=(25.0,),
+        load_history=(0.5,),
+    )
+    values.update(fields)
+    return Snapshot(**values)
@@ -0,0 +1,179 @@
+"""
+Tests for CgroupReader and the "cgroup" Docker backend on a fake cgroup v2 tree.
+"""
+
+import os
+
+import pytest
+
+from sysmon.collectors.cgroup import CgroupReader
+from sysmon.collectors.docker import ContainerInfo, DockerCollector
+
+HOST_NETNS = "net:[4026531840]"
+
+NET_DEV_HEADER = (
+    "Inter-|   Receive                                                |  Transmit\n"
+    " face |bytes    packets errs drop fifo frame compressed multicast|"
+    "bytes    packets errs drop fifo colls carrier compressed\n"
+)
+
+
+def write(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(content)
+
+
+class FakeTree:
+    """cgroup v2 hierarchy and procfs with containers added on demand."""
+
+    def __init__(self, root):
+        self.cgroup_root = str(root / "cgroup")
+        self.proc_root = str(root / "proc")
+        write(os.path.join(self.cgroup_root, "cgroup.controllers"), "cpu io memory pids\n")
+        self.add_process("1", HOST_NETNS, {"eth0": (10_000, 20_000)})
+
+    def add_process(self, pid, netns, interfaces):
+        lines = [NET_DEV_HEADER]
+        for name, (rx, tx) in interfaces.items():
+            lines.append(f"{name:>6}: {rx} 10 0 0 0 0 0 0 {tx} 10 0 0 0 0 0 0\n")
+        write(os.path.join(self.proc_root, pid, "net", "dev"), "".join(lines))
+        os.makedirs(os.path.join(self.proc_root, pid, "ns"), exist_ok=True)
+        os.symlink(netns, os.path.join(self.proc_root, pid, "ns", "net"))
+
+    def add_container(
+        self,
+        container_id,
+        pid="100",
+        netns="net:[4026532000]",
+        template="system.slice/docker-{id}.scope",
+        memory_max="max",
+        io=True,
+    ):
+        path = os.path.join(self.cgroup_root, template.format(id=container_id))
+        write(
+            os.path.join(path, "cpu.stat"),
+            "usage_usec 5000000\nuser_usec 4000000\nsystem_usec 1000000\n"
+            "nr_periods 100\nnr_throttled 7\nthrottled_usec 250000\n",
+        )
+        write(os.path.join(path, "memory.current"), "104857600\n")
+        write(os.path.join(path, "memory.max"), f"{memory_max}\n")
+        write(os.path.join(path, "memory.stat"), "anon 52428800\ninactive_file 4194304\n")
+        if io:
+            write(
+                os.path.join(path, "io.stat"),
+                "8:0 rbytes=1000 wbytes=2000 rios=1 wios=2 dbytes=0 dios=0\n"
+                "8:16 rbytes=300 wbytes=400 rios=3 wios=4 dbytes=0 dios=0\n",
+            )
+        write(os.path.join(path, "cgroup.procs"), f"{pid}\n")
+        self.add_process(pid, netns, {"lo": (999, 999), "eth0": (1500, 900), "eth1": (500, 100)})
+        return path
+
+
+@pytest.fixture
+def tree(tmp_path):
+    return FakeTree(tmp_path)
+
+
+def reader(tree):
+    return CgroupReader(tree.cgroup_root, tree.proc_root)
+
+
+def test_reads_counters(tree):
+    tree.add_container("a" * 64)
+
+    stats = reader(tree).read("a" * 64)
+
+    assert stats.usage_usec == 5_000_000
+    assert stats.nr_throttled == 7
+    assert stats.throttled_usec == 250_000
+    assert stats.memory_current == 100 << 20
+    assert stats.memory_max is None
+    assert stats.inactive_file == 4 << 20
+    assert (stats.io_read_bytes, stats.io_write_bytes) == (1300, 2400)
+    # Loopback traffic is not counted
+    assert (stats.network_rx_bytes, stats.network_tx_bytes) == (2000, 1000)
+
+
+def test_finds_cgroupfs_driver_path_and_limit(tree):
+    path = tree.add_container("b" * 64, template="docker/{id}", memory_max="536870912")
+    cgroups = reader(tree)
+
+    assert cgroups.find("b" * 64) == path
+    assert cgroups.read("b" * 64).memory_max == 512 << 20
+
+
+def test_missing_io_controller_reads_zero(tree):
+    tree.add_container("c" * 64, io=False)
+
+    stats = reader(tree).read("c" * 64)
+
+    assert (stats.io_read_bytes, stats.io_write_bytes) == (0, 0)
+
+
+def test_unknown_or_removed_container(tree):
+    path = tree.add_container("d" * 64)
+    cgroups = reader(tree)
+    assert cgroups.read("d" * 64) is not None
+
+    for name in os.listdir(path):
+        os.unlink(os.path.join(path, name))
+    os.rmdir(path)
+
+    assert cgroups.read("d" * 64) is None
+    assert cgroups.read("e" * 64) is None
+
+
+def test_host_network_container_reports_no_traffic(tree):
+    # --network=host: the container's net/dev is the whole host's
+    tree.add_container("f" * 64, pid="200", netns=HOST_NETNS)
+
+    stats = reader(tree).read("f" * 64)
+
+    assert (stats.network_rx_bytes, stats.network_tx_bytes) == (0, 0)
+    assert stats.usage_usec == 5_000_000
+
+
+def test_host_netns_falls_back_to_own_namespace(tree):
+    # Without privileges init's namespace cannot be read
+    os.unlink(os.path.join(tree.proc_root, "1", "ns", "net"))
+    tree.add_process("self", HOST_NETNS, {})
+    tree.add_container("f" * 64, pid="200", netns=HOST_NETNS)
+    tree.add_container("1" * 64, pid="201")
+    cgroups = reader(tree)
+
+    assert cgroups.read("f" * 64).network_rx_bytes == 0
+    assert cgroups.read("1" * 64).network_rx_bytes == 2000
+
+
+def test_unreadable_namespace_still_reads_traffic(tree):
+    tree.add_container("2" * 64, pid="300")
+    os.unlink(os.path.join(tree.proc_root, "300", "ns", "net"))
+
+    stats = reader(tree).read("2" * 64)
+
+    assert stats.network_rx_bytes == 2000
+
+
+def test_docker_collector_uses_proc_root(tree, monkeypatch):
+    pytest.importorskip("docker")
+    monkeypatch.setenv("DOCKER_HOST", f"unix://{tree.proc_root}/no-docker.sock")
+    tree.add_container("3" * 64, pid="400")
+
+    collector = DockerCollector(
+        backend="cgroup", cgroup_root=tree.cgroup_root, proc_root=tree.proc_root
+    )
+    try:
+        # The daemon is unreachable, but the cgroup reader is set up first
+        collector.wait_connected(timeout=5.0)
+        metrics = collector._get_cgroup_metrics(
+            ContainerInfo(container_id="3" * 64, name="web", image="nginx", status="running")
+        )
+    finally:
+        collector.close()
+
+    assert metrics.network_rx_bytes == 2000
+    assert metrics.network_tx_bytes == 1000
+    assert metrics.cpu_throttled_usec == 250_000
+    # Same accounting as docker stats: page cache is excluded
+    assert metrics.memory_used_bytes == (100 << 20) - (4 << 20)
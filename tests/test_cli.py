@@ -0,0 +1,97 @@
+"""
+Tests for the command line output modes.
+"""
+
+import sys
+
+import pytest
+
+from sysmon.__main__ import parse_args
+
+
+def parse(monkeypatch, *argv):
+    monkeypatch.setattr(sys, "argv", ["sysmon", *argv])
+    return parse_args()
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ("--json", "--exporter"),
+        ("--exporter", "--once"),
+        ("--json", "record", "out.rec"),
+        ("--exporter", "record", "out.rec"),
+        ("--once", "replay", "out.rec"),
+    ],
+)
+def test_conflicting_modes_are_rejected(monkeypatch, capsys, argv):
+    with pytest.raises(SystemExit) as exit_info:
+        parse(monkeypatch, *argv)
+
+    assert exit_info.value.code == 2
+    assert "not allowed with" in capsys.readouterr().err
+
+
+def test_single_json_snapshot_is_allowed(monkeypatch):
+    args = parse(monkeypatch, "--json", "--once")
+
+    assert args.json and args.once and not args.exporter
+
+
+def test_record_takes_its_own_collection_flags(monkeypatch):
+    args = parse(monkeypatch, "record", "--no-docker", "out.rec")
+
+    assert args.command == "record"
+    assert args.no_docker
+
+
+@pytest.mark.parametrize(
+    "option", ["--braille", "--overhead", "--profile", "--runtime=threads", "--docker-sort=io"]
+)
+@pytest.mark.parametrize(
+    "mode", [("--json",), ("--exporter",), ("record", "out.rec"), ("replay", "out.rec")]
+)
+def test_dashboard_options_are_rejected_in_other_modes(monkeypatch, capsys, option, mode):
+    with pytest.raises(SystemExit) as exit_info:
+        parse(monkeypatch, option, *mode)
+
+    assert exit_info.value.code == 2
+    assert f"argument {option.split('=')[0]}: not allowed with" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize(
+    "option, mode",
+    [
+        ("--json-flush=10", ()),
+        ("--json-flush=10", ("--exporter",)),
+        ("--json-flush=10", ("record", "out.rec")),
+        ("--listen=0.0.0.0:9877", ()),
+        ("--listen=0.0.0.0:9877", ("--json",)),
+        ("--listen=0.0.0.0:9877", ("replay", "out.rec")),
+    ],
+)
+def test_output_options_are_rejected_outside_their_mode(monkeypatch, capsys, option, mode):
+    with pytest.raises(SystemExit) as exit_info:
+        parse(monkeypatch, option, *mode)
+
+    assert exit_info.value.code == 2
+    assert f"argument {option.split('=')[0]}: not allowed with" in capsys.readouterr().err
+
+
+def test_output_options_default_in_their_mode(monkeypatch):
+    assert parse(monkeypatch, "--json").json_flush == 1
+    assert parse(monkeypatch, "--json", "--json-flush=0").json_flush == 0
+    assert parse(monkeypatch, "--exporter").listen == "127.0.0.1:9877"
+    assert parse(monkeypatch, "--exporter", "--listen=[::]:9000").listen == "[::]:9000"
+
+
+def test_dashboard_options_are_allowed_with_once(monkeypatch):
+    args = parse(monkeypatch, "--once", "--braille", "--runtime", "asyncio")
+
+    assert args.braille and args.runtime == "asyncio"
+
+
+def test_docker_backend_defaults_to_one_request_per_container(monkeypatch):
+    assert parse(monkeypatch).docker_backend == "api"
+    assert parse(monkeypatch, "record", "out.rec").docker_backend == "api"
+    assert parse(monkeypatch, "--docker-backend", "stream").docker_backend == "stream"
@@ -0,0 +1,72 @@
+"""
+Tests for the cumulative counter helpers.
+"""
+
+import pytest
+
+from sysmon.utils.counters import RateTracker, counter_delta
+
+
+@pytest.mark.parametrize(
+    "current, previous, delta",
+    [
+        (150, 100, 50),
+        (100, 100, 0),
+        # A 32-bit counter wrapped
+        (10, (1 << 32) - 20, 30),
+        # Reset: the new value is the increase
+        (40, 5000, 40),
+        # Above the 32-bit range a decrease is always a reset
+        (40, 1 << 40, 40),
+    ],
+)
+def test_counter_delta(current, previous, delta):
+    assert counter_delta(current, previous) == delta
+
+
+def test_first_sample_reports_zero_rates():
+    tracker = RateTracker()
+
+    assert tracker.update("a", (100, 200), 10.0) == (0.0, 0.0)
+
+
+def test_rates_per_second_between_samples():
+    tracker = RateTracker()
+    tracker.update("a", (100, 200), 10.0)
+
+    assert tracker.update("a", (300, 260), 12.0) == (100.0, 30.0)
+
+
+def test_reset_counter_counts_its_new_value():
+    tracker = RateTracker()
+    tracker.update("a", (5000, 200), 10.0)
+
+    # The container restarted: its first counter starts over
+    assert tracker.update("a", (50, 300), 11.0) == (50.0, 100.0)
+
+
+def test_sample_not_newer_repeats_previous_rates():
+    tracker = RateTracker()
+    tracker.update("a", (0,), 10.0)
+    rates = tracker.update("a", (20,), 12.0)
+
+    assert tracker.update("a", (999,), 12.0) == rates
+    # The repeated sample was not recorded
+    assert tracker.update("a", (60,), 14.0) == (20.0,)
+
+
+def test_keys_are_independent_and_retained():
+    tracker = RateTracker()
+    tracker.update("a", (0,), 10.0)
+    tracker.update("b", (0,), 10.0)
+    tracker.retain(["a"])
+
+    assert tracker.update("a", (10,), 11.0) == (10.0,)
+    assert tracker.update("b", (10,), 11.0) == (0.0,)
+
+
+def test_changed_counter_count_starts_over():
+    tracker = RateTracker()
+    tracker.update("a", (0,), 10.0)
+
+    assert tracker.update("a", (10, 20), 11.0) == (0.0, 0.0)
@@ -0,0 +1,63 @@
+"""
+Tests for rendering snapshots in the dashboard without collectors.
+"""
+
+import io
+
+from rich.console import Console
+
+from fakesnapshot import make_snapshot
+from sysmon.collectors.processes import ProcessInfo
+from sysmon.display.dashboard import Dashboard
+
+PROCESSES = (
+    ProcessInfo(pid=1, name="init", cpu_percent=0.5, memory_percent=0.1, status="sleeping"),
+    ProcessInfo(pid=42, name="worker", cpu_percent=60.0, memory_percent=5.0, status="running"),
+)
+
+
+def process_title(dashboard, snapshot):
+    dashboard.create_layout(snapshot)
+    panel = dashboard._layout["processes"].renderable.renderable
+    return panel.title
+
+
+def test_stale_process_scan_is_marked():
+    dashboard = Dashboard(show_docker=False, collect=False)
+    fresh = make_snapshot(processes=PROCESSES)
+    stale = make_snapshot(processes=PROCESSES, stale=frozenset({"processes"}))
+
+    assert "(stale)" not in process_title(dashboard, fresh)
+    # Same processes, now stale: the memoized panel must be rebuilt
+    assert "(stale)" in process_title(dashboard, stale)
+    assert "(stale)" not in process_title(dashboard, fresh)
+
+
+def test_snapshot_renders():
+    dashboard = Dashboard(show_docker=False, collect=False)
+    console = Console(width=120, height=50, record=True, file=io.StringIO())
+
+    console.print(dashboard.create_layout(make_snapshot(processes=PROCESSES)))
+
+    assert "worker" in console.export_text()
+
+
+def render_sections(dashboard, height):
+    console = Console(width=120, height=height, file=io.StringIO())
+    snapshot = make_snapshot(processes=PROCESSES, disk_devices=(), network=())
+    console.print(dashboard.create_layout(snapshot))
+    return {section.name for section in dashboard._layout.children}
+
+
+def test_short_terminal_hides_optional_sections_last_first():
+    dashboard = Dashboard(show_docker=True, collect=False)
+    # Header, docker and processes take 25 rows; each optional section 7
+    fixed = 3 + 12 + 10 + Dashboard.MIN_MAIN_HEIGHT
+
+    assert {"disk_io", "network"} <= render_sections(dashboard, fixed + 14)
+    shown = render_sections(dashboard, fixed + 13)
+    assert "disk_io" in shown and "network" not in shown
+    assert not {"disk_io", "network"} & render_sections(dashboard, 40)
+
+    # Back once the terminal is tall enough again
+    assert {"disk_io", "network"} <= render_sections(dashboard, 60)
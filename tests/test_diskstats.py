@@ -0,0 +1,155 @@
+"""
+Tests for DiskStatsCollector against a fake /proc/diskstats and /sys.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from sysmon.collectors import diskstats as diskstats_module
+from sysmon.collectors.diskstats import DiskStatsCollector
+
+
+def line(name, reads=0, read_sectors=0, read_ms=0, writes=0, write_sectors=0,
+         write_ms=0, io_ms=0, weighted_ms=0):
+    """One /proc/diskstats line with the counters the collector reads."""
+    return (
+        f" 259 0 {name} {reads} 0 {read_sectors} {read_ms} {writes} 0 "
+        f"{write_sectors} {write_ms} 0 {io_ms} {weighted_ms} 0 0 0 0\n"
+    )
+
+
+class FakeHost:
+    """A fake procfs and sysfs with a clock the collector reads."""
+
+    def __init__(self, root, monkeypatch):
+        self.proc = root / "proc"
+        self.sys = root / "sys"
+        self.proc.mkdir()
+        (self.sys / "block").mkdir(parents=True)
+        (self.sys / "class" / "block").mkdir(parents=True)
+        self.now = 1000.0
+        monkeypatch.setattr(
+            diskstats_module, "time", SimpleNamespace(monotonic=lambda: self.now)
+        )
+
+    def add_disk(self, name):
+        (self.sys / "block" / name).mkdir()
+        (self.sys / "class" / "block" / name).mkdir()
+
+    def add_partition(self, name):
+        (self.sys / "class" / "block" / name).mkdir()
+
+    def remove(self, name):
+        for path in (self.sys / "block" / name, self.sys / "class" / "block" / name):
+            if path.exists():
+                path.rmdir()
+
+    def write(self, *lines):
+        (self.proc / "diskstats").write_text("".join(lines))
+
+    def collector(self):
+        return DiskStatsCollector(proc_root=str(self.proc), sys_root=str(self.sys))
+
+
+@pytest.fixture
+def host(tmp_path, monkeypatch):
+    return FakeHost(tmp_path, monkeypatch)
+
+
+def test_iostat_rates(host):
+    host.add_disk("sda")
+    collector = host.collector()
+    host.write(line("sda"))
+    assert collector.collect() == []
+
+    host.now += 2.0
+    host.write(line("sda", reads=100, read_sectors=800, read_ms=300, writes=60,
+                    write_sectors=400, write_ms=180, io_ms=500, weighted_ms=1000))
+    (device,) = collector.collect()
+
+    assert device.name == "sda"
+    assert device.read_bytes_per_sec == 800 * 512 / 2
+    assert device.write_bytes_per_sec == 400 * 512 / 2
+    assert device.read_iops == 50
+    assert device.write_iops == 30
+    # (300 + 180) ms over 160 requests
+    assert device.await_ms == 3.0
+    assert device.queue_depth == 0.5
+    assert device.util_percent == 25.0
+
+
+def test_idle_device_and_saturated_util(host):
+    host.add_disk("sda")
+    collector = host.collector()
+    host.write(line("sda", io_ms=1000))
+    collector.collect()
+
+    host.now += 1.0
+    host.write(line("sda", io_ms=2100))
+    (device,) = collector.collect()
+
+    assert device.await_ms == 0.0
+    assert device.util_percent == 100.0
+
+
+def test_partitions_loop_and_ram_devices_are_skipped(host):
+    host.add_disk("nvme0n1")
+    host.add_partition("nvme0n1p1")
+    host.add_disk("loop0")
+    host.add_disk("ram0")
+    collector = host.collector()
+    lines = [line(name) for name in ("nvme0n1", "nvme0n1p1", "loop0", "ram0")]
+    host.write(*lines)
+    collector.collect()
+
+    host.now += 1.0
+    assert [d.name for d in collector.collect()] == ["nvme0n1"]
+
+
+def test_device_listed_before_sysfs_knows_it_is_reported_later(host):
+    collector = host.collector()
+    host.add_disk("sda")
+    host.write(line("sda"), line("sdb"))
+    collector.collect()
+
+    host.now += 1.0
+    host.add_disk("sdb")
+    collector.collect()
+    host.now += 1.0
+
+    assert [d.name for d in collector.collect()] == ["sda", "sdb"]
+
+
+def test_reused_name_is_classified_again(host):
+    host.add_disk("sda")
+    host.add_disk("sdb")
+    host.add_partition("sdc")
+    collector = host.collector()
+    host.write(line("sda"), line("sdc"))
+    collector.collect()
+
+    # sdc is unplugged, and its name comes back as a whole disk
+    host.now += 1.0
+    host.remove("sdc")
+    host.write(line("sda"))
+    collector.collect()
+    host.add_disk("sdc")
+    host.write(line("sda"), line("sdc"))
+    collector.collect()
+    host.now += 1.0
+
+    assert [d.name for d in collector.collect()] == ["sda", "sdc"]
+
+
+def test_counter_reset_counts_from_zero(host):
+    host.add_disk("sda")
+    collector = host.collector()
+    host.write(line("sda", reads=5000))
+    collector.collect()
+
+    host.now += 1.0
+    host.write(line("sda", reads=10))
+    (device,) = collector.collect()
+
+    assert device.read_iops == 10
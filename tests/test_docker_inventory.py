@@ -0,0 +1,161 @@
+"""
+Tests for ContainerInventory against a fake Docker API and events stream.
+"""
+
+import threading
+
+import pytest
+
+from sysmon.collectors.docker import ContainerInventory
+
+
+class FakeEventStream:
+    """Yields a fixed event sequence, then stays open until closed."""
+
+    def __init__(self, events):
+        self.events = events
+        self.drained = threading.Event()
+        self._closed = threading.Event()
+
+    def __iter__(self):
+        yield from self.events
+        self.drained.set()
+        self._closed.wait(5)
+
+    def close(self):
+        self._closed.set()
+
+
+class FakeAPI:
+    """Low-level Docker API client serving a container list and one stream."""
+
+    def __init__(self, listing, events):
+        self.listing = listing
+        self.stream = FakeEventStream(events)
+        self.listings = 0
+
+    def containers(self, all=False):
+        self.listings += 1
+        return self.listing
+
+    def events(self, since=None, decode=False, filters=None):
+        return self.stream
+
+
+def listing(container_id, name, image="nginx:latest", state="running"):
+    return {"Id": container_id, "Names": [f"/{name}"], "Image": image, "State": state}
+
+
+def event(action, container_id, **attributes):
+    return {
+        "Type": "container",
+        "Action": action,
+        "Actor": {"ID": container_id, "Attributes": attributes},
+    }
+
+
+def replay(listing_entries, events):
+    """Load an inventory, apply the events and return it with its API."""
+    api = FakeAPI(listing_entries, events)
+    inventory = ContainerInventory(api)
+    inventory.containers()
+    assert api.stream.drained.wait(5)
+    return inventory, api
+
+
+@pytest.fixture
+def statuses():
+    def read(inventory):
+        return {c.container_id: c.status for c in inventory.containers()}
+
+    return read
+
+
+def test_listing_is_loaded_once(statuses):
+    inventory, api = replay(
+        [listing("a", "web"), listing("b", "db", "sha256:" + "f" * 64, "exited")], []
+    )
+    containers = {c.container_id: c for c in inventory.containers()}
+
+    assert statuses(inventory) == {"a": "running", "b": "exited"}
+    assert containers["a"].name == "web"
+    assert containers["b"].image == "sha256:ffffffffff"
+    assert api.listings == 1
+    inventory.stop()
+
+
+def test_lifecycle_events_update_statuses(statuses):
+    inventory, _ = replay(
+        [listing("a", "web")],
+        [
+            event("create", "b", name="worker", image="python:3.12"),
+            event("start", "b", name="worker", image="python:3.12"),
+            event("pause", "a"),
+            event("die", "b"),
+            event("start", "b"),
+            event("unpause", "a"),
+            event("stop", "a"),
+        ],
+    )
+    containers = {c.container_id: c for c in inventory.containers()}
+
+    assert statuses(inventory) == {"a": "exited", "b": "running"}
+    assert containers["b"].name == "worker"
+    assert containers["b"].image == "python:3.12"
+    inventory.stop()
+
+
+def test_destroy_removes_container(statuses):
+    inventory, _ = replay(
+        [listing("a", "web"), listing("b", "db")],
+        [event("die", "b"), event("destroy", "b")],
+    )
+
+    assert statuses(inventory) == {"a": "running"}
+    inventory.stop()
+
+
+def test_rename_updates_name():
+    inventory, _ = replay([listing("a", "web")], [event("rename", "a", name="/frontend")])
+
+    assert [c.name for c in inventory.containers()] == ["frontend"]
+    inventory.stop()
+
+
+def test_health_status_keeps_status(statuses):
+    inventory, _ = replay(
+        [listing("a", "web")],
+        [event("health_status: unhealthy", "a"), event("health_status: healthy", "a")],
+    )
+
+    assert statuses(inventory) == {"a": "running"}
+    inventory.stop()
+
+
+def test_kill_without_die_keeps_running(statuses):
+    # docker kill -s HUP, or the SIGTERM of a stop the container survives
+    inventory, _ = replay([listing("a", "web")], [event("kill", "a", signal="1")])
+
+    assert statuses(inventory) == {"a": "running"}
+    inventory.stop()
+
+
+def test_kill_then_die_exits(statuses):
+    inventory, _ = replay(
+        [listing("a", "web")], [event("kill", "a", signal="15"), event("die", "a")]
+    )
+
+    assert statuses(inventory) == {"a": "exited"}
+    inventory.stop()
+
+
+def test_legacy_event_fields(statuses):
+    inventory, _ = replay(
+        [], [{"status": "start", "id": "c" * 64, "from": "redis:7"}]
+    )
+    (container,) = inventory.containers()
+
+    assert container.status == "running"
+    assert container.name == "c" * 12
+    assert container.image == "redis:7"
+    inventory.stop()
@@ -0,0 +1,250 @@
+"""
+Tests for ContainerStatsStreamer and DockerCollector's background
+reconnection, against a fake Docker SDK.
+"""
+
+import queue
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from sysmon.collectors.docker import ContainerStatsStreamer, DockerCollector
+
+TIMEOUT = 5.0
+FIRST_ID = "a" * 64
+SECOND_ID = "b" * 64
+
+
+def wait_until(condition, timeout=TIMEOUT):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.005)
+    return True
+
+
+def sample(total_usage):
+    return {
+        "cpu_stats": {"cpu_usage": {"total_usage": total_usage}, "system_cpu_usage": 1},
+        "memory_stats": {"usage": 1 << 20, "limit": 1 << 30},
+    }
+
+
+class FakeStatsAPI:
+    """Low-level API whose stats streams yield what the test feeds them."""
+
+    def __init__(self):
+        self.feeds = {}
+        self.opened = []
+
+    def feed(self, container_id, stats):
+        """Send a sample on a container's stream (None ends the stream)."""
+        self.feeds[container_id].put(stats)
+
+    def stats(self, container_id, stream=False, decode=False):
+        feed = self.feeds[container_id] = queue.Queue()
+        self.opened.append(container_id)
+        return iter(lambda: feed.get(timeout=TIMEOUT), None)
+
+
+@pytest.fixture
+def api():
+    return FakeStatsAPI()
+
+
+@pytest.fixture
+def streamer(api):
+    streamer = ContainerStatsStreamer(api)
+    yield streamer
+    streamer.stop()
+
+
+def test_streams_start_for_running_containers(api, streamer):
+    streamer.sync([FIRST_ID, SECOND_ID])
+    assert wait_until(lambda: len(api.opened) == 2)
+    assert streamer.latest(FIRST_ID) is None
+
+    api.feed(FIRST_ID, sample(1))
+    assert wait_until(lambda: streamer.latest(FIRST_ID) is not None)
+
+    arrived, stats = streamer.latest(FIRST_ID)
+    assert stats == sample(1)
+    assert arrived <= time.monotonic()
+
+
+def test_running_streams_are_not_restarted(api, streamer):
+    streamer.sync([FIRST_ID])
+    assert wait_until(lambda: len(api.opened) == 1)
+
+    streamer.sync([FIRST_ID])
+
+    assert api.opened == [FIRST_ID]
+
+
+def test_gone_container_is_retired(api, streamer):
+    streamer.sync([FIRST_ID, SECOND_ID])
+    assert wait_until(lambda: len(api.opened) == 2)
+    api.feed(SECOND_ID, sample(1))
+    assert wait_until(lambda: streamer.latest(SECOND_ID) is not None)
+    thread = streamer._streams[SECOND_ID]
+
+    streamer.sync([FIRST_ID])
+
+    # Forgotten at once; the thread leaves on its next sample
+    assert streamer.latest(SECOND_ID) is None
+    api.feed(SECOND_ID, sample(2))
+    thread.join(TIMEOUT)
+    assert not thread.is_alive()
+    assert streamer.latest(SECOND_ID) is None
+
+
+def test_ended_stream_restarts_on_next_sync(api, streamer):
+    streamer.sync([FIRST_ID])
+    assert wait_until(lambda: len(api.opened) == 1)
+    api.feed(FIRST_ID, sample(1))
+    assert wait_until(lambda: streamer.latest(FIRST_ID) is not None)
+
+    api.feed(FIRST_ID, None)
+    assert wait_until(lambda: FIRST_ID not in streamer._streams)
+    assert streamer.latest(FIRST_ID) is None
+
+    streamer.sync([FIRST_ID])
+    assert wait_until(lambda: len(api.opened) == 2)
+
+
+class FakeDaemon:
+    """State behind the fake SDK: fails pings and requests while down."""
+
+    def __init__(self, failed_pings=0):
+        self.failed_pings = failed_pings
+        self.down = False
+        self.up = threading.Event()
+        self.up.set()
+        self.pings = 0
+        self.clients = 0
+        self.streams = []
+
+    def stop(self):
+        """Go down, breaking the events streams; pings wait until start()."""
+        self.up.clear()
+        self.down = True
+        for stream in self.streams:
+            stream.close()
+
+    def start(self):
+        self.down = False
+        self.up.set()
+
+    def ping(self):
+        self.up.wait(TIMEOUT)
+        self.pings += 1
+        if self.failed_pings:
+            self.failed_pings -= 1
+            raise ConnectionError("Connection refused")
+
+    def containers(self, all=False):
+        if self.down:
+            raise ConnectionError("Connection aborted")
+        return [{"Id": FIRST_ID, "Names": ["/web"], "Image": "nginx", "State": "running"}]
+
+    def events(self, since=None, decode=False, filters=None):
+        self.streams.append(FakeEvents())
+        return self.streams[-1]
+
+    def stats(self, container_id, stream=False, decode=False):
+        if self.down:
+            raise ConnectionError("Connection aborted")
+        return sample(1)
+
+
+class FakeEvents:
+    """Events stream that sends nothing until closed."""
+
+    def __init__(self):
+        self._closed = threading.Event()
+
+    def __iter__(self):
+        self._closed.wait(TIMEOUT)
+        return iter(())
+
+    def close(self):
+        self._closed.set()
+
+
+class RecordingEvent(threading.Event):
+    """Event recording each wait's timeout and returning at once."""
+
+    def __init__(self):
+        super().__init__()
+        self.waits = []
+
+    def wait(self, timeout=None):
+        self.waits.append(timeout)
+        return self.is_set()
+
+
+@pytest.fixture
+def daemon(monkeypatch):
+    daemon = FakeDaemon()
+
+    def from_env():
+        daemon.clients += 1
+        return SimpleNamespace(ping=daemon.ping, api=daemon, close=lambda: None)
+
+    monkeypatch.setitem(sys.modules, "docker", SimpleNamespace(from_env=from_env))
+    return daemon
+
+
+@pytest.fixture
+def collector():
+    collector = DockerCollector(backend="api")
+    collector._closed = RecordingEvent()
+    yield collector
+    collector.close()
+
+
+def test_backoff_doubles_up_to_the_maximum(daemon, collector):
+    daemon.failed_pings = 7
+
+    assert wait_until(lambda: collector.wait_connected(0.01))
+
+    assert collector._closed.waits == [1.0, 2.0, 4.0, 8.0, 16.0, 30.0, 30.0]
+    assert daemon.pings == 8
+
+
+def test_unavailable_while_connecting(daemon, collector):
+    daemon.failed_pings = 1
+    collector._closed = threading.Event()
+    collector.RETRY_INITIAL = TIMEOUT
+
+    metrics = collector.collect()
+
+    assert not metrics.available
+    assert metrics.error.startswith(("Connecting", "Connection refused"))
+
+
+def test_failed_collect_disconnects_and_recovers(daemon, collector):
+    daemon.failed_pings = 2
+    assert wait_until(lambda: collector.wait_connected(0.01))
+    assert collector.collect().running_containers == 1
+
+    daemon.stop()
+    # The inventory reloads once its events stream has broken
+    assert wait_until(lambda: not collector.collect().available)
+    metrics = collector.collect()
+    assert "Connection aborted" in metrics.error
+    assert not collector.is_available
+
+    # The daemon comes back after one more refused ping
+    daemon.failed_pings = 1
+    daemon.start()
+    assert wait_until(lambda: collector.wait_connected(0.01))
+
+    assert collector.collect().running_containers == 1
+    assert daemon.clients == 5
+    # The backoff started over for the reconnection
+    assert collector._closed.waits == [1.0, 2.0, 1.0]
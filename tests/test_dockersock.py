@@ -0,0 +1,260 @@
+"""
+Tests for DockerSocketClient and the "socket" Docker backend against a
+fake daemon on a unix socket.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from sysmon.collectors.docker import DockerCollector
+from sysmon.collectors.dockersock import DockerAPIError, DockerSocketAPI, DockerSocketClient
+
+
+def stats_path(container_id):
+    return f"/containers/{container_id}/stats"
+
+
+async def get_all(client, paths):
+    try:
+        return await asyncio.gather(*(client.get(path) for path in paths))
+    finally:
+        client.close()
+
+
+@pytest.mark.parametrize("chunked", [True, False], ids=["chunked", "content-length"])
+def test_reads_body(docker_daemon, chunked):
+    daemon = docker_daemon(containers=1, chunked=chunked)
+    client = DockerSocketClient(daemon.path)
+
+    listing, stats = asyncio.run(
+        get_all(client, ["/containers/json", stats_path(daemon.ids[0])])
+    )
+
+    assert [entry["Id"] for entry in listing] == daemon.ids
+    assert stats["cpu_stats"]["cpu_usage"]["total_usage"] == 10_000_000
+    assert stats["memory_stats"]["limit"] == 1 << 30
+
+
+def test_keep_alive_reuses_connection(docker_daemon):
+    daemon = docker_daemon(containers=1)
+    client = DockerSocketClient(daemon.path)
+
+    async def sequential():
+        try:
+            for _ in range(10):
+                await client.get(stats_path(daemon.ids[0]))
+        finally:
+            client.close()
+
+    asyncio.run(sequential())
+
+    assert daemon.samples[daemon.ids[0]] == 10
+    assert daemon.connections == 1
+
+
+def test_concurrent_requests_share_pool(docker_daemon):
+    daemon = docker_daemon(containers=50, latency=0.01)
+    client = DockerSocketClient(daemon.path, max_connections=4)
+
+    results = asyncio.run(get_all(client, [stats_path(cid) for cid in daemon.ids]))
+
+    assert len(results) == 50
+    assert daemon.stats_requests == 50
+    assert daemon.connections <= 4
+
+
+def test_reconnects_after_server_closes_connection(docker_daemon):
+    daemon = docker_daemon(containers=1)
+    client = DockerSocketClient(daemon.path)
+
+    async def across_drop():
+        try:
+            await client.get(stats_path(daemon.ids[0]))
+            daemon.drop_connections()
+            return await client.get(stats_path(daemon.ids[0]))
+        finally:
+            client.close()
+
+    stats = asyncio.run(across_drop())
+
+    assert stats["cpu_stats"]["cpu_usage"]["total_usage"] == 20_000_000
+    assert daemon.connections == 2
+
+
+def test_connection_close_is_honoured(docker_daemon):
+    daemon = docker_daemon(containers=1, keep_alive=False)
+    client = DockerSocketClient(daemon.path)
+
+    results = asyncio.run(get_all(client, [stats_path(daemon.ids[0])] * 3))
+
+    assert len(results) == 3
+    assert daemon.connections == 3
+
+
+def test_error_status_raises(docker_daemon):
+    daemon = docker_daemon()
+    client = DockerSocketClient(daemon.path)
+
+    with pytest.raises(DockerAPIError) as error:
+        asyncio.run(get_all(client, [stats_path("gone")]))
+
+    assert error.value.status == 404
+    assert "No such container" in error.value.message
+
+
+def test_ping(docker_daemon):
+    daemon = docker_daemon()
+
+    asyncio.run(DockerSocketClient(daemon.path).ping())
+    with pytest.raises(OSError):
+        asyncio.run(DockerSocketClient(daemon.path + ".missing").ping())
+
+
+def test_from_env(monkeypatch):
+    monkeypatch.setenv("DOCKER_HOST", "unix:///run/user/1000/docker.sock")
+    assert DockerSocketClient.from_env().path == "/run/user/1000/docker.sock"
+
+    monkeypatch.delenv("DOCKER_HOST")
+    assert DockerSocketClient.from_env().path == DockerSocketClient.DEFAULT_SOCKET
+
+    monkeypatch.setenv("DOCKER_HOST", "tcp://10.0.0.1:2375")
+    with pytest.raises(ValueError):
+        DockerSocketClient.from_env()
+
+
+def wait_for(produce, done, timeout=5.0):
+    """Call `produce` until `done` accepts its result or the timeout passes."""
+    deadline = time.monotonic() + timeout
+    while True:
+        result = produce()
+        if done(result) or time.monotonic() > deadline:
+            return result
+        time.sleep(0.01)
+
+
+def two_samples(daemon, forget_between=False):
+    """Take two one-shot samples of the first container."""
+    collector = DockerCollector(backend="socket")
+    client = DockerSocketClient(daemon.path)
+    container_id = daemon.ids[0]
+
+    async def sample():
+        try:
+            first = await collector._socket_stats(client, container_id)
+            if forget_between:
+                collector._socket_cpu.clear()
+            second = await collector._socket_stats(client, container_id)
+            return first[1], second[1]
+        finally:
+            client.close()
+
+    return asyncio.run(sample())
+
+
+def test_precpu_synthesized_from_previous_sample(docker_daemon):
+    daemon = docker_daemon(containers=1)
+
+    first, second = two_samples(daemon)
+
+    assert first["precpu_stats"] == {}
+    assert second["precpu_stats"] == first["cpu_stats"]
+
+
+def test_precpu_from_daemon_is_kept(docker_daemon):
+    daemon = docker_daemon(containers=1, precpu=True)
+
+    _, second = two_samples(daemon, forget_between=True)
+
+    assert second["precpu_stats"]["system_cpu_usage"] == 1_000_000_000
+
+
+def test_collector_reports_containers(docker_daemon):
+    daemon = docker_daemon(containers=20)
+    collector = DockerCollector(backend="socket")
+    try:
+        assert collector.wait_connected(5.0)
+        collector.collect()
+        metrics = collector.collect()
+
+        # A container that stopped drops out, and its CPU sample with it
+        stopped = daemon.ids[-1]
+        daemon.stop_container(stopped)
+        after_stop = wait_for(collector.collect, lambda m: m.running_containers == 19)
+    finally:
+        collector.close()
+
+    # The inventory is listed once and then follows the events stream
+    assert len([r for r in daemon.requests if r.startswith("/containers/json")]) == 1
+    assert metrics.available
+    assert metrics.running_containers == 20
+    assert {c.name for c in metrics.containers} == {f"app-{i}" for i in range(20)}
+    # 10 ms of container CPU per second of system CPU on 8 CPUs
+    assert all(c.cpu_percent == pytest.approx(8.0) for c in metrics.containers)
+    assert after_stop.running_containers == 19
+    assert stopped not in collector._socket_cpu
+
+
+def test_collect_async_on_running_loop(docker_daemon):
+    daemon = docker_daemon(containers=3)
+    collector = DockerCollector(backend="socket")
+
+    async def collect_twice():
+        await collector.collect_async()
+        return await collector.collect_async()
+
+    try:
+        assert collector.wait_connected(5.0)
+        metrics = asyncio.run(collect_twice())
+    finally:
+        collector.close()
+
+    assert len(metrics.containers) == 3
+    assert daemon.stats_requests == 6
+
+
+def test_unreachable_daemon_reports_unavailable(docker_daemon, monkeypatch):
+    daemon = docker_daemon()
+    monkeypatch.setenv("DOCKER_HOST", f"unix://{daemon.path}.missing")
+    collector = DockerCollector(backend="socket")
+    try:
+        assert not collector.wait_connected(5.0)
+        metrics = collector.collect()
+    finally:
+        collector.close()
+
+    assert not metrics.available
+    assert "retrying" in metrics.error
+
+
+def test_blocking_api_lists_and_follows_events(docker_daemon):
+    daemon = docker_daemon(containers=2)
+    api = DockerSocketAPI(daemon.path)
+
+    assert [entry["Id"] for entry in api.containers(all=True)] == daemon.ids
+
+    events = api.events(since=1, decode=True, filters={"type": "container"})
+    received = []
+    reader = threading.Thread(target=lambda: received.extend(events))
+    reader.start()
+    try:
+        wait_for(lambda: daemon.requests[-1], lambda r: r.startswith("/events"))
+        daemon.stop_container(daemon.ids[0])
+        wait_for(lambda: received, bool)
+    finally:
+        events.close()
+        reader.join(5.0)
+
+    assert not reader.is_alive()
+    assert received[0]["Action"] == "die"
+    assert "filters=%7B%22type%22%3A+%5B%22container%22%5D%7D" in daemon.requests[-1]
+
+
+def test_blocking_api_needs_the_socket(docker_daemon):
+    daemon = docker_daemon()
+    api = DockerSocketAPI(daemon.path + ".missing")
+
+    with pytest.raises(OSError):
+        api.containers()
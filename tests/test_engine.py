@@ -0,0 +1,146 @@
+"""
+Tests for CollectionEngine deadlines with a deliberately slow fake collector.
+"""
+
+import threading
+import time
+
+import pytest
+
+from sysmon.collectors.engine import CollectionEngine
+
+DEADLINE = 0.05
+
+
+class SlowCollector:
+    """Collector returning 1, 2, 3, ... that blocks while held."""
+
+    def __init__(self):
+        self.calls = 0
+        self.held = None
+        self.finished = threading.Event()
+
+    def hold(self):
+        self.held = threading.Event()
+        self.finished.clear()
+
+    def release(self):
+        self.held.set()
+        self.held = None
+
+    def __call__(self):
+        self.calls += 1
+        value = self.calls
+        held = self.held
+        if held is not None:
+            held.wait(10)
+        self.finished.set()
+        return value
+
+
+@pytest.fixture
+def engine():
+    engine = CollectionEngine(max_workers=2)
+    yield engine
+    engine.shutdown()
+
+
+def test_fast_collector_is_fresh(engine):
+    engine.register("slow", SlowCollector(), deadline=DEADLINE)
+
+    result = engine.collect_all()["slow"]
+
+    assert result.value == 1
+    assert not result.stale
+    assert result.error is None
+
+
+def test_missed_deadline_reports_last_value_as_stale(engine):
+    collector = SlowCollector()
+    engine.register("slow", collector, deadline=DEADLINE)
+    engine.collect_all()
+    time.sleep(0.1)
+
+    collector.hold()
+    result = engine.collect_all()["slow"]
+    collector.release()
+
+    assert result.stale
+    assert result.value == 1
+    assert result.error == "deadline exceeded"
+    assert result.age >= 0.1
+
+
+def test_missed_first_deadline_reports_placeholder(engine):
+    collector = SlowCollector()
+    collector.hold()
+    engine.register("slow", collector, deadline=DEADLINE, placeholder={})
+
+    result = engine.collect_all()["slow"]
+    collector.release()
+
+    assert result.stale
+    assert result.value == {}
+
+
+def test_late_run_is_picked_up_once_finished(engine):
+    collector = SlowCollector()
+    collector.hold()
+    engine.register("slow", collector, deadline=DEADLINE, interval=60.0)
+    assert engine.collect_all()["slow"].stale
+
+    collector.release()
+    assert collector.finished.wait(1)
+    # Not due again for a minute: the finished late run is reported
+    result = engine.collect_all()["slow"]
+
+    assert not result.stale
+    assert result.value == 1
+    assert collector.calls == 1
+
+
+def test_hung_collector_is_not_queued_twice(engine):
+    collector = SlowCollector()
+    collector.hold()
+    engine.register("slow", collector, deadline=DEADLINE)
+
+    engine.collect_all()
+    engine.collect_all()
+    collector.release()
+
+    assert collector.calls == 1
+
+
+def test_collector_registered_later_is_collected(engine):
+    engine.register("first", SlowCollector(), deadline=DEADLINE, interval=60.0)
+    engine.collect_all()
+
+    engine.register("second", SlowCollector(), deadline=DEADLINE, interval=60.0)
+    results = engine.collect_all()
+
+    assert results["first"].value == 1
+    assert results["second"].value == 1
+    assert not results["second"].stale
+
+
+def test_tick_waking_early_still_runs_collector_at_tick_rate(engine):
+    collector = SlowCollector()
+    engine.register("slow", collector, deadline=DEADLINE, interval=0.2)
+    engine.collect_all()
+
+    time.sleep(0.18)
+    result = engine.collect_all()["slow"]
+
+    assert collector.calls == 2
+    assert result.value == 2
+
+
+def test_collector_is_not_run_before_it_is_due(engine):
+    collector = SlowCollector()
+    engine.register("slow", collector, deadline=DEADLINE, interval=60.0)
+    engine.collect_all()
+
+    time.sleep(0.05)
+    engine.collect_all()
+
+    assert collector.calls == 1
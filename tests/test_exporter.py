@@ -0,0 +1,107 @@
+"""
+Tests for the Prometheus exposition of snapshots and the exporter server.
+"""
+
+import socket
+import threading
+import urllib.request
+
+import pytest
+
+from fakesnapshot import make_snapshot
+from sysmon.exporter import MetricsExporter, encode_snapshot
+
+
+def samples(text: str, name: str):
+    """Get the sample lines of one metric family."""
+    return [line for line in text.splitlines() if line.split("{")[0].split(" ")[0] == name]
+
+
+def test_families_have_help_type_and_samples():
+    text = encode_snapshot(make_snapshot(cpu_percent=12.5)).decode()
+
+    assert "# HELP sysmon_cpu_usage_percent Overall CPU usage" in text
+    assert "# TYPE sysmon_cpu_usage_percent gauge" in text
+    assert samples(text, "sysmon_cpu_usage_percent") == ["sysmon_cpu_usage_percent 12.5"]
+    assert samples(text, "sysmon_cpu_core_usage_percent") == [
+        'sysmon_cpu_core_usage_percent{core="0"} 12.5',
+        'sysmon_cpu_core_usage_percent{core="1"} 12.5',
+    ]
+    assert samples(text, "sysmon_disk_reads_total") == ["sysmon_disk_reads_total 10"]
+    assert 'sysmon_load_average{period="15m"} 0.125' in text
+    assert text.endswith("\n")
+
+
+def test_stale_is_exported_for_every_collector():
+    fresh = make_snapshot(ages={"cpu": 0.0, "disk": 4.0})
+    stale = make_snapshot(ages={"cpu": 0.0, "disk": 4.0}, stale=frozenset({"disk"}))
+
+    assert samples(encode_snapshot(fresh).decode(), "sysmon_collector_stale") == [
+        'sysmon_collector_stale{collector="cpu"} 0',
+        'sysmon_collector_stale{collector="disk"} 0',
+    ]
+    assert samples(encode_snapshot(stale).decode(), "sysmon_collector_stale") == [
+        'sysmon_collector_stale{collector="cpu"} 0',
+        'sysmon_collector_stale{collector="disk"} 1',
+    ]
+
+
+def test_label_values_are_escaped_and_missing_values_skipped():
+    snapshot = make_snapshot()
+    partition = snapshot.disk.partitions[0]
+    partition.mountpoint = '/mnt/"odd"\\dir'
+    snapshot.cpu.frequency_current = None
+
+    text = encode_snapshot(snapshot).decode()
+
+    assert 'mountpoint="/mnt/\\"odd\\"\\\\dir"' in text
+    assert "sysmon_cpu_frequency_mhz" not in text
+
+
+class FakeStream:
+    """Stands in for SnapshotStream with a fixed latest snapshot."""
+
+    def __init__(self, latest=None):
+        self.latest = latest
+
+
+def exporter_for(snapshot, host="127.0.0.1"):
+    exporter = MetricsExporter(collector=None, host=host, port=0)
+    exporter.stream = FakeStream(snapshot)
+    return exporter
+
+
+def test_payload_is_encoded_once_per_snapshot():
+    exporter = exporter_for(None)
+    assert exporter.payload() is None
+
+    exporter.stream.latest = make_snapshot()
+    first = exporter.payload()
+    assert exporter.payload() is first
+    assert exporter.payload("gzip") is exporter.payload("gzip")
+
+    exporter.stream.latest = make_snapshot(cpu_percent=50)
+    assert exporter.payload() is not first
+
+
+@pytest.mark.parametrize("host", ["127.0.0.1", "::1"])
+def test_server_listens_on_ipv4_and_ipv6(host):
+    if ":" in host and not socket.has_ipv6:
+        pytest.skip("no IPv6 support")
+    exporter = exporter_for(make_snapshot(), host=host)
+    try:
+        server = exporter._create_server()
+    except OSError:
+        pytest.skip(f"cannot bind {host}")
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        port = server.server_address[1]
+        address = f"[{host}]" if ":" in host else host
+        with urllib.request.urlopen(f"http://{address}:{port}/metrics", timeout=5) as response:
+            body = response.read().decode()
+        assert "sysmon_cpu_usage_percent 25.0" in body
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,56 @@
+"""
+Tests for the sparkline graphs.
+"""
+
+from sysmon.display.graphs import SparklineGraph
+
+
+def colors(text):
+    """List the color of each span, in order."""
+    return [(span.start, span.end, span.style.color.name) for span in text.spans]
+
+
+def test_output_is_padded_to_width():
+    text = SparklineGraph(width=8).render_text([10, 20, 30])
+
+    assert len(text.plain) == 8
+    assert text.plain.startswith("     ")
+
+
+def test_low_values_stay_green_on_an_autoscaled_range():
+    text = SparklineGraph(width=4).render_text([5, 5, 5, 5], 0, 5)
+
+    assert text.plain == "████"
+    assert colors(text) == [(0, 4, "green")]
+
+
+def test_colors_follow_alert_thresholds():
+    text = SparklineGraph(width=4).render_text([10, 59.9, 60, 80])
+
+    assert colors(text) == [(0, 2, "green"), (2, 3, "yellow"), (3, 4, "red")]
+
+
+def test_braille_character_takes_the_color_of_its_higher_sample():
+    text = SparklineGraph(width=2, braille=True).render_text([90, 10, 10, 70])
+
+    assert len(text.plain) == 2
+    assert colors(text) == [(0, 1, "red"), (1, 2, "yellow")]
+
+
+def test_explicit_style_overrides_value_colors():
+    text = SparklineGraph(width=3).render_text([90, 90, 90], style="cyan")
+
+    assert not text.spans
+    assert text.style == "cyan"
+
+
+def test_nan_and_infinite_values_are_clamped():
+    nan, inf = float("nan"), float("inf")
+
+    text = SparklineGraph(width=4).render_text([nan, -inf, inf, 50])
+    assert text.plain[:3] == "  █"
+    assert colors(text) == [(0, 2, "green"), (2, 3, "red"), (3, 4, "green")]
+
+    text = SparklineGraph(width=2, braille=True).render_text([nan, inf, nan, nan])
+    assert len(text.plain) == 2
+    assert colors(text) == [(0, 1, "red"), (1, 2, "green")]
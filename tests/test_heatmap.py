@@ -0,0 +1,60 @@
+"""
+Tests for laying out the per-core CPU heatmap.
+"""
+
+import io
+
+import pytest
+from rich.console import Console
+
+from sysmon.display.heatmap import CELL, CoreHeatmap
+
+
+def render(heatmap, width):
+    console = Console(width=width, file=io.StringIO(), color_system=None)
+    with console.capture() as capture:
+        console.print(heatmap)
+    return capture.get().splitlines()
+
+
+@pytest.mark.parametrize(
+    "cores, width, labels",
+    [
+        (4, 40, ["0"]),
+        (16, 10, ["0", "7", "14"]),
+        (64, 20, ["0", "17", "34", "51"]),
+        (256, 60, ["0", "56", "112", "168", "224"]),
+    ],
+)
+def test_cells_wrap_to_the_width_with_first_cpu_labels(cores, width, labels):
+    lines = render(CoreHeatmap([50.0] * cores), width)
+
+    assert [line.split()[0] for line in lines] == labels
+    assert sum(line.count(CELL) for line in lines) == cores
+    assert all(len(line) <= width for line in lines)
+
+
+def test_labels_are_right_aligned_to_the_widest():
+    lines = render(CoreHeatmap([0.0] * 12), 5)
+
+    assert lines[0].startswith(" 0 ")
+    assert lines[-1].startswith("10 ")
+
+
+def test_history_strips_are_padded_and_wrapped():
+    history = [(0.0, 100.0), (100.0,), (50.0, 50.0)]
+
+    lines = render(CoreHeatmap([0.0, 100.0, 50.0], history), 8)
+
+    # Label, then strips of two samples with a gap: two CPUs per row
+    assert lines == ["0 ▁█  █", "2 ▄▄"]
+
+
+def test_history_is_ignored_unless_every_cpu_has_one():
+    lines = render(CoreHeatmap([10.0, 20.0], [(10.0,)]), 20)
+
+    assert lines == ["0 " + CELL * 2]
+
+
+def test_no_cpus_render_nothing():
+    assert render(CoreHeatmap([]), 20) == []
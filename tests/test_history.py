@@ -0,0 +1,180 @@
+"""
+Tests for the ring-buffer histories.
+"""
+
+import random
+
+import pytest
+
+from sysmon.utils.history import HistoryBuffer, HistoryMatrix, TieredHistory
+
+
+def test_values_are_oldest_first_after_wrap():
+    buffer = HistoryBuffer(max_size=3)
+    for value in range(5):
+        buffer.add(value)
+
+    assert buffer.get_values() == [2.0, 3.0, 4.0]
+    assert buffer.get_latest() == 4.0
+    assert buffer.is_full
+    assert len(buffer) == 3
+
+
+def test_view_of_recent_values_is_contiguous():
+    buffer = HistoryBuffer(max_size=4)
+    for value in range(6):
+        buffer.add(value)
+
+    assert buffer.view(2).tolist() == [4.0, 5.0]
+    assert buffer.view(10).tolist() == [2.0, 3.0, 4.0, 5.0]
+    with pytest.raises(TypeError):
+        buffer.view()[0] = 1.0
+
+
+def test_min_max_drop_values_that_wrapped_out():
+    buffer = HistoryBuffer(max_size=3)
+    for value in (9, 1, 5, 4, 6):
+        buffer.add(value)
+
+    # 9 and 1 have been overwritten
+    assert buffer.get_max() == 6.0
+    assert buffer.get_min() == 4.0
+    assert buffer.get_average() == pytest.approx(5.0)
+
+
+def test_stats_match_a_rescan_over_many_laps():
+    rng = random.Random(1)
+    buffer = HistoryBuffer(max_size=7)
+    for _ in range(200):
+        buffer.add(rng.uniform(0, 100))
+        values = buffer.get_values()
+        assert buffer.get_min() == min(values)
+        assert buffer.get_max() == max(values)
+        assert buffer.get_average() == pytest.approx(sum(values) / len(values))
+
+
+def test_empty_and_cleared_buffers():
+    buffer = HistoryBuffer(max_size=3)
+    assert buffer.get_latest() is None
+    assert (buffer.get_min(), buffer.get_max(), buffer.get_average()) == (0.0, 0.0, 0.0)
+
+    buffer.add(5)
+    buffer.clear()
+    buffer.add(2)
+
+    assert buffer.get_values() == [2.0]
+    assert buffer.get_max() == 2.0
+
+
+def test_size_must_be_positive():
+    with pytest.raises(ValueError):
+        HistoryBuffer(max_size=0)
+
+
+def test_tiered_history_rolls_up_min_avg_max_per_bucket():
+    history = TieredHistory(interval=1.0, raw_span=10.0, rollups=((10.0, 5),))
+    for second in range(25):
+        history.add(second % 10, timestamp=1000.0 + second)
+
+    tier = history.tiers[0]
+    # Two buckets completed; the third is still in progress
+    assert tier.min.get_values() == [0.0, 0.0]
+    assert tier.avg.get_values() == [4.5, 4.5]
+    assert tier.max.get_values() == [9.0, 9.0]
+
+
+def test_tiered_history_skips_empty_buckets():
+    history = TieredHistory(interval=1.0, raw_span=10.0, rollups=((10.0, 5),))
+    history.add(1, timestamp=1000.0)
+    history.add(3, timestamp=1035.0)
+    history.add(5, timestamp=1041.0)
+
+    assert history.tiers[0].avg.get_values() == [1.0, 3.0]
+
+
+def test_tiered_history_answers_long_spans_from_rollups():
+    history = TieredHistory(interval=1.0, raw_span=10.0, rollups=((10.0, 5),))
+    for second in range(41):
+        history.add(second, timestamp=1000.0 + second)
+
+    # 10 seconds fit the raw buffer
+    assert list(history.span(3)) == [38.0, 39.0, 40.0]
+    # 40 seconds need the rollup: four 10 second buckets
+    assert list(history.span(40)) == [4.5, 14.5, 24.5, 34.5]
+    assert list(history.span(40, stat="max")) == [9.0, 19.0, 29.0, 39.0]
+    assert history.span(40, points=2) == [9.5, 29.5]
+
+
+def test_tiered_history_resizes_raw_samples_on_interval_change():
+    history = TieredHistory(interval=1.0, raw_span=10.0, rollups=((10.0, 5),))
+    for second in range(30):
+        history.add(second, timestamp=1000.0 + second)
+
+    history.set_interval(2.0)
+
+    assert history.raw.max_size == 5
+    # Pairs of the last ten samples are averaged
+    assert history.raw.get_values() == [20.5, 22.5, 24.5, 26.5, 28.5]
+    assert history.tiers[0].avg.get_values() == [4.5, 14.5]
+
+
+def test_tiered_history_repeats_raw_samples_on_shorter_interval():
+    history = TieredHistory(interval=1.0, raw_span=10.0, rollups=())
+    for second in range(4):
+        history.add(second, timestamp=1000.0 + second)
+
+    history.set_interval(0.5)
+
+    assert history.raw.max_size == 20
+    assert history.raw.get_values() == [0.0, 0.0, 1.0, 1.0, 2.0, 2.0, 3.0]
+    assert list(history.span(1.0)) == [2.0, 3.0]
+
+
+def test_tiered_history_resamples_an_empty_raw_buffer():
+    history = TieredHistory(interval=1.0, raw_span=10.0, rollups=())
+
+    history.set_interval(2.0)
+
+    assert len(history) == 0
+    history.add(1.0)
+    assert history.get_latest() == 1.0
+
+
+def test_matrix_rows_are_oldest_first_after_wrap():
+    matrix = HistoryMatrix(max_size=3)
+    for step in range(5):
+        matrix.add([step, 10 + step, 20 + step])
+
+    assert len(matrix) == 3
+    assert matrix.rows() == [(2.0, 3.0, 4.0), (12.0, 13.0, 14.0), (22.0, 23.0, 24.0)]
+    assert matrix.rows(2) == [(3.0, 4.0), (13.0, 14.0), (23.0, 24.0)]
+
+
+def test_matrix_row_view_is_contiguous_at_every_position():
+    matrix = HistoryMatrix(max_size=4)
+    for step in range(11):
+        matrix.add([step, -step])
+
+        expected = [float(v) for v in range(max(0, step - 3), step + 1)]
+        assert matrix.row(0).tolist() == expected
+        assert matrix.row(1).tolist() == [-v for v in expected]
+
+
+def test_matrix_starts_over_when_the_series_count_changes():
+    matrix = HistoryMatrix(max_size=3)
+    matrix.add([1.0, 2.0])
+    matrix.add([3.0, 4.0])
+
+    matrix.add([5.0, 6.0, 7.0])
+
+    assert matrix.series_count == 3
+    assert len(matrix) == 1
+    assert matrix.rows() == [(5.0,), (6.0,), (7.0,)]
+
+
+def test_matrix_row_index_is_checked():
+    matrix = HistoryMatrix(max_size=3)
+    matrix.add([1.0, 2.0])
+
+    with pytest.raises(IndexError):
+        matrix.row(2)
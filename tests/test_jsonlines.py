@@ -0,0 +1,88 @@
+"""
+Tests for the JSON-lines writer.
+"""
+
+import io
+import json
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from fakesnapshot import make_snapshot
+from sysmon import jsonlines
+from sysmon.jsonlines import JsonLinesWriter, snapshot_to_record
+
+
+class ClosedPipe(io.BytesIO):
+    """Stream whose reader has gone away."""
+
+    def write(self, data):
+        raise BrokenPipeError
+
+    def flush(self):
+        raise BrokenPipeError
+
+
+class CountingStream(io.BytesIO):
+    """Stream counting its flushes."""
+
+    def __init__(self):
+        super().__init__()
+        self.flushes = 0
+
+    def flush(self):
+        self.flushes += 1
+
+
+@pytest.fixture
+def stdout(monkeypatch, tmp_path):
+    """Point the writer's stdout at a file, so a broken pipe can redirect it."""
+    stream = open(tmp_path / "stdout", "w")
+    monkeypatch.setattr(jsonlines, "sys", SimpleNamespace(stdout=stream))
+    yield stream
+    stream.close()
+
+
+def test_one_compact_record_per_line():
+    stream = CountingStream()
+    writer = JsonLinesWriter(stream)
+
+    assert writer.write(snapshot_to_record(make_snapshot(100.0)))
+    assert writer.write(snapshot_to_record(make_snapshot(102.0, stale=frozenset({"disk"}))))
+
+    lines = stream.getvalue().splitlines()
+    assert [json.loads(line)["timestamp"] for line in lines] == [100.0, 102.0]
+    assert json.loads(lines[1])["stale"] == ["disk"]
+    assert b" " not in lines[0].split(b'"mountpoint"')[0]
+
+
+def test_flushes_every_n_lines():
+    stream = CountingStream()
+    writer = JsonLinesWriter(stream, flush_every=3)
+
+    for _ in range(7):
+        writer.write({})
+    assert stream.flushes == 2
+
+    writer.close()
+    assert stream.flushes == 3
+
+
+def test_broken_pipe_stops_writing_and_silences_stdout(stdout):
+    writer = JsonLinesWriter(ClosedPipe())
+
+    assert not writer.write({"a": 1})
+    assert writer.closed
+    assert not writer.write({"a": 2})
+    writer.close()
+
+    assert os.path.samestat(os.fstat(stdout.fileno()), os.stat(os.devnull))
+
+
+def test_broken_pipe_on_close_is_swallowed(stdout):
+    writer = JsonLinesWriter(ClosedPipe(), flush_every=0)
+
+    writer.close()
+
+    assert writer.closed
@@ -0,0 +1,49 @@
+"""
+Tests for decoding terminal input into keys.
+"""
+
+import pytest
+
+from sysmon.utils.keys import KeyReader
+
+
+@pytest.mark.parametrize(
+    "data, keys",
+    [
+        (b"\x1b[A\x1b[B\x1b[C\x1b[D", ["up", "down", "right", "left"]),
+        (b"\x1bOA\x1bOD", ["up", "left"]),
+        (b"\x1b[5~\x1b[6~", ["pageup", "pagedown"]),
+        (b"\x1b[H\x1bOH\x1b[1~", ["home", "home", "home"]),
+        (b"\x1b[F\x1bOF\x1b[4~", ["end", "end", "end"]),
+    ],
+)
+def test_escape_sequences(data, keys):
+    assert KeyReader.decode(data) == keys
+
+
+def test_named_and_printable_keys():
+    assert KeyReader.decode(b"q+-\t\r\n \x7f") == [
+        "q", "+", "-", "tab", "enter", "enter", "space", "backspace",
+    ]
+
+
+def test_lone_escape_is_a_key():
+    assert KeyReader.decode(b"\x1b") == ["escape"]
+
+
+def test_unknown_sequences_are_skipped_whole():
+    # F5 (CSI 15~), shift+up (CSI 1;2A) and an SS3 function key
+    assert KeyReader.decode(b"\x1b[15~a\x1b[1;2Ab\x1bOPc") == ["a", "b", "c"]
+
+
+def test_control_characters_are_dropped():
+    assert KeyReader.decode(b"\x01j\x02") == ["j"]
+
+
+def test_stdin_that_is_not_a_terminal_reads_no_keys(tmp_path):
+    with open(tmp_path / "input", "w+") as stream:
+        reader = KeyReader(stream=stream)
+
+        assert not reader.start()
+        assert not reader.active
+        assert reader.read() == []
@@ -0,0 +1,100 @@
+"""
+Tests for MountTable against a fake /proc and /sys.
+"""
+
+import select
+from types import SimpleNamespace
+
+import pytest
+
+from sysmon.collectors import mounts as mounts_module
+from sysmon.collectors.mounts import MountInfo, MountTable
+
+FILESYSTEMS = "nodev\tproc\nnodev\ttmpfs\n\text4\n\txfs\nnodev\tnfs4\n"
+
+MOUNTINFO = (
+    "22 1 0:21 / /proc rw,nosuid - proc proc rw\n"
+    "25 1 259:2 / / rw,relatime shared:1 - ext4 /dev/root rw\n"
+    "26 25 0:23 / /run rw - tmpfs tmpfs rw\n"
+    "27 25 259:3 / /mnt/my\\040data rw - xfs /dev/nvme0n1p3 rw\n"
+    "28 25 0:50 / /mnt/share rw - nfs4 server:/export rw\n"
+)
+
+
+class FakePoll:
+    """Stands in for select.poll with notifications queued by the test."""
+
+    def __init__(self):
+        self.pending = []
+
+    def notify(self):
+        self.pending.append((3, select.POLLPRI | select.POLLERR))
+
+    def poll(self, timeout):
+        events, self.pending = self.pending, []
+        return events
+
+    def unregister(self, fd):
+        pass
+
+
+@pytest.fixture
+def roots(tmp_path):
+    proc = tmp_path / "proc"
+    (proc / "self").mkdir(parents=True)
+    (proc / "self" / "mountinfo").write_text(MOUNTINFO)
+    (proc / "filesystems").write_text(FILESYSTEMS)
+
+    sys_root = tmp_path / "sys"
+    (sys_root / "dev" / "block" / "259:2").mkdir(parents=True)
+    (sys_root / "dev" / "block" / "259:2" / "uevent").write_text(
+        "MAJOR=259\nMINOR=2\nDEVNAME=nvme0n1p2\nDEVTYPE=partition\n"
+    )
+    return SimpleNamespace(proc=proc, sys=sys_root)
+
+
+@pytest.fixture
+def table(roots):
+    table = MountTable(proc_root=str(roots.proc), sys_root=str(roots.sys))
+    yield table
+    table.close()
+
+
+def test_reads_physical_mounts(table):
+    assert table.read() == [
+        MountInfo("/dev/nvme0n1p2", "/", "ext4"),
+        MountInfo("/dev/nvme0n1p3", "/mnt/my data", "xfs"),
+    ]
+
+
+def test_changed_only_after_a_notification(table):
+    table._poll = poll = FakePoll()
+    assert table.changed()
+
+    table.read()
+    assert not table.changed()
+
+    poll.notify()
+    assert table.changed()
+
+
+def test_read_drains_a_pending_notification(table):
+    table._poll = poll = FakePoll()
+    table.read()
+
+    poll.notify()
+    table.read()
+
+    assert not table.changed()
+
+
+def test_unwatchable_table_changes_after_ttl(table, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(mounts_module, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    table._poll = None
+    table.read()
+
+    now[0] += table.ttl - 1
+    assert not table.changed()
+    now[0] += 1
+    assert table.changed()
@@ -0,0 +1,86 @@
+"""
+Tests for NetworkCollector on a fake /proc/net/dev and sysfs.
+"""
+
+import os
+
+import pytest
+
+from sysmon.collectors.network import NetworkCollector
+
+NET_DEV_HEADER = (
+    "Inter-|   Receive                                                |  Transmit\n"
+    " face |bytes    packets errs drop fifo frame compressed multicast|"
+    "bytes    packets errs drop fifo colls carrier compressed\n"
+)
+
+
+class FakeHost:
+    """procfs and sysfs whose interfaces and counters are set per sample."""
+
+    def __init__(self, root):
+        self.proc_root = str(root / "proc")
+        self.sys_root = str(root / "sys")
+        os.makedirs(os.path.join(self.proc_root, "net"))
+        os.makedirs(os.path.join(self.sys_root, "devices", "virtual", "net"))
+        self.set_interfaces({"lo": 0})
+
+    def set_interfaces(self, interfaces, virtual=()):
+        """Write /proc/net/dev with rx bytes per interface, marking some virtual."""
+        lines = [NET_DEV_HEADER]
+        for name, rx in interfaces.items():
+            lines.append(f"{name:>6}: {rx} 10 0 0 0 0 0 0 0 10 0 0 0 0 0 0\n")
+        with open(os.path.join(self.proc_root, "net", "dev"), "w") as f:
+            f.write("".join(lines))
+        for name in virtual:
+            os.makedirs(
+                os.path.join(self.sys_root, "devices", "virtual", "net", name), exist_ok=True
+            )
+
+
+@pytest.fixture
+def host(tmp_path):
+    return FakeHost(tmp_path)
+
+
+def sample(collector, monkeypatch, now):
+    monkeypatch.setattr("sysmon.collectors.network.time.monotonic", lambda: now)
+    return {interface.name: interface for interface in collector.collect()}
+
+
+def test_virtual_group_keeps_its_name_through_churn(host, monkeypatch):
+    collector = NetworkCollector(host.proc_root, host.sys_root)
+
+    host.set_interfaces({"lo": 0, "eth0": 0, "veth1a": 0}, virtual=["veth1a"])
+    assert sample(collector, monkeypatch, 1.0) == {}
+
+    # A single member is still reported under its group
+    host.set_interfaces({"lo": 5, "eth0": 1000, "veth1a": 200})
+    first = sample(collector, monkeypatch, 2.0)
+    assert list(first) == ["eth0", "veth*"]
+    assert first["veth*"].interfaces == 1
+    assert first["veth*"].rx_bytes_per_sec == 200
+
+    # A second container starts: counted from its second sample, same key
+    host.set_interfaces({"lo": 5, "eth0": 1000, "veth1a": 300, "veth2b": 0}, virtual=["veth2b"])
+    assert sample(collector, monkeypatch, 3.0)["veth*"].interfaces == 1
+    host.set_interfaces({"lo": 5, "eth0": 1000, "veth1a": 350, "veth2b": 100})
+    second = sample(collector, monkeypatch, 4.0)
+    assert second["veth*"].interfaces == 2
+    assert second["veth*"].rx_bytes_per_sec == 150
+
+    # The first one stops: still the same key
+    host.set_interfaces({"lo": 5, "eth0": 1000, "veth2b": 150})
+    third = sample(collector, monkeypatch, 5.0)
+    assert third["veth*"].interfaces == 1
+    assert third["veth*"].rx_bytes_per_sec == 50
+
+
+def test_no_grouping_reports_each_interface(host, monkeypatch):
+    collector = NetworkCollector(host.proc_root, host.sys_root, group_virtual=False)
+
+    host.set_interfaces({"lo": 0, "veth1a": 0}, virtual=["veth1a"])
+    sample(collector, monkeypatch, 1.0)
+    host.set_interfaces({"lo": 0, "veth1a": 100})
+
+    assert list(sample(collector, monkeypatch, 2.0)) == ["veth1a"]
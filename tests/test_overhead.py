@@ -0,0 +1,78 @@
+"""
+Tests for the overhead recorder and its percentile math.
+"""
+
+import pytest
+
+from sysmon.utils.overhead import OverheadRecorder, percentile
+
+
+def test_percentile_of_no_values_is_zero():
+    assert percentile([], 0.5) == 0.0
+
+
+def test_percentile_of_one_value_is_that_value():
+    assert percentile([7.0], 0.0) == 7.0
+    assert percentile([7.0], 0.5) == 7.0
+    assert percentile([7.0], 1.0) == 7.0
+
+
+@pytest.mark.parametrize(
+    "fraction, expected",
+    [(0.0, 1.0), (0.1, 1.0), (0.11, 2.0), (0.5, 5.0), (0.95, 10.0), (1.0, 10.0)],
+)
+def test_percentile_is_nearest_rank(fraction, expected):
+    values = [float(v) for v in range(1, 11)]
+
+    assert percentile(values, fraction) == expected
+
+
+def test_record_keeps_a_bounded_window_per_name():
+    recorder = OverheadRecorder(window=3)
+    for i in range(10):
+        recorder.record("layout", i / 1000, i / 2000)
+    recorder.record("write", 0.5, 0.25)
+
+    summary = recorder.summary()
+
+    assert summary["layout"]["count"] == 3
+    # Only the three most recent samples are left: 7, 8 and 9 ms
+    assert summary["layout"]["wall_p50"] == pytest.approx(8.0)
+    assert summary["layout"]["wall_max"] == pytest.approx(9.0)
+    assert summary["layout"]["cpu_max"] == pytest.approx(4.5)
+    assert summary["write"]["count"] == 1
+    assert recorder.latest("layout") == (0.009, 0.0045)
+
+
+def test_memory_samples_are_bounded_too():
+    recorder = OverheadRecorder(window=2)
+    for _ in range(5):
+        recorder.sample_memory()
+
+    summary = recorder.summary()
+
+    assert summary["rss_mb"]["count"] == 2
+    assert summary["blocks"]["count"] == 2
+    assert summary["rss_mb"]["max"] > 0
+
+
+def test_measure_records_under_the_name():
+    recorder = OverheadRecorder()
+
+    with recorder.measure("snapshot"):
+        sum(range(1000))
+
+    wall, cpu = recorder.latest("snapshot")
+    assert wall >= 0 and cpu >= 0
+    assert recorder.latest("other") is None
+
+
+def test_footer_and_summary_table():
+    recorder = OverheadRecorder()
+    recorder.record("layout", 0.0031, 0.0029)
+
+    assert recorder.footer(["layout", "write"]) == (
+        "sysmon overhead (wall/cpu): layout 3.1/2.9 ms"
+    )
+    lines = recorder.format_summary().splitlines()
+    assert lines[1].split()[:3] == ["layout", "1", "3.10"]
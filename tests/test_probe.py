@@ -0,0 +1,197 @@
+"""
+Tests for UsageProber and DiskCollector with a fake hanging usage probe.
+"""
+
+import threading
+import time
+from collections import Counter, namedtuple
+from types import SimpleNamespace
+
+import pytest
+
+from sysmon.collectors import probe as probe_module
+from sysmon.collectors.disk import DiskCollector
+from sysmon.collectors.mounts import MountInfo
+from sysmon.collectors.probe import UsageProber
+
+Usage = namedtuple("Usage", "total used free percent")
+
+TIMEOUT = 0.05
+
+
+class FakeProbe:
+    """Usage probe that blocks on mounts marked as hung until released."""
+
+    def __init__(self):
+        self.calls = Counter()
+        self.hung = {}
+
+    def hang(self, mountpoint):
+        self.hung[mountpoint] = threading.Event()
+
+    def release(self, mountpoint):
+        self.hung.pop(mountpoint).set()
+
+    def __call__(self, mountpoint):
+        self.calls[mountpoint] += 1
+        hung = self.hung.get(mountpoint)
+        if hung is not None:
+            hung.wait(10)
+        return Usage(total=1000, used=250, free=750, percent=25.0)
+
+
+class FakeClock:
+    """Replaces time.monotonic for the prober's backoff schedule."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(probe_module, "time", SimpleNamespace(monotonic=clock.monotonic))
+    return clock
+
+
+@pytest.fixture
+def fake_probe():
+    fake = FakeProbe()
+    yield fake
+    for event in fake.hung.values():
+        event.set()
+
+
+@pytest.fixture
+def prober(fake_probe):
+    prober = UsageProber(probe=fake_probe, timeout=TIMEOUT, workers=1)
+    yield prober
+    prober.close()
+
+
+def settle(fake_probe, mountpoint):
+    """Release a hung probe and give its worker time to finish."""
+    fake_probe.release(mountpoint)
+    time.sleep(TIMEOUT * 2)
+
+
+def test_timeout_quarantines_mount(prober, fake_probe, clock):
+    fake_probe.hang("/nfs")
+
+    start = time.monotonic()
+    results = prober.probe_all(["/", "/nfs"])
+
+    assert time.monotonic() - start < 1.0
+    assert set(results) == {"/"}
+    assert prober.quarantined == {"/nfs"}
+
+
+def test_other_mounts_keep_working(prober, fake_probe, clock):
+    # The single worker is stuck in /nfs and is replaced for the others
+    fake_probe.hang("/nfs")
+    prober.probe_all(["/nfs"])
+
+    for _ in range(3):
+        clock.now += 1
+        assert set(prober.probe_all(["/", "/data", "/nfs"])) == {"/", "/data"}
+
+    assert fake_probe.calls["/"] == 3
+    assert fake_probe.calls["/nfs"] == 1
+
+
+def test_not_reprobed_while_blocked(prober, fake_probe, clock):
+    fake_probe.hang("/nfs")
+    prober.probe_all(["/nfs"])
+
+    # Well past any backoff, the first probe is still blocked
+    for _ in range(5):
+        clock.now += 600
+        prober.probe_all(["/nfs"])
+
+    assert fake_probe.calls["/nfs"] == 1
+    assert prober.quarantined == {"/nfs"}
+
+
+def test_backoff_doubles_up_to_max(fake_probe, clock):
+    # Every probe outlives the timeout but finishes before the next retry
+    def slow_probe(mountpoint):
+        usage = fake_probe(mountpoint)
+        time.sleep(TIMEOUT * 2)
+        return usage
+
+    slow = UsageProber(
+        probe=slow_probe,
+        timeout=TIMEOUT,
+        workers=1,
+        backoff=5.0,
+        max_backoff=300.0,
+    )
+    try:
+        slow.probe_all(["/nfs"])
+        time.sleep(TIMEOUT * 3)
+
+        for backoff in (5, 10, 20, 40, 80, 160, 300, 300):
+            calls = fake_probe.calls["/nfs"]
+            clock.now += backoff - 0.5
+            slow.probe_all(["/nfs"])
+            assert fake_probe.calls["/nfs"] == calls, f"re-probed before {backoff}s"
+
+            clock.now += 0.5
+            slow.probe_all(["/nfs"])
+            assert fake_probe.calls["/nfs"] == calls + 1, f"not re-probed after {backoff}s"
+            time.sleep(TIMEOUT * 3)
+    finally:
+        slow.close()
+
+
+def test_recovers_once_probe_answers(prober, fake_probe, clock):
+    fake_probe.hang("/nfs")
+    prober.probe_all(["/nfs"])
+    settle(fake_probe, "/nfs")
+
+    clock.now += 5
+    results = prober.probe_all(["/nfs"])
+
+    assert results["/nfs"].percent == 25.0
+    assert prober.quarantined == set()
+
+
+class FakeMountTable:
+    """Fixed mount table that never changes."""
+
+    def __init__(self, mountpoints):
+        self.mounts = [MountInfo("/dev/sda1", m, "ext4") for m in mountpoints]
+
+    def changed(self):
+        return False
+
+    def read(self):
+        return self.mounts
+
+    def close(self):
+        pass
+
+
+def test_disk_collector_reports_responsive(prober, fake_probe, clock):
+    collector = DiskCollector(mount_table=FakeMountTable(["/", "/nfs"]), prober=prober)
+
+    def responsive():
+        return {p.mountpoint: p.responsive for p in collector.collect_usage()}
+
+    assert responsive() == {"/": True, "/nfs": True}
+
+    # Hung: last known usage is kept and marked unresponsive
+    fake_probe.hang("/nfs")
+    clock.now += 1
+    partitions = {p.mountpoint: p for p in collector.collect_usage()}
+    assert partitions["/nfs"].responsive is False
+    assert partitions["/nfs"].used_bytes == 250
+    assert partitions["/"].responsive is True
+
+    # Answers again after its backoff
+    settle(fake_probe, "/nfs")
+    clock.now += 5
+    assert responsive() == {"/": True, "/nfs": True}
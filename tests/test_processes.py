@@ -0,0 +1,123 @@
+"""
+Tests for ProcessScanner against a fake /proc.
+"""
+
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from sysmon.collectors import processes as processes_module
+from sysmon.collectors.processes import ProcessScanner
+
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK")
+
+# 1 GiB of memory, so a process of `percent` uses percent * PAGES_PER_PERCENT pages
+TOTAL_KB = 1 << 20
+PAGES_PER_PERCENT = (TOTAL_KB * 1024) // PAGE_SIZE // 100
+
+
+class FakeProc:
+    """A procfs tree holding only meminfo, stat and each process's stat."""
+
+    def __init__(self, root):
+        self.root = root
+        (root / "stat").write_text("cpu  0 0 0 0 0 0 0 0 0 0\n")
+        (root / "meminfo").write_text(f"MemTotal:       {TOTAL_KB} kB\n")
+
+    def process(self, pid, name="worker", state="S", ticks=0, start=100, memory=0):
+        (self.root / str(pid)).mkdir(exist_ok=True)
+        (self.root / str(pid) / "stat").write_text(
+            f"{pid} ({name}) {state} 1 {pid} {pid} 0 -1 4194560 100 0 0 0 "
+            f"{ticks} 0 0 0 20 0 1 0 {start} 10000000 {memory * PAGES_PER_PERCENT} "
+            "18446744073709551615 1 1 0 0 0 0 0 0 0 0 0 0 17 0 0 0 0 0 0\n"
+        )
+
+
+@pytest.fixture
+def proc(tmp_path):
+    return FakeProc(tmp_path)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(processes_module, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+@pytest.fixture
+def scanner(proc, clock):
+    return ProcessScanner(proc_root=str(proc.root))
+
+
+def test_name_may_contain_spaces_and_parentheses(proc, scanner):
+    proc.process(42, name="tmux: server) (x", state="R", memory=10)
+
+    [info] = scanner.scan(5)
+
+    assert info.pid == 42
+    assert info.name == "tmux: server) (x"
+    assert info.status == "running"
+    assert info.memory_percent == pytest.approx(10.0, abs=0.01)
+
+
+def test_cpu_is_measured_between_scans(proc, scanner, clock):
+    proc.process(1, ticks=100)
+    assert scanner.scan(5)[0].cpu_percent == 0.0
+
+    proc.process(1, ticks=100 + CLOCK_TICKS // 2)
+    clock[0] += 1.0
+
+    assert scanner.scan(5)[0].cpu_percent == pytest.approx(50.0, abs=1.0)
+
+
+def test_reused_pid_starts_from_zero(proc, scanner, clock):
+    proc.process(1, ticks=100, start=100)
+    scanner.scan(5)
+
+    # A new process with the same PID and more ticks than the old one
+    proc.process(1, ticks=500, start=200)
+    clock[0] += 1.0
+
+    assert scanner.scan(5)[0].cpu_percent == 0.0
+
+
+def test_top_entries_of_each_order(proc, scanner, clock):
+    for pid in range(1, 11):
+        proc.process(pid, ticks=0, memory=pid)
+    scanner.scan(3)
+
+    # CPU busiest in the opposite order to memory
+    for pid in range(1, 11):
+        proc.process(pid, ticks=(11 - pid) * 10, memory=pid)
+    clock[0] += 1.0
+
+    assert [p.pid for p in scanner.scan(3, "cpu")] == [1, 2, 3]
+    clock[0] += 1.0
+    assert [p.pid for p in scanner.scan(3, "memory")] == [10, 9, 8]
+
+
+def test_several_orders_from_one_scan(proc, scanner, clock):
+    for pid in range(1, 11):
+        proc.process(pid, ticks=0, memory=pid)
+    scanner.scan(3)
+    for pid in range(1, 11):
+        proc.process(pid, ticks=(11 - pid) * 10, memory=pid)
+    clock[0] += 1.0
+
+    top = scanner.scan_top(3, ("cpu", "memory"))
+
+    assert [p.pid for p in top] == [1, 2, 3, 10, 9, 8]
+
+
+def test_orders_share_listed_processes(proc, scanner):
+    proc.process(1, memory=30)
+    proc.process(2, memory=20)
+    proc.process(3, memory=10)
+
+    top = scanner.scan_top(2, ("memory", "memory"))
+
+    assert [p.pid for p in top] == [1, 2]
+    assert scanner.scan_top(0, ("cpu", "memory")) == []
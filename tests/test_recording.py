@@ -0,0 +1,184 @@
+"""
+Tests for recordings, their time index, and replay seeking.
+"""
+
+import os
+
+import pytest
+
+from fakesnapshot import make_snapshot
+from sysmon.recording import (
+    RECORD_HEADER,
+    HistoryRebuilder,
+    RecordingError,
+    RecordingReader,
+    RecordingWriter,
+)
+from sysmon.replay import Replayer
+
+START = 1_700_000_000.0
+
+
+@pytest.fixture
+def recording(tmp_path):
+    """A recording of 10 snapshots taken 2 seconds apart, then one after a minute's gap."""
+    path = str(tmp_path / "host.rec")
+    writer = RecordingWriter(path)
+    for number in range(10):
+        writer.append(make_snapshot(START + 2 * number, cpu_percent=number))
+    writer.append(make_snapshot(START + 80, cpu_percent=99))
+    writer.close()
+    return path
+
+
+def test_round_trip(recording):
+    reader = RecordingReader(recording)
+
+    assert len(reader) == 11
+    assert reader.start_time == START
+    assert reader.end_time == START + 80
+    snapshot = reader.read(3)
+    # Histories are not stored
+    assert snapshot == make_snapshot(
+        START + 6, cpu_percent=3, cpu_history=(), memory_history=(), load_history=()
+    )
+    assert [s.cpu.overall_percent for s in reader.iter_from(8)] == [8, 9, 99]
+    reader.close()
+
+
+def test_find_is_first_record_at_or_after(recording):
+    reader = RecordingReader(recording)
+
+    assert reader.find(START - 5) == 0
+    assert reader.find(START) == 0
+    assert reader.find(START + 5) == 3
+    assert reader.find(START + 6) == 3
+    assert reader.find(START + 30) == 10
+    assert reader.find(START + 81) == 11
+    reader.close()
+
+
+def test_appending_continues_the_recording(recording):
+    writer = RecordingWriter(recording)
+    writer.append(make_snapshot(START + 82))
+    writer.close()
+
+    reader = RecordingReader(recording)
+    assert len(reader) == 12
+    assert reader.read(11).timestamp == START + 82
+    reader.close()
+
+
+def test_missing_index_is_rebuilt_without_partial_record(recording):
+    os.remove(recording + ".idx")
+    with open(recording, "ab") as data:
+        # Header of a record whose payload was never written
+        data.write(RECORD_HEADER.pack(START + 82, 100))
+
+    reader = RecordingReader(recording)
+
+    assert len(reader) == 11
+    assert reader.find(START + 5) == 3
+    assert reader.read(10).cpu.overall_percent == 99
+    reader.close()
+
+
+def test_index_is_kept_in_memory_when_it_cannot_be_written(recording, monkeypatch):
+    def read_only(self):
+        raise PermissionError(13, "Permission denied")
+
+    os.remove(recording + ".idx")
+    monkeypatch.setattr(RecordingReader, "rebuild_index", read_only)
+
+    reader = RecordingReader(recording)
+
+    assert not os.path.exists(recording + ".idx")
+    assert len(reader) == 11
+    assert reader.end_time == START + 80
+    assert reader.find(START + 5) == 3
+    assert reader.read(10).cpu.overall_percent == 99
+    reader.close()
+
+
+def test_histories_are_rebuilt_from_earlier_records(recording):
+    reader = RecordingReader(recording)
+    histories = HistoryRebuilder(reader, points=4)
+
+    assert histories.read(0).cpu_history == (0,)
+    assert histories.read(1).cpu_history == (0, 1)
+    snapshot = histories.read(2)
+    assert snapshot.cpu_history == (0, 1, 2)
+    assert snapshot.memory_history == (25.0, 25.0, 25.0)
+    assert snapshot.load_history == (25.0, 25.0, 25.0)
+    assert snapshot.core_history == ((0, 1, 2), (0, 1, 2))
+
+    # Seeking reads the records before the new position
+    assert histories.read(8).cpu_history == (5, 6, 7, 8)
+    assert histories.read(9).cpu_history == (6, 7, 8, 9)
+    assert histories.read(3).cpu_history == (0, 1, 2, 3)
+    reader.close()
+
+
+def test_rebuilt_histories_skip_values_that_are_not_fresh(tmp_path):
+    path = str(tmp_path / "host.rec")
+    writer = RecordingWriter(path)
+    writer.append(make_snapshot(START, cpu_percent=10))
+    # A stale value, then one sampled before the previous record
+    writer.append(make_snapshot(START + 2, cpu_percent=10, stale=frozenset({"cpu"})))
+    writer.append(make_snapshot(START + 4, cpu_percent=10, ages={"cpu": 3.0}))
+    writer.append(make_snapshot(START + 6, cpu_percent=20, ages={"cpu": 0.1}))
+    writer.close()
+
+    reader = RecordingReader(path)
+    histories = HistoryRebuilder(reader)
+
+    snapshots = [histories.read(number) for number in range(4)]
+    assert snapshots[2].cpu_history == (10,)
+    assert snapshots[2].memory_history == (25.0, 25.0, 25.0)
+    assert snapshots[3].cpu_history == (10, 20)
+    reader.close()
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "other.txt"
+    path.write_text("not a recording")
+
+    with pytest.raises(RecordingError):
+        RecordingReader(str(path))
+    with pytest.raises(RecordingError):
+        RecordingReader(str(tmp_path / "missing.rec"))
+
+
+def test_replay_seeks_by_recorded_seconds(recording):
+    replayer = Replayer(recording)
+
+    replayer.seek(Replayer.SEEK_STEP)
+    assert replayer._seek == 5
+    replayer.seek(Replayer.SEEK_STEP)
+    # Across the gap to the next record
+    assert replayer._seek == 10
+    replayer.seek(Replayer.SEEK_STEP)
+    assert replayer._seek == 10
+    replayer.seek(-Replayer.SEEK_STEP)
+    # 10 seconds before the last record is inside the gap: one record back
+    assert replayer._seek == 9
+    replayer.seek(-100)
+    assert replayer._seek == 0
+    replayer.reader.close()
+
+
+def test_replay_steps_through_speeds(recording):
+    replayer = Replayer(recording, speed=1.0)
+
+    replayer.step_speed(1)
+    assert replayer.speed == 2.0
+    replayer.step_speed(-1)
+    replayer.step_speed(-1)
+    assert replayer.speed == 0.5
+
+    replayer.speed = 0
+    replayer.step_speed(1)
+    assert replayer.speed == 0
+    replayer.step_speed(-1)
+    assert replayer.speed == Replayer.SPEEDS[-1]
+    replayer.reader.close()
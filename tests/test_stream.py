@@ -0,0 +1,91 @@
+"""
+Tests for SnapshotStream with a fake collector that fails on demand.
+"""
+
+import threading
+import time
+
+import pytest
+
+from fakesnapshot import make_snapshot
+from sysmon.snapshot import SnapshotStream
+
+TIMEOUT = 5.0
+
+
+class FlakyCollector:
+    """Collector returning a new snapshot per call, or raising while failing."""
+
+    def __init__(self):
+        self.calls = 0
+        self.failing = False
+        self.tick_interval = 0.01
+        self.interval_threads = []
+
+    def set_interval(self, interval):
+        self.interval_threads.append(threading.current_thread())
+        self.tick_interval = interval
+
+    def collect(self):
+        self.calls += 1
+        if self.failing:
+            raise OSError("/proc vanished")
+        return make_snapshot(timestamp=float(self.calls))
+
+
+@pytest.fixture
+def collector():
+    return FlakyCollector()
+
+
+@pytest.fixture
+def stream(collector):
+    errors = []
+    stream = SnapshotStream(collector, interval=0.01, on_error=errors.append)
+    stream.errors = errors
+    yield stream
+    stream.stop()
+
+
+def test_failed_collection_keeps_the_stream_running(collector, stream):
+    collector.failing = True
+    stream.start()
+    assert stream.wait(None, timeout=0.2) is None
+
+    assert stream.error == "OSError: /proc vanished"
+    assert isinstance(stream.errors[0], OSError)
+
+    collector.failing = False
+    snapshot = stream.wait(None, timeout=TIMEOUT)
+    assert snapshot is not None
+    assert stream.error is None
+
+
+def test_failed_collection_keeps_the_last_snapshot(collector, stream):
+    stream.start()
+    first = stream.wait(None, timeout=TIMEOUT)
+
+    collector.failing = True
+    calls = collector.calls
+    deadline = time.monotonic() + TIMEOUT
+    while collector.calls < calls + 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert collector.calls >= calls + 2
+    assert stream.error is not None
+    assert stream.latest.timestamp >= first.timestamp
+    assert stream.latest.timestamp <= calls
+
+
+def test_interval_changes_on_the_collection_thread(collector, stream):
+    stream.start()
+    stream.wait(None, timeout=TIMEOUT)
+
+    stream.set_interval(30.0)
+    deadline = time.monotonic() + TIMEOUT
+    while stream.interval != 30.0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert collector.tick_interval == 30.0
+    assert stream.interval == 30.0
+    assert collector.interval_threads == [stream._thread]